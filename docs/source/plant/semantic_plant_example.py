@@ -153,10 +153,8 @@ def semantic_plant_example():
     
     performance = plant.evaluate(operating_conditions)
     print(f"\nStep 9: Plant Performance Evaluation:")
-    print(f"  Overall efficiency: {performance['plant']['overall_efficiency']:.1%}")
-    print(f"  Total energy consumption: {performance['plant']['total_energy']:.0f} kW")
-    print(f"  Production rate: {performance['plant']['production_rate']:.0f} kg/h")
-    print(f"  Profit rate: ${performance['plant']['profit_rate']:.2f}/h")
+    for metric, value in performance['plant'].items():  # only metrics the units provide data for
+        print(f"  {metric.replace('_', ' ').capitalize()}: {value:.3g}")
     
     return plant
 
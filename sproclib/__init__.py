@@ -14,82 +14,69 @@ __version__ = "3.0.1"
 __author__ = "Thorsten Gressling"
 __email__ = "gressling@paramus.ai"
 
-# Legacy imports for backward compatibility (with error handling)
-try:
-    from .controllers import PIDController, TuningRule
-except ImportError:
-    pass
+# Public names are imported on first access (PEP 562), so that e.g.
+# `sproclib.PIDController` does not pull in every unit model and SciPy.
+from ._lazy import attach
 
-# Import reactor models from new organized structure
-try:
-    from .unit.reactor import (
-        CSTR, BatchReactor, PlugFlowReactor, FixedBedReactor, 
-        SemiBatchReactor, FluidizedBedReactor
-    )
-except ImportError:
-    # Fallback to old structure if new one not available
-    CSTR = BatchReactor = PlugFlowReactor = FixedBedReactor = None
-    SemiBatchReactor = FluidizedBedReactor = None
-
-# Import other unit operations
-try:
-    from .unit.tank.Tank import Tank
-    from .unit.heat_exchanger.HeatExchanger import HeatExchanger
-    from .unit.distillation.DistillationTray import DistillationTray
-    from .unit.distillation.BinaryDistillationColumn import BinaryDistillationColumn
-    from .unit.valve.ControlValve import ControlValve
-    from .unit.valve.ThreeWayValve import ThreeWayValve
-except ImportError:
-    # Create placeholder classes for backward compatibility
-    Tank = HeatExchanger = DistillationTray = BinaryDistillationColumn = None
-    ControlValve = ThreeWayValve = None
-
-# Legacy models import (deprecated but maintained for compatibility)
-try:
-    from .models import (
-        ProcessModel, LinearApproximation, InteractingTanks
-    )
-except ImportError:
-    # Create basic ProcessModel if not available
-    try:
-        from .base import ProcessModel
-    except ImportError:
-        class ProcessModel:
-            pass
-    LinearApproximation = InteractingTanks = None
-
-try:
-    from .analysis import TransferFunction, Simulation, Optimization, StateTaskNetwork
-except ImportError:
-    pass
-
-try:
-    from .functions import (
-        step_response, bode_plot, linearize, tune_pid, simulate_process,
-        optimize_operation, fit_fopdt, stability_analysis, disturbance_rejection,
-        model_predictive_control
-    )
-except ImportError:
-    pass
+_EXPORTS = {
+    # Controllers
+    "PIDController": (".controller.pid", "PIDController"),
+    "ModularPIDController": (".controller.pid", "PIDController"),
+    "TuningRule": (".controller.base", "TuningRule"),
+    "ZieglerNicholsTuning": (".controller.tuning", "ZieglerNicholsTuning"),
+    
+    # Unit operations
+    "ProcessModel": (".unit.base", "ProcessModel"),
+    "CSTR": (".unit.reactor.cstr", "CSTR"),
+    "BatchReactor": (".unit.reactor.batch", "BatchReactor"),
+    "PlugFlowReactor": (".unit.reactor.plug_flow", "PlugFlowReactor"),
+    "FixedBedReactor": (".unit.reactor.fixed_bed", "FixedBedReactor"),
+    "SemiBatchReactor": (".unit.reactor.semi_batch", "SemiBatchReactor"),
+    "FluidizedBedReactor": (".unit.reactor.fluidized_bed", "FluidizedBedReactor"),
+    "Tank": (".unit.tank.single", "Tank"),
+    "UnitTank": (".unit.tank.single", "Tank"),
+    "InteractingTanks": (".unit.tank.interacting", "InteractingTanks"),
+    "HeatExchanger": (".unit.heat_exchanger", "HeatExchanger"),
+    "DistillationTray": (".unit.distillation.tray", "DistillationTray"),
+    "BinaryDistillationColumn": (".unit.distillation.column", "BinaryDistillationColumn"),
+    "ControlValve": (".unit.valve.control", "ControlValve"),
+    "ThreeWayValve": (".unit.valve.three_way", "ThreeWayValve"),
+    "Pump": (".unit.pump", "Pump"),
+    "Compressor": (".unit.compressor", "Compressor"),
+    "LinearApproximation": (".unit.utilities", "LinearApproximation"),
+    "GainScheduledModel": (".unit.utilities", "GainScheduledModel"),
+    
+    # Analysis, simulation, optimization and scheduling (legacy names)
+    "TransferFunction": (".analysis.transfer_function", "TransferFunction"),
+    "Simulation": (".simulation", "ProcessSimulation"),
+    "Optimization": (".optimization.process_optimization", "ProcessOptimization"),
+    "StateTaskNetwork": (".scheduling.state_task_network", "StateTaskNetwork"),
+    
+    # Functions
+    "step_response": (".utilities.math_utils", "step_response"),
+    "bode_plot": (".utilities.math_utils", "bode_plot"),
+    "linearize": (".utilities.math_utils", "linearize"),
+    "tune_pid": (".utilities.control_utils", "tune_pid"),
+    "simulate_process": (".utilities.control_utils", "simulate_process"),
+    "disturbance_rejection": (".utilities.control_utils", "disturbance_rejection"),
+    "model_predictive_control": (".utilities.control_utils", "model_predictive_control"),
+    "optimize_operation": (".optimization.economic_optimization.economic_optimization", "optimize_operation"),
+    "fit_fopdt": (".analysis.model_identification", "fit_fopdt"),
+    "stability_analysis": (".analysis.system_analysis", "stability_analysis"),
+}
 
-# Modern modular imports (recommended for new code)
-try:
-    from .unit.tank.Tank import Tank as UnitTank
-    from .unit.pump.Pump import Pump
-    from .unit.compressor.Compressor import Compressor
-except ImportError:
-    pass
+_SUBMODULES = [
+    "analysis", "controller", "optimization", "scheduling",
+    "simulation", "transport", "unit", "utilities", "viz"
+]
 
-try:
-    from .controller.pid.PIDController import PIDController as ModularPIDController
-    from .controller.tuning.ZieglerNicholsTuning import ZieglerNicholsTuning
-except ImportError:
-    pass
+__getattr__, __dir__ = attach(__name__, _EXPORTS, _SUBMODULES)
 
 __all__ = [
     # Classes
     "PIDController", "TuningRule", "ProcessModel", "CSTR", "Tank", 
     "HeatExchanger", "DistillationTray", "BinaryDistillationColumn", "LinearApproximation", 
+    "GainScheduledModel",
     "PlugFlowReactor", "BatchReactor", "FixedBedReactor", "SemiBatchReactor", "InteractingTanks",
     "ControlValve", "ThreeWayValve",
     "TransferFunction", "Simulation", "Optimization", "StateTaskNetwork",
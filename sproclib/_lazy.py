@@ -0,0 +1,51 @@
+"""
+Lazy Package Exports for SPROCLIB
+
+Helper for PEP 562 module-level __getattr__/__dir__ so packages can list
+their public classes without importing every module (and SciPy) up front.
+A name is imported the first time it is accessed and then cached in the
+package namespace.
+
+Author: Thorsten Gressling <gressling@paramus.ai>
+License: MIT License
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, Iterable, List, Tuple
+
+
+def attach(
+    package: str,
+    exports: Dict[str, Tuple[str, str]],
+    submodules: Iterable[str] = ()
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Create lazy __getattr__ and __dir__ functions for a package.
+
+    Args:
+        package: Package name (pass __name__)
+        exports: Mapping of public name to (module, attribute); relative
+            module names are resolved against the package
+        submodules: Subpackages/modules importable as attributes
+
+    Returns:
+        (__getattr__, __dir__) to assign in the package __init__
+    """
+    submodules = set(submodules)
+
+    def __getattr__(name: str):
+        if name in exports:
+            module_name, attribute = exports[name]
+            value = getattr(importlib.import_module(module_name, package), attribute)
+        elif name in submodules:
+            value = importlib.import_module(f'{package}.{name}')
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports) | submodules)
+
+    return __getattr__, __dir__
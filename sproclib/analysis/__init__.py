@@ -8,17 +8,25 @@ Classes:
     TransferFunction: Transfer function representation and analysis
     SystemAnalysis: Comprehensive system analysis tools
     ModelIdentification: Model fitting and identification methods
+
+Modules:
+    frequency_response: Batched Bode data and stability margins
     
 Author: Thorsten Gressling <gressling@paramus.ai>
 License: MIT License
 """
 
-from .transfer_function import TransferFunction
-from .system_analysis import SystemAnalysis
-from .model_identification import ModelIdentification
+# Analysis tools are imported on first access (PEP 562)
+from .._lazy import attach
+
+_EXPORTS = {
+    'TransferFunction': ('.transfer_function', 'TransferFunction'),
+    'SystemAnalysis': ('.system_analysis', 'SystemAnalysis'),
+    'ModelIdentification': ('.model_identification', 'ModelIdentification'),
+}
+
+__getattr__, __dir__ = attach(
+    __name__, _EXPORTS, ['transfer_function', 'system_analysis', 'model_identification', 'frequency_response']
+)
 
-__all__ = [
-    'TransferFunction',
-    'SystemAnalysis', 
-    'ModelIdentification'
-]
+__all__ = list(_EXPORTS)
@@ -0,0 +1,330 @@
+"""
+Frequency Response Engine for SPROCLIB
+
+This module evaluates frequency responses of rational transfer functions
+with optional dead time for many systems at once. Numerator and denominator
+polynomials of B systems are stacked into zero-padded coefficient arrays and
+evaluated with Horner's method on s = jw for all frequencies in one array
+pass (in real arithmetic on the even and odd parts, since s^2 = -w^2 is
+real); dead time is applied analytically as exp(-jw*theta). Gain and phase
+margins of all systems are located on the frequency grid and refined by a
+vectorized bisection on the exact response.
+
+Author: Thorsten Gressling <gressling@paramus.ai>
+License: MIT License
+"""
+
+import numpy as np
+from typing import Dict, Tuple, Union, Sequence
+import logging
+
+logger = logging.getLogger(__name__)
+
+PolynomialBatch = Union[np.ndarray, Sequence[Sequence[float]]]
+
+
+def coefficient_batch(polynomials: PolynomialBatch) -> np.ndarray:
+    """
+    Stack polynomials (highest order first) into a zero-padded array.
+
+    Args:
+        polynomials: One coefficient vector, a (B, d+1) array, or a sequence
+            of B coefficient vectors of different lengths
+
+    Returns:
+        Coefficients of shape (B, d+1), left-padded with zeros
+    """
+    if isinstance(polynomials, np.ndarray) and polynomials.ndim == 2:
+        return polynomials.astype(float, copy=False)
+    array = np.asarray(polynomials, dtype=object)
+    if array.ndim == 1 and len(array) and np.isscalar(array[0]):
+        return np.atleast_2d(np.asarray(polynomials, dtype=float))
+    rows = [np.atleast_1d(np.asarray(p, dtype=float)) for p in polynomials]
+    width = max(len(row) for row in rows)
+    batch = np.zeros((len(rows), width))
+    for k, row in enumerate(rows):
+        batch[k, width - len(row):] = row
+    return batch
+
+
+def polymul(a: PolynomialBatch, b: PolynomialBatch) -> np.ndarray:
+    """
+    Row-wise product of polynomial batches (one or B rows each).
+
+    Args:
+        a: Coefficients, highest order first
+        b: Coefficients, highest order first
+
+    Returns:
+        Product coefficients of shape (B, da+db+1)
+    """
+    a = coefficient_batch(a)
+    b = coefficient_batch(b)
+    B = max(a.shape[0], b.shape[0])
+    product = np.zeros((B, a.shape[1] + b.shape[1] - 1))
+    for i in range(a.shape[1]):
+        product[:, i:i + b.shape[1]] += a[:, i:i + 1] * b
+    return product
+
+
+def polyadd(a: PolynomialBatch, b: PolynomialBatch) -> np.ndarray:
+    """
+    Row-wise sum of polynomial batches (one or B rows each).
+
+    Args:
+        a: Coefficients, highest order first
+        b: Coefficients, highest order first
+
+    Returns:
+        Sum coefficients of shape (B, max(da, db)+1)
+    """
+    a = coefficient_batch(a)
+    b = coefficient_batch(b)
+    width = max(a.shape[1], b.shape[1])
+    return np.pad(a, ((0, 0), (width - a.shape[1], 0))) + np.pad(b, ((0, 0), (width - b.shape[1], 0)))
+
+
+def horner(coefficients: np.ndarray, s: np.ndarray) -> np.ndarray:
+    """
+    Evaluate B polynomials at complex points with Horner's method.
+
+    Args:
+        coefficients: (B, d+1) coefficients, highest order first
+        s: Points of shape (W,) shared by all systems, or (B, W)
+
+    Returns:
+        Polynomial values of shape (B, W)
+    """
+    coefficients = np.asarray(coefficients)
+    s = np.asarray(s)
+    values = np.broadcast_to(coefficients[:, :1], (coefficients.shape[0], s.shape[-1])).astype(complex)
+    for k in range(1, coefficients.shape[1]):
+        values = values * s + coefficients[:, k:k + 1]
+    return values
+
+
+def _parts(coefficients: np.ndarray, w: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # P(jw) = E(-w^2) + jw O(-w^2): real Horner on the even and odd coefficients
+    x = -w * w
+    d = coefficients.shape[1] - 1
+    even = coefficients[:, d % 2::2]
+    odd = coefficients[:, 1 - d % 2::2]
+    real = np.broadcast_to(even[:, :1], (coefficients.shape[0], x.shape[-1])).copy()
+    for k in range(1, even.shape[1]):
+        real *= x
+        real += even[:, k:k + 1]
+    imag = np.zeros_like(real)
+    if odd.shape[1]:
+        imag += odd[:, :1]
+        for k in range(1, odd.shape[1]):
+            imag *= x
+            imag += odd[:, k:k + 1]
+        imag *= w
+    return real, imag
+
+
+def _rational(num: np.ndarray, den: np.ndarray, w: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Real and imaginary part of num(jw)/den(jw)
+    n_re, n_im = _parts(num, w)
+    d_re, d_im = _parts(den, w)
+    scale = d_re * d_re + d_im * d_im
+    return (n_re * d_re + n_im * d_im) / scale, (n_im * d_re - n_re * d_im) / scale
+
+
+def frequency_response(
+    num: PolynomialBatch,
+    den: PolynomialBatch,
+    w: np.ndarray,
+    dead_time: Union[float, np.ndarray] = 0.0
+) -> np.ndarray:
+    """
+    Complex frequency response G(jw) = num(jw)/den(jw) * exp(-jw*theta).
+
+    Args:
+        num: Numerator coefficients of one or B systems (highest order first)
+        den: Denominator coefficients of one or B systems
+        w: Frequencies [rad/time], shape (W,) or (B, W)
+        dead_time: Dead time theta, scalar or shape (B,)
+
+    Returns:
+        Complex response of shape (B, W)
+    """
+    w = np.asarray(w, dtype=float)
+    re, im = _rational(coefficient_batch(num), coefficient_batch(den), w)
+    response = re + 1j * im
+    dead_time = np.asarray(dead_time, dtype=float)
+    if np.any(dead_time != 0.0):
+        response *= np.exp(-1j * w * dead_time.reshape(-1, 1))
+    return response
+
+
+def _grid_margins(
+    num: np.ndarray,
+    den: np.ndarray,
+    w: np.ndarray,
+    theta: np.ndarray,
+    magnitude_db: np.ndarray,
+    phase: np.ndarray,
+    iterations: int
+) -> Dict[str, np.ndarray]:
+    B = magnitude_db.shape[0]
+    num = np.broadcast_to(num, (B, num.shape[1]))
+    den = np.broadcast_to(den, (B, den.shape[1]))
+    theta = np.broadcast_to(theta.ravel(), (B,))
+    rows = np.arange(B)
+
+    def first_crossing(values):
+        # Index k of the first sign change between w[k] and w[k+1] (-1 if none)
+        change = np.signbit(values[:, 1:]) != np.signbit(values[:, :-1])
+        k = np.argmax(change, axis=1)
+        return np.where(change[rows, k], k, -1)
+
+    def bisect(k, function):
+        found = k >= 0
+        lo = np.log(w[np.where(found, k, 0)])
+        hi = np.log(w[np.where(found, k + 1, 0)])
+        f_lo = function(np.exp(lo))
+        for _ in range(iterations):
+            mid = 0.5 * (lo + hi)
+            f_mid = function(np.exp(mid))
+            lower = np.signbit(f_mid) == np.signbit(f_lo)
+            lo = np.where(lower, mid, lo)
+            f_lo = np.where(lower, f_mid, f_lo)
+            hi = np.where(lower, hi, mid)
+        return np.where(found, np.exp(0.5 * (lo + hi)), np.nan)
+
+    def loop_at(x):
+        # Rational part of the loop at one frequency per system
+        re, im = _rational(num, den, np.nan_to_num(x, nan=1.0)[:, None])
+        return re[:, 0] + 1j * im[:, 0]
+
+    def phase_at(x, k):
+        # Unwrapped phase at x, continued from the grid point w[k] below it
+        return phase[rows, k] + np.angle(loop_at(x) / loop_at(w[k])) - (x - w[k]) * theta
+
+    # Gain crossover |L| = 1, phase crossover -180 deg
+    k_gain = first_crossing(magnitude_db)
+    wg = bisect(k_gain, lambda x: np.log(np.abs(loop_at(x))))
+    k_phase = first_crossing(phase + np.pi)
+    wp = bisect(k_phase, lambda x: phase_at(x, np.maximum(k_phase, 0)) + np.pi)
+
+    gain_margin = np.where(np.isnan(wp), np.inf, 1.0 / np.abs(loop_at(wp)))
+    phase_wg = np.degrees(phase_at(wg, np.maximum(k_gain, 0)))
+    phase_margin = np.where(np.isnan(wg), np.inf, (phase_wg + 360.0) % 360.0 - 180.0)
+    with np.errstate(divide='ignore'):
+        gain_margin_db = 20 * np.log10(gain_margin)
+
+    return {
+        'gain_margin': gain_margin,
+        'gain_margin_db': gain_margin_db,
+        'phase_margin_deg': phase_margin,
+        'gain_crossover_frequency': wg,
+        'phase_crossover_frequency': wp
+    }
+
+
+def _systems(
+    num: PolynomialBatch,
+    den: PolynomialBatch,
+    dead_time: Union[float, np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Coefficient batches and dead times broadcast to a common B
+    num = coefficient_batch(num)
+    den = coefficient_batch(den)
+    theta = np.atleast_1d(np.asarray(dead_time, dtype=float))
+    B = max(len(num), len(den), len(theta))
+    return (np.broadcast_to(num, (B, num.shape[1])), np.broadcast_to(den, (B, den.shape[1])),
+            np.broadcast_to(theta, (B,)))
+
+
+def _magnitude_phase(
+    num: np.ndarray,
+    den: np.ndarray,
+    w: np.ndarray,
+    theta: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Magnitude, magnitude [dB] and unwrapped phase [rad] on the grid; dead
+    # time adds -w*theta
+    re, im = _rational(num, den, w)
+    squared = re * re
+    squared += im * im
+    phase = np.arctan2(im, re)
+    jumps = np.round(np.diff(phase, axis=-1) * (0.5 / np.pi))
+    phase[:, 1:] -= (2.0 * np.pi) * np.cumsum(jumps, axis=-1)
+    phase -= w * theta.reshape(-1, 1)
+    return np.sqrt(squared), 10.0 * np.log10(squared), phase
+
+
+def margins(
+    num: PolynomialBatch,
+    den: PolynomialBatch,
+    w: np.ndarray,
+    dead_time: Union[float, np.ndarray] = 0.0,
+    iterations: int = 50
+) -> Dict[str, np.ndarray]:
+    """
+    Gain and phase margins of B open loops L(s) in one call.
+
+    Crossovers are bracketed on the frequency grid (lowest-frequency
+    crossing of |L| = 1 and of -180 degrees) and refined by bisection in
+    log frequency on the exact response. Loops without a crossing get an
+    infinite margin and a NaN frequency.
+
+    Args:
+        num: Loop numerator coefficients of one or B systems
+        den: Loop denominator coefficients
+        w: Frequency grid [rad/time], increasing, shape (W,)
+        dead_time: Loop dead time, scalar or shape (B,)
+        iterations: Bisection steps
+
+    Returns:
+        Dictionary of (B,) arrays 'gain_margin', 'gain_margin_db',
+        'phase_margin_deg', 'gain_crossover_frequency' (|L| = 1) and
+        'phase_crossover_frequency' (phase = -180 deg)
+    """
+    num, den, theta = _systems(num, den, dead_time)
+    w = np.asarray(w, dtype=float)
+    _, magnitude_db, phase = _magnitude_phase(num, den, w, theta)
+    return _grid_margins(num, den, w, theta, magnitude_db, phase, iterations)
+
+
+def bode(
+    num: PolynomialBatch,
+    den: PolynomialBatch,
+    w: np.ndarray,
+    dead_time: Union[float, np.ndarray] = 0.0,
+    with_margins: bool = True
+) -> Dict[str, np.ndarray]:
+    """
+    Bode data (and margins) of one or B systems in one call.
+
+    The phase of the rational part is unwrapped along frequency (the grid
+    must resolve phase changes below 180 degrees between neighbouring
+    frequencies); the dead time contributes -w*theta exactly.
+
+    Args:
+        num: Numerator coefficients of one or B systems (highest order first)
+        den: Denominator coefficients of one or B systems
+        w: Frequencies [rad/time], increasing, shape (W,)
+        dead_time: Dead time theta, scalar or shape (B,)
+        with_margins: Also compute gain and phase margins of each system as
+            an open loop
+
+    Returns:
+        Dictionary with 'frequency' (W,), 'magnitude', 'magnitude_db',
+        'phase' [rad] and 'phase_deg' of shape (B, W), plus the margins()
+        arrays of shape (B,)
+    """
+    num, den, theta = _systems(num, den, dead_time)
+    w = np.asarray(w, dtype=float)
+    magnitude, magnitude_db, phase = _magnitude_phase(num, den, w, theta)
+    result = {
+        'frequency': w,
+        'magnitude': magnitude,
+        'magnitude_db': magnitude_db,
+        'phase': phase,
+        'phase_deg': np.degrees(phase)
+    }
+    if with_margins:
+        result.update(_grid_margins(num, den, w, theta, magnitude_db, phase, 50))
+    return result
@@ -13,6 +13,8 @@ from typing import Optional, Tuple, Dict, Any, List
 from scipy import signal
 import logging
 
+from . import frequency_response as fr
+
 logger = logging.getLogger(__name__)
 
 
@@ -153,14 +155,12 @@ class SystemAnalysis:
             Dictionary with disturbance rejection analysis
         """
         try:
-            # Create transfer functions
-            G = signal.TransferFunction(*plant_tf)
-            C = signal.TransferFunction(*controller_tf)
-            
             # Closed-loop transfer function from disturbance to output
-            # T_d = G / (1 + G*C)
-            GC = G * C
-            T_d = G / (1 + GC)
+            # T_d = G / (1 + G*C) = Gn*Cd / (Gd*Cd + Gn*Cn)
+            (Gn, Gd), (Cn, Cd) = plant_tf, controller_tf
+            num = fr.polymul(Gn, Cd)[0]
+            den = fr.polyadd(fr.polymul(Gd, Cd), fr.polymul(Gn, Cn))[0]
+            T_d = signal.TransferFunction(num, den)
             
             if disturbance_type == "step":
                 # Step response analysis
@@ -193,20 +193,19 @@ class SystemAnalysis:
                 if w is None:
                     w = np.logspace(-2, 2, 100)
                 
-                w, mag, phase = signal.bode(T_d, w)
-                mag_db = 20 * np.log10(mag)
-                
-                max_sensitivity_db = np.max(mag_db)
-                max_sensitivity_freq = w[np.argmax(mag_db)]
+                response = fr.bode(num, den, w, with_margins=False)
+                mag_db = response['magnitude_db'][0]
+                peak = np.argmax(mag_db)
                 
                 return {
                     'type': 'frequency',
-                    'frequency': w,
-                    'magnitude': mag,
-                    'phase': phase,
+                    'frequency': response['frequency'],
+                    'magnitude': response['magnitude'][0],
+                    'phase': response['phase'][0],
                     'magnitude_db': mag_db,
-                    'max_sensitivity_db': max_sensitivity_db,
-                    'max_sensitivity_freq': max_sensitivity_freq
+                    'phase_deg': response['phase_deg'][0],
+                    'max_sensitivity_db': mag_db[peak],
+                    'max_sensitivity_freq': response['frequency'][peak]
                 }
             
             else:
@@ -227,6 +226,45 @@ class SystemAnalysis:
                 'error': str(e)
             }
     
+    def robustness_analysis(
+        self,
+        plant_tf: Tuple[np.ndarray, np.ndarray],
+        controllers: List[Tuple[np.ndarray, np.ndarray]],
+        w: Optional[np.ndarray] = None,
+        dead_time: float = 0.0
+    ) -> Dict[str, np.ndarray]:
+        """
+        Compare the loop robustness of many controller tunings in one call.
+        
+        The loop transfer functions L = G*C of all tunings are evaluated as
+        one batch, so scanning hundreds of tunings costs about as much as a
+        few scalar Bode evaluations.
+        
+        Args:
+            plant_tf: Plant transfer function (num, den)
+            controllers: List of B controller transfer functions (num, den)
+            w: Frequency vector for analysis
+            dead_time: Plant dead time
+            
+        Returns:
+            Dictionary with loop 'magnitude_db' and 'phase_deg' (B, W), the
+            margins of each loop (B,), and the peak sensitivity
+            'max_sensitivity' = max |1/(1+L)| with its frequency (B,)
+        """
+        if w is None:
+            w = np.logspace(-3, 3, 1000)
+        
+        Gn, Gd = plant_tf
+        num = fr.polymul(Gn, [controller[0] for controller in controllers])
+        den = fr.polymul(Gd, [controller[1] for controller in controllers])
+        
+        result = fr.bode(num, den, w, dead_time=dead_time)
+        sensitivity = np.abs(1.0 / (1.0 + fr.frequency_response(num, den, w, dead_time=dead_time)))
+        peak = np.argmax(sensitivity, axis=1)
+        result['max_sensitivity'] = sensitivity[np.arange(len(peak)), peak]
+        result['max_sensitivity_freq'] = result['frequency'][peak]
+        return result
+    
     def performance_metrics(
         self,
         t: np.ndarray,
@@ -394,43 +432,28 @@ def bode_plot(
     Returns:
         Dictionary with frequency, magnitude, and phase data
     """
-    import matplotlib.pyplot as plt
-    
     if hasattr(system, 'sys'):
-        sys = system.sys
+        num, den = system.sys.num, system.sys.den
     else:
         num, den = system
-        sys = signal.TransferFunction(num, den)
     
     if w is None:
         w = np.logspace(-2, 2, 1000)
     
-    w, mag, phase = signal.bode(sys, w)
+    response = fr.bode(num, den, w, with_margins=False)
+    mag_db = response['magnitude_db'][0]
+    phase_deg = response['phase_deg'][0]
     
     if plot:
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
-        
-        # Magnitude plot
-        ax1.semilogx(w/(2*np.pi), 20*np.log10(mag))
-        ax1.set_ylabel('Magnitude (dB)')
-        ax1.grid(True, which='both', alpha=0.3)
-        ax1.set_title(title)
-        
-        # Phase plot
-        ax2.semilogx(w/(2*np.pi), np.degrees(phase))
-        ax2.set_ylabel('Phase (degrees)')
-        ax2.set_xlabel('Frequency (Hz)')
-        ax2.grid(True, which='both', alpha=0.3)
-        
-        plt.tight_layout()
-        plt.show()
+        from ..viz.analysis import plot_bode
+        plot_bode(response['frequency'], mag_db, phase_deg, title=title)
     
     return {
-        'frequency': w,
-        'magnitude': mag,
-        'phase': phase,
-        'magnitude_db': 20*np.log10(mag),
-        'phase_deg': np.degrees(phase)
+        'frequency': response['frequency'],
+        'magnitude': response['magnitude'][0],
+        'phase': response['phase'][0],
+        'magnitude_db': mag_db,
+        'phase_deg': phase_deg
     }
 
 
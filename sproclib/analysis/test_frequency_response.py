@@ -0,0 +1,133 @@
+"""
+Test suite for the frequency response engine in sproclib.analysis.frequency_response
+"""
+
+import numpy as np
+import pytest
+from scipy import signal
+
+from . import frequency_response as fr
+from .system_analysis import SystemAnalysis
+from .transfer_function import TransferFunction
+from ..controller.model_based.IMCController import IMCController, FOPDTModel, SOPDTModel
+from ..utilities import math_utils
+
+
+def pi_fopdt_loop(K, tau, Kc):
+    """PI controller with Ti = tau on K/(tau s + 1): L(s) = K Kc exp(-theta s) / (tau s)."""
+    Kc = np.atleast_1d(Kc)
+    return fr.polymul([K], np.column_stack([Kc * tau, Kc])), fr.polymul([tau, 1.0], [tau, 0.0])
+
+
+class TestFrequencyResponse:
+    """Test class for the batched frequency response engine."""
+
+    w = np.logspace(-3, 3, 500)
+
+    def test_matches_scipy_bode(self):
+        systems = [([1.0, 2.0], [1.0, 3.0, 5.0, 1.0]), ([4.0], [2.0, 1.0]), ([1.0, 0.0, 1.0], [1.0, 0.4, 4.0])]
+        result = fr.bode([n for n, _ in systems], [d for _, d in systems], self.w, with_margins=False)
+        assert result['magnitude_db'].shape == (3, len(self.w))
+        for k, (num, den) in enumerate(systems):
+            _, mag_db, phase_deg = signal.bode((num, den), self.w)
+            np.testing.assert_allclose(result['magnitude_db'][k], mag_db, atol=1e-9)
+            np.testing.assert_allclose(result['phase_deg'][k], phase_deg, atol=1e-9)
+
+    def test_horner_matches_polyval(self):
+        coefficients = fr.coefficient_batch([[1.0, -2.0, 3.0], [5.0]])
+        s = 1j * self.w
+        np.testing.assert_allclose(fr.horner(coefficients, s)[0], np.polyval([1.0, -2.0, 3.0], s))
+        np.testing.assert_allclose(fr.horner(coefficients, s)[1], 5.0)
+
+    def test_dead_time_phase(self):
+        theta = np.array([0.0, 0.5, 2.0])
+        result = fr.bode([1.0], [1.0, 1.0], self.w, dead_time=theta, with_margins=False)
+        np.testing.assert_allclose(result['magnitude_db'], np.broadcast_to(result['magnitude_db'][0], (3, 500)))
+        np.testing.assert_allclose(result['phase'][1:] - result['phase'][0], -np.outer(theta[1:], self.w))
+
+    def test_pi_fopdt_margins(self):
+        """Test batched margins against the analytic PI-FOPDT result."""
+        K, tau, theta = 2.0, 5.0, 1.0
+        Kc = np.linspace(0.2, 1.5, 40)
+        num, den = pi_fopdt_loop(K, tau, Kc)
+        result = fr.margins(num, den, self.w, dead_time=theta)
+
+        wg = K * Kc / tau
+        wp = np.pi / (2 * theta)
+        np.testing.assert_allclose(result['gain_crossover_frequency'], wg, rtol=1e-8)
+        np.testing.assert_allclose(result['phase_margin_deg'], 90.0 - np.degrees(wg * theta), atol=1e-6)
+        np.testing.assert_allclose(result['phase_crossover_frequency'], wp, rtol=1e-8)
+        np.testing.assert_allclose(result['gain_margin'], wp * tau / (K * Kc), rtol=1e-8)
+
+    def test_no_crossover(self):
+        """Test that 1/(s + 1) has neither crossover and infinite margins."""
+        result = fr.margins([1.0], [1.0, 1.0], self.w)
+        assert np.isinf(result['gain_margin'][0]) and np.isinf(result['phase_margin_deg'][0])
+        assert np.isnan(result['gain_crossover_frequency'][0])
+        assert np.isnan(result['phase_crossover_frequency'][0])
+
+
+class TestAnalysisIntegration:
+    """Test the analysis functions that use the engine."""
+
+    def test_transfer_function_bode_plot(self):
+        """Test that bode_plot reports dB and degrees once (not converted twice)."""
+        tf = TransferFunction([10.0], [1.0, 1.0])
+        result = tf.bode_plot(w=np.array([1e-3, 1.0]), plot=False)
+        np.testing.assert_allclose(result['magnitude_db'], [20.0, 20.0 - 10 * np.log10(2.0)], atol=1e-5)
+        np.testing.assert_allclose(result['phase_deg'], [0.0, -45.0], atol=1e-1)
+
+    def test_transfer_function_stability_margins(self):
+        tf = TransferFunction([8.0], [1.0, 3.0, 3.0, 1.0])
+        result = tf.stability_analysis()
+        # 8/(s+1)^3: phase crossover at sqrt(3), |L| = 1 there, so marginally stable
+        assert result['phase_crossover_freq'] == pytest.approx(np.sqrt(3.0), rel=1e-6)
+        assert result['gain_margin_db'] == pytest.approx(0.0, abs=1e-6)
+
+    def test_math_utils_frequency_response(self):
+        w = np.logspace(-2, 2, 50)
+        mag_db, phase_deg = math_utils.frequency_response([1.0], [1.0, 1.0], w)
+        _, ref_db, ref_deg = signal.bode(([1.0], [1.0, 1.0]), w)
+        np.testing.assert_allclose(mag_db, ref_db, atol=1e-9)
+        np.testing.assert_allclose(phase_deg, ref_deg, atol=1e-9)
+
+    def test_disturbance_frequency_analysis(self):
+        analysis = SystemAnalysis()
+        result = analysis.disturbance_rejection_analysis(([1.0], [1.0, 1.0]), ([2.0, 1.0], [1.0, 0.0]),
+                                                         disturbance_type='frequency')
+        assert 'error' not in result
+        # T_d = s / (s^2 + 3s + 1)
+        w = result['frequency']
+        reference = np.abs(1j * w / ((1j * w) ** 2 + 3j * w + 1.0))
+        np.testing.assert_allclose(result['magnitude'], reference, rtol=1e-10)
+        assert result['max_sensitivity_db'] == pytest.approx(np.max(20 * np.log10(reference)))
+
+    def test_robustness_analysis(self):
+        K, tau, theta = 2.0, 5.0, 1.0
+        Kc = [0.3, 0.6, 1.2]
+        controllers = [([k * tau, k], [tau, 0.0]) for k in Kc]
+        result = SystemAnalysis().robustness_analysis(([K], [tau, 1.0]), controllers, dead_time=theta)
+        assert result['magnitude_db'].shape == (3, 1000)
+        np.testing.assert_allclose(result['gain_crossover_frequency'], K * np.array(Kc) / tau, rtol=1e-8)
+        # More aggressive tunings are less robust
+        assert np.all(np.diff(result['max_sensitivity']) > 0)
+        assert np.all(result['max_sensitivity'] > 1.0)
+
+
+class TestIMCFrequencyResponse:
+    """Test the vectorized IMC frequency responses against the pointwise evaluation."""
+
+    omega = np.logspace(-2, 2, 200)
+
+    @pytest.mark.parametrize("model", [FOPDTModel(2.0, 5.0, 1.0), SOPDTModel(1.5, 4.0, 2.0, 0.5)])
+    def test_matches_pointwise(self, model):
+        controller = IMCController(model, filter_time_constant=2.0, filter_order=2)
+        magnitude, phase, omega = controller.frequency_response(self.omega)
+        pointwise = np.array([controller._controller_transfer_function(s) for s in 1j * self.omega])
+        np.testing.assert_allclose(magnitude, np.abs(pointwise), rtol=1e-10)
+        np.testing.assert_allclose(np.exp(1j * np.radians(phase)), np.exp(1j * np.angle(pointwise)), atol=1e-9)
+
+        magnitude, phase = controller.closed_loop_response(self.omega)
+        GQ = np.array([model.transfer_function(s) for s in 1j * self.omega]) * pointwise
+        np.testing.assert_allclose(magnitude, np.abs(GQ / (1 + GQ)), rtol=1e-10)
+        np.testing.assert_allclose(phase, np.degrees(np.angle(GQ / (1 + GQ))), atol=1e-8)
@@ -10,10 +10,11 @@ License: MIT License
 
 import numpy as np
 from typing import Optional, Tuple, Dict, Any, List, Union
-import matplotlib.pyplot as plt
 from scipy import signal
 import logging
 
+from . import frequency_response as fr
+
 logger = logging.getLogger(__name__)
 
 
@@ -138,43 +139,32 @@ class TransferFunction:
         """
         Generate Bode plot data.
         
+        The dead time of FOPDT transfer functions is included exactly in the
+        phase.
+        
         Args:
             w: Frequency vector (optional)
             plot: Whether to create plot
             
         Returns:
-            Dictionary with frequency, magnitude, and phase data
+            Dictionary with frequency, magnitude (absolute and dB), phase
+            (rad and deg) and the gain and phase margins
         """
         if w is None:
             w = np.logspace(-2, 2, 1000)
         
-        w, mag, phase = signal.bode(self.sys, w)
+        data = fr.bode(self.num, self.den, w, dead_time=getattr(self, 'dead_time', 0.0))
+        result = {key: value[0] if np.ndim(value) == 2 else value for key, value in data.items()}
+        for key in ('gain_margin', 'gain_margin_db', 'phase_margin_deg',
+                    'gain_crossover_frequency', 'phase_crossover_frequency'):
+            result[key] = float(data[key][0])
         
         if plot:
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
-            
-            # Magnitude plot
-            ax1.semilogx(w/(2*np.pi), 20*np.log10(mag))
-            ax1.set_ylabel('Magnitude (dB)')
-            ax1.grid(True, which='both', alpha=0.3)
-            ax1.set_title(f'Bode Plot - {self.name}')
-            
-            # Phase plot
-            ax2.semilogx(w/(2*np.pi), np.degrees(phase))
-            ax2.set_ylabel('Phase (degrees)')
-            ax2.set_xlabel('Frequency (Hz)')
-            ax2.grid(True, which='both', alpha=0.3)
-            
-            plt.tight_layout()
-            plt.show()
+            from ..viz.analysis import plot_bode
+            plot_bode(result['frequency'], result['magnitude_db'], result['phase_deg'],
+                      title=f'Bode Plot - {self.name}')
         
-        return {
-            'frequency': w,
-            'magnitude': mag,
-            'phase': phase,
-            'magnitude_db': 20*np.log10(mag),
-            'phase_deg': np.degrees(phase)
-        }
+        return result
     
     def poles_zeros(self) -> Dict[str, np.ndarray]:
         """Get poles and zeros of transfer function."""
@@ -190,13 +180,16 @@ class TransferFunction:
         # Check if all poles have negative real parts
         stable = np.all(np.real(poles) < 0)
         
-        # Gain and phase margins
-        try:
-            gm, pm, wg, wp = signal.margin(self.sys)
-            gm_db = 20 * np.log10(gm) if gm is not None else None
-            pm_deg = np.degrees(pm) if pm is not None else None
-        except:
-            gm_db, pm_deg, wg, wp = None, None, None, None
+        # Gain and phase margins on a grid spanning the pole/zero frequencies
+        corners = np.abs(np.concatenate([poles, self.sys.zeros]))
+        corners = corners[corners > 1e-12]
+        low, high = (corners.min(), corners.max()) if len(corners) else (1.0, 1.0)
+        w = np.logspace(np.log10(low) - 3, np.log10(high) + 3, 2000)
+        margins = fr.margins(self.num, self.den, w, dead_time=getattr(self, 'dead_time', 0.0))
+        gm_db = float(margins['gain_margin_db'][0])
+        pm_deg = float(margins['phase_margin_deg'][0])
+        wg = float(margins['gain_crossover_frequency'][0])
+        wp = float(margins['phase_crossover_frequency'][0])
         
         return {
             'stable': stable,
@@ -218,10 +211,11 @@ class TransferFunction:
             w: Frequency vector [rad/s]
             
         Returns:
-            Tuple of (magnitude, phase, frequency)
+            Tuple of (magnitude [dB], phase [deg], frequency)
         """
-        w, mag, phase = signal.bode(self.sys, w)
-        return mag, phase, w
+        data = fr.bode(self.num, self.den, w, dead_time=getattr(self, 'dead_time', 0.0),
+                       with_margins=False)
+        return data['magnitude_db'][0], data['phase_deg'][0], data['frequency']
     
     def impulse_response(
         self,
@@ -9,52 +9,44 @@ The package is organized as follows:
 - pid: PID controller implementations  
 - tuning: Various tuning methods (Ziegler-Nichols, AMIGO, Relay)
 - model_based: Model-based controllers (IMC, etc.)
+- state_space: State-space controllers
+- mpc: Model Predictive Control
 
 Author: Thorsten Gressling <gressling@paramus.ai>
 License: MIT License
 """
 
-# Import base classes
-from .base import TuningRule
+# Controllers are imported on first access (PEP 562)
+from .._lazy import attach
 
-# Import PID controllers
-from .pid import PIDController
-
-# Import tuning methods
-from .tuning import ZieglerNicholsTuning, AMIGOTuning, RelayTuning
-
-# Import model-based controllers
-from .model_based import IMCController, FOPDTModel, SOPDTModel, tune_imc_lambda
-
-# Import state-space controllers
-from .state_space import StateSpaceController, StateSpaceModel
-
-# Backward compatibility imports (maintain legacy interface)
-from .pid.PIDController import PIDController
-from .tuning.ZieglerNicholsTuning import ZieglerNicholsTuning
-from .tuning.AMIGOTuning import AMIGOTuning
-from .tuning.RelayTuning import RelayTuning
-from .base.TuningRule import TuningRule
-
-__all__ = [
+_EXPORTS = {
     # Base classes
-    'TuningRule',
+    'TuningRule': ('.base', 'TuningRule'),
     
     # PID Controllers
-    'PIDController',
+    'PIDController': ('.pid', 'PIDController'),
+    'PIDBank': ('.pid', 'PIDBank'),
     
     # Tuning Methods
-    'ZieglerNicholsTuning',
-    'AMIGOTuning', 
-    'RelayTuning',
+    'ZieglerNicholsTuning': ('.tuning', 'ZieglerNicholsTuning'),
+    'AMIGOTuning': ('.tuning', 'AMIGOTuning'),
+    'RelayTuning': ('.tuning', 'RelayTuning'),
     
     # Model-Based Controllers
-    'IMCController',
-    'FOPDTModel',
-    'SOPDTModel',
-    'tune_imc_lambda',
+    'IMCController': ('.model_based', 'IMCController'),
+    'FOPDTModel': ('.model_based', 'FOPDTModel'),
+    'SOPDTModel': ('.model_based', 'SOPDTModel'),
+    'tune_imc_lambda': ('.model_based', 'tune_imc_lambda'),
     
     # State-Space Controllers
-    'StateSpaceController',
-    'StateSpaceModel'
-]
+    'StateSpaceController': ('.state_space', 'StateSpaceController'),
+    'StateSpaceModel': ('.state_space', 'StateSpaceModel'),
+    
+    # Model Predictive Control
+    'MPCController': ('.mpc', 'MPCController'),
+    'ExplicitMPC': ('.mpc', 'ExplicitMPC'),
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS, ['base', 'pid', 'tuning', 'model_based', 'state_space', 'mpc'])
+
+__all__ = list(_EXPORTS)
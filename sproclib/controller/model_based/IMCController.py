@@ -18,9 +18,15 @@ import numpy as np
 from typing import Optional, Callable, Dict, Any, Tuple
 import logging
 from abc import ABC, abstractmethod
+from scipy.signal import cont2discrete
+
+from ...utilities.buffers import RingBuffer
 
 logger = logging.getLogger(__name__)
 
+# Longest delay line of the discrete realization, in samples of Ts
+MAX_DELAY_SAMPLES = 100000
+
 
 class ProcessModelInterface(ABC):
     """Interface for process models to be used with IMC."""
@@ -617,20 +623,75 @@ class SOPDTModel(ProcessModelInterface):
             return "Complex calculation for distinct time constants"
 
 
+class _DifferenceEquation:
+    """Scalar IIR filter b(z)/a(z) in transposed direct form II."""
+    
+    __slots__ = ('b', 'a', 'z')
+    
+    def __init__(self, b: np.ndarray, a: np.ndarray):
+        a = np.atleast_1d(np.asarray(a, dtype=float))
+        b = np.atleast_1d(np.asarray(b, dtype=float).squeeze())
+        b = np.concatenate([np.zeros(len(a) - len(b)), b]) / a[0]
+        self.b = tuple(float(v) for v in b)
+        self.a = tuple(float(v) for v in a / a[0])
+        self.z = [0.0] * (len(a) - 1)
+    
+    def step(self, x: float) -> float:
+        """Filter one input sample and return the output sample."""
+        b, a, z = self.b, self.a, self.z
+        y = b[0] * x + (z[0] if z else 0.0)
+        n = len(z)
+        for i in range(n - 1):
+            z[i] = b[i + 1] * x - a[i + 1] * y + z[i + 1]
+        if n:
+            z[n - 1] = b[n] * x - a[n] * y
+        return y
+    
+    def reset(self):
+        """Zero the filter state."""
+        self.z = [0.0] * len(self.z)
+
+
 class IMCController:
     """
     Internal Model Control (IMC) Controller.
     
     IMC uses the inverse of the process model to cancel process dynamics,
     providing excellent setpoint tracking and disturbance rejection.
+    Per-tick state lives in __slots__ and the setpoint/measurement history
+    in a preallocated ring buffer, so update() does not allocate.
+    
+    sample_time is required for dead-time-exact IMC. With it, FOPDT and
+    SOPDT models are realized in discrete time: Q(s) = G⁻¹(s)·f(s) (without
+    the dead-time inverse) is discretized with the Tustin method and the
+    internal model with a zero-order hold plus a delay line of round(θ/Ts)
+    samples. Each sample then costs a fixed, small number of multiply-adds.
+    Other models fall back to the equivalent PID. The controller samples
+    and holds: calls less than one sample time apart return the held output.
+    
+    Without sample_time the controller is NOT the IMC structure but its
+    equivalent PID approximation (the dead time enters only through the
+    tuning), integrating the error over the actual time between calls. The
+    sample time is never inferred from call spacing, which is irregular when
+    update() is called at the right-hand-side evaluations of an ODE solver;
+    a warning is logged for FOPDT/SOPDT models built without it.
     """
     
+    __slots__ = (
+        'process_model', 'lambda_c', 'filter_order', 'name', 'output_limits',
+        'sample_time', 'last_update_time', '_history', '_output',
+        '_q_filter', '_model_filter', '_delay_line', '_delay_index',
+        '_pid_gains', '_integral', '_last_error'
+    )
+    
     def __init__(
         self,
         process_model: ProcessModelInterface,
         filter_time_constant: float,
         filter_order: int = 1,
-        name: str = "IMC_Controller"
+        name: str = "IMC_Controller",
+        history_length: int = 1000,
+        sample_time: Optional[float] = None
     ):
         """
         Initialize IMC controller.
@@ -640,26 +701,65 @@ class IMCController:
             filter_time_constant: IMC filter time constant λ [time units]
             filter_order: Order of IMC filter (1 or 2)
             name: Controller name for identification
+            history_length: Number of recent updates kept in the history
+                ring buffer (0 disables the history)
+            sample_time: Controller sample time Ts. Required for the
+                dead-time-exact discrete IMC realization of FOPDT/SOPDT
+                models; if None only the continuous equivalent PID
+                approximation is used (and a warning is logged for them)
         """
         self.process_model = process_model
         self.lambda_c = filter_time_constant
         self.filter_order = filter_order
         self.name = name
+        self.output_limits = None
         
         # Controller state
-        self.setpoint_history = []
-        self.output_history = []
-        self.time_history = []
+        self._history = RingBuffer(history_length, width=3)  # t, setpoint, measurement
         self.last_update_time = None
+        self._output = 0.0
+        self._integral = 0.0
+        self._last_error = None
+        self._q_filter = None
+        self._model_filter = None
+        self._delay_line = []
+        self._delay_index = 0
+        self._pid_gains = None
         
         # Validate inputs
         if filter_time_constant <= 0:
             raise ValueError("Filter time constant λ must be positive")
         if filter_order not in [1, 2]:
             raise ValueError("Filter order must be 1 or 2")
+        if sample_time is not None and sample_time <= 0:
+            raise ValueError("Sample time must be positive")
+        
+        self.sample_time = None
+        if sample_time is not None:
+            self._discretize(sample_time)
+        else:
+            self._pid_gains = self._get_equivalent_pid_parameters()
+            if isinstance(process_model, (FOPDTModel, SOPDTModel)):
+                logger.warning(f"IMC '{name}': no sample_time given, running the equivalent PID "
+                               f"approximation instead of the dead-time-exact IMC realization")
         
         logger.info(f"IMC Controller '{name}' initialized with λ = {filter_time_constant}")
     
+    @property
+    def time_history(self) -> np.ndarray:
+        """Update times of the stored history, oldest first."""
+        return self._history.column(0)
+    
+    @property
+    def setpoint_history(self) -> np.ndarray:
+        """Setpoints of the stored history, oldest first."""
+        return self._history.column(1)
+    
+    @property
+    def output_history(self) -> np.ndarray:
+        """Process variable measurements of the stored history, oldest first."""
+        return self._history.column(2)
+    
     def _imc_filter(self, s: complex) -> complex:
         """
         IMC filter transfer function f(s).
@@ -705,62 +805,107 @@ class IMCController:
             Controller output (manipulated variable)
         """
         # Store history
-        self.setpoint_history.append(setpoint)
-        self.output_history.append(process_variable)
-        self.time_history.append(t)
-        
-        # Limit history length
-        max_history = 1000
-        if len(self.time_history) > max_history:
-            self.setpoint_history = self.setpoint_history[-max_history:]
-            self.output_history = self.output_history[-max_history:]
-            self.time_history = self.time_history[-max_history:]
-        
-        # For discrete implementation, use simple approximation
-        # In practice, this would use more sophisticated numerical methods
-        error = setpoint - process_variable
-        
-        # Simple IMC approximation for real-time implementation
-        # Full IMC requires convolution or frequency domain methods
-        if self.last_update_time is not None:
-            dt = t - self.last_update_time
-            if dt > 0:
-                # Approximate IMC response using equivalent PID parameters
-                Kp, Ki, Kd = self._get_equivalent_pid_parameters()
-                
-                # Simple PID-like calculation (approximation)
-                proportional = Kp * error
-                
-                # Simplified integral (would need proper integration in practice)
-                integral = Ki * error * dt if hasattr(self, '_integral') else 0
-                if not hasattr(self, '_integral'):
-                    self._integral = 0
-                self._integral += error * dt
-                integral = Ki * self._integral
-                
-                # Simplified derivative
-                if hasattr(self, '_last_error'):
-                    derivative = Kd * (error - self._last_error) / dt
-                else:
-                    derivative = 0
-                self._last_error = error
-                
-                output = proportional + integral + derivative + feedforward
-            else:
-                output = feedforward
-        else:
-            output = feedforward
-            if not hasattr(self, '_integral'):
-                self._integral = 0
+        self._history.append(t, setpoint, process_variable)
+        
+        if self.sample_time is None:
+            # Continuous equivalent PID; the integral only advances with time, so
+            # solver stages that step back (rejected steps) are not integrated twice
+            dt = 0.0 if self.last_update_time is None else t - self.last_update_time
+            if self.last_update_time is None or dt > 0:
+                self.last_update_time = t
+            self._output = self._limit(
+                self._equivalent_pid_step(setpoint - process_variable, max(dt, 0.0)) + feedforward
+            )
+            return self._output
+        
+        if self.last_update_time is not None and t - self.last_update_time < self.sample_time * (1.0 - 1e-9):
+            return self._output  # hold between samples
         
         self.last_update_time = t
+        if self._q_filter is None:
+            output = self._equivalent_pid_step(setpoint - process_variable, self.sample_time) + feedforward
+        else:
+            # Model mismatch/disturbance estimate d̂ = y - y_model, then Q(r - d̂)
+            y_model = self._model_filter.z[0]
+            output = self._q_filter.step(setpoint - (process_variable - y_model)) + feedforward
         
-        # Apply output limits if specified
-        if hasattr(self, 'output_limits'):
-            output = np.clip(output, self.output_limits[0], self.output_limits[1])
+        # Apply output limits; the internal model sees the applied output
+        output = self._limit(output)
+        if self._model_filter is not None:
+            line = self._delay_line
+            if line:
+                index = self._delay_index
+                delayed, line[index] = line[index], output
+                self._delay_index = (index + 1) % len(line)
+            else:
+                delayed = output
+            self._model_filter.step(delayed)
         
+        self._output = output
         return output
     
+    def _limit(self, output: float) -> float:
+        if self.output_limits is None:
+            return output
+        return min(max(output, self.output_limits[0]), self.output_limits[1])
+    
+    def _equivalent_pid_step(self, error: float, dt: float) -> float:
+        """Equivalent PID over a step dt (dt = 0 evaluates without advancing)."""
+        Kp, Ki, Kd = self._pid_gains
+        if dt <= 0:
+            return Kp * error + Ki * self._integral
+        self._integral += error * dt
+        derivative = 0.0 if self._last_error is None else Kd * (error - self._last_error) / dt
+        self._last_error = error
+        return Kp * error + Ki * self._integral + derivative
+    
+    def _discretize(self, sample_time: float):
+        """
+        Precompute the difference equations for sample time Ts.
+        
+        Q(s) = Π(τᵢs + 1) / (K (λs + 1)ⁿ) with n raised to the model order if
+        needed for a proper controller; the model K / Π(τᵢs + 1) is
+        discretized with a zero-order hold and followed by the delay line.
+        """
+        self.sample_time = float(sample_time)
+        model = self.process_model
+        if isinstance(model, (FOPDTModel, SOPDTModel)):
+            delay = int(round(model.theta / self.sample_time))
+            if delay > MAX_DELAY_SAMPLES:
+                raise ValueError(f"Dead time θ = {model.theta} is {delay} samples of Ts = {self.sample_time}; "
+                                 f"at most {MAX_DELAY_SAMPLES} are supported, increase the sample time")
+        if isinstance(model, FOPDTModel):
+            lags = [model.tau]
+        elif isinstance(model, SOPDTModel):
+            lags = [model.tau1, model.tau2]
+        else:
+            self._pid_gains = self._get_equivalent_pid_parameters()
+            return
+        
+        if abs(model.K) < 1e-12:
+            raise ValueError("Process gain K cannot be zero")
+        
+        lag_polynomial = np.array([1.0])
+        for tau in lags:
+            lag_polynomial = np.convolve(lag_polynomial, [tau, 1.0])
+        order = max(self.filter_order, len(lags))
+        if order != self.filter_order:
+            logger.info(f"IMC '{self.name}': filter order raised to {order} for a proper Q(s)")
+        filter_polynomial = np.array([1.0])
+        for _ in range(order):
+            filter_polynomial = np.convolve(filter_polynomial, [self.lambda_c, 1.0])
+        
+        b_q, a_q, _ = cont2discrete((lag_polynomial, model.K * filter_polynomial),
+                                    self.sample_time, method='bilinear')
+        b_m, a_m, _ = cont2discrete(([model.K], lag_polynomial), self.sample_time, method='zoh')
+        b_m = np.asarray(b_m, dtype=float).squeeze().copy()
+        b_m[0] = 0.0  # strictly proper: removes round-off in the direct feedthrough
+        
+        self._q_filter = _DifferenceEquation(b_q, a_q)
+        self._model_filter = _DifferenceEquation(b_m, a_m)
+        self._delay_line = [0.0] * delay
+        self._delay_index = 0
+    
     def _get_equivalent_pid_parameters(self) -> Tuple[float, float, float]:
         """
         Calculate equivalent PID parameters for the IMC controller.
@@ -812,14 +957,16 @@ class IMCController:
     
     def reset(self):
         """Reset controller internal state."""
-        self.setpoint_history.clear()
-        self.output_history.clear()
-        self.time_history.clear()
+        self._history.clear()
         self.last_update_time = None
-        if hasattr(self, '_integral'):
-            self._integral = 0
-        if hasattr(self, '_last_error'):
-            delattr(self, '_last_error')
+        self._output = 0.0
+        self._integral = 0.0
+        self._last_error = None
+        if self._q_filter is not None:
+            self._q_filter.reset()
+            self._model_filter.reset()
+            self._delay_line = [0.0] * len(self._delay_line)
+            self._delay_index = 0
         logger.info(f"IMC Controller '{self.name}' reset")
     
     def get_tuning_parameters(self) -> Dict[str, float]:
@@ -833,6 +980,31 @@ class IMCController:
             'equivalent_Kd': Kd
         }
     
+    def _q_polynomials(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Rational part of Q(s) as (numerator, denominator) coefficients.
+        
+        Returns Π(τᵢs + 1) and K (λs + 1)ⁿ for FOPDT and SOPDT models (the
+        exp(θs) of the model inverse is kept separate), None otherwise.
+        """
+        model = self.process_model
+        if isinstance(model, FOPDTModel):
+            lags = [model.tau]
+        elif isinstance(model, SOPDTModel):
+            lags = [model.tau1, model.tau2]
+        else:
+            return None
+        if abs(model.K) < 1e-12:
+            return None
+        
+        lag_polynomial = np.array([1.0])
+        for tau in lags:
+            lag_polynomial = np.convolve(lag_polynomial, [tau, 1.0])
+        filter_polynomial = np.array([1.0])
+        for _ in range(self.filter_order):
+            filter_polynomial = np.convolve(filter_polynomial, [self.lambda_c, 1.0])
+        return lag_polynomial, model.K * filter_polynomial
+    
     def frequency_response(
         self,
         omega: np.ndarray
@@ -846,8 +1018,17 @@ class IMCController:
         Returns:
             Tuple of (magnitude, phase, frequency)
         """
-        s_values = 1j * omega
-        response = np.array([self._controller_transfer_function(s) for s in s_values])
+        omega = np.asarray(omega, dtype=float)
+        polynomials = self._q_polynomials()
+        if polynomials is not None:
+            # Q(s) = Π(τᵢs + 1) exp(θs) / (K (λs + 1)ⁿ) for all frequencies at once
+            from ...analysis.frequency_response import frequency_response
+            q_num, q_den = polynomials
+            response = frequency_response(q_num, q_den, omega,
+                                          dead_time=-self.process_model.theta)[0]
+        else:
+            s_values = 1j * omega
+            response = np.array([self._controller_transfer_function(s) for s in s_values])
         
         magnitude = np.abs(response)
         phase = np.angle(response) * 180 / np.pi  # Convert to degrees
@@ -869,6 +1050,16 @@ class IMCController:
         Returns:
             Tuple of (magnitude, phase)
         """
+        omega = np.asarray(omega, dtype=float)
+        polynomials = self._q_polynomials()
+        if polynomials is not None:
+            # With a perfect model G*Q = 1/(λs + 1)ⁿ: the dead times cancel
+            from ...analysis.frequency_response import frequency_response, polyadd
+            _, q_den = polynomials
+            filter_polynomial = q_den / self.process_model.K
+            response = frequency_response([1.0], polyadd(filter_polynomial, [1.0]), omega)[0]
+            return np.abs(response), np.angle(response) * 180 / np.pi
+        
         s_values = 1j * omega
         response = []
         
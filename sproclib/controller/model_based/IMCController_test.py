@@ -1,3 +1,4 @@
+import logging
 import pytest
 import numpy as np
 from sproclib.controller.model_based.IMCController import IMCController
@@ -359,3 +360,128 @@ class TestIMCController:
         assert len(controllers) == 3
         for name, controller in controllers.items():
             assert controller.name == f"IMC_{name}"
+
+
+class TestIMCControllerHistory:
+    """Tests for the preallocated IMC history and slot-based state."""
+    
+    def _controller(self, **kwargs):
+        from sproclib.controller.model_based.IMCController import FOPDTModel
+        return IMCController(FOPDTModel(K=2.0, tau=5.0, theta=1.0), filter_time_constant=2.0, **kwargs)
+    
+    def test_history_is_bounded_ring_buffer(self):
+        """Test that only the most recent updates are kept, oldest first."""
+        controller = self._controller(history_length=5)
+        for k in range(12):
+            controller.update(float(k), 1.0 + k, 0.5 * k)
+        
+        np.testing.assert_array_equal(controller.time_history, [7, 8, 9, 10, 11])
+        np.testing.assert_array_equal(controller.setpoint_history, [8, 9, 10, 11, 12])
+        np.testing.assert_array_equal(controller.output_history, [3.5, 4.0, 4.5, 5.0, 5.5])
+        
+        controller.reset()
+        assert len(controller.time_history) == 0
+    
+    def test_history_can_be_disabled(self):
+        """Test that history_length=0 stores nothing but still controls."""
+        controller = self._controller(history_length=0)
+        reference = self._controller()
+        for t in (0.0, 1.0, 2.0):
+            assert controller.update(t, 1.0, 0.2 * t) == reference.update(t, 1.0, 0.2 * t)
+        
+        assert len(controller.time_history) == 0
+        assert len(reference.time_history) == 3
+        assert not hasattr(controller, '__dict__')
+    
+    def test_perfect_model_tracks_filtered_setpoint(self):
+        """Test that with an exact model the loop follows f(s)·exp(-θs)."""
+        from sproclib.controller.model_based.IMCController import FOPDTModel
+        K, tau, theta, lam, Ts = 2.0, 5.0, 1.0, 2.0, 0.05
+        controller = IMCController(FOPDTModel(K, tau, theta), filter_time_constant=lam, sample_time=Ts)
+        
+        a, delay = np.exp(-Ts / tau), int(round(theta / Ts))
+        u_past, y = [0.0] * delay, 0.0
+        t = np.arange(400) * Ts
+        y_log = []
+        for tk in t:
+            y_log.append(y)
+            u_past.append(controller.update(tk, 1.0, y))
+            y = a * y + K * (1 - a) * u_past.pop(0)
+        
+        expected = np.where(t > theta, 1.0 - np.exp(-(t - theta) / lam), 0.0)
+        np.testing.assert_allclose(y_log, expected, atol=2e-2)
+    
+    def test_dead_time_process_without_offset(self):
+        """Test offset-free control of an SOPDT plant with gain mismatch."""
+        from sproclib.controller.model_based.IMCController import SOPDTModel
+        model = SOPDTModel(K=1.5, tau1=4.0, tau2=1.0, theta=2.0)
+        controller = IMCController(model, filter_time_constant=3.0, sample_time=0.1)
+        
+        # Plant: 20 % higher gain, Euler-integrated SOPDT with the same dead time
+        x1 = x2 = 0.0
+        u_past = [0.0] * 20
+        for k in range(1500):
+            u_past.append(controller.update(0.1 * k, 1.0, x2))
+            u = u_past.pop(0)
+            x1 += 0.1 * (1.8 * u - x1) / 4.0
+            x2 += 0.1 * (x1 - x2) / 1.0
+        
+        assert x2 == pytest.approx(1.0, abs=1e-3)
+    
+    def test_sample_and_hold(self):
+        """Test that calls within one sample time return the held output."""
+        controller = self._controller(sample_time=1.0)
+        u0 = controller.update(0.0, 1.0, 0.0)
+        assert controller.update(0.4, 5.0, 0.0) == u0
+        assert controller.update(0.4, 5.0, 0.0) == u0
+        assert controller.update(1.0, 1.0, 0.0) != u0
+    
+    def test_continuous_without_sample_time(self):
+        """Test that without a sample time the equivalent PID runs on the actual call spacing."""
+        controller = self._controller()
+        Kp, Ki, _ = controller._get_equivalent_pid_parameters()
+        assert controller.update(0.0, 1.0, 0.2) == pytest.approx(Kp * 0.8)
+        assert controller.update(1e-6, 1.0, 0.2) == pytest.approx(Kp * 0.8 + Ki * 0.8e-6)
+        # A call back in time (rejected solver step) does not integrate again
+        assert controller.update(0.5e-6, 1.0, 0.2) == pytest.approx(Kp * 0.8 + Ki * 0.8e-6)
+        assert controller.sample_time is None and controller._q_filter is None
+    
+    def test_warns_without_sample_time(self, caplog):
+        """Test that a dead-time model without sample_time warns about the PID approximation."""
+        with caplog.at_level(logging.WARNING):
+            self._controller()
+        assert 'sample_time' in caplog.text
+        caplog.clear()
+        with caplog.at_level(logging.WARNING):
+            self._controller(sample_time=0.1)
+        assert caplog.text == ''
+    
+    def test_tracks_setpoint_in_process_simulation(self):
+        """Test the IMC loop without sample_time under ProcessSimulation.run (ODE solver stages)."""
+        from sproclib.simulation.process_simulation import ProcessSimulation
+        
+        class FirstOrderPlant:
+            def dynamics(self, t, x, u):
+                return np.array([(2.0 * float(np.ravel(u)[0]) - x[0]) / 5.0])
+        
+        sim = ProcessSimulation(FirstOrderPlant(), self._controller())
+        sim.set_setpoint_profile(lambda t: 1.0)
+        results = sim.run((0.0, 30.0), np.array([0.0]), n_output_points=301)
+        assert results['success']
+        assert results['y'][-1] == pytest.approx(1.0, abs=5e-3)
+        assert sim.controller._delay_line == []
+    
+    def test_dead_time_too_long_for_sample_time(self):
+        """Test that a delay line longer than MAX_DELAY_SAMPLES is rejected."""
+        with pytest.raises(ValueError, match="samples"):
+            self._controller(sample_time=1e-6)
+    
+    def test_output_limits(self):
+        """Test that outputs are clipped and the model sees the clipped value."""
+        controller = self._controller(sample_time=0.1)
+        controller.set_output_limits(-0.1, 0.1)
+        outputs = [controller.update(0.1 * k, 10.0, 0.0) for k in range(50)]
+        assert max(outputs) == pytest.approx(0.1)
+        
+        controller.reset()
+        assert controller.update(0.0, 0.0, 0.0) == 0.0
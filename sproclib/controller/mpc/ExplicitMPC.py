@@ -0,0 +1,629 @@
+"""
+Explicit Model Predictive Controller for SPROCLIB
+
+This module provides explicit (multiparametric) MPC for small systems. The
+constrained MPC problem is solved offline for every state and setpoint in a
+bounded parameter region: the optimal input is piecewise affine over
+polyhedral critical regions, one per optimal active set. Regions are found
+by exploring across region facets and are stored with a uniform grid index,
+so the online controller only locates the region containing the current
+parameter and applies its affine law.
+
+Author: Thorsten Gressling <gressling@paramus.ai>
+License: MIT License
+"""
+
+import numpy as np
+import time
+from typing import Optional, Dict, Any, List, Tuple, Union
+import logging
+from scipy.linalg import solve_discrete_are
+from scipy.optimize import linprog
+
+from .MPCController import prediction_matrices
+from ..state_space.StateSpaceController import StateSpaceModel
+
+logger = logging.getLogger(__name__)
+
+ArrayLike = Union[float, np.ndarray]
+
+FORMAT_VERSION = 1
+
+
+def _solve_qp(
+    H: np.ndarray,
+    f: np.ndarray,
+    G: np.ndarray,
+    w: np.ndarray,
+    tol: float = 1e-9,
+    max_iterations: int = 200
+) -> Tuple[Optional[np.ndarray], Tuple[int, ...]]:
+    """
+    Primal active-set solution of min 1/2 z'Hz + f'z s.t. G z <= w.
+
+    Returns:
+        Tuple of (solution or None if infeasible, optimal active set)
+    """
+    n = H.shape[0]
+    z = np.linalg.solve(H, -f)
+    if np.any(G @ z > w + tol):
+        result = linprog(np.zeros(n), A_ub=G, b_ub=w, bounds=[(None, None)] * n, method='highs')
+        if result.status != 0:
+            return None, ()
+        z = result.x
+
+    # Initial working set: active constraints with independent normals
+    working: List[int] = []
+    for i in np.flatnonzero(np.abs(G @ z - w) <= 1e-7):
+        if np.linalg.matrix_rank(G[working + [i]], tol=1e-9) == len(working) + 1:
+            working.append(int(i))
+        if len(working) == n:
+            break
+
+    for _ in range(max_iterations):
+        k = len(working)
+        Gw = G[working]
+        kkt = np.block([[H, Gw.T], [Gw, np.zeros((k, k))]])
+        solution = np.linalg.lstsq(kkt, np.concatenate([-(H @ z + f), np.zeros(k)]), rcond=None)[0]
+        p, multipliers = solution[:n], solution[n:]
+
+        if np.linalg.norm(p) <= tol * (1.0 + np.linalg.norm(z)):
+            if k == 0 or multipliers.min() >= -tol:
+                return z, tuple(sorted(working))
+            working.pop(int(np.argmin(multipliers)))
+            continue
+
+        # Longest feasible step along p
+        Gp = G @ p
+        blocking = [i for i in np.flatnonzero(Gp > tol) if i not in working]
+        alpha, block = 1.0, None
+        for i in blocking:
+            step = (w[i] - G[i] @ z) / Gp[i]
+            if step < alpha:
+                alpha, block = max(step, 0.0), int(i)
+        z = z + alpha * p
+        if block is not None:
+            working.append(block)
+
+    logger.warning("Active-set QP solver reached the iteration limit")
+    return z, tuple(sorted(working))
+
+
+class ExplicitMPC:
+    """
+    Explicit MPC with a critical-region lookup table.
+
+    Offline, the MPC problem
+
+        min  sum (x_i - x_s)'Q(x_i - x_s) + (x_N - x_s)'P(x_N - x_s)
+             + sum (u_i - u_s)'R(u_i - u_s)
+        s.t. u_min <= u_i <= u_max,  x_min <= x_i <= x_max
+
+    is solved for all parameters theta = [x; r] (state and, optionally,
+    output setpoint) in a box. (x_s, u_s) is the steady-state target for r and
+    P the discrete LQR cost. Online, update() finds the critical region
+    containing theta and returns u = K theta + k.
+    """
+
+    def __init__(
+        self,
+        model: StateSpaceModel,
+        sample_time: float,
+        state_range: Tuple[ArrayLike, ArrayLike],
+        setpoint_range: Optional[Tuple[ArrayLike, ArrayLike]] = None,
+        prediction_horizon: int = 5,
+        control_horizon: Optional[int] = None,
+        Q: Optional[ArrayLike] = None,
+        R: Optional[ArrayLike] = None,
+        u_min: Optional[ArrayLike] = None,
+        u_max: Optional[ArrayLike] = None,
+        x_min: Optional[ArrayLike] = None,
+        x_max: Optional[ArrayLike] = None,
+        u_nominal: Optional[ArrayLike] = None,
+        grid_size: Optional[int] = None,
+        max_regions: int = 5000,
+        name: str = "ExplicitMPC"
+    ):
+        """
+        Initialize explicit MPC and compute its region table.
+
+        Args:
+            model: Continuous-time state-space model (deviation variables)
+            sample_time: Controller sample time
+            state_range: (lower, upper) state bounds of the explored region
+            setpoint_range: (lower, upper) output setpoint bounds; None
+                regulates to the origin (theta = x only)
+            prediction_horizon: Prediction horizon N (samples)
+            control_horizon: Control horizon M (samples, default: N)
+            Q: State weight (scalar, vector or matrix; default: identity)
+            R: Input weight (scalar, vector or matrix; default: 0.1 identity)
+            u_min, u_max: Input bounds (absolute values)
+            x_min, x_max: State constraints over the horizon
+            u_nominal: Input operating point of the linear model
+            grid_size: Grid cells per parameter dimension of the spatial
+                index (default: about 4096 cells in total)
+            max_regions: Abort the exploration after this many regions
+            name: Controller name
+        """
+        if sample_time <= 0:
+            raise ValueError("Sample time must be positive")
+
+        self.model = model
+        self.sample_time = float(sample_time)
+        self.name = name
+        self.N = int(prediction_horizon)
+        self.M = self.N if control_horizon is None else int(min(control_horizon, self.N))
+        n, m, p = model.n_states, model.n_inputs, model.n_outputs
+        self.n_states, self.n_inputs = n, m
+        self.n_setpoints = 0 if setpoint_range is None else p
+        self.u_nominal = self._vector(0.0 if u_nominal is None else u_nominal, m)
+
+        lower = [self._vector(state_range[0], n)]
+        upper = [self._vector(state_range[1], n)]
+        if setpoint_range is not None:
+            lower.append(self._vector(setpoint_range[0], p))
+            upper.append(self._vector(setpoint_range[1], p))
+        self.theta_min, self.theta_max = np.concatenate(lower), np.concatenate(upper)
+        if np.any(self.theta_min >= self.theta_max):
+            raise ValueError("Parameter ranges must have lower < upper")
+
+        self._formulate(Q, R, u_min, u_max, x_min, x_max)
+
+        start = time.perf_counter()
+        self._explore(max_regions)
+        d = self.theta_min.size
+        self._build_index(grid_size or max(1, int(round(4096 ** (1.0 / d)))))
+        self.build_time = time.perf_counter() - start
+
+        self.reset()
+        logger.info(f"ExplicitMPC '{name}': {self.n_regions} critical regions in "
+                    f"{self.build_time:.2f} s")
+
+    def _vector(self, value: ArrayLike, size: int) -> np.ndarray:
+        return np.broadcast_to(np.asarray(value, dtype=float), (size,)).copy()
+
+    def _weight(self, value: ArrayLike, size: int) -> np.ndarray:
+        value = np.asarray(value, dtype=float)
+        if value.ndim < 2:
+            value = np.diag(np.broadcast_to(value, (size,)))
+        if value.shape != (size, size):
+            raise ValueError(f"Weight must be a scalar, a length-{size} vector or a {size}x{size} matrix")
+        return value
+
+    def _formulate(self, Q, R, u_min, u_max, x_min, x_max):
+        """Parametric QP min 1/2 U'HU + theta'F'U s.t. G U <= w + S theta."""
+        model, n, m, N, M = self.model, self.n_states, self.n_inputs, self.N, self.M
+        Q = self._weight(1.0 if Q is None else Q, n)
+        R = self._weight(0.1 if R is None else R, m)
+        Ad, Bd, _, _ = model.discretize(self.sample_time, 'zoh')
+        try:
+            P = solve_discrete_are(Ad, Bd, Q, R)
+        except (ValueError, np.linalg.LinAlgError):
+            logger.warning("Terminal LQR cost unavailable, using Q")
+            P = Q
+
+        # State predictions X = Phi x + Gamma U with u held after the control horizon
+        Phi, _, Theta = prediction_matrices(Ad, Bd, np.eye(n), N, M)
+        difference = np.kron(np.eye(M) - np.eye(M, k=-1), np.eye(m))
+        Gamma = Theta @ difference
+        hold = np.kron(np.minimum(np.arange(N)[:, None], M - 1) == np.arange(M)[None, :], np.eye(m))
+
+        # Steady-state target (x_s, u_s) = (Mx r, Mu r)
+        p = self.n_setpoints
+        if p:
+            target = np.block([[Ad - np.eye(n), Bd], [model.C, np.zeros((p, m))]])
+            rhs = np.vstack([np.zeros((n, p)), np.eye(p)])
+            target_map = np.linalg.lstsq(target, rhs, rcond=None)[0]
+            Ex, Eu = np.tile(target_map[:n], (N, 1)), np.tile(target_map[n:], (N, 1))
+        else:
+            Ex, Eu = np.zeros((N * n, 0)), np.zeros((N * m, 0))
+
+        Q_bar = np.kron(np.eye(N), Q)
+        Q_bar[-n:, -n:] = P
+        R_bar = np.kron(np.eye(N), R)
+        self.H = Gamma.T @ Q_bar @ Gamma + hold.T @ R_bar @ hold
+        self.H = (self.H + self.H.T) / 2
+        self.F = np.hstack([Gamma.T @ Q_bar @ Phi, -Gamma.T @ Q_bar @ Ex - hold.T @ R_bar @ Eu])
+
+        d = n + p
+        G, w, S = [], [], []
+        if u_max is not None:
+            G.append(np.eye(M * m))
+            w.append(np.tile(self._vector(u_max, m) - self.u_nominal, M))
+            S.append(np.zeros((M * m, d)))
+        if u_min is not None:
+            G.append(-np.eye(M * m))
+            w.append(-np.tile(self._vector(u_min, m) - self.u_nominal, M))
+            S.append(np.zeros((M * m, d)))
+        if x_max is not None:
+            G.append(Gamma)
+            w.append(np.tile(self._vector(x_max, n), N))
+            S.append(np.hstack([-Phi, np.zeros((N * n, p))]))
+        if x_min is not None:
+            G.append(-Gamma)
+            w.append(-np.tile(self._vector(x_min, n), N))
+            S.append(np.hstack([Phi, np.zeros((N * n, p))]))
+
+        self.G = np.vstack(G) if G else np.zeros((0, M * m))
+        self.w = np.concatenate(w) if w else np.zeros(0)
+        self.S = np.vstack(S) if S else np.zeros((0, d))
+        self._H_inv = np.linalg.inv(self.H)
+        self._u_bounds = (
+            None if u_min is None else self._vector(u_min, m),
+            None if u_max is None else self._vector(u_max, m)
+        )
+
+    def solve_online(self, x: ArrayLike, setpoint: Optional[ArrayLike] = None) -> np.ndarray:
+        """
+        First optimal input from an online solve of the MPC QP.
+
+        Args:
+            x: State [n_states]
+            setpoint: Output setpoint [n_outputs] (if setpoint_range was given)
+
+        Returns:
+            Optimal input [n_inputs] (absolute); NaN if the QP is infeasible
+        """
+        theta = self._parameter(x, setpoint)
+        U, _ = _solve_qp(self.H, self.F @ theta, self.G, self.w + self.S @ theta)
+        if U is None:
+            return np.full(self.n_inputs, np.nan)
+        return self.u_nominal + U[:self.n_inputs]
+
+    def _parameter(self, x: ArrayLike, setpoint: Optional[ArrayLike]) -> np.ndarray:
+        x = np.asarray(x, dtype=float).reshape(self.n_states)
+        if not self.n_setpoints:
+            return x
+        r = np.asarray(0.0 if setpoint is None else setpoint, dtype=float)
+        if r.size != self.n_setpoints:
+            r = np.broadcast_to(r, (self.n_setpoints,))
+        return np.concatenate((x, r.reshape(self.n_setpoints)))
+
+    # ------------------------------------------------------------------
+    # Offline region exploration
+    # ------------------------------------------------------------------
+
+    def _critical_region(self, active: Tuple[int, ...]):
+        """Affine law and region inequalities A theta <= b of an active set."""
+        H_inv, F, G, w, S = self._H_inv, self.F, self.G, self.w, self.S
+        active = list(active)
+        if active:
+            Ga = G[active]
+            try:
+                M_inv = np.linalg.inv(Ga @ H_inv @ Ga.T)
+            except np.linalg.LinAlgError:
+                return None
+            L = -M_inv @ (S[active] + Ga @ H_inv @ F)
+            l0 = -M_inv @ w[active]
+            K = -H_inv @ (F + Ga.T @ L)
+            k = -H_inv @ Ga.T @ l0
+        else:
+            L, l0 = np.zeros((0, F.shape[1])), np.zeros(0)
+            K, k = -H_inv @ F, np.zeros(F.shape[0])
+
+        inactive = np.setdiff1d(np.arange(G.shape[0]), active)
+        A = np.vstack([G[inactive] @ K - S[inactive], -L])
+        b = np.concatenate([w[inactive] - G[inactive] @ k, l0])
+
+        # Normalize and drop empty rows
+        norms = np.linalg.norm(A, axis=1)
+        keep = norms > 1e-12
+        if np.any(b[~keep] < -1e-9):
+            return None
+        A, b = A[keep] / norms[keep, None], b[keep] / norms[keep]
+        return K, k, A, b
+
+    def _box_rows(self) -> Tuple[np.ndarray, np.ndarray]:
+        d = self.theta_min.size
+        return np.vstack([np.eye(d), -np.eye(d)]), np.concatenate([self.theta_max, -self.theta_min])
+
+    def _chebyshev(self, A, b, equality: Optional[int] = None):
+        """Chebyshev ball of {A theta <= b} in the box (on facet `equality`)."""
+        box_A, box_b = self._box_rows()
+        A_all = np.vstack([A, box_A])
+        b_all = np.concatenate([b, box_b])
+        d = A.shape[1]
+        radius = np.linalg.norm(A_all, axis=1)
+        A_ub = np.hstack([A_all, radius[:, None]])
+        A_eq = b_eq = None
+        if equality is not None:
+            A_ub = np.delete(A_ub, equality, axis=0)
+            b_all = np.delete(b_all, equality)
+            A_eq, b_eq = np.append(A[equality], 0.0)[None, :], [b[equality]]
+        c = np.zeros(d + 1)
+        c[-1] = -1.0
+        result = linprog(c, A_ub=A_ub, b_ub=b_all, A_eq=A_eq, b_eq=b_eq,
+                         bounds=[(None, None)] * d + [(0, None)], method='highs')
+        if result.status != 0:
+            return None, 0.0
+        return result.x[:d], result.x[-1]
+
+    def _explore(self, max_regions: int):
+        """Find critical regions by stepping across region facets."""
+        scale = np.max(self.theta_max - self.theta_min)
+        step, min_radius = 1e-5 * scale, 1e-8 * scale
+        regions, seen = [], set()
+        queue = [(self.theta_min + self.theta_max) / 2]
+        rng = np.random.default_rng(0)
+        queue.extend(rng.uniform(self.theta_min, self.theta_max, size=(8, self.theta_min.size)))
+
+        while queue and len(regions) < max_regions:
+            theta = queue.pop()
+            if any(np.all(A @ theta <= b + 1e-9) for _, _, A, b in regions):
+                continue
+            U, active = _solve_qp(self.H, self.F @ theta, self.G, self.w + self.S @ theta)
+            if U is None or active in seen:
+                continue
+            seen.add(active)
+            region = self._critical_region(active)
+            if region is None:
+                continue
+            K, k, A, b = region
+            center, radius = self._chebyshev(A, b)
+            if center is None or radius < min_radius:
+                continue
+
+            # Keep facets that bound the region, step across each
+            facets = []
+            for i in range(A.shape[0]):
+                point, facet_radius = self._chebyshev(A, b, equality=i)
+                if point is None or facet_radius < min_radius:
+                    continue
+                facets.append(i)
+                neighbour = point + step * A[i]
+                if np.all(neighbour >= self.theta_min) and np.all(neighbour <= self.theta_max):
+                    queue.append(neighbour)
+            if not facets:
+                # Region is the whole box: store one box row so lookups stay uniform
+                A, b, facets = self._box_rows()[0][:1], self.theta_max[:1], [0]
+            regions.append((K, k, A[facets], b[facets]))
+
+        if queue:
+            logger.warning(f"ExplicitMPC '{self.name}': exploration stopped at {max_regions} regions")
+
+        if not regions:
+            raise ValueError("MPC problem is infeasible over the whole parameter range")
+        m = self.n_inputs
+        self.gains = np.array([K[:m] for K, _, _, _ in regions]).reshape(-1, m, self.theta_min.size)
+        self.offsets = np.array([k[:m] for _, k, _, _ in regions]).reshape(-1, m)
+        self.region_A = np.vstack([A for _, _, A, _ in regions]) if regions else np.zeros((0, self.theta_min.size))
+        self.region_b = np.concatenate([b for _, _, _, b in regions]) if regions else np.zeros(0)
+        self.row_offsets = np.cumsum([0] + [A.shape[0] for _, _, A, _ in regions]).astype(np.int64)
+
+    def _build_index(self, grid_size: int):
+        """Uniform grid over the parameter box listing regions per cell."""
+        d = self.theta_min.size
+        self.grid_size = int(grid_size)
+        width = (self.theta_max - self.theta_min) / self.grid_size
+        cells: List[List[int]] = [[] for _ in range(self.grid_size ** d)]
+        for r in range(self.n_regions):
+            A, b = self._region(r)
+            low, high = np.empty(d), np.empty(d)
+            box_A, box_b = self._box_rows()
+            for j in range(d):
+                for sign, bound in ((1.0, low), (-1.0, high)):
+                    c = np.zeros(d)
+                    c[j] = sign
+                    result = linprog(c, A_ub=np.vstack([A, box_A]), b_ub=np.concatenate([b, box_b]),
+                                     bounds=[(None, None)] * d, method='highs')
+                    bound[j] = result.x[j] if result.status == 0 else (
+                        self.theta_min[j] if sign > 0 else self.theta_max[j])
+            first = np.clip(np.floor((low - self.theta_min) / width - 1e-9), 0, self.grid_size - 1).astype(int)
+            last = np.clip(np.floor((high - self.theta_min) / width + 1e-9), 0, self.grid_size - 1).astype(int)
+            for index in np.ndindex(*(last - first + 1)):
+                cells[np.ravel_multi_index(first + np.array(index), (self.grid_size,) * d)].append(r)
+
+        self.cell_offsets = np.cumsum([0] + [len(c) for c in cells]).astype(np.int64)
+        self.cell_regions = np.array([r for c in cells for r in c], dtype=np.int32)
+        self._prepare_lookup()
+
+    def _prepare_lookup(self):
+        """Per-cell stacked region rows so a lookup is one matrix-vector product."""
+        self._width = (self.theta_max - self.theta_min) / self.grid_size
+        self._strides = self.grid_size ** np.arange(self.theta_min.size)[::-1]
+        self._cell_rows = []
+        for c in range(len(self.cell_offsets) - 1):
+            candidates = self.cell_regions[self.cell_offsets[c]:self.cell_offsets[c + 1]]
+            rows = [np.arange(self.row_offsets[r], self.row_offsets[r + 1]) for r in candidates]
+            index = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+            starts = np.cumsum([0] + [len(rw) for rw in rows[:-1]]).astype(np.int64)
+            self._cell_rows.append((candidates, self.region_A[index], self.region_b[index], starts))
+        self._region_rows = [self._region(r) for r in range(self.n_regions)]
+        self._law_offsets = self.offsets + self.u_nominal
+        self._hint = 0
+
+    def _region(self, r: int) -> Tuple[np.ndarray, np.ndarray]:
+        rows = slice(self.row_offsets[r], self.row_offsets[r + 1])
+        return self.region_A[rows], self.region_b[rows]
+
+    @property
+    def n_regions(self) -> int:
+        """Number of critical regions."""
+        return len(self.offsets)
+
+    # ------------------------------------------------------------------
+    # Online evaluation
+    # ------------------------------------------------------------------
+
+    def locate(self, theta: np.ndarray) -> Tuple[int, bool]:
+        """
+        Critical region containing a parameter point.
+
+        Args:
+            theta: Parameter [x; r]
+
+        Returns:
+            Tuple of (region index, exact); exact is False when theta lies in
+            no region (outside the box or an infeasible area) and the least
+            violated candidate is returned instead
+        """
+        cell = np.clip(((theta - self.theta_min) / self._width).astype(int), 0, self.grid_size - 1)
+        candidates, A, b, starts = self._cell_rows[int(cell @ self._strides)]
+        if len(candidates) == 0:
+            violation = np.maximum.reduceat(self.region_A @ theta - self.region_b, self.row_offsets[:-1])
+            return int(np.argmin(violation)), False
+        violation = np.maximum.reduceat(A @ theta - b, starts)
+        best = int(np.argmin(violation))
+        return int(candidates[best]), bool(violation[best] <= 1e-9)
+
+    def evaluate(self, x: ArrayLike, setpoint: Optional[ArrayLike] = None) -> np.ndarray:
+        """
+        Explicit control law at a state (and setpoint).
+
+        Args:
+            x: State [n_states]
+            setpoint: Output setpoint [n_outputs] (if setpoint_range was given)
+
+        Returns:
+            Input [n_inputs] (absolute, clipped to the input bounds)
+        """
+        theta = self._parameter(x, setpoint)
+
+        # Fast path: still in the region of the previous evaluation
+        r = self._hint
+        A, b = self._region_rows[r]
+        exact = (A @ theta <= b + 1e-9).all()
+        if not exact:
+            r, exact = self.locate(theta)
+            self._hint = r
+
+        u = self.gains[r] @ theta + self._law_offsets[r]
+        u_min, u_max = self._u_bounds
+        if not exact and (u_min is not None or u_max is not None):
+            u = np.clip(u, u_min, u_max)
+        return u
+
+    def reset(self):
+        """Reset held input."""
+        self.last_update_time = None
+        self._u_output = self.u_nominal.copy()
+
+    def update(
+        self,
+        t: float,
+        setpoint: Optional[ArrayLike],
+        measurement: ArrayLike
+    ) -> np.ndarray:
+        """
+        Update explicit MPC and calculate control output.
+
+        Calls less than one sample time after the previous update return the
+        held input.
+
+        Args:
+            t: Current time
+            setpoint: Output setpoint(s) (ignored by a regulator)
+            measurement: Measured state [n_states]
+
+        Returns:
+            Manipulated variables [n_inputs]
+        """
+        if (self.last_update_time is not None
+                and t - self.last_update_time < self.sample_time * (1.0 - 1e-9)):
+            return self._u_output.copy()
+        self.last_update_time = t
+        self._u_output = self.evaluate(measurement, setpoint)
+        return self._u_output.copy()
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+
+    def save(self, file) -> None:
+        """
+        Write the region table to a compressed .npz file.
+
+        Args:
+            file: Path or binary file object
+        """
+        u_min, u_max = self._u_bounds
+        nan = np.full(self.n_inputs, np.nan)
+        np.savez_compressed(
+            file,
+            format_version=FORMAT_VERSION,
+            name=np.array(self.name),
+            dimensions=np.array([self.n_states, self.n_inputs, self.n_setpoints, self.grid_size]),
+            sample_time=self.sample_time,
+            u_nominal=self.u_nominal,
+            u_bounds=np.vstack([nan if u_min is None else u_min, nan if u_max is None else u_max]),
+            theta_min=self.theta_min,
+            theta_max=self.theta_max,
+            gains=self.gains,
+            offsets=self.offsets,
+            region_A=self.region_A,
+            region_b=self.region_b,
+            row_offsets=self.row_offsets.astype(np.int32),
+            cell_offsets=self.cell_offsets.astype(np.int32),
+            cell_regions=self.cell_regions
+        )
+
+    @classmethod
+    def load(cls, file) -> 'ExplicitMPC':
+        """
+        Read a region table written by save().
+
+        The loaded controller evaluates the stored law; it has no model and
+        cannot solve the QP online.
+
+        Args:
+            file: Path or binary file object
+
+        Returns:
+            ExplicitMPC ready for update()/evaluate()
+        """
+        with np.load(file) as data:
+            if int(data['format_version']) != FORMAT_VERSION:
+                raise ValueError(f"Unsupported explicit MPC table version {int(data['format_version'])}")
+            controller = cls.__new__(cls)
+            controller.model = None
+            controller.name = str(data['name'])
+            (controller.n_states, controller.n_inputs,
+             controller.n_setpoints, controller.grid_size) = (int(v) for v in data['dimensions'])
+            controller.sample_time = float(data['sample_time'])
+            controller.u_nominal = data['u_nominal']
+            u_min, u_max = data['u_bounds']
+            controller._u_bounds = (None if np.all(np.isnan(u_min)) else u_min,
+                                    None if np.all(np.isnan(u_max)) else u_max)
+            controller.theta_min, controller.theta_max = data['theta_min'], data['theta_max']
+            controller.gains, controller.offsets = data['gains'], data['offsets']
+            controller.region_A, controller.region_b = data['region_A'], data['region_b']
+            controller.row_offsets = data['row_offsets'].astype(np.int64)
+            controller.cell_offsets = data['cell_offsets'].astype(np.int64)
+            controller.cell_regions = data['cell_regions']
+        controller._prepare_lookup()
+        controller.reset()
+        return controller
+
+    def describe(self) -> Dict[str, Any]:
+        """
+        Description of the explicit MPC controller.
+
+        Returns:
+            Dictionary with the formulation, region table size and index.
+        """
+        return {
+            'class_name': 'ExplicitMPC',
+            'description': 'Explicit (multiparametric) MPC with a critical-region lookup table',
+            'purpose': 'Constrained MPC for small, fast loops without an online QP',
+            'formulation': {
+                'cost': 'Tracking of steady-state target with terminal LQR cost',
+                'parameters': 'theta = [x; r]' if self.n_setpoints else 'theta = x',
+                'control_law': 'u = K_i theta + k_i on critical region i'
+            },
+            'dimensions': {
+                'n_states': self.n_states,
+                'n_inputs': self.n_inputs,
+                'n_parameters': int(self.theta_min.size)
+            },
+            'region_table': {
+                'n_regions': self.n_regions,
+                'n_inequalities': int(self.region_A.shape[0]),
+                'index': f'uniform grid, {self.grid_size} cells per dimension',
+                'mean_regions_per_cell': float(np.diff(self.cell_offsets).mean())
+            },
+            'parameter_box': {
+                'lower': self.theta_min.tolist(),
+                'upper': self.theta_max.tolist()
+            },
+            'sample_time': self.sample_time
+        }
@@ -0,0 +1,102 @@
+import io
+import pytest
+import numpy as np
+from sproclib.controller.mpc.ExplicitMPC import ExplicitMPC
+from sproclib.controller.state_space.StateSpaceController import StateSpaceModel
+
+
+@pytest.fixture(scope="module")
+def tracking_controller():
+    """Explicit MPC over state and setpoint with input bounds (built once)."""
+    model = StateSpaceModel(np.array([[-1.0, 0.0], [0.5, -0.5]]), np.array([[1.0], [0.0]]),
+                            np.array([[0.0, 1.0]]))
+    return ExplicitMPC(model, 0.5, state_range=([-3, -3], [3, 3]), setpoint_range=(-1, 1),
+                       prediction_horizon=4, u_min=-1.0, u_max=1.0)
+
+
+class TestExplicitMPC:
+    @pytest.fixture
+    def siso_model(self):
+        """First-order plus lag SISO model (two states)."""
+        A = np.array([[-1.0, 0.0], [0.5, -0.5]])
+        B = np.array([[1.0], [0.0]])
+        C = np.array([[0.0, 1.0]])
+        return StateSpaceModel(A, B, C, name="TwoTank")
+
+    def test_explicit_law_matches_online_qp(self, tracking_controller):
+        """Region lookup plus affine map reproduces the QP solution."""
+        mpc = tracking_controller
+        assert mpc.n_regions > 1
+        rng = np.random.default_rng(1)
+        for theta in rng.uniform(mpc.theta_min, mpc.theta_max, size=(100, 3)):
+            region, exact = mpc.locate(theta)
+            assert exact
+            np.testing.assert_allclose(mpc.evaluate(theta[:2], theta[2:]),
+                                       mpc.solve_online(theta[:2], theta[2:]), atol=1e-8)
+
+    def test_state_constraints(self):
+        """Double integrator with speed limits: law matches the QP and bounds hold."""
+        model = StateSpaceModel(np.array([[0.0, 1.0], [0.0, 0.0]]), np.array([[0.0], [1.0]]),
+                                np.array([[1.0, 0.0]]))
+        mpc = ExplicitMPC(model, 0.5, state_range=([-5, -1.5], [5, 1.5]), prediction_horizon=4,
+                          u_min=-1.0, u_max=1.0, x_min=[-10, -1.5], x_max=[10, 1.5])
+        rng = np.random.default_rng(2)
+        for x in rng.uniform(mpc.theta_min, mpc.theta_max, size=(50, 2)):
+            u = mpc.evaluate(x)
+            assert -1.0 - 1e-9 <= u[0] <= 1.0 + 1e-9
+            np.testing.assert_allclose(u, mpc.solve_online(x), atol=1e-8)
+
+    def test_save_and_load(self, tracking_controller):
+        """Region table round-trips through the binary format."""
+        buffer = io.BytesIO()
+        tracking_controller.save(buffer)
+        buffer.seek(0)
+        loaded = ExplicitMPC.load(buffer)
+
+        assert loaded.n_regions == tracking_controller.n_regions
+        assert loaded.model is None
+        rng = np.random.default_rng(3)
+        for theta in rng.uniform(loaded.theta_min, loaded.theta_max, size=(20, 3)):
+            np.testing.assert_array_equal(loaded.evaluate(theta[:2], theta[2:]),
+                                          tracking_controller.evaluate(theta[:2], theta[2:]))
+
+    def test_save_to_file(self, tracking_controller, tmp_path):
+        path = tmp_path / "table.npz"
+        tracking_controller.save(path)
+        assert ExplicitMPC.load(path).n_regions == tracking_controller.n_regions
+
+    def test_outside_parameter_box(self, tracking_controller):
+        """Points outside the explored box use the nearest region, clipped to bounds."""
+        u = tracking_controller.evaluate([10.0, -10.0], 0.0)
+        assert -1.0 <= u[0] <= 1.0
+
+    def test_closed_loop_tracking(self, tracking_controller):
+        """Closed loop reaches the setpoint with input bounds respected."""
+        mpc = tracking_controller
+        mpc.reset()
+        Ad, Bd, Cd, _ = mpc.model.discretize(0.5)
+        x, inputs = np.zeros(2), []
+        for k in range(60):
+            u = mpc.update(0.5 * k, 0.8, x)
+            x = Ad @ x + Bd @ u
+            inputs.append(u[0])
+        assert np.all(np.abs(inputs) <= 1.0 + 1e-9)
+        assert (Cd @ x)[0] == pytest.approx(0.8, abs=1e-6)
+
+    def test_sample_and_hold(self, tracking_controller):
+        mpc = tracking_controller
+        mpc.reset()
+        u0 = mpc.update(0.0, 0.5, [0.0, 0.0])
+        np.testing.assert_array_equal(mpc.update(0.2, 0.5, [1.0, 1.0]), u0)
+
+    def test_invalid_parameters(self, siso_model):
+        with pytest.raises(ValueError):
+            ExplicitMPC(siso_model, 0.0, state_range=([-1, -1], [1, 1]))
+        with pytest.raises(ValueError):
+            ExplicitMPC(siso_model, 0.1, state_range=([1, -1], [1, 1]))
+
+    def test_describe(self, tracking_controller):
+        info = tracking_controller.describe()
+        assert info['class_name'] == 'ExplicitMPC'
+        assert info['region_table']['n_regions'] == tracking_controller.n_regions
+        assert info['dimensions']['n_parameters'] == 3
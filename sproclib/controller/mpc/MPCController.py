@@ -0,0 +1,586 @@
+"""
+Model Predictive Controller for SPROCLIB
+
+This module provides a condensed, constrained linear MPC. Prediction
+matrices are built once from the sampled state-space model (block-Toeplitz
+in the step-response coefficients), the Hessian is factorized with
+Cholesky, and each sample solves a QP with input, input-rate and output
+constraints by a warm-started ADMM method implemented here.
+
+Author: Thorsten Gressling <gressling@paramus.ai>
+License: MIT License
+"""
+
+import numpy as np
+import time
+from typing import Optional, Dict, Any, Tuple, Union
+import logging
+from scipy.linalg import cho_factor, cho_solve, solve_triangular
+
+from ..state_space.StateSpaceController import StateSpaceModel
+from ...utilities.buffers import RingBuffer
+
+logger = logging.getLogger(__name__)
+
+ArrayLike = Union[float, np.ndarray]
+
+
+def prediction_matrices(
+    Ad: np.ndarray,
+    Bd: np.ndarray,
+    C: np.ndarray,
+    prediction_horizon: int,
+    control_horizon: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Condensed output predictions in velocity form.
+
+    Y = Psi x[k] + Upsilon u[k-1] + Theta dU, with Y = [y[k+1]; ...; y[k+N]]
+    and dU = [du[k]; ...; du[k+M-1]] (input held after the control horizon).
+    Theta is block-Toeplitz in the step-response matrices
+    S_q = sum_{l<q} C Ad^l Bd.
+
+    Args:
+        Ad, Bd: Discrete-time state and input matrices
+        C: Output matrix
+        prediction_horizon: Prediction horizon N
+        control_horizon: Control horizon M (default: N)
+
+    Returns:
+        Tuple of (Psi [N*p x n], Upsilon [N*p x m], Theta [N*p x M*m])
+    """
+    N = prediction_horizon
+    M = N if control_horizon is None else min(control_horizon, N)
+    n, m = Bd.shape
+    p = C.shape[0]
+
+    # C Ad^i for i = 0..N
+    CA = np.empty((N + 1, p, n))
+    CA[0] = C
+    for i in range(N):
+        CA[i + 1] = CA[i] @ Ad
+
+    # Step-response matrices S_q, q = 0..N (S_0 = 0)
+    S = np.zeros((N + 1, p, m))
+    S[1:] = np.cumsum(CA[:N] @ Bd, axis=0)
+
+    Psi = CA[1:].reshape(N * p, n)
+    Upsilon = S[1:].reshape(N * p, m)
+
+    # Theta[i, j] = S_{i+1-j} for j <= i (block row i predicts y[k+i+1])
+    lag = np.arange(N)[:, None] + 1 - np.arange(M)[None, :]
+    blocks = S[np.clip(lag, 0, N)] * (lag > 0)[:, :, None, None]
+    Theta = blocks.transpose(0, 2, 1, 3).reshape(N * p, M * m)
+
+    return Psi, Upsilon, Theta
+
+
+class MPCController:
+    """
+    Constrained linear Model Predictive Controller.
+
+    Minimizes sum ||y[k+i] - r||²_Q + sum ||du[k+j]||²_R over the control
+    moves subject to input, input-rate and output bounds. The internal model
+    runs open loop on the applied inputs and a constant output disturbance
+    d = y - C x (DMC-style) gives offset-free tracking.
+    """
+
+    def __init__(
+        self,
+        model: StateSpaceModel,
+        sample_time: float,
+        prediction_horizon: int = 20,
+        control_horizon: Optional[int] = None,
+        Q: Optional[ArrayLike] = None,
+        R: Optional[ArrayLike] = None,
+        u_min: Optional[ArrayLike] = None,
+        u_max: Optional[ArrayLike] = None,
+        du_min: Optional[ArrayLike] = None,
+        du_max: Optional[ArrayLike] = None,
+        y_min: Optional[ArrayLike] = None,
+        y_max: Optional[ArrayLike] = None,
+        u_nominal: Optional[ArrayLike] = None,
+        y_nominal: Optional[ArrayLike] = None,
+        rho: float = 0.1,
+        tolerance: float = 1e-6,
+        max_iterations: int = 4000,
+        stats_length: int = 1000,
+        name: str = "MPCController"
+    ):
+        """
+        Initialize MPC controller.
+
+        Args:
+            model: Continuous-time state-space model (deviation variables)
+            sample_time: Controller sample time
+            prediction_horizon: Prediction horizon N (samples)
+            control_horizon: Control horizon M (samples, default: N)
+            Q: Output tracking weight (scalar, vector or matrix; default: identity)
+            R: Input move weight (scalar, vector or matrix; default: 0.1 identity)
+            u_min, u_max: Input bounds (absolute values)
+            du_min, du_max: Input rate bounds per sample
+            y_min, y_max: Output bounds (absolute values, soft only through
+                the solver tolerance)
+            u_nominal, y_nominal: Operating point of the linear model
+            rho: ADMM penalty parameter (adapted during the solve)
+            tolerance: Absolute/relative QP residual tolerance
+            max_iterations: Maximum ADMM iterations per sample
+            stats_length: Number of recent solves kept in the statistics buffer
+            name: Controller name
+        """
+        if sample_time <= 0:
+            raise ValueError("Sample time must be positive")
+        if prediction_horizon < 1:
+            raise ValueError("Prediction horizon must be at least 1")
+
+        self.model = model
+        self.sample_time = float(sample_time)
+        self.N = int(prediction_horizon)
+        self.M = self.N if control_horizon is None else int(min(control_horizon, self.N))
+        self.name = name
+        self.rho = rho
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+
+        n, m, p = model.n_states, model.n_inputs, model.n_outputs
+        self.n_states, self.n_inputs, self.n_outputs = n, m, p
+
+        self.Q = self._weight(1.0 if Q is None else Q, p)
+        self.R = self._weight(0.1 if R is None else R, m)
+        self.u_nominal = self._vector(0.0 if u_nominal is None else u_nominal, m)
+        self.y_nominal = self._vector(0.0 if y_nominal is None else y_nominal, p)
+
+        # Sampled model and condensed predictions
+        self.Ad, self.Bd, _, _ = model.discretize(self.sample_time, 'zoh')
+        self.C = np.asarray(model.C, dtype=float)
+        self.Psi, self.Upsilon, self.Theta = prediction_matrices(self.Ad, self.Bd, self.C, self.N, self.M)
+
+        # Cost 1/2 dU' H dU + g' dU, H = Theta' Qbar Theta + Rbar
+        Q_bar = np.kron(np.eye(self.N), self.Q)
+        self._QTheta = Q_bar @ self.Theta
+        self.H = self.Theta.T @ self._QTheta + np.kron(np.eye(self.M), self.R)
+        self.H = (self.H + self.H.T) / 2
+        self._H_factor = cho_factor(self.H)
+
+        self._build_constraints(u_min, u_max, du_min, du_max, y_min, y_max)
+
+        # Controller state
+        self._stats = RingBuffer(stats_length, width=4)  # t, solve time, iterations, residual
+        self.reset()
+
+        logger.info(f"MPCController '{name}' initialized: N={self.N}, M={self.M}, "
+                    f"{self._A_con.shape[0]} constraints")
+
+    def _weight(self, value: ArrayLike, size: int) -> np.ndarray:
+        value = np.asarray(value, dtype=float)
+        if value.ndim < 2:
+            value = np.diag(np.broadcast_to(value, (size,)))
+        if value.shape != (size, size):
+            raise ValueError(f"Weight must be a scalar, a length-{size} vector or a {size}x{size} matrix")
+        return value
+
+    def _vector(self, value: ArrayLike, size: int) -> np.ndarray:
+        return np.broadcast_to(np.asarray(value, dtype=float), (size,)).copy()
+
+    def _build_constraints(self, u_min, u_max, du_min, du_max, y_min, y_max):
+        """Constant constraint matrix of l <= A_con dU <= u; bounds are set per sample."""
+        m, p, M, N = self.n_inputs, self.n_outputs, self.M, self.N
+        rows = []
+        self._bounds = {}
+
+        if du_min is not None or du_max is not None:
+            rows.append(np.eye(M * m))
+            self._bounds['du'] = (np.tile(self._vector(-np.inf if du_min is None else du_min, m), M),
+                                  np.tile(self._vector(np.inf if du_max is None else du_max, m), M))
+        if u_min is not None or u_max is not None:
+            rows.append(np.kron(np.tril(np.ones((M, M))), np.eye(m)))
+            self._bounds['u'] = (self._vector(-np.inf if u_min is None else u_min, m) - self.u_nominal,
+                                 self._vector(np.inf if u_max is None else u_max, m) - self.u_nominal)
+        if y_min is not None or y_max is not None:
+            rows.append(self.Theta)
+            self._bounds['y'] = (self._vector(-np.inf if y_min is None else y_min, p) - self.y_nominal,
+                                 self._vector(np.inf if y_max is None else y_max, p) - self.y_nominal)
+
+        self._A_con = np.vstack(rows) if rows else np.zeros((0, M * m))
+        self._equilibrate()
+
+        # Rows without finite bounds only need a tiny penalty, equality rows a large one
+        lower, upper = self._row_bounds()
+        self._loose = np.isinf(lower) & np.isinf(upper)
+        self._equality = lower == upper
+        self._factor_kkt(self.rho)
+
+    def _row_bounds(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Bounds of the stacked constraints up to their per-sample shift (for row classification)."""
+        lower, upper = [], []
+        for name, repeat in (('du', 1), ('u', self.M), ('y', self.N)):
+            if name in self._bounds:
+                lower.append(np.tile(self._bounds[name][0], repeat))
+                upper.append(np.tile(self._bounds[name][1], repeat))
+        if not lower:
+            return np.zeros(0), np.zeros(0)
+        return np.concatenate(lower), np.concatenate(upper)
+
+    def _equilibrate(self, iterations: int = 15):
+        """
+        Ruiz equilibration of the QP data.
+
+        The solver works on x̄ = D⁻¹x with H̄ = c D H D, Ā = E A D and bounds
+        scaled by E, so that all rows and columns of the KKT matrix have
+        comparable norms. This removes the ill-conditioning of the stacked
+        output-prediction rows that otherwise stalls ADMM.
+        """
+        H, A = self.H, self._A_con
+        D, E = np.ones(H.shape[0]), np.ones(A.shape[0])
+        H_s, A_s = H.copy(), A.copy()
+        for _ in range(iterations):
+            columns = np.abs(H_s).max(axis=0)
+            if A_s.shape[0]:
+                columns = np.maximum(columns, np.abs(A_s).max(axis=0))
+            d = 1.0 / np.sqrt(np.clip(columns, 1e-4, 1e4))
+            e = 1.0 / np.sqrt(np.clip(np.abs(A_s).max(axis=1), 1e-4, 1e4)) if A_s.shape[0] else E
+            H_s = d[:, None] * H_s * d[None, :]
+            A_s = e[:, None] * A_s * d[None, :]
+            D, E = D * d, E * e
+        c = 1.0 / np.clip(np.abs(H_s).max(axis=0).mean(), 1e-4, 1e4)
+        self._D, self._E, self._c = D, E, c
+        self._H_scaled, self._A_scaled = c * H_s, A_s
+        self._L_inv = solve_triangular(np.linalg.cholesky(self._H_scaled), np.eye(len(D)), lower=True)
+
+    def _factor_kkt(self, rho: float):
+        """Cholesky factor of H̄ + sigma I + Ā' diag(rho) Ā used by every ADMM iteration."""
+        self._rho = rho
+        self._sigma = 1e-6
+        self._rho_vector = np.where(self._loose, 1e-6, np.where(self._equality, 1e3 * rho, rho))
+        A = self._A_scaled
+        K = self._H_scaled + self._sigma * np.eye(self.H.shape[0]) + A.T @ (self._rho_vector[:, None] * A)
+        self._kkt_factor = cho_factor(K)
+
+    def reset(self):
+        """Reset internal model, held input and solver warm start."""
+        self.x_hat = np.zeros(self.n_states)
+        self.u_prev = np.zeros(self.n_inputs)  # deviation from u_nominal
+        self.last_update_time = None
+        self._u_output = self.u_nominal.copy()
+        self._dU = np.zeros(self.M * self.n_inputs)
+        self._y_dual = np.zeros(self._A_con.shape[0])
+        self._stats.clear()
+        self.last_solve = {'solve_time': 0.0, 'iterations': 0, 'residual': 0.0, 'status': 'not_run'}
+
+    def update(
+        self,
+        t: float,
+        setpoint: ArrayLike,
+        measurement: ArrayLike
+    ) -> np.ndarray:
+        """
+        Update MPC controller and calculate control output.
+
+        Calls less than one sample time after the previous update return the
+        held input.
+
+        Args:
+            t: Current time
+            setpoint: Output setpoint(s) (scalar or [n_outputs])
+            measurement: Measured output(s) (scalar or [n_outputs])
+
+        Returns:
+            Manipulated variables [n_inputs]
+        """
+        if self.last_update_time is not None:
+            if t - self.last_update_time < self.sample_time * (1.0 - 1e-9):
+                return self._u_output.copy()
+            # Advance the internal model over the elapsed sample
+            self.x_hat = self.Ad @ self.x_hat + self.Bd @ self.u_prev
+        self.last_update_time = t
+
+        y = self._vector(measurement, self.n_outputs) - self.y_nominal
+        r = self._vector(setpoint, self.n_outputs) - self.y_nominal
+        disturbance = y - self.C @ self.x_hat
+
+        # Free response and linear cost term
+        free = (self.Psi @ self.x_hat + self.Upsilon @ self.u_prev
+                + np.tile(disturbance, self.N))
+        g = self._QTheta.T @ (free - np.tile(r, self.N))
+
+        start = time.perf_counter()
+        if self._A_con.shape[0] == 0:
+            dU = -cho_solve(self._H_factor, g)
+            iterations, residual, status = 0, 0.0, 'solved'
+        else:
+            lower, upper = self._constraint_bounds(free)
+            dU, iterations, residual, status = self._solve_admm(g, lower, upper)
+        solve_time = time.perf_counter() - start
+
+        # Enforce the hard input bounds exactly (the QP meets them to tolerance)
+        du = dU[:self.n_inputs]
+        if 'du' in self._bounds:
+            du = np.clip(du, self._bounds['du'][0][:self.n_inputs], self._bounds['du'][1][:self.n_inputs])
+        u = self.u_prev + du
+        if 'u' in self._bounds:
+            u = np.clip(u, *self._bounds['u'])
+        self.u_prev = u
+
+        # Warm start for the next sample: shift the move sequence
+        self._dU = np.concatenate([dU[self.n_inputs:], np.zeros(self.n_inputs)])
+
+        self.last_solve = {'solve_time': solve_time, 'iterations': iterations,
+                           'residual': residual, 'status': status}
+        self._stats.append(t, solve_time, iterations, residual)
+        if status != 'solved':
+            logger.warning(f"MPC '{self.name}' QP {status} at t={t} after {iterations} iterations")
+
+        self._u_output = self.u_nominal + u
+        return self._u_output.copy()
+
+    def _constraint_bounds(self, free: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Bounds l, u of the stacked constraints for the current sample."""
+        lower, upper = [], []
+        if 'du' in self._bounds:
+            lower.append(self._bounds['du'][0])
+            upper.append(self._bounds['du'][1])
+        if 'u' in self._bounds:
+            lower.append(np.tile(self._bounds['u'][0] - self.u_prev, self.M))
+            upper.append(np.tile(self._bounds['u'][1] - self.u_prev, self.M))
+        if 'y' in self._bounds:
+            lower.append(np.tile(self._bounds['y'][0], self.N) - free)
+            upper.append(np.tile(self._bounds['y'][1], self.N) - free)
+        return np.concatenate(lower), np.concatenate(upper)
+
+    def _solve_admm(
+        self,
+        g: np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray
+    ) -> Tuple[np.ndarray, int, float, str]:
+        """
+        Solve min 1/2 x'Hx + g'x s.t. lower <= A x <= upper (OSQP-type ADMM).
+
+        Iterates on the equilibrated problem. Every 10 iterations convergence
+        is tested on the unscaled residuals, and the iterate is polished by
+        a dual active-set solve seeded from its duals; rho is rebalanced from the normalized residuals (as
+        in OSQP) at most every 50 iterations.
+
+        Returns:
+            Tuple of (solution, iterations, primal residual, status)
+        """
+        A, H = self._A_scaled, self._H_scaled
+        D, E, c = self._D, self._E, self._c
+        sigma, alpha = self._sigma, 1.6
+        q = c * D * g
+        lower, upper = E * lower, E * upper
+        x = self._dU / D
+        z = np.clip(A @ x, lower, upper)
+        y = self._y_dual.copy()
+
+        status, r_prim = 'max_iterations', np.inf
+        for iteration in range(1, self.max_iterations + 1):
+            rho = self._rho_vector
+            x_tilde = cho_solve(self._kkt_factor, sigma * x - q + A.T @ (rho * z - y))
+            z_tilde = A @ x_tilde
+            x = alpha * x_tilde + (1 - alpha) * x
+            z_relaxed = alpha * z_tilde + (1 - alpha) * z
+            z_new = np.clip(z_relaxed + y / rho, lower, upper)
+            y = y + rho * (z_relaxed - z_new)
+            z = z_new
+
+            if iteration % 10 == 0 or iteration == self.max_iterations:
+                r_prim, converged = self._converged(x, z, y, q, g)
+                if converged:
+                    status = 'solved'
+                    break
+
+                # Polish: finish exactly with an active-set solve seeded from the ADMM duals
+                polished = self._polish(x, z, y, q, lower, upper)
+                if polished is not None:
+                    x_p, z_p, y_p = polished
+                    r_polished, converged = self._converged(x_p, z_p, y_p, q, g)
+                    if converged:
+                        x, y, r_prim, status = x_p, y_p, r_polished, 'solved'
+                        break
+
+                if iteration % 50 == 0:
+                    # Rebalance rho (and refactor) when the normalized residuals drift apart
+                    Ax, Hx, ATy = A @ x, H @ x, A.T @ y
+                    prim = np.max(np.abs(Ax - z)) / (max(np.max(np.abs(Ax)), np.max(np.abs(z))) + 1e-12)
+                    dual = np.max(np.abs(Hx + q + ATy)) / (max(np.max(np.abs(Hx)), np.max(np.abs(ATy)),
+                                                              np.max(np.abs(q))) + 1e-12)
+                    ratio = np.sqrt(prim / (dual + 1e-12))
+                    if ratio > 5.0 or ratio < 0.2:
+                        self._factor_kkt(float(np.clip(self._rho * ratio, 1e-6, 1e6)))
+
+        self._y_dual = y
+        return D * x, iteration, float(r_prim), status
+
+    def _converged(self, x: np.ndarray, z: np.ndarray, y: np.ndarray, q: np.ndarray,
+                   g: np.ndarray) -> Tuple[float, bool]:
+        """Primal residual and convergence test on the unscaled QP residuals."""
+        A, H, D, E, c, eps = self._A_scaled, self._H_scaled, self._D, self._E, self._c, self.tolerance
+        Ax, Hx, ATy = A @ x, H @ x, A.T @ y
+        r_prim = np.max(np.abs((Ax - z) / E))
+        r_dual = np.max(np.abs((Hx + q + ATy) / (c * D)))
+        scale_prim = max(np.max(np.abs(Ax / E)), np.max(np.abs(z / E)))
+        scale_dual = max(np.max(np.abs(Hx / (c * D))), np.max(np.abs(ATy / (c * D))), np.max(np.abs(g)))
+        return float(r_prim), bool(r_prim <= eps * (1 + scale_prim) and r_dual <= eps * (1 + scale_dual))
+
+    def _polish(
+        self,
+        x: np.ndarray,
+        z: np.ndarray,
+        y: np.ndarray,
+        q: np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray
+    ) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Polish the ADMM iterate with a dual active-set method on the scaled QP.
+
+        Constraints whose ADMM dual pushes against a bound seed the working
+        set; rows with negative multipliers are released until the start is
+        dual feasible. Goldfarb-Idnani iterations then add the most violated
+        constraint, taking partial steps that release blocking rows. This
+        terminates finitely also for the (nearly) redundant output rows of a
+        saturated prediction horizon, where ADMM converges slowly.
+
+        Returns:
+            Polished (x, z, y), or None if the iterations do not finish
+        """
+        A, H = self._A_scaled, self._H_scaled
+        n = len(x)
+        # Inequalities C x >= b: one row per finite lower and upper bound
+        finite_lower, finite_upper = np.flatnonzero(np.isfinite(lower)), np.flatnonzero(np.isfinite(upper))
+        rows = np.concatenate([finite_lower, finite_upper])
+        sign = np.concatenate([np.ones(len(finite_lower)), -np.ones(len(finite_upper))])
+        C = sign[:, None] * A[rows]
+        b = sign * np.concatenate([lower[finite_lower], upper[finite_upper]])
+        tolerance = 1e-10 * (1 + np.max(np.abs(b), initial=0.0))
+
+        L_inv = self._L_inv
+        working = list(np.flatnonzero(np.concatenate([(z - lower < -y)[finite_lower],
+                                                      (upper - z < y)[finite_upper]])))
+
+        def factor(working):
+            # J = L^-T Q and R from the QR factorization of L^-1 N
+            Q, R = np.linalg.qr(L_inv @ C[working].T, mode='complete')
+            return L_inv.T @ Q, R[:len(working), :len(working)]
+
+        # Dual-feasible start: independent seed rows with non-negative multipliers
+        independent = []
+        for row in working:
+            if len(independent) < n and (not independent or abs(factor(independent + [row])[1][-1, -1]) > 1e-9):
+                independent.append(row)
+        working = independent
+        while True:
+            J, R = factor(working)
+            k = len(working)
+            x_p = -J[:, k:] @ (J[:, k:].T @ q)
+            if k:
+                # Particular solution of C_W x = b_W plus the null-space minimizer
+                x_p += J[:, :k] @ solve_triangular(R, b[working], trans='T')
+                u = solve_triangular(R, J[:, :k].T @ (H @ x_p + q))
+                if np.min(u) < 0:
+                    working.pop(int(np.argmin(u)))
+                    continue
+            else:
+                u = np.zeros(0)
+            break
+
+        for _ in range(4 * len(b) + 10):
+            slack = C @ x_p - b
+            p = int(np.argmin(slack)) if len(b) else 0
+            if not len(b) or slack[p] >= -tolerance:
+                y_p = np.zeros_like(y)
+                np.add.at(y_p, rows[working], -sign[working] * u)
+                return x_p, np.clip(A @ x_p, lower, upper), y_p
+            u_p = 0.0
+            while True:
+                J, R = factor(working)
+                k = len(working)
+                d = J.T @ C[p]
+                step = J[:, k:] @ d[k:]
+                r = solve_triangular(R, d[:k]) if k else np.zeros(0)
+                blocking = np.flatnonzero(r > 1e-12)
+                t_partial, drop = np.inf, None
+                if len(blocking):
+                    ratios = u[blocking] / r[blocking]
+                    drop = int(blocking[np.argmin(ratios)])
+                    t_partial = float(np.min(ratios))
+                curvature = step @ C[p]
+                t_full = -(C[p] @ x_p - b[p]) / curvature if curvature > 1e-12 else np.inf
+                t = min(t_partial, t_full)
+                if not np.isfinite(t):
+                    return None  # infeasible
+                if np.isfinite(t_full):
+                    x_p = x_p + t * step
+                u = u - t * r
+                u_p += t
+                if t_full <= t_partial:
+                    working.append(p)
+                    u = np.append(u, u_p)
+                    break
+                working.pop(drop)
+                u = np.delete(u, drop)
+        return None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Per-step solver statistics of the recent updates.
+
+        Returns:
+            Dictionary with arrays 't', 'solve_time', 'iterations', 'residual'
+            and their mean/max summary
+        """
+        values = self._stats.values()
+        stats = {
+            't': values[:, 0],
+            'solve_time': values[:, 1],
+            'iterations': values[:, 2].astype(int),
+            'residual': values[:, 3]
+        }
+        if len(values):
+            stats.update({
+                'mean_solve_time': float(values[:, 1].mean()),
+                'max_solve_time': float(values[:, 1].max()),
+                'mean_iterations': float(values[:, 2].mean()),
+                'max_iterations': int(values[:, 2].max())
+            })
+        return stats
+
+    def describe(self) -> Dict[str, Any]:
+        """
+        Description of the MPC controller.
+
+        Returns:
+            Dictionary with the formulation, dimensions, constraints and
+            solver settings.
+        """
+        return {
+            'class_name': 'MPCController',
+            'description': 'Condensed linear Model Predictive Controller with constrained QP',
+            'purpose': 'Multivariable control with input, rate and output constraints',
+            'formulation': {
+                'cost': 'sum ||y[k+i] - r||²_Q + sum ||du[k+j]||²_R',
+                'prediction': 'Y = Psi x + Upsilon u[k-1] + Theta dU + d (block-Toeplitz Theta)',
+                'disturbance_model': 'Constant output disturbance d = y - C x_hat',
+                'discretization': 'Zero-order hold'
+            },
+            'dimensions': {
+                'n_states': self.n_states,
+                'n_inputs': self.n_inputs,
+                'n_outputs': self.n_outputs,
+                'prediction_horizon': self.N,
+                'control_horizon': self.M,
+                'n_decision_variables': self.M * self.n_inputs,
+                'n_constraints': int(self._A_con.shape[0])
+            },
+            'constraints': sorted(self._bounds),
+            'solver': {
+                'method': 'ADMM (OSQP-type) on the Ruiz-equilibrated QP with Cholesky-factored KKT matrix',
+                'warm_start': 'Shifted move sequence and previous duals',
+                'rho': self._rho,
+                'tolerance': self.tolerance,
+                'max_iterations': self.max_iterations
+            },
+            'sample_time': self.sample_time,
+            'last_solve': dict(self.last_solve)
+        }
@@ -0,0 +1,148 @@
+import pytest
+import numpy as np
+from scipy.optimize import minimize
+from sproclib.controller.mpc.MPCController import MPCController, prediction_matrices
+from sproclib.controller.state_space.StateSpaceController import StateSpaceModel
+
+
+class TestMPCController:
+    @pytest.fixture
+    def siso_model(self):
+        """First-order plus lag SISO model (two states)."""
+        A = np.array([[-1.0, 0.0], [0.5, -0.5]])
+        B = np.array([[1.0], [0.0]])
+        C = np.array([[0.0, 1.0]])
+        return StateSpaceModel(A, B, C, name="TwoTank")
+
+    @pytest.fixture
+    def mimo_model(self):
+        """2x2 reactor model."""
+        A = np.array([[-0.5, -0.1], [0.2, -0.3]])
+        B = np.array([[0.8, 0.0], [0.0, 0.6]])
+        C = np.eye(2)
+        return StateSpaceModel(A, B, C, name="Reactor")
+
+    def test_prediction_matrices_match_simulation(self, mimo_model):
+        """Condensed predictions reproduce a step-by-step simulation."""
+        Ad, Bd, _, _ = mimo_model.discretize(0.5)
+        N, M = 6, 3
+        Psi, Upsilon, Theta = prediction_matrices(Ad, Bd, mimo_model.C, N, M)
+        assert Psi.shape == (12, 2) and Upsilon.shape == (12, 2) and Theta.shape == (12, 6)
+
+        rng = np.random.default_rng(0)
+        x0, u_prev, dU = rng.normal(size=2), rng.normal(size=2), rng.normal(size=6)
+        x, u, y = x0.copy(), u_prev.copy(), []
+        for i in range(N):
+            if i < M:
+                u = u + dU[2 * i:2 * i + 2]
+            x = Ad @ x + Bd @ u
+            y.append(mimo_model.C @ x)
+
+        np.testing.assert_allclose(Psi @ x0 + Upsilon @ u_prev + Theta @ dU, np.concatenate(y), atol=1e-12)
+
+    def test_unconstrained_move_is_least_squares_solution(self, mimo_model):
+        """Without constraints the first move solves H dU = -g directly."""
+        mpc = MPCController(mimo_model, sample_time=0.5, prediction_horizon=8, control_horizon=4)
+        u = mpc.update(0.0, [1.0, -0.5], [0.0, 0.0])
+
+        g = mpc._QTheta.T @ -np.tile([1.0, -0.5], 8)
+        dU = np.linalg.solve(mpc.H, -g)
+        np.testing.assert_allclose(u, dU[:2], atol=1e-10)
+        assert mpc.last_solve['iterations'] == 0
+
+    def test_constrained_qp_matches_reference_solver(self, mimo_model):
+        """ADMM solution agrees with a general-purpose NLP solver."""
+        mpc = MPCController(mimo_model, sample_time=0.5, prediction_horizon=8, control_horizon=4,
+                            u_min=-0.4, u_max=0.4, du_min=-0.3, du_max=0.3, y_max=[0.6, 10.0],
+                            tolerance=1e-8)
+        r = np.array([1.0, -0.5])
+        g = mpc._QTheta.T @ -np.tile(r, 8)
+        lower, upper = mpc._constraint_bounds(np.zeros(16))
+
+        u = mpc.update(0.0, r, [0.0, 0.0])
+        assert mpc.last_solve['status'] == 'solved'
+        A = mpc._A_con
+        finite_l, finite_u = np.isfinite(lower), np.isfinite(upper)
+        result = minimize(
+            lambda x: 0.5 * x @ mpc.H @ x + g @ x, np.zeros(8), jac=lambda x: mpc.H @ x + g,
+            method='SLSQP', options={'ftol': 1e-12, 'maxiter': 500},
+            constraints=[{'type': 'ineq', 'fun': lambda x: (A @ x - lower)[finite_l]},
+                         {'type': 'ineq', 'fun': lambda x: (upper - A @ x)[finite_u]}])
+        np.testing.assert_allclose(u, result.x[:2], atol=1e-4)
+
+    def test_closed_loop_tracking_with_constraints(self, siso_model):
+        """Offset-free tracking under plant mismatch with input bounds respected."""
+        mpc = MPCController(siso_model, sample_time=0.2, prediction_horizon=30, control_horizon=5,
+                            R=0.01, u_min=0.0, u_max=1.5, du_min=-0.2, du_max=0.2)
+        Ad, Bd, Cd, _ = siso_model.discretize(0.2)
+        Bd = 1.3 * Bd  # plant gain differs from the model
+        x, inputs, outputs = np.zeros(2), [], []
+        for k in range(200):
+            y = Cd @ x
+            u = mpc.update(0.2 * k, 1.0, y)
+            x = Ad @ x + Bd @ u
+            inputs.append(u[0])
+            outputs.append(y[0])
+
+        inputs = np.array(inputs)
+        assert np.all(inputs >= -1e-9) and np.all(inputs <= 1.5 + 1e-9)
+        assert np.all(np.abs(np.diff(inputs)) <= 0.2 + 1e-6)
+        assert abs(outputs[-1] - 1.0) < 1e-3
+
+    def test_active_output_constraint_converges(self, mimo_model):
+        """Every QP solves in few iterations while an output bound is active."""
+        mpc = MPCController(mimo_model, sample_time=0.2, prediction_horizon=15, control_horizon=5,
+                            y_max=[1.5, 10.0], u_min=-1.0, u_max=1.0)
+        Ad, Bd, Cd, _ = mimo_model.discretize(0.2)
+        x, outputs = np.zeros(2), []
+        for k in range(100):
+            y = Cd @ x
+            u = mpc.update(0.2 * k, [2.0, 0.5], y)
+            x = Ad @ x + Bd @ u
+            outputs.append(y)
+            assert mpc.last_solve['status'] == 'solved'
+            assert mpc.last_solve['iterations'] <= 200
+
+        outputs = np.array(outputs)
+        assert np.all(outputs[:, 0] <= 1.5 + 1e-4)
+        np.testing.assert_allclose(outputs[-1], [1.5, 0.5], atol=1e-3)
+
+    def test_sample_and_hold(self, siso_model):
+        """Calls within one sample period return the held input."""
+        mpc = MPCController(siso_model, sample_time=1.0)
+        u0 = mpc.update(0.0, 1.0, 0.0)
+        np.testing.assert_array_equal(mpc.update(0.4, 1.0, 0.3), u0)
+        assert len(mpc.get_statistics()['t']) == 1
+        mpc.update(1.0, 1.0, 0.3)
+        assert len(mpc.get_statistics()['t']) == 2
+
+    def test_solver_statistics(self, siso_model):
+        """Per-step solve time and iteration counts are recorded."""
+        mpc = MPCController(siso_model, sample_time=0.2, u_min=0.0, u_max=0.5, stats_length=5)
+        for k in range(8):
+            mpc.update(0.2 * k, 2.0, 0.0)
+        stats = mpc.get_statistics()
+        assert len(stats['t']) == 5
+        assert np.all(stats['solve_time'] > 0)
+        assert stats['max_iterations'] >= 1
+        assert mpc.last_solve['status'] == 'solved'
+
+    def test_nominal_operating_point(self, siso_model):
+        """Absolute setpoints, measurements and bounds around a nominal point."""
+        mpc = MPCController(siso_model, sample_time=0.2, u_nominal=10.0, y_nominal=50.0,
+                            u_min=9.0, u_max=12.0)
+        assert mpc.update(0.0, 50.0, 50.0)[0] == pytest.approx(10.0)
+        assert 10.0 < mpc.update(0.2, 55.0, 50.0)[0] <= 12.0
+
+    def test_invalid_parameters(self, siso_model):
+        with pytest.raises(ValueError):
+            MPCController(siso_model, sample_time=0.0)
+        with pytest.raises(ValueError):
+            MPCController(siso_model, sample_time=0.1, Q=np.eye(3))
+
+    def test_describe(self, mimo_model):
+        mpc = MPCController(mimo_model, sample_time=0.5, u_min=-1, u_max=1)
+        info = mpc.describe()
+        assert info['class_name'] == 'MPCController'
+        assert info['dimensions']['n_decision_variables'] == 40
+        assert info['constraints'] == ['u']
@@ -0,0 +1,24 @@
+"""
+Model Predictive Control for SPROCLIB - Standard Process Control Library
+
+This package provides constrained linear Model Predictive Control.
+
+Classes:
+    MPCController: Condensed MPC with input, rate and output constraints
+    ExplicitMPC: Explicit MPC with a critical-region lookup table
+
+Functions:
+    prediction_matrices: Block-Toeplitz output prediction matrices
+
+Author: Thorsten Gressling <gressling@paramus.ai>
+License: MIT License
+"""
+
+from .MPCController import MPCController, prediction_matrices
+from .ExplicitMPC import ExplicitMPC
+
+__all__ = [
+    'MPCController',
+    'ExplicitMPC',
+    'prediction_matrices'
+]
@@ -0,0 +1,78 @@
+"""
+Explicit MPC Benchmark
+
+This script compares the online cost of explicit MPC (region lookup plus
+one affine map) with solving the constrained MPC QP every sample, for a
+small two-state loop with input bounds. The online QPs are the warm-started
+ADMM of MPCController and the active-set solve of the same problem that
+ExplicitMPC precomputes.
+
+Usage:
+    python -m sproclib.controller.mpc.benchmark_explicit
+
+Author: Thorsten Gressling <gressling@paramus.ai>
+License: MIT License
+"""
+
+import io
+import time
+import numpy as np
+
+from sproclib.controller.state_space.StateSpaceController import StateSpaceModel
+from sproclib.controller.mpc.MPCController import MPCController
+from sproclib.controller.mpc.ExplicitMPC import ExplicitMPC
+
+
+def closed_loop(controller, Ad, Bd, n_steps: int, sample_time: float, full_state: bool) -> float:
+    """Average time [s] per controller update over a setpoint-tracking run."""
+    x = np.zeros(Ad.shape[0])
+    elapsed = 0.0
+    for k in range(n_steps):
+        setpoint = 1.0 if (k // 50) % 2 == 0 else -0.5
+        measurement = x if full_state else x[1:]
+        start = time.perf_counter()
+        u = controller.update(k * sample_time, setpoint, measurement)
+        elapsed += time.perf_counter() - start
+        x = Ad @ x + Bd @ u
+    return elapsed / n_steps
+
+
+def main():
+    """Run the explicit MPC benchmark."""
+    model = StateSpaceModel(np.array([[-1.0, 0.0], [0.5, -0.5]]), np.array([[1.0], [0.0]]),
+                            np.array([[0.0, 1.0]]), name="TwoTank")
+    Ts, N = 0.5, 5
+    Ad, Bd, _, _ = model.discretize(Ts)
+
+    explicit = ExplicitMPC(model, Ts, state_range=([-3, -3], [3, 3]), setpoint_range=(-1.5, 1.5),
+                           prediction_horizon=N, u_min=-1.0, u_max=1.0)
+    online = MPCController(model, Ts, prediction_horizon=N, u_min=-1.0, u_max=1.0)
+
+    buffer = io.BytesIO()
+    explicit.save(buffer)
+
+    print("=" * 62)
+    print("Explicit MPC vs. online QP (2 states, 1 input, N = 5)")
+    print("=" * 62)
+    print(f"Offline build:      {explicit.build_time:8.2f} s, {explicit.n_regions} regions")
+    print(f"Serialized table:   {len(buffer.getvalue()):8d} bytes")
+
+    n_steps = 2000
+    t_explicit = closed_loop(explicit, Ad, Bd, n_steps, Ts, full_state=True)
+    t_admm = closed_loop(online, Ad, Bd, n_steps, Ts, full_state=False)
+
+    rng = np.random.default_rng(0)
+    points = rng.uniform(explicit.theta_min, explicit.theta_max, size=(200, 3))
+    start = time.perf_counter()
+    for theta in points:
+        explicit.solve_online(theta[:2], theta[2:])
+    t_active_set = (time.perf_counter() - start) / len(points)
+
+    print(f"\n{'method':<28} {'time per update [us]':>22}")
+    print(f"{'explicit lookup':<28} {t_explicit * 1e6:>22.1f}")
+    print(f"{'online QP (ADMM, warm)':<28} {t_admm * 1e6:>22.1f}")
+    print(f"{'online QP (active set)':<28} {t_active_set * 1e6:>22.1f}")
+
+
+if __name__ == "__main__":
+    main()
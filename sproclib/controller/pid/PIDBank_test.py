@@ -0,0 +1,100 @@
+import pytest
+import numpy as np
+from sproclib.controller.pid.PIDController import PIDController
+from sproclib.controller.pid.PIDBank import PIDBank
+
+
+class TestPIDBank:
+    @pytest.fixture
+    def tunings(self):
+        """Randomized tunings covering both actions, filtering and saturation."""
+        rng = np.random.default_rng(0)
+        n = 40
+        return dict(
+            Kp=rng.uniform(0.1, 5.0, n),
+            Ki=rng.uniform(0.0, 2.0, n),
+            Kd=np.where(rng.random(n) < 0.3, 0.0, rng.uniform(0.0, 2.0, n)),
+            MV_bar=rng.uniform(0.0, 50.0, n),
+            beta=rng.uniform(0.0, 1.0, n),
+            gamma=rng.uniform(0.0, 1.0, n),
+            N=rng.uniform(2.0, 20.0, n),
+            MV_min=np.full(n, 0.0),
+            MV_max=rng.uniform(20.0, 100.0, n),
+            direct_action=rng.random(n) < 0.5
+        )
+
+    def _scalar_controllers(self, tunings):
+        n = len(tunings['Kp'])
+        return [PIDController(**{k: (bool(v[i]) if k == 'direct_action' else float(v[i]))
+                                 for k, v in tunings.items()}) for i in range(n)]
+
+    def test_parity_with_scalar_controller(self, tunings):
+        """Test that every loop matches PIDController step by step."""
+        rng = np.random.default_rng(1)
+        scalars = self._scalar_controllers(tunings)
+        bank = PIDBank(len(scalars), **tunings)
+
+        for k in range(200):
+            t = 0.1 * k
+            SP = rng.uniform(0.0, 80.0, len(scalars))
+            PV = rng.uniform(0.0, 80.0, len(scalars))
+            TR = np.where(rng.random(len(scalars)) < 0.1, rng.uniform(0, 50, len(scalars)), np.nan) \
+                if k % 25 == 0 else None
+
+            expected = [c.update(t, SP[i], PV[i], None if TR is None or np.isnan(TR[i]) else TR[i])
+                        for i, c in enumerate(scalars)]
+            np.testing.assert_allclose(bank.update(t, SP, PV, TR), expected, rtol=1e-12, atol=1e-12)
+
+        for name in ('P', 'I', 'D', 'S', 'error_prev'):
+            np.testing.assert_allclose(getattr(bank, name), [getattr(c, name) for c in scalars],
+                                       rtol=1e-12, atol=1e-12)
+
+    def test_non_positive_dt_keeps_output(self, tunings):
+        """Test that repeated time stamps return the previous outputs."""
+        bank = PIDBank(len(tunings['Kp']), **tunings)
+        MV1 = bank.update(1.0, 50.0, 40.0)
+        MV2 = bank.update(1.0, 10.0, 90.0)
+        np.testing.assert_array_equal(MV1, MV2)
+
+    def test_partial_reset_only_updates_active_loops(self):
+        """Test that loops with dt <= 0 keep their state."""
+        bank = PIDBank(3, Kp=1.0, Ki=1.0, MV_bar=50.0, MV_max=1e4, direct_action=True)
+        bank.update(1.0, 10.0, 0.0)
+        bank.t_prev[1] = 5.0
+        MV_before = bank.MV.copy()
+        MV = bank.update(2.0, 10.0, 0.0)
+
+        assert MV[1] == MV_before[1]
+        assert MV[0] != MV_before[0]
+        assert bank.t_prev[1] == 5.0
+
+    def test_output_limits_and_manual_mode(self):
+        """Test output clipping and manual mode per loop."""
+        bank = PIDBank(4, Kp=100.0, MV_min=0.0, MV_max=[10.0, 20.0, 30.0, 40.0], direct_action=True)
+        MV = bank.update(1.0, 100.0, 0.0)
+        np.testing.assert_array_equal(MV, [10.0, 20.0, 30.0, 40.0])
+
+        bank.set_manual_mode(55.0, loops=[1, 3])
+        np.testing.assert_array_equal(bank.manual_mode, [False, True, False, True])
+        np.testing.assert_array_equal(bank.MV[[1, 3]], [20.0, 40.0])
+        bank.set_auto_mode()
+        assert not bank.manual_mode.any()
+
+    def test_round_trip_with_scalar_controllers(self, tunings):
+        """Test from_controllers and controller() continue the same trajectory."""
+        scalars = self._scalar_controllers(tunings)
+        for c in scalars:
+            c.update(1.0, 30.0, 20.0)
+        bank = PIDBank.from_controllers(scalars)
+        copy = bank.controller(7)
+
+        MV = bank.update(2.0, 30.0, 25.0)
+        assert MV[7] == pytest.approx(scalars[7].update(2.0, 30.0, 25.0))
+        assert copy.update(2.0, 30.0, 25.0) == pytest.approx(MV[7])
+
+    def test_invalid_parameters(self):
+        """Test parameter shape and limit validation."""
+        with pytest.raises(ValueError):
+            PIDBank(3, Kp=[1.0, 2.0])
+        with pytest.raises(ValueError):
+            PIDBank(2, MV_min=10.0, MV_max=5.0)
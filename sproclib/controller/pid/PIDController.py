@@ -21,8 +21,15 @@ class PIDController:
     setpoint weighting, and derivative filtering.
     
     Implementation with modern industrial features for robust process control.
+    Parameters and per-tick state live in __slots__, so an instance has no
+    __dict__ and update() only rebinds float attributes.
     """
     
+    __slots__ = (
+        'Kp', 'Ki', 'Kd', 'MV_bar', 'beta', 'gamma', 'N', 'MV_min', 'MV_max',
+        'direct_action', 't_prev', 'P', 'I', 'D', 'S', 'MV', 'error_prev', 'manual_mode'
+    )
+    
     def __init__(
         self,
         Kp: float = 1.0,
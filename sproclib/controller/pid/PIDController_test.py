@@ -211,3 +211,15 @@ class TestPIDController:
             output = column_controller.update(temp, dt)
             # Should stay within reboiler duty limits
             assert 20 <= output <= 80
+
+    def test_scalar_controller_uses_slots(self):
+        """Test that PIDController state lives in slots and survives pickling."""
+        import pickle
+        pid = PIDController(Kp=2.0, Ki=0.5)
+        pid.update(1.0, 1.0, 0.0)
+        assert not hasattr(pid, '__dict__')
+        with pytest.raises(AttributeError):
+            pid.unknown_attribute = 1.0
+
+        copy = pickle.loads(pickle.dumps(pid))
+        assert copy.update(2.0, 1.0, 0.5) == pid.update(2.0, 1.0, 0.5)
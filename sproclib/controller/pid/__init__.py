@@ -5,5 +5,6 @@ This package provides PID controller implementations for process control.
 """
 
 from .PIDController import PIDController
+from .PIDBank import PIDBank
 
-__all__ = ['PIDController']
+__all__ = ['PIDController', 'PIDBank']
@@ -18,7 +18,7 @@ import numpy as np
 from typing import Optional, Tuple, Dict, Any, List, Union
 import logging
 from abc import ABC, abstractmethod
-from scipy.linalg import solve_continuous_are, inv, eigvals, solve_lyapunov
+from scipy.linalg import solve_continuous_are, inv, eigvals, solve_lyapunov, expm, solve
 from scipy.signal import place_poles
 
 logger = logging.getLogger(__name__)
@@ -115,6 +115,9 @@ class StateSpaceModel:
         self.input_names = input_names or [f"u{i+1}" for i in range(self.n_inputs)]
         self.output_names = output_names or [f"y{i+1}" for i in range(self.n_outputs)]
         
+        # Discretizations keyed by (dt, method); see discretize()
+        self._discretizations = {}
+        
         logger.info(f"StateSpaceModel '{name}' initialized: {self.n_states} states, "
                    f"{self.n_inputs} inputs, {self.n_outputs} outputs")
     
@@ -139,44 +142,202 @@ class StateSpaceModel:
         """
         from scipy.integrate import solve_ivp
         
+        t = np.asarray(t, dtype=float)
+        u = np.asarray(u)
         if u.shape != (len(t), self.n_inputs):
             raise ValueError(f"Input array must be {len(t)}x{self.n_inputs}")
         
-        if d is not None and self.E is not None:
+        use_d = d is not None and self.E is not None
+        if use_d:
+            d = np.asarray(d)
             if d.shape != (len(t), self.n_disturbances):
                 raise ValueError(f"Disturbance array must be {len(t)}x{self.n_disturbances}")
         
-        def dynamics(time, x):
-            # Interpolate inputs at current time
-            t_idx = np.searchsorted(t, time)
-            t_idx = min(t_idx, len(t) - 1)
+        steps = np.diff(t)
+        if len(t) > 1 and steps[0] > 0 and np.allclose(steps, steps[0], rtol=1e-9, atol=0.0):
+            # Uniform grid: exact solution. The input in effect on (t[k], t[k+1]]
+            # is the one sampled at t[k+1], as in the ODE path below.
+            u_held = np.concatenate([u[1:], u[-1:]])
+            d_held = np.concatenate([d[1:], d[-1:]]) if use_d else None
+            states = self._propagate(steps[0], 'zoh', np.asarray(x0, dtype=float), u_held, d_held)
+        else:
+            def dynamics(time, x):
+                # Interpolate inputs at current time
+                t_idx = np.searchsorted(t, time)
+                t_idx = min(t_idx, len(t) - 1)
+                
+                # State dynamics: dx/dt = A*x + B*u + E*d
+                dxdt = self.A @ x + self.B @ u[t_idx, :]
+                if use_d:
+                    dxdt += self.E @ d[t_idx, :]
+                
+                return dxdt
             
-            u_current = u[t_idx, :]
-            d_current = d[t_idx, :] if d is not None and self.E is not None else np.zeros(self.n_disturbances)
+            # Solve ODE
+            sol = solve_ivp(dynamics, [t[0], t[-1]], x0, t_eval=t, dense_output=True)
             
-            # State dynamics: dx/dt = A*x + B*u + E*d
-            dxdt = self.A @ x + self.B @ u_current
-            if self.E is not None:
-                dxdt += self.E @ d_current
+            if not sol.success:
+                raise RuntimeError("State-space simulation failed")
             
-            return dxdt
+            states = sol.y.T  # [len(t) x n_states]
         
-        # Solve ODE
-        sol = solve_ivp(dynamics, [t[0], t[-1]], x0, t_eval=t, dense_output=True)
+        # Calculate outputs: y = C*x + D*u + F*d
+        outputs = self._outputs(states, u, d if use_d else None)
         
-        if not sol.success:
-            raise RuntimeError("State-space simulation failed")
+        return states, outputs
+    
+    def discretize(
+        self,
+        dt: float,
+        method: str = 'zoh'
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Discrete-time model x[k+1] = Ad x[k] + Bd u[k], y[k] = Cd x[k] + Dd u[k].
         
-        states = sol.y.T  # [len(t) x n_states]
+        Methods:
+        - 'zoh': exact for inputs held constant over each sample
+        - 'foh': exact for inputs varying linearly between samples
+        - 'tustin': bilinear (trapezoidal) approximation
         
-        # Calculate outputs: y = C*x + D*u + F*d
-        outputs = np.zeros((len(t), self.n_outputs))
-        for i in range(len(t)):
-            outputs[i, :] = self.C @ states[i, :] + self.D @ u[i, :]
-            if d is not None and self.F is not None:
-                outputs[i, :] += self.F @ d[i, :]
+        For 'foh' and 'tustin' the realization uses the shifted state
+        x[k] - B1 u[k] (B1 = weight of the next input), so Cd = C and
+        Dd = D + C B1. The matrix exponential is computed once per (dt, method)
+        and cached until A, B or E change.
         
-        return states, outputs
+        Args:
+            dt: Sample time
+            method: Discretization method ('zoh', 'foh', 'tustin')
+            
+        Returns:
+            Tuple of (Ad, Bd, Cd, Dd)
+        """
+        Ad, B0, B1 = self._discretization(dt, method)
+        m = self.n_inputs
+        Bd = B0[:, :m] + Ad @ B1[:, :m]
+        return Ad, Bd, self.C.copy(), self.D + self.C @ B1[:, :m]
+    
+    def simulate_discrete(
+        self,
+        u: np.ndarray,
+        dt: float,
+        x0: Optional[np.ndarray] = None,
+        d: Optional[np.ndarray] = None,
+        method: str = 'zoh'
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Simulate the sampled system for input sequences u[k] at t = k*dt.
+        
+        Several trajectories are simulated at once when u is 3-D
+        ([n_trajectories x n_steps x n_inputs]); x0 is then [n_states] or
+        [n_trajectories x n_states] and d follows the shape of u.
+        
+        Args:
+            u: Input samples [n_steps x n_inputs] or [n_trajectories x n_steps x n_inputs]
+            dt: Sample time
+            x0: Initial state (default: zero)
+            d: Disturbance samples (optional)
+            method: Input hold ('zoh', 'foh') or 'tustin'
+            
+        Returns:
+            Tuple of (states, outputs) at the sample times, with the leading
+            dimensions of u
+        """
+        u = np.asarray(u, dtype=float)
+        if u.ndim not in (2, 3) or u.shape[-1] != self.n_inputs:
+            raise ValueError(f"Input array must be [n_steps x {self.n_inputs}] "
+                             f"or [n_trajectories x n_steps x {self.n_inputs}]")
+        use_d = d is not None and self.E is not None
+        if use_d:
+            d = np.asarray(d, dtype=float)
+            if d.shape != u.shape[:-1] + (self.n_disturbances,):
+                raise ValueError(f"Disturbance array must be {u.shape[:-1] + (self.n_disturbances,)}")
+        
+        if x0 is None:
+            x0 = np.zeros(self.n_states)
+        x0 = np.broadcast_to(np.asarray(x0, dtype=float), u.shape[:-2] + (self.n_states,))
+        
+        states = self._propagate(dt, method, x0, u, d if use_d else None)
+        return states, self._outputs(states, u, d if use_d else None)
+    
+    def _discretization(self, dt: float, method: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Cached (Ad, B0, B1) with x[k+1] = Ad x[k] + B0 w[k] + B1 w[k+1] for the
+        stacked input w = [u, d].
+        """
+        if dt <= 0:
+            raise ValueError("Sample time dt must be positive")
+        if method not in ('zoh', 'foh', 'tustin'):
+            raise ValueError(f"Unknown discretization method '{method}'")
+        
+        key = (float(dt), method)
+        cached = self._discretizations.get(key)
+        if cached is not None and np.array_equal(cached[0], self.A) and np.array_equal(cached[1], self._input_matrix()):
+            return cached[2]
+        
+        A, G = self.A.astype(float), self._input_matrix()
+        n, m = G.shape
+        if method == 'zoh':
+            M = np.zeros((n + m, n + m))
+            M[:n, :n], M[:n, n:] = A * dt, G * dt
+            E = expm(M)
+            Ad, B0, B1 = E[:n, :n], E[:n, n:], np.zeros((n, m))
+        elif method == 'foh':
+            M = np.zeros((n + 2 * m, n + 2 * m))
+            M[:n, :n], M[:n, n:n + m] = A * dt, G * dt
+            M[n:n + m, n + m:] = np.eye(m)
+            E = expm(M)
+            Ad, Gamma1, Gamma2 = E[:n, :n], E[:n, n:n + m], E[:n, n + m:]
+            B0, B1 = Gamma1 - Gamma2, Gamma2
+        else:
+            I = np.eye(n)
+            Minv_B = solve(I - A * dt / 2, np.hstack([I + A * dt / 2, G * dt / 2]))
+            Ad, B0 = Minv_B[:, :n], Minv_B[:, n:]
+            B1 = B0.copy()
+        
+        self._discretizations[key] = (self.A.copy(), G.copy(), (Ad, B0, B1))
+        return Ad, B0, B1
+    
+    def _input_matrix(self) -> np.ndarray:
+        """Stacked input matrix [B E]."""
+        if self.E is None:
+            return self.B.astype(float)
+        return np.hstack([self.B, self.E]).astype(float)
+    
+    def _propagate(
+        self,
+        dt: float,
+        method: str,
+        x0: np.ndarray,
+        u: np.ndarray,
+        d: Optional[np.ndarray]
+    ) -> np.ndarray:
+        """States at all samples for inputs u (and d), leading dimensions preserved."""
+        Ad, B0, B1 = self._discretization(dt, method)
+        w = u if self.E is None else np.concatenate(
+            [u, d if d is not None else np.zeros(u.shape[:-1] + (self.n_disturbances,))], axis=-1)
+        
+        # Shifted state z[k] = x[k] - B1 w[k] turns the recursion into
+        # z[k+1] = Ad z[k] + G w[k]; all input terms in one matrix product.
+        forcing = w @ (B0 + Ad @ B1).T
+        states = np.empty(u.shape[:-1] + (self.n_states,))
+        z = states[..., 0, :]
+        z[...] = x0 - w[..., 0, :] @ B1.T
+        AdT = np.ascontiguousarray(Ad.T)
+        for k in range(u.shape[-2] - 1):
+            z_next = states[..., k + 1, :]
+            np.matmul(states[..., k, :], AdT, out=z_next)
+            z_next += forcing[..., k, :]
+        
+        if method != 'zoh':
+            states += w @ B1.T
+        return states
+    
+    def _outputs(self, states: np.ndarray, u: np.ndarray, d: Optional[np.ndarray]) -> np.ndarray:
+        """Outputs y = C x + D u + F d for stacked samples."""
+        outputs = states @ self.C.T + u @ self.D.T
+        if d is not None and self.F is not None:
+            outputs += d @ self.F.T
+        return outputs
     
     def step_response(
         self,
@@ -434,8 +595,16 @@ class StateSpaceController:
     - Pole placement
     - Linear Quadratic Regulator (LQR)
     - State observer design
+    
+    Per-tick state lives in __slots__ and preallocated arrays; update()
+    works in place on them.
     """
     
+    __slots__ = (
+        'model', 'control_method', 'name', 'K', 'L', 'N', 'x_hat', 'integral_states',
+        'last_update_time', 'control_limits', '_last_u', '_u', '_u_work', '_y_work', '_x_work'
+    )
+    
     def __init__(
         self,
         model: StateSpaceModel,
@@ -463,6 +632,14 @@ class StateSpaceController:
         self.x_hat = np.zeros(model.n_states)  # State estimate
         self.integral_states = np.zeros(model.n_outputs)  # Integral states for tracking
         self.last_update_time = None
+        self.control_limits = None
+        
+        # Preallocated work arrays for update()
+        self._last_u = np.zeros(model.n_inputs)
+        self._u = np.zeros(model.n_inputs)
+        self._u_work = np.zeros(model.n_inputs)
+        self._y_work = np.zeros((2, model.n_outputs))
+        self._x_work = np.zeros((2, model.n_states))
         
         # Validate controllability and observability
         if not model.is_controllable():
@@ -655,46 +832,53 @@ class StateSpaceController:
         if self.last_update_time is not None:
             dt = t - self.last_update_time
         
+        model = self.model
+        u = self._u
+        
         # State estimation (if full state not available)
         if x is None:
             if self.L is None:
                 raise RuntimeError("Observer gain L not designed yet")
             
             # Previous control input (simple approximation)
-            u_prev = getattr(self, '_last_u', np.zeros(self.model.n_inputs))
+            u_prev = self._last_u
             
             # Observer dynamics: dx_hat/dt = Ax_hat + Bu + L(y - Cx_hat - Du)
-            y_pred = self.model.C @ self.x_hat + self.model.D @ u_prev
-            error = y - y_pred
+            y_pred, y_tmp = self._y_work
+            np.matmul(model.C, self.x_hat, out=y_pred)
+            np.matmul(model.D, u_prev, out=y_tmp)
+            y_pred += y_tmp
+            error = np.subtract(y, y_pred, out=y_pred)
             
             # Simple Euler integration
-            dxhat_dt = (self.model.A @ self.x_hat + 
-                       self.model.B @ u_prev + 
-                       self.L @ error)
+            dxhat_dt, x_tmp = self._x_work
+            np.matmul(model.A, self.x_hat, out=dxhat_dt)
+            dxhat_dt += np.matmul(model.B, u_prev, out=x_tmp)
+            dxhat_dt += np.matmul(self.L, error, out=x_tmp)
             
-            if self.model.E is not None and d is not None:
-                dxhat_dt += self.model.E @ d
+            if model.E is not None and d is not None:
+                dxhat_dt += np.matmul(model.E, d, out=x_tmp)
             
-            self.x_hat += dxhat_dt * dt
-            x_current = self.x_hat
+            dxhat_dt *= dt
+            self.x_hat += dxhat_dt
         else:
-            x_current = x
-            self.x_hat = x  # Update estimate with measurement
+            self.x_hat[:] = x  # Update estimate with measurement
         
         # Control law: u = -Kx + Nr (state feedback + reference tracking)
-        u = -self.K @ x_current
+        np.matmul(self.K, self.x_hat, out=u)
+        np.negative(u, out=u)
         
         if self.N is not None:
-            u += self.N @ r
+            u += np.matmul(self.N, r, out=self._u_work)
         
         # Apply control limits if specified
-        if hasattr(self, 'control_limits'):
-            u = np.clip(u, self.control_limits[0], self.control_limits[1])
+        if self.control_limits is not None:
+            np.clip(u, self.control_limits[0], self.control_limits[1], out=u)
         
-        self._last_u = u
+        self._last_u[:] = u
         self.last_update_time = t
         
-        return u
+        return u.copy()
     
     def set_control_limits(self, u_min: np.ndarray, u_max: np.ndarray):
         """Set control input saturation limits."""
@@ -709,11 +893,10 @@ class StateSpaceController:
     
     def reset(self):
         """Reset controller internal state."""
-        self.x_hat = np.zeros(self.model.n_states)
-        self.integral_states = np.zeros(self.model.n_outputs)
+        self.x_hat.fill(0.0)
+        self.integral_states.fill(0.0)
         self.last_update_time = None
-        if hasattr(self, '_last_u'):
-            delattr(self, '_last_u')
+        self._last_u.fill(0.0)
         logger.info(f"StateSpaceController '{self.name}' reset")
     
     def get_controller_info(self) -> Dict[str, Any]:
@@ -245,3 +245,93 @@ class TestStateSpaceController:
         assert controller_desc['class_name'] == 'StateSpaceController'
         assert 'state_space_theory' in controller_desc
         assert 'control_methods' in controller_desc
+    
+    def test_update_works_in_place(self, default_controller):
+        """Test observer update against the explicit equations and state ownership."""
+        model = default_controller.model
+        default_controller.design_lqr_controller(np.eye(2), np.eye(2))
+        default_controller.design_observer(np.array([-2.0, -3.0]))
+        default_controller.design_reference_tracking()
+        
+        x_hat = default_controller.x_hat
+        x_expected = np.zeros(2)
+        u_prev = np.zeros(2)
+        y, r = np.array([0.3, -0.2]), np.array([1.0, 0.5])
+        for k, t in enumerate([0.0, 0.1, 0.25]):
+            dt = 0.1 if k == 0 else t - [0.0, 0.1, 0.25][k - 1]
+            error = y - (model.C @ x_expected + model.D @ u_prev)
+            x_expected = x_expected + (model.A @ x_expected + model.B @ u_prev
+                                       + default_controller.L @ error) * dt
+            u_prev = -default_controller.K @ x_expected + default_controller.N @ r
+            u = default_controller.update(t, y, r)
+            np.testing.assert_allclose(u, u_prev, rtol=1e-12)
+        
+        assert default_controller.x_hat is x_hat
+        assert not hasattr(default_controller, '__dict__')
+        
+        # A measured state is copied, not aliased
+        x_meas = np.array([1.0, 2.0])
+        default_controller.update(0.3, y, r, x=x_meas)
+        default_controller.update(0.4, y, r)
+        np.testing.assert_array_equal(x_meas, [1.0, 2.0])
+    
+    def test_discretize_zoh_matches_scipy(self, reactor_model):
+        """Test ZOH discretization against scipy.signal.cont2discrete."""
+        from scipy.signal import cont2discrete
+        m = reactor_model
+        Ad, Bd, Cd, Dd = m.discretize(0.5)
+        Ad_ref, Bd_ref, _, _, _ = cont2discrete((m.A, m.B, m.C, m.D), 0.5, method='zoh')
+        np.testing.assert_allclose(Ad, Ad_ref, rtol=1e-12)
+        np.testing.assert_allclose(Bd, Bd_ref, rtol=1e-12)
+        
+        # Cached per (dt, method) and refreshed when A changes
+        assert m.discretize(0.5)[0] is Ad
+        m.A = m.A * 2
+        assert not np.allclose(m.discretize(0.5)[0], Ad)
+        
+        with pytest.raises(ValueError):
+            m.discretize(0.5, method='euler')
+    
+    def test_simulate_discrete_foh_is_exact(self, reactor_model):
+        """Test that FOH matches the ODE solution for piecewise-linear inputs."""
+        from scipy.integrate import solve_ivp
+        m = reactor_model
+        rng = np.random.default_rng(3)
+        dt, u = 0.25, rng.normal(size=(40, 2))
+        t = np.arange(40) * dt
+        x0 = np.array([1.0, -0.5])
+        
+        def rhs(time, x):
+            return m.A @ x + m.B @ np.array([np.interp(time, t, u[:, j]) for j in range(2)])
+        sol = solve_ivp(rhs, (0, t[-1]), x0, t_eval=t, rtol=1e-10, atol=1e-12, max_step=0.01)
+        
+        states, outputs = m.simulate_discrete(u, dt, x0=x0, method='foh')
+        np.testing.assert_allclose(states, sol.y.T, atol=1e-7)
+        np.testing.assert_allclose(outputs, states @ m.C.T + u @ m.D.T)
+    
+    def test_simulate_discrete_batched(self, reactor_model):
+        """Test that 3-D inputs give the same result as one trajectory at a time."""
+        rng = np.random.default_rng(4)
+        U = rng.normal(size=(5, 30, 2))
+        X0 = rng.normal(size=(5, 2))
+        states, outputs = reactor_model.simulate_discrete(U, 0.1, x0=X0, method='tustin')
+        
+        assert states.shape == (5, 30, 2) and outputs.shape == (5, 30, 2)
+        for i in range(5):
+            x_i, y_i = reactor_model.simulate_discrete(U[i], 0.1, x0=X0[i], method='tustin')
+            np.testing.assert_allclose(states[i], x_i, rtol=1e-12, atol=1e-14)
+            np.testing.assert_allclose(outputs[i], y_i, rtol=1e-12, atol=1e-14)
+    
+    def test_simulate_uniform_grid_is_exact(self, reactor_model):
+        """Test that simulate on a uniform grid agrees with a tight ODE solution."""
+        from scipy.integrate import solve_ivp
+        m = reactor_model
+        t = np.linspace(0, 10, 51)
+        u = np.random.default_rng(5).normal(size=(51, 2))
+        
+        def rhs(time, x):
+            return m.A @ x + m.B @ u[min(np.searchsorted(t, time), 50)]
+        sol = solve_ivp(rhs, (0, 10), np.zeros(2), t_eval=t, rtol=1e-10, atol=1e-12, max_step=0.02)
+        
+        states, _ = m.simulate(t, u, np.zeros(2))
+        np.testing.assert_allclose(states, sol.y.T, atol=1e-7)
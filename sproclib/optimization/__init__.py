@@ -13,12 +13,17 @@ Author: Thorsten Gressling <gressling@paramus.ai>
 License: MIT License
 """
 
-from .economic_optimization import EconomicOptimization
-from .parameter_estimation import ParameterEstimation  
-from .process_optimization import ProcessOptimization
+# Optimization tools are imported on first access (PEP 562)
+from .._lazy import attach
 
-__all__ = [
-    'EconomicOptimization',
-    'ParameterEstimation',
-    'ProcessOptimization'
-]
+_EXPORTS = {
+    'EconomicOptimization': ('.economic_optimization', 'EconomicOptimization'),
+    'ParameterEstimation': ('.parameter_estimation', 'ParameterEstimation'),
+    'ProcessOptimization': ('.process_optimization', 'ProcessOptimization'),
+}
+
+__getattr__, __dir__ = attach(
+    __name__, _EXPORTS, ['economic_optimization', 'parameter_estimation', 'process_optimization']
+)
+
+__all__ = list(_EXPORTS)
@@ -9,7 +9,10 @@ License: MIT License
 """
 
 import numpy as np
+import time
 from typing import Optional, Tuple, Dict, Any, List
+from scipy import sparse
+from scipy.integrate import solve_ivp
 from scipy.optimize import linprog, minimize
 import logging
 
@@ -252,26 +255,65 @@ class EconomicOptimization:
         economic_objective: callable,
         constraints: List[Dict],
         prediction_horizon: int = 10,
-        control_horizon: Optional[int] = None
+        control_horizon: Optional[int] = None,
+        x0: Optional[np.ndarray] = None,
+        sample_time: float = 1.0,
+        u_bounds: Optional[List[Tuple]] = None,
+        x_bounds: Optional[List[Tuple]] = None,
+        u_guess: Optional[np.ndarray] = None,
+        objective_gradient: Optional[callable] = None,
+        warm_start: bool = True,
+        t0: float = 0.0
     ) -> Dict[str, Any]:
         """
         Economic Model Predictive Control optimization.
         
+        Without an initial state the problem is the static one: minimize
+        sum_k economic_objective(u_k, k) over the control sequence.
+        
+        With x0 the process model is used by multiple shooting: the states
+        at the sample instants are decision variables, and each interval is
+        integrated from process_model.dynamics together with its
+        sensitivity equations (from process_model.jacobian), which give
+        the exact continuity-constraint Jacobian. Each interval end state
+        and its sensitivities are computed once per iterate and shared by
+        the constraint and its Jacobian.
+        
+        Repeated calls start from the previous solution, shifted by one
+        sample (warm start).
+        
         Args:
-            process_model: Process model for predictions
-            economic_objective: Economic objective function
-            constraints: List of constraint dictionaries
-            prediction_horizon: Prediction horizon
-            control_horizon: Control horizon
+            process_model: Process model for predictions (ProcessModel with
+                dynamics when x0 is given)
+            economic_objective: Economic stage cost, economic_objective(u, k)
+                without x0 or economic_objective(x, u, k) with x0
+            constraints: List of constraint dictionaries on the flattened
+                control sequence (scipy format)
+            prediction_horizon: Prediction horizon (samples)
+            control_horizon: Control horizon (samples, inputs held after it)
+            x0: Current process state (enables model-based prediction)
+            sample_time: Sample time of the control moves
+            u_bounds: Bounds per input [(min, max), ...]
+            x_bounds: Bounds per state on the predicted trajectory
+            u_guess: Input used for a cold start (default: zeros)
+            objective_gradient: Optional function returning (dl/dx, dl/du) of
+                the stage cost at (x, u, k); finite differences otherwise
+            warm_start: Start from the shifted previous solution if available
+            t0: Time of the current sample
             
         Returns:
-            Economic MPC solution
+            Economic MPC solution including solve time and iteration count
         """
         if control_horizon is None:
             control_horizon = prediction_horizon
+        control_horizon = min(control_horizon, prediction_horizon)
         
-        # This is a simplified implementation
-        # Full economic MPC requires more sophisticated formulation
+        if x0 is not None:
+            return self._economic_mpc_shooting(
+                process_model, economic_objective, constraints, prediction_horizon,
+                control_horizon, np.asarray(x0, dtype=float), sample_time, u_bounds,
+                x_bounds, u_guess, objective_gradient, warm_start, t0
+            )
         
         def objective(u_sequence):
             """Economic objective over prediction horizon."""
@@ -292,7 +334,11 @@ class EconomicOptimization:
         
         # Initial guess for control sequence
         n_inputs = getattr(process_model, 'n_inputs', 1)
-        x0 = np.zeros(control_horizon * n_inputs)
+        x_init = self._warm_start('static', control_horizon * n_inputs, n_inputs) if warm_start else None
+        if x_init is None:
+            x_init = np.zeros(control_horizon * n_inputs)
+            if u_guess is not None:
+                x_init[:] = np.tile(np.asarray(u_guess, dtype=float), control_horizon)
         
         # Convert constraints to scipy format
         scipy_constraints = []
@@ -310,12 +356,16 @@ class EconomicOptimization:
         
         try:
             # Solve optimization
+            start = time.perf_counter()
             result = minimize(
-                objective, x0, method='SLSQP',
-                constraints=scipy_constraints
+                objective, x_init, method='SLSQP',
+                constraints=scipy_constraints,
+                bounds=None if u_bounds is None else list(u_bounds) * control_horizon
             )
+            solve_time = time.perf_counter() - start
             
             optimal_sequence = result.x.reshape(control_horizon, n_inputs)
+            self._empc_solution = ('static', result.x.copy(), n_inputs)
             
             return {
                 'success': result.success,
@@ -323,6 +373,8 @@ class EconomicOptimization:
                 'optimal_cost': result.fun,
                 'first_control_action': optimal_sequence[0, :],
                 'message': result.message,
+                'solve_time': solve_time,
+                'iterations': result.nit,
                 'problem_type': 'economic_mpc'
             }
         
@@ -334,6 +386,138 @@ class EconomicOptimization:
                 'problem_type': 'economic_mpc'
             }
     
+    def _warm_start(self, mode: str, size: int, block: int) -> Optional[np.ndarray]:
+        """Previous solution shifted by one sample, or None if incompatible."""
+        previous = getattr(self, '_empc_solution', None)
+        if previous is None or previous[0] != mode or previous[1].size != size:
+            return None
+        blocks = previous[1].reshape(-1, block)
+        return np.vstack([blocks[1:], blocks[-1:]]).ravel()
+    
+    def _economic_mpc_shooting(
+        self,
+        process_model,
+        economic_objective: callable,
+        constraints: List[Dict],
+        N: int,
+        M: int,
+        x0: np.ndarray,
+        sample_time: float,
+        u_bounds: Optional[List[Tuple]],
+        x_bounds: Optional[List[Tuple]],
+        u_guess: Optional[np.ndarray],
+        objective_gradient: Optional[callable],
+        warm_start: bool,
+        t0: float
+    ) -> Dict[str, Any]:
+        """Multiple-shooting economic MPC (see economic_mpc)."""
+        n = x0.size
+        if u_guess is not None:
+            m = np.asarray(u_guess).size
+        elif u_bounds is not None:
+            m = len(u_bounds)
+        else:
+            m = getattr(process_model, 'n_inputs', 1)
+        shooting = _MultipleShooting(process_model, n, m, N, M, sample_time, t0)
+        n_u = M * m
+        
+        # Warm start: shift inputs and node states by one sample
+        z_init = None
+        previous = getattr(self, '_empc_solution', None) if warm_start else None
+        if previous is not None and previous[0] == 'shooting' and previous[1].size == n_u + N * n:
+            U_prev = previous[1][:n_u].reshape(M, m)
+            S_prev = previous[1][n_u:].reshape(N, n)
+            z_init = np.concatenate([
+                np.vstack([U_prev[1:], U_prev[-1:]]).ravel(),
+                np.vstack([S_prev[1:], S_prev[-1:]]).ravel()
+            ])
+        warm_started = z_init is not None
+        if z_init is None:
+            # Cold start: simulate the guessed inputs (single-shooting initialization)
+            u0 = np.zeros(m) if u_guess is None else np.asarray(u_guess, dtype=float)
+            if u_bounds is not None:
+                lower = np.array([-np.inf if b[0] is None else b[0] for b in u_bounds], dtype=float)
+                upper = np.array([np.inf if b[1] is None else b[1] for b in u_bounds], dtype=float)
+                if u_guess is None:
+                    # Middle of the input range where both bounds are given
+                    middle = (lower + upper) / 2
+                    u0 = np.where(np.isfinite(middle), middle, u0)
+                u0 = np.clip(u0, lower, upper)
+            z_init = np.concatenate([np.tile(u0, M), shooting.simulate(x0, u0)])
+        
+        def stage_costs(z):
+            U, S = shooting.split(z)
+            X = np.vstack([x0, S[:-1]])
+            return X, U
+        
+        def objective(z):
+            X, U = stage_costs(z)
+            return float(sum(economic_objective(X[k], U[k], k) for k in range(N)))
+        
+        def gradient(z):
+            X, U = stage_costs(z)
+            grad_U = np.zeros((N, m))
+            grad_X = np.zeros((N, n))
+            for k in range(N):
+                if objective_gradient is not None:
+                    gx, gu = objective_gradient(X[k], U[k], k)
+                    grad_X[k], grad_U[k] = gx, gu
+                else:
+                    grad_X[k], grad_U[k] = _stage_gradient(economic_objective, X[k], U[k], k)
+            return shooting.gather(grad_X, grad_U)
+        
+        scipy_constraints = [{
+            'type': 'eq',
+            'fun': lambda z: shooting.defects(z, x0),
+            'jac': lambda z: shooting.defect_jacobian(z, x0)
+        }]
+        for constraint in constraints:
+            if constraint['type'] in ('ineq', 'eq'):
+                scipy_constraints.append({
+                    'type': constraint['type'],
+                    'fun': lambda z, fun=constraint['fun']: fun(z[:n_u])
+                })
+        
+        bounds = None
+        if u_bounds is not None or x_bounds is not None:
+            bounds = (list(u_bounds or [(None, None)] * m) * M
+                      + list(x_bounds or [(None, None)] * n) * N)
+        
+        try:
+            start = time.perf_counter()
+            result = minimize(
+                objective, z_init, jac=gradient, method='SLSQP',
+                bounds=bounds, constraints=scipy_constraints
+            )
+            solve_time = time.perf_counter() - start
+        except Exception as e:
+            logger.error(f"Economic MPC optimization error: {e}")
+            return {
+                'success': False,
+                'error': str(e),
+                'problem_type': 'economic_mpc'
+            }
+        
+        self._empc_solution = ('shooting', result.x.copy(), m)
+        U, S = shooting.split(result.x)
+        optimal_sequence = U[:M]
+        
+        return {
+            'success': result.success,
+            'optimal_control_sequence': optimal_sequence,
+            'optimal_cost': result.fun,
+            'first_control_action': optimal_sequence[0, :],
+            'predicted_states': np.vstack([x0, S]),
+            'max_defect': float(np.max(np.abs(shooting.defects(result.x, x0)))),
+            'message': result.message,
+            'solve_time': solve_time,
+            'iterations': result.nit,
+            'integrations': shooting.n_integrations,
+            'warm_started': warm_started,
+            'method': 'multiple_shooting',
+            'problem_type': 'economic_mpc'
+        }
+    
     def investment_optimization(
         self,
         investment_options: List[Dict[str, float]],
@@ -407,6 +591,150 @@ class EconomicOptimization:
         
         return result
 
+
+def _stage_gradient(cost: callable, x: np.ndarray, u: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Forward-difference gradient of a stage cost with respect to x and u."""
+    v = np.concatenate([x, u]).astype(float)
+    n = x.size
+    f0 = cost(x, u, k)
+    grad = np.empty(v.size)
+    for j in range(v.size):
+        h = np.sqrt(np.finfo(float).eps) * max(1.0, abs(v[j]))
+        v_pert = v.copy()
+        v_pert[j] += h
+        grad[j] = (cost(v_pert[:n], v_pert[n:], k) - f0) / h
+    return grad[:n], grad[n:]
+
+
+class _MultipleShooting:
+    """
+    Shooting intervals of the economic MPC.
+    
+    The decision vector is z = [u_0, ..., u_{M-1}, s_1, ..., s_N]. All N
+    intervals are integrated together with their sensitivities
+    dE_k/ds_k and dE_k/du_k in one solve_ivp call; the result is cached
+    for the last z so the defects and their Jacobian share it.
+    """
+    
+    def __init__(self, model, n: int, m: int, N: int, M: int, sample_time: float, t0: float):
+        self.model = model
+        self.n, self.m, self.N, self.M = n, m, N, M
+        self.sample_time = sample_time
+        self.t0 = t0
+        self.n_integrations = 0
+        self._cache_key = None
+        self._cache = None
+        # Input index used in each interval (held after the control horizon)
+        self.input_index = np.minimum(np.arange(N), M - 1)
+    
+    def split(self, z: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Inputs per interval (N, m) and node states (N, n)."""
+        U = z[:self.M * self.m].reshape(self.M, self.m)[self.input_index]
+        return U, z[self.M * self.m:].reshape(self.N, self.n)
+    
+    def gather(self, grad_X: np.ndarray, grad_U: np.ndarray) -> np.ndarray:
+        """Gradient in z from per-interval gradients (x_0 is fixed)."""
+        grad = np.zeros(self.M * self.m + self.N * self.n)
+        grad_inputs = grad[:self.M * self.m].reshape(self.M, self.m)
+        np.add.at(grad_inputs, self.input_index, grad_U)
+        grad[self.M * self.m:self.M * self.m + (self.N - 1) * self.n] = grad_X[1:].ravel()
+        return grad
+    
+    def _state_jacobian(self, t: float, x: np.ndarray, u: np.ndarray, f0: np.ndarray) -> np.ndarray:
+        if hasattr(self.model, 'jacobian'):
+            A = self.model.jacobian(t, x, u)
+            return A.toarray() if sparse.issparse(A) else np.asarray(A, dtype=float)
+        A = np.empty((self.n, self.n))
+        for j in range(self.n):
+            h = np.sqrt(np.finfo(float).eps) * max(1.0, abs(x[j]))
+            x_pert = x.copy()
+            x_pert[j] += h
+            A[:, j] = (np.asarray(self.model.dynamics(t, x_pert, u), dtype=float) - f0) / h
+        return A
+    
+    def _input_jacobian(self, t: float, x: np.ndarray, u: np.ndarray, f0: np.ndarray) -> np.ndarray:
+        B = np.empty((self.n, self.m))
+        for j in range(self.m):
+            h = np.sqrt(np.finfo(float).eps) * max(1.0, abs(u[j]))
+            u_pert = u.copy()
+            u_pert[j] += h
+            B[:, j] = (np.asarray(self.model.dynamics(t, x, u_pert), dtype=float) - f0) / h
+        return B
+    
+    def integrate(self, X: np.ndarray, U: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Integrate all intervals with sensitivities.
+        
+        Returns:
+            Tuple of end states (N, n), dE/dx (N, n, n) and dE/du (N, n, m)
+        """
+        n, m, N = self.n, self.m, self.N
+        size = n + n * n + n * m
+        z0 = np.zeros((N, size))
+        z0[:, :n] = X
+        z0[:, n:n + n * n] = np.eye(n).ravel()
+        offsets = self.t0 + self.sample_time * np.arange(N)
+        
+        def rhs(tau, z):
+            z = z.reshape(N, size)
+            dz = np.empty_like(z)
+            for k in range(N):
+                t, x, u = offsets[k] + tau, z[k, :n], U[k]
+                f = np.asarray(self.model.dynamics(t, x, u), dtype=float)
+                A = self._state_jacobian(t, x, u, f)
+                B = self._input_jacobian(t, x, u, f)
+                dz[k, :n] = f
+                dz[k, n:n + n * n] = (A @ z[k, n:n + n * n].reshape(n, n)).ravel()
+                dz[k, n + n * n:] = (A @ z[k, n + n * n:].reshape(n, m) + B).ravel()
+            return dz.ravel()
+        
+        sol = solve_ivp(rhs, (0.0, self.sample_time), z0.ravel(), rtol=1e-8, atol=1e-10)
+        self.n_integrations += 1
+        if not sol.success:
+            logger.warning(f"Shooting integration failed: {sol.message}")
+        z_end = sol.y[:, -1].reshape(N, size)
+        return (z_end[:, :n], z_end[:, n:n + n * n].reshape(N, n, n),
+                z_end[:, n + n * n:].reshape(N, n, m))
+    
+    def _evaluate(self, z: np.ndarray, x0: np.ndarray):
+        key = z.tobytes()
+        if key != self._cache_key:
+            U, S = self.split(z)
+            self._cache = self.integrate(np.vstack([x0, S[:-1]]), U)
+            self._cache_key = key
+        return self._cache
+    
+    def defects(self, z: np.ndarray, x0: np.ndarray) -> np.ndarray:
+        """Continuity constraints s_{k+1} - E_k(s_k, u_k) = 0."""
+        E, _, _ = self._evaluate(z, x0)
+        return (self.split(z)[1] - E).ravel()
+    
+    def defect_jacobian(self, z: np.ndarray, x0: np.ndarray) -> np.ndarray:
+        """Jacobian of the defects from the interval sensitivities."""
+        _, Sx, Su = self._evaluate(z, x0)
+        n, m, N, n_u = self.n, self.m, self.N, self.M * self.m
+        J = np.zeros((N * n, n_u + N * n))
+        J[:, n_u:] = np.eye(N * n)
+        for k in range(N):
+            rows = slice(k * n, (k + 1) * n)
+            j = self.input_index[k] * m
+            J[rows, j:j + m] -= Su[k]
+            if k > 0:
+                J[rows, n_u + (k - 1) * n:n_u + k * n] = -Sx[k]
+        return J
+    
+    def simulate(self, x0: np.ndarray, u: np.ndarray) -> np.ndarray:
+        """Node states for a constant input (cold-start initialization)."""
+        states, x = [], x0
+        for k in range(self.N):
+            t = self.t0 + k * self.sample_time
+            sol = solve_ivp(lambda t, x: self.model.dynamics(t, x, u),
+                            (t, t + self.sample_time), x, rtol=1e-8, atol=1e-10)
+            x = sol.y[:, -1]
+            states.append(x)
+        return np.concatenate(states)
+
+
 # Standalone function wrappers for backward compatibility
 def optimize_operation(
     objective_func: callable,
@@ -60,7 +60,13 @@ References:
 """
 
 from .parameter_estimation import ParameterEstimation, estimate_fopdt_parameters
-from .example import main as run_example
+
+
+def run_example():
+    """Run the parameter estimation example (imports matplotlib on demand)."""
+    from .example import main
+    return main()
+
 
 __version__ = "1.0.0"
 __author__ = "SProcLib Development Team"
@@ -202,15 +208,13 @@ def quick_power_law_fit(x_data, y_data, initial_guess=None):
         'full_results': results
     }
 
-# Check dependencies and warn if missing
-try:
-    import scipy
-    import numpy
-    import matplotlib
-except ImportError as e:
-    import warnings
-    warnings.warn(
-        f"Parameter estimation module requires scipy, numpy, and matplotlib. "
-        f"Missing dependency: {e.name}. Some functionality may be limited.",
-        ImportWarning
-    )
+# Check dependencies and warn if missing (without importing matplotlib)
+import importlib.util
+for _dependency in ('scipy', 'numpy', 'matplotlib'):
+    if importlib.util.find_spec(_dependency) is None:
+        import warnings
+        warnings.warn(
+            f"Parameter estimation module requires scipy, numpy, and matplotlib. "
+            f"Missing dependency: {_dependency}. Some functionality may be limited.",
+            ImportWarning
+        )
@@ -10,7 +10,6 @@ License: MIT License
 
 import numpy as np
 from typing import Optional, Tuple, Dict, Any, List
-import matplotlib.pyplot as plt
 import logging
 
 logger = logging.getLogger(__name__)
@@ -348,7 +347,7 @@ class StateTaskNetwork:
         show_inventories: bool = True
     ):
         """
-        Plot Gantt chart of the schedule.
+        Plot Gantt chart of the schedule (requires matplotlib, see sproclib.viz).
         
         Args:
             figsize: Figure size
@@ -358,82 +357,8 @@ class StateTaskNetwork:
             logger.error("No schedule to plot")
             return
         
-        n_plots = 2 if show_inventories else 1
-        fig, axes = plt.subplots(n_plots, 1, figsize=(figsize[0], figsize[1] * n_plots))
-        
-        if n_plots == 1:
-            axes = [axes]
-        
-        # Gantt chart
-        ax = axes[0]
-        units = list(self.schedule['unit_schedules'].keys())
-        time_horizon = self.schedule['time_horizon']
-        
-        # Color map for tasks
-        task_names = list(self.tasks.keys())
-        colors = plt.cm.Set3(np.linspace(0, 1, len(task_names)))
-        task_colors = dict(zip(task_names, colors))
-        
-        # Create Gantt chart
-        for i, unit in enumerate(units):
-            schedule_unit = self.schedule['unit_schedules'][unit]
-            
-            current_task = None
-            start_time = 0
-            
-            for t, task in enumerate(schedule_unit):
-                if task != current_task:
-                    if current_task is not None:
-                        # Plot previous task
-                        color = task_colors.get(current_task, 'gray')
-                        ax.barh(i, t - start_time, left=start_time, 
-                               height=0.6, alpha=0.8, color=color,
-                               label=current_task if current_task not in [t.get_text() for t in ax.get_legend().get_texts()] else "")
-                    current_task = task
-                    start_time = t
-            
-            # Plot last task
-            if current_task is not None:
-                color = task_colors.get(current_task, 'gray')
-                ax.barh(i, len(schedule_unit) - start_time, left=start_time,
-                       height=0.6, alpha=0.8, color=color,
-                       label=current_task if current_task not in [t.get_text() for t in ax.get_legend().get_texts()] else "")
-        
-        ax.set_yticks(range(len(units)))
-        ax.set_yticklabels(units)
-        ax.set_xlabel('Time')
-        ax.set_ylabel('Units')
-        ax.set_title(f'{self.name} - Production Schedule')
-        ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-        ax.grid(True, alpha=0.3)
-        
-        # Inventory plot
-        if show_inventories and n_plots > 1:
-            ax2 = axes[1]
-            
-            # Simulate inventory evolution (simplified)
-            time_points = range(time_horizon + 1)
-            inventories = {state: [info['initial_amount']] for state, info in self.states.items()}
-            
-            # Simple inventory tracking
-            for t in range(time_horizon):
-                # Copy previous inventories
-                for state in inventories:
-                    inventories[state].append(inventories[state][-1])
-            
-            # Plot inventories
-            for state, inventory_history in inventories.items():
-                if self.states[state].get('is_product', False) or state in ['FeedA', 'FeedB']:  # Show key materials
-                    ax2.plot(time_points, inventory_history, marker='o', label=state)
-            
-            ax2.set_xlabel('Time')
-            ax2.set_ylabel('Inventory')
-            ax2.set_title('Material Inventories')
-            ax2.legend()
-            ax2.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plt.show()
+        from ..viz.scheduling import plot_schedule
+        plot_schedule(self, figsize=figsize, show_inventories=show_inventories)
     
     def get_schedule_metrics(self) -> Dict[str, Any]:
         """
@@ -6,13 +6,20 @@ including dynamic simulation and process analysis.
 
 Classes:
     ProcessSimulation: Dynamic process simulation with control loops
+    ScenarioRunner: Serial or process-pool execution of independent scenarios
+    ScenarioSpec: Picklable scenario description
+    StepProfile: Picklable step profile for setpoints and disturbances
     
 Author: Thorsten Gressling <gressling@paramus.ai>
 License: MIT License
 """
 
 from .process_simulation import ProcessSimulation
+from .scenario_runner import ScenarioRunner, ScenarioSpec, StepProfile
 
 __all__ = [
-    'ProcessSimulation'
+    'ProcessSimulation',
+    'ScenarioRunner',
+    'ScenarioSpec',
+    'StepProfile'
 ]
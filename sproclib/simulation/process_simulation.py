@@ -10,8 +10,9 @@ License: MIT License
 
 import numpy as np
 from typing import Optional, Tuple, Dict, Any, List, Callable, Union
-import matplotlib.pyplot as plt
+from scipy import integrate
 from scipy.integrate import solve_ivp
+from scipy.optimize import OptimizeResult
 import logging
 
 logger = logging.getLogger(__name__)
@@ -78,11 +79,22 @@ class ProcessSimulation:
         solver: str = 'RK45',
         rtol: float = 1e-6,
         atol: float = 1e-9,
-        max_step: Optional[float] = None
+        max_step: Optional[float] = None,
+        sample_time: Optional[float] = None,
+        n_output_points: int = 1000,
+        t_eval: Optional[np.ndarray] = None,
+        dtype: type = np.float64
     ) -> Dict[str, np.ndarray]:
         """
         Run simulation with specified conditions.
         
+        States are taken from the solver's dense output in a single matrix
+        evaluation, and outputs from the model's output_batch(X) if it has
+        one. In closed loop the recorded inputs are the controller outputs
+        actually applied during integration, kept once per accepted solver
+        step (evaluations of rejected steps are dropped), so the controller
+        is not re-run afterwards and the history stays bounded.
+        
         Args:
             t_span: Time span (start, end)
             x0: Initial conditions
@@ -91,50 +103,66 @@ class ProcessSimulation:
             rtol: Relative tolerance
             atol: Absolute tolerance
             max_step: Maximum step size
+            sample_time: Controller sample period. If given, the simulation runs
+                as a sampled-data loop (see run_sampled)
+            n_output_points: Number of equally spaced output times (ignored if
+                t_eval is given)
+            t_eval: Explicit output times within t_span
+            dtype: Storage dtype for x, u, y and setpoint (e.g. np.float32 to
+                halve memory for long runs). Time stays float64
             
         Returns:
             Simulation results
         """
+        if sample_time is not None:
+            return self.run_sampled(
+                t_span, x0, sample_time, u_profile=u_profile,
+                solver=solver, rtol=rtol, atol=atol, max_step=max_step,
+                dtype=dtype
+            )
+        
         # Initialize controller state if present
         if self.controller is not None:
             self.controller.reset()
         
-        # Store control history for closed-loop
+        closed_loop = (u_profile is None and self.controller is not None
+                       and self.setpoint_profile is not None)
+        
+        # Controller outputs at accepted solver steps; evaluations of the
+        # current (trial) step are pending until the step is accepted
+        control_times = []
         control_history = []
-        setpoint_history = []
-        output_history = []
+        pending = []
+        u_hold = {'u': None}  # Latest input, used to evaluate the plant Jacobian
+        
+        def accept(t_accepted):
+            """Record the input applied last at or before an accepted time."""
+            for t_i, u_i in reversed(pending):
+                if t_i <= t_accepted:
+                    control_times.append(t_accepted)
+                    control_history.append(u_i)
+                    break
+            pending.clear()
         
         def dynamics(t, x):
             """Combined process and control dynamics."""
-            # Calculate process output
-            if hasattr(self.process_model, 'output'):
-                y = self.process_model.output(x)
-            else:
-                y = x[0] if len(x) > 0 else 0.0  # Default to first state
-            
             # Determine control input
             if u_profile is not None:
                 # Open-loop simulation
                 u = u_profile(t)
-            elif self.controller is not None and self.setpoint_profile is not None:
+            elif closed_loop:
                 # Closed-loop simulation
                 setpoint = self.setpoint_profile(t)
-                u = self.controller.update(t, setpoint, y)
+                u = self.controller.update(t, setpoint, self._output(x))
                 
-                # Store history
-                control_history.append(u)
-                setpoint_history.append(setpoint)
-                output_history.append(y)
+                pending.append((t, u))
             else:
                 # No control input
                 u = np.zeros(getattr(self.process_model, 'n_inputs', 1))
+            u_hold['u'] = u
             
             # Add disturbances
-            d_total = np.zeros_like(x)
-            for disturbance in self.disturbances:
-                d = disturbance['function'](t)
-                if len(d) == len(x):
-                    d_total += d
+            d_total = self._disturbance(t, x)
             
             # Calculate process dynamics
             if hasattr(self.process_model, 'dynamics'):
@@ -147,63 +175,269 @@ class ProcessSimulation:
         
         # Run simulation
         try:
-            sol = solve_ivp(
-                dynamics, t_span, x0, 
-                method=solver, rtol=rtol, atol=atol,
-                max_step=max_step, dense_output=True
+            sol = self._integrate(
+                dynamics, t_span, x0, solver, accept,
+                rtol=rtol, atol=atol, max_step=np.inf if max_step is None else max_step,
+                **self._jacobian_options(solver, lambda t: u_hold['u'])
             )
             
             if not sol.success:
                 logger.error(f"Simulation failed: {sol.message}")
                 return {}
             
-            # Extract results at regular intervals
-            t_eval = np.linspace(t_span[0], t_span[1], 1000)
+            # Evaluate dense output once on the output grid
+            if t_eval is None:
+                t_eval = np.linspace(t_span[0], t_span[1], n_output_points)
+            t_eval = np.asarray(t_eval, dtype=float)
             x_results = sol.sol(t_eval)
             
-            # Reconstruct control inputs and outputs
-            u_results = []
-            y_results = []
+            y_results = self._output_batch(x_results)
             
-            for t in t_eval:
-                # Calculate output
-                x_t = sol.sol(t)
-                if hasattr(self.process_model, 'output'):
-                    y_t = self.process_model.output(x_t)
-                else:
-                    y_t = x_t[0] if len(x_t) > 0 else 0.0
-                y_results.append(y_t)
+            # Inputs
+            if u_profile is not None:
+                u_results = self._evaluate_profile(u_profile, t_eval)
+            elif closed_loop and control_history:
+                idx = np.searchsorted(control_times, t_eval, side='right') - 1
+                u_results = np.asarray(control_history)[np.maximum(idx, 0)]
+            else:
+                u_results = np.zeros(len(t_eval))
+            
+            # Store results
+            self.results = {
+                't': t_eval,
+                'x': x_results.astype(dtype, copy=False),
+                'u': np.asarray(u_results.T if u_results.ndim > 1 else u_results, dtype=dtype),
+                'y': y_results.astype(dtype, copy=False),
+                'success': sol.success,
+                'message': sol.message,
+                'nfev': sol.nfev
+            }
+            
+            # Add setpoint history for closed-loop
+            if self.setpoint_profile is not None:
+                self.results['setpoint'] = self._evaluate_profile(
+                    self.setpoint_profile, t_eval
+                ).astype(dtype, copy=False)
+            
+            logger.info(f"Simulation completed successfully over {t_span[1]-t_span[0]:.2f} time units")
+            return self.results
+            
+        except Exception as e:
+            logger.error(f"Simulation error: {e}")
+            return {'success': False, 'error': str(e)}
+    
+    @staticmethod
+    def _evaluate_profile(func: Callable[[float], Any], t: np.ndarray) -> np.ndarray:
+        """
+        Evaluate a time profile on an array of times.
+        
+        Scalar-valued profiles are first called with the whole time array;
+        profiles that are not array-aware (or return vectors) fall back to
+        one call per time point.
+        """
+        if np.ndim(func(t[0])) == 0:
+            try:
+                values = np.asarray(func(t), dtype=float)
+                if values.ndim == 0:
+                    return np.full(len(t), float(values))
+                if values.shape == t.shape:
+                    return values
+            except (TypeError, ValueError):
+                pass
+        return np.array([func(t_i) for t_i in t])
+    
+    @staticmethod
+    def _integrate(
+        fun: Callable[[float, np.ndarray], np.ndarray],
+        t_span: Tuple[float, float],
+        x0: np.ndarray,
+        solver: str,
+        on_step: Callable[[float], None],
+        **options
+    ):
+        """
+        Integrate like solve_ivp(..., dense_output=True), reporting accepted steps.
+        
+        on_step(t) is called with the initial time and with the end time of
+        every accepted step, so callers can discard the RHS evaluations of
+        rejected steps.
+        
+        Returns:
+            OptimizeResult with sol, success, message and nfev
+        """
+        method = getattr(integrate, solver, None) if isinstance(solver, str) else solver
+        if not (isinstance(method, type) and issubclass(method, integrate.OdeSolver)):
+            raise ValueError(f"Unknown ODE solver '{solver}'")
+        
+        ode = method(fun, t_span[0], np.asarray(x0, dtype=float), t_span[1], **options)
+        on_step(ode.t)
+        ts, interpolants = [ode.t], []
+        while ode.status == 'running':
+            message = ode.step()
+            if ode.status == 'failed':
+                return OptimizeResult(sol=None, success=False, message=message, nfev=ode.nfev)
+            ts.append(ode.t)
+            interpolants.append(ode.dense_output())
+            on_step(ode.t)
+        
+        return OptimizeResult(sol=integrate.OdeSolution(ts, interpolants), success=True,
+                              message='The solver successfully reached the end of the integration interval.',
+                              nfev=ode.nfev)
+    
+    def _output_batch(self, X: np.ndarray) -> np.ndarray:
+        """
+        Process outputs for states X of shape (n_states, T).
+        
+        Models may provide output_batch(X) taking the (T, n_states) state
+        trajectory in one array call; output(x) is looped over otherwise.
+        """
+        if hasattr(self.process_model, 'output_batch'):
+            return np.asarray(self.process_model.output_batch(X.T))
+        if hasattr(self.process_model, 'output'):
+            return np.array([self.process_model.output(x_t) for x_t in X.T])
+        if len(X) > 0:
+            return X[0].copy()
+        return np.zeros(X.shape[1])
+    
+    def _output(self, x: np.ndarray):
+        """Process output for state x (first state if the model has no output method)."""
+        if hasattr(self.process_model, 'output'):
+            return self.process_model.output(x)
+        return x[0] if len(x) > 0 else 0.0
+    
+    def _disturbance(self, t: float, x: np.ndarray) -> np.ndarray:
+        """Sum of all state disturbances at time t."""
+        d_total = np.zeros_like(x)
+        for disturbance in self.disturbances:
+            d = disturbance['function'](t)
+            if len(d) == len(x):
+                d_total += d
+        return d_total
+    
+    def _jacobian_options(
+        self,
+        solver: str,
+        u_func: Callable[[float], np.ndarray]
+    ) -> Dict[str, Any]:
+        """Jacobian options for solve_ivp if the process model provides them."""
+        if hasattr(self.process_model, 'solver_jacobian_options'):
+            return self.process_model.solver_jacobian_options(solver, u_func)
+        return {}
+    
+    def run_sampled(
+        self,
+        t_span: Tuple[float, float],
+        x0: np.ndarray,
+        sample_time: float,
+        u_profile: Optional[Callable[[float], np.ndarray]] = None,
+        solver: str = 'RK45',
+        rtol: float = 1e-6,
+        atol: float = 1e-9,
+        max_step: Optional[float] = None,
+        dtype: type = np.float64
+    ) -> Dict[str, np.ndarray]:
+        """
+        Run a sampled-data (discrete-time controller) simulation.
+        
+        The controller is executed exactly once per sample period and its
+        output is held constant (zero-order hold) while the plant is
+        integrated to the next sample. Histories are recorded once per
+        sample into preallocated arrays, so results do not depend on the
+        step sizes chosen by the ODE solver.
+        
+        Args:
+            t_span: Time span (start, end)
+            x0: Initial conditions
+            sample_time: Controller sample period
+            u_profile: Input profile function (for open-loop) or None (for closed-loop)
+            solver: ODE solver method used between samples
+            rtol: Relative tolerance
+            atol: Absolute tolerance
+            max_step: Maximum step size
+            dtype: Storage dtype for x, u, y and setpoint
+            
+        Returns:
+            Simulation results with one entry per sample
+        """
+        if sample_time <= 0:
+            raise ValueError("sample_time must be positive")
+        
+        if self.controller is not None:
+            self.controller.reset()
+        
+        t_start, t_end = t_span
+        n_intervals = int(np.ceil((t_end - t_start) / sample_time - 1e-9))
+        t_samples = np.minimum(t_start + sample_time * np.arange(n_intervals + 1), t_end)
+        n_samples = len(t_samples)
+        
+        x = np.asarray(x0, dtype=float)
+        x_results = np.empty((len(x), n_samples), dtype=dtype)
+        y_results = u_results = sp_results = None
+        closed_loop = (u_profile is None and self.controller is not None
+                       and self.setpoint_profile is not None)
+        n_inputs = getattr(self.process_model, 'n_inputs', 1)
+        nfev = 0
+        
+        try:
+            for k, t in enumerate(t_samples):
+                y = self._output(x)
+                setpoint = self.setpoint_profile(t) if self.setpoint_profile is not None else None
                 
-                # Calculate control input
+                # Controller executes once per sample
                 if u_profile is not None:
-                    u_t = u_profile(t)
-                elif self.controller is not None and self.setpoint_profile is not None:
-                    setpoint_t = self.setpoint_profile(t)
-                    u_t = self.controller.update(t, setpoint_t, y_t)
+                    u = u_profile(t)
+                elif closed_loop:
+                    u = self.controller.update(t, setpoint, y)
                 else:
-                    u_t = 0.0
+                    u = np.zeros(n_inputs)
                 
-                u_results.append(u_t)
-            
-            u_results = np.array(u_results)
-            y_results = np.array(y_results)
+                if k == 0:
+                    y_results = np.empty((n_samples,) + np.shape(y), dtype=dtype)
+                    u_results = np.empty((n_samples,) + np.shape(u), dtype=dtype)
+                    if setpoint is not None:
+                        sp_results = np.empty((n_samples,) + np.shape(setpoint), dtype=dtype)
+                x_results[:, k] = x
+                y_results[k] = y
+                u_results[k] = u
+                if sp_results is not None:
+                    sp_results[k] = setpoint
+                
+                if k == n_samples - 1:
+                    break
+                
+                # Integrate plant over the sample interval with u held
+                def dynamics(t, x, u=u):
+                    return self.process_model.dynamics(t, x, u) + self._disturbance(t, x)
+                
+                options = self._jacobian_options(solver, lambda t, u=u: u)
+                if max_step is not None:
+                    options['max_step'] = max_step
+                sol = solve_ivp(
+                    dynamics, (t, t_samples[k + 1]), x,
+                    method=solver, rtol=rtol, atol=atol, **options
+                )
+                nfev += sol.nfev
+                
+                if not sol.success:
+                    logger.error(f"Simulation failed at t={t:.4g}: {sol.message}")
+                    return {}
+                
+                x = sol.y[:, -1]
             
-            # Store results
             self.results = {
-                't': t_eval,
+                't': t_samples,
                 'x': x_results,
                 'u': u_results.T if u_results.ndim > 1 else u_results,
                 'y': y_results,
-                'success': sol.success,
-                'message': sol.message
+                'success': True,
+                'message': 'Sampled-data simulation completed',
+                'nfev': nfev
             }
             
-            # Add setpoint history for closed-loop
-            if self.setpoint_profile is not None:
-                sp_results = [self.setpoint_profile(t) for t in t_eval]
-                self.results['setpoint'] = np.array(sp_results)
+            if sp_results is not None:
+                self.results['setpoint'] = sp_results
             
-            logger.info(f"Simulation completed successfully over {t_span[1]-t_span[0]:.2f} time units")
+            logger.info(f"Sampled simulation completed: {n_samples} samples, {nfev} RHS evaluations")
             return self.results
             
         except Exception as e:
@@ -216,7 +450,7 @@ class ProcessSimulation:
         figsize: Tuple[int, int] = (12, 10)
     ):
         """
-        Plot simulation results.
+        Plot simulation results (requires matplotlib, see sproclib.viz).
         
         Args:
             variables: List of variables to plot
@@ -226,67 +460,8 @@ class ProcessSimulation:
             logger.error("No valid simulation results to plot")
             return
         
-        t = self.results['t']
-        x = self.results['x']
-        u = self.results['u']
-        y = self.results['y']
-        
-        # Determine number of subplots
-        n_plots = 3
-        if 'setpoint' in self.results:
-            n_plots = 4
-        
-        fig, axes = plt.subplots(n_plots, 1, figsize=figsize)
-        if n_plots == 1:
-            axes = [axes]
-        
-        # Plot states
-        if x.ndim > 1:
-            for i in range(x.shape[0]):
-                axes[0].plot(t, x[i, :], label=f'x{i+1}')
-        else:
-            axes[0].plot(t, x, label='x')
-        axes[0].set_ylabel('States')
-        axes[0].legend()
-        axes[0].grid(True, alpha=0.3)
-        axes[0].set_title(f'{self.name} - State Variables')
-        
-        # Plot inputs
-        if u.ndim > 1:
-            for i in range(u.shape[0]):
-                axes[1].plot(t, u[i, :], label=f'u{i+1}')
-        else:
-            axes[1].plot(t, u, label='u')
-        axes[1].set_ylabel('Inputs')
-        axes[1].legend()
-        axes[1].grid(True, alpha=0.3)
-        axes[1].set_title('Control Inputs')
-        
-        # Plot outputs
-        axes[2].plot(t, y, 'b-', label='Output', linewidth=2)
-        if 'setpoint' in self.results:
-            axes[2].plot(t, self.results['setpoint'], 'r--', label='Setpoint', linewidth=2)
-            axes[2].set_title('Process Output vs Setpoint')
-        else:
-            axes[2].set_title('Process Output')
-        axes[2].set_ylabel('Output')
-        axes[2].legend()
-        axes[2].grid(True, alpha=0.3)
-        
-        # Plot control performance if closed-loop
-        if 'setpoint' in self.results and n_plots >= 4:
-            error = self.results['setpoint'] - y
-            axes[3].plot(t, error, 'g-', label='Error')
-            axes[3].set_ylabel('Control Error')
-            axes[3].set_xlabel('Time')
-            axes[3].legend()
-            axes[3].grid(True, alpha=0.3)
-            axes[3].set_title('Control Error')
-        else:
-            axes[-1].set_xlabel('Time')
-        
-        plt.tight_layout()
-        plt.show()
+        from ..viz.simulation import plot_simulation_results
+        plot_simulation_results(self.results, name=self.name, variables=variables, figsize=figsize)
     
     def get_performance_metrics(self) -> Dict[str, float]:
         """
@@ -339,40 +514,49 @@ class ProcessSimulation:
     def compare_scenarios(
         self,
         scenarios: List[Dict[str, Any]],
-        metric: str = 'mae'
+        metric: str = 'mae',
+        n_workers: int = 1,
+        chunksize: int = 1,
+        seed: Optional[int] = None,
+        return_trajectories: bool = True
     ) -> Dict[str, Any]:
         """
         Compare multiple simulation scenarios.
         
+        Scenarios are independent and can run in a process pool (see
+        ScenarioRunner). Besides run() keyword arguments in
+        'simulation_params', a scenario may give a 'setpoint' profile,
+        extra 'disturbances' and a 'seed'.
+        
         Args:
             scenarios: List of scenario dictionaries
-            metric: Performance metric for comparison
+            metric: Performance metric for comparison (e.g. 'mae', 'ise', 'iae', 'itae')
+            n_workers: Number of worker processes (1 runs in this process)
+            chunksize: Number of scenarios sent to a worker at a time
+            seed: Base seed for per-scenario random number seeds
+            return_trajectories: Include full results for every scenario
             
         Returns:
-            Comparison results
+            Comparison results, including a columnar metrics 'table'
         """
-        results = {}
+        from .scenario_runner import ScenarioRunner
         
-        for i, scenario in enumerate(scenarios):
-            scenario_name = scenario.get('name', f'Scenario_{i+1}')
-            
-            # Run scenario
-            scenario_results = self.run(**scenario.get('simulation_params', {}))
-            
-            if scenario_results.get('success', False):
-                # Calculate performance metrics
-                metrics = self.get_performance_metrics()
-                results[scenario_name] = {
-                    'results': scenario_results,
-                    'metrics': metrics,
-                    'metric_value': metrics.get(metric, np.inf)
-                }
-            else:
-                results[scenario_name] = {
-                    'results': scenario_results,
-                    'metrics': {},
-                    'metric_value': np.inf
-                }
+        runner = ScenarioRunner(
+            self, n_workers=n_workers, chunksize=chunksize, seed=seed,
+            return_trajectories=return_trajectories
+        )
+        outcome = runner.run(scenarios)
+        table = outcome['table']
+        metric_names = [key for key in table if key not in ('name', 'seed', 'success', 'elapsed')]
+        
+        results = {}
+        for i, scenario_name in enumerate(table['name']):
+            metrics = {key: table[key][i] for key in metric_names if not np.isnan(table[key][i])}
+            results[scenario_name] = {
+                'results': outcome['trajectories'][i] if return_trajectories else None,
+                'metrics': metrics,
+                'metric_value': metrics.get(metric, np.inf)
+            }
         
         # Find best scenario
         best_scenario = min(results.keys(), key=lambda k: results[k]['metric_value'])
@@ -380,5 +564,6 @@ class ProcessSimulation:
         return {
             'scenarios': results,
             'best_scenario': best_scenario,
-            'comparison_metric': metric
+            'comparison_metric': metric,
+            'table': table
         }
@@ -0,0 +1,319 @@
+"""
+Parallel Scenario Runner for SPROCLIB
+
+This module runs many independent closed-loop scenarios of one
+ProcessSimulation, optionally across a process pool, and collects a
+columnar table of performance metrics.
+
+The simulation (process model and controller) is sent to each worker once;
+tasks only carry picklable scenario specs and seeds. Full trajectories are
+optional and are returned through shared memory rather than pickled back
+through the pool's pipes.
+
+Author: Thorsten Gressling <gressling@paramus.ai>
+License: MIT License
+"""
+
+import numpy as np
+import multiprocessing
+import random
+import secrets
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory, resource_tracker
+from typing import Optional, Dict, Any, List, Callable, Union
+import logging
+
+from ..utilities.control_utils import calculate_ise, calculate_iae, calculate_itae
+
+logger = logging.getLogger(__name__)
+
+TRAJECTORY_KEYS = ('t', 'x', 'u', 'y', 'setpoint')
+
+
+@dataclass
+class ScenarioSpec:
+    """
+    Picklable description of one simulation scenario.
+
+    Profiles must be picklable for parallel runs: module-level functions,
+    functools.partial objects or callable instances such as StepProfile
+    (lambdas only work with n_workers=1).
+    """
+    name: str
+    simulation_params: Dict[str, Any] = field(default_factory=dict)
+    setpoint: Optional[Callable[[float], Union[float, np.ndarray]]] = None
+    disturbances: List[Callable[[float], np.ndarray]] = field(default_factory=list)
+    seed: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, scenario: Dict[str, Any], index: int = 0) -> 'ScenarioSpec':
+        """Create a spec from a compare_scenarios style dictionary."""
+        return cls(
+            name=scenario.get('name', f'Scenario_{index+1}'),
+            simulation_params=dict(scenario.get('simulation_params', {})),
+            setpoint=scenario.get('setpoint'),
+            disturbances=list(scenario.get('disturbances', [])),
+            seed=scenario.get('seed')
+        )
+
+
+class StepProfile:
+    """Picklable step profile: initial value before t_step, final value after."""
+
+    def __init__(self, t_step: float, initial: Union[float, np.ndarray], final: Union[float, np.ndarray]):
+        """
+        Initialize step profile.
+
+        Args:
+            t_step: Step time
+            initial: Value before the step
+            final: Value from the step time on
+        """
+        self.t_step = t_step
+        self.initial = initial
+        self.final = final
+
+    def __call__(self, t):
+        if np.ndim(t) == 0:
+            return self.final if t >= self.t_step else self.initial
+        return np.where(np.asarray(t) >= self.t_step, self.final, self.initial)
+
+
+class ScenarioRunner:
+    """Run independent scenarios of a ProcessSimulation serially or in a process pool."""
+
+    def __init__(
+        self,
+        simulation,
+        n_workers: Optional[int] = None,
+        chunksize: int = 1,
+        seed: Optional[int] = None,
+        return_trajectories: bool = False,
+        use_shared_memory: bool = True,
+        mp_context: Optional[str] = None
+    ):
+        """
+        Initialize scenario runner.
+
+        Args:
+            simulation: ProcessSimulation instance (must be picklable for n_workers > 1)
+            n_workers: Number of worker processes (None: CPU count, 1: run in-process)
+            chunksize: Number of scenarios sent to a worker at a time
+            seed: Base seed; per-scenario seeds are spawned from it
+            return_trajectories: Also return the full trajectories
+            use_shared_memory: Transport trajectories from workers via shared memory
+            mp_context: Multiprocessing start method ('fork', 'spawn', ...)
+        """
+        self.simulation = simulation
+        self.n_workers = n_workers or multiprocessing.cpu_count()
+        self.chunksize = chunksize
+        self.seed = seed
+        self.return_trajectories = return_trajectories
+        self.use_shared_memory = use_shared_memory
+        self.mp_context = mp_context
+
+    def run(self, scenarios: List[Union[ScenarioSpec, Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Run all scenarios.
+
+        Args:
+            scenarios: Scenario specs or compare_scenarios style dictionaries
+
+        Returns:
+            Dictionary with a columnar 'table' (name, seed, success, elapsed
+            and one array per metric, NaN where unavailable) and, if requested,
+            'trajectories' (one results dictionary per scenario, in order)
+        """
+        specs = [s if isinstance(s, ScenarioSpec) else ScenarioSpec.from_dict(s, i)
+                 for i, s in enumerate(scenarios)]
+        children = np.random.SeedSequence(self.seed).spawn(len(specs))
+        seeds = [int(spec.seed) if spec.seed is not None else int(child.generate_state(1)[0])
+                 for spec, child in zip(specs, children)]
+
+        start = time.perf_counter()
+        parallel = self.n_workers > 1 and len(specs) > 1
+        if parallel:
+            # Shared memory blocks get known names, so the parent can release
+            # every block a worker may have created if the run is aborted
+            token = secrets.token_hex(4)
+            block_names = [f'psm_sc{token}_{k}' for k in range(len(specs))]
+            tasks = [(spec, seed, self.return_trajectories, self.use_shared_memory, name)
+                     for spec, seed, name in zip(specs, seeds, block_names)]
+            context = multiprocessing.get_context(self.mp_context)
+            rows = []
+            try:
+                with context.Pool(self.n_workers, initializer=_init_worker,
+                                  initargs=(self.simulation,)) as pool:
+                    for row in pool.imap(_run_task, tasks, chunksize=self.chunksize):
+                        if 'shared_memory' in row:
+                            row['trajectories'] = _unpack_trajectories(row.pop('shared_memory'))
+                        rows.append(row)
+            except BaseException:
+                # The pool is terminated here, so no worker creates blocks any more
+                if self.return_trajectories and self.use_shared_memory:
+                    _release_blocks(block_names)
+                raise
+        else:
+            rows = [_run_scenario(self.simulation, spec, seed, self.return_trajectories, False)
+                    for spec, seed in zip(specs, seeds)]
+
+        logger.info(f"Ran {len(specs)} scenarios in {time.perf_counter() - start:.2f} s "
+                    f"({self.n_workers if parallel else 1} workers)")
+
+        outcome = {'table': _build_table(rows)}
+        if self.return_trajectories:
+            outcome['trajectories'] = [row.get('trajectories', {}) for row in rows]
+        return outcome
+
+
+def scenario_metrics(simulation, results: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Performance metrics of one simulation result.
+
+    Args:
+        simulation: ProcessSimulation whose results are evaluated
+        results: Results dictionary returned by run
+
+    Returns:
+        get_performance_metrics values plus ISE, IAE and ITAE
+    """
+    if not results.get('success', False) or 'setpoint' not in results:
+        return {}
+
+    metrics = dict(simulation.get_performance_metrics())
+    t = np.asarray(results['t'], dtype=float)
+    error = np.asarray(results['setpoint'], dtype=float) - np.asarray(results['y'], dtype=float)
+    metrics['ise'] = calculate_ise(t, error)
+    metrics['iae'] = calculate_iae(t, error)
+    metrics['itae'] = calculate_itae(t - t[0], error)
+    return {key: float(value) for key, value in metrics.items()}
+
+
+# Worker-side state: the simulation is shipped once per worker by the initializer
+_worker_simulation = None
+
+
+def _init_worker(simulation):
+    global _worker_simulation
+    _worker_simulation = simulation
+
+
+def _run_task(task):
+    spec, seed, keep_trajectories, use_shared_memory, block_name = task
+    return _run_scenario(_worker_simulation, spec, seed, keep_trajectories, use_shared_memory,
+                         block_name)
+
+
+@contextmanager
+def _seeded_global_rngs(seed: int):
+    """Seed NumPy's and Python's global RNGs, restoring the caller's state on exit."""
+    numpy_state, python_state = np.random.get_state(), random.getstate()
+    np.random.seed(seed)
+    random.seed(seed)
+    try:
+        yield
+    finally:
+        np.random.set_state(numpy_state)
+        random.setstate(python_state)
+
+
+def _run_scenario(simulation, spec: ScenarioSpec, seed: int, keep_trajectories: bool,
+                  use_shared_memory: bool, block_name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run one scenario and restore the simulation's profiles afterwards.
+
+    The global NumPy and Python RNGs are seeded for the scenario, so random
+    profiles are reproducible, and restored afterwards, so serial runs leave
+    the caller's random state untouched.
+    """
+    with _seeded_global_rngs(seed):
+        saved_setpoint = simulation.setpoint_profile
+        saved_disturbances = simulation.disturbances
+        try:
+            if spec.setpoint is not None:
+                simulation.setpoint_profile = spec.setpoint
+            simulation.disturbances = saved_disturbances + [
+                {'function': d, 'name': f'{spec.name}_disturbance_{i+1}'}
+                for i, d in enumerate(spec.disturbances)
+            ]
+
+            start = time.perf_counter()
+            results = simulation.run(**spec.simulation_params)
+            row = {
+                'name': spec.name,
+                'seed': seed,
+                'success': bool(results.get('success', False)),
+                'elapsed': time.perf_counter() - start,
+                'metrics': scenario_metrics(simulation, results)
+            }
+
+            if keep_trajectories:
+                arrays = {key: np.asarray(results[key]) for key in TRAJECTORY_KEYS if key in results}
+                scalars = {key: value for key, value in results.items() if key not in arrays}
+                if use_shared_memory and arrays:
+                    row['shared_memory'] = _pack_trajectories(arrays, scalars, block_name)
+                else:
+                    row['trajectories'] = {**scalars, **arrays}
+            return row
+        finally:
+            simulation.setpoint_profile = saved_setpoint
+            simulation.disturbances = saved_disturbances
+
+
+def _pack_trajectories(arrays: Dict[str, np.ndarray], scalars: Dict[str, Any],
+                       name: Optional[str] = None) -> Dict[str, Any]:
+    """Copy arrays into a new shared memory block; only its name and layout are pickled."""
+    layout, offset = [], 0
+    for key, array in arrays.items():
+        layout.append((key, offset, array.shape, array.dtype.str))
+        offset += -(-array.nbytes // 16) * 16  # 16-byte aligned
+
+    shm = shared_memory.SharedMemory(name=name, create=True, size=max(offset, 1))
+    # Ownership passes to the parent, which attaches and unlinks the block
+    resource_tracker.unregister(shm._name, 'shared_memory')
+    try:
+        for (key, start, shape, dtype) in layout:
+            np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=start)[...] = arrays[key]
+    finally:
+        shm.close()
+    return {'name': shm.name, 'layout': layout, 'scalars': scalars}
+
+
+def _unpack_trajectories(packed: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy arrays out of a worker's shared memory block and release it."""
+    shm = shared_memory.SharedMemory(name=packed['name'])
+    try:
+        trajectories = dict(packed['scalars'])
+        for key, start, shape, dtype in packed['layout']:
+            trajectories[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=start).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+    return trajectories
+
+
+def _release_blocks(names: List[str]):
+    """Unlink the shared memory blocks that exist among names (after an aborted run)."""
+    for name in names:
+        try:
+            shm = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            continue
+        shm.close()
+        shm.unlink()
+
+
+def _build_table(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Columnar result table from per-scenario rows."""
+    metric_names = sorted({name for row in rows for name in row['metrics']})
+    table = {
+        'name': [row['name'] for row in rows],
+        'seed': np.array([row['seed'] for row in rows], dtype=np.int64),
+        'success': np.array([row['success'] for row in rows], dtype=bool),
+        'elapsed': np.array([row['elapsed'] for row in rows], dtype=float)
+    }
+    for name in metric_names:
+        table[name] = np.array([row['metrics'].get(name, np.nan) for row in rows], dtype=float)
+    return table
@@ -0,0 +1,297 @@
+"""
+Test suite for ProcessSimulation
+
+Tests cover the continuous and sampled-data closed-loop engines and result
+bookkeeping.
+"""
+
+import pytest
+import numpy as np
+import glob
+import random
+import time
+from .process_simulation import ProcessSimulation
+from .scenario_runner import ScenarioRunner, ScenarioSpec, StepProfile
+from ..controller.pid.PIDController import PIDController
+
+
+class FirstOrderProcess:
+    """First-order process dx/dt = (K*u - x)/tau with a scalar input."""
+
+    def __init__(self, K: float = 2.0, tau: float = 5.0):
+        self.K = K
+        self.tau = tau
+
+    def dynamics(self, t, x, u):
+        return np.array([(self.K * float(np.ravel(u)[0]) - x[0]) / self.tau])
+
+
+class CountingPID(PIDController):
+    """PID controller that counts update calls."""
+
+    def reset(self):
+        super().reset()
+        self.n_updates = 0
+
+    def update(self, t, SP, PV, TR=None):
+        self.n_updates += 1
+        return super().update(t, SP, PV, TR)
+
+
+class TimeStampController:
+    """Controller whose output is the time of the call."""
+
+    def reset(self):
+        self.calls = 0
+
+    def update(self, t, SP, PV, TR=None):
+        self.calls += 1
+        return np.array([t])
+
+
+class BatchOutputProcess(FirstOrderProcess):
+    """First-order process with a scaled output and a vectorized output_batch."""
+
+    def output(self, x):
+        raise AssertionError("pointwise output used")
+
+    def output_batch(self, X):
+        return 10.0 * X[:, 0]
+
+
+class SlowInvalidState:
+    """Initial state that fails to convert after a delay (lets other scenarios finish first)."""
+
+    def __array__(self, dtype=None, copy=None):
+        time.sleep(1.0)
+        raise RuntimeError("invalid initial state")
+
+
+class RandomLoad:
+    """Constant load disturbance of random size, drawn when first evaluated."""
+
+    def __init__(self, scale: float = 0.05):
+        self.scale = scale
+        self.value = None
+
+    def __call__(self, t):
+        if self.value is None:
+            self.value = np.random.normal(0.0, self.scale, 1)
+        return self.value
+
+
+class TestProcessSimulation:
+    """Test class for ProcessSimulation."""
+
+    @pytest.fixture
+    def closed_loop(self):
+        """Closed-loop first-order process with a PI controller."""
+        controller = CountingPID(Kp=1.0, Ki=0.5, MV_min=0.0, MV_max=10.0, direct_action=True)
+        sim = ProcessSimulation(FirstOrderProcess(), controller, name="Test Loop")
+        sim.set_setpoint_profile(lambda t: 1.0)
+        return sim
+
+    def test_run_sampled_tracks_setpoint(self, closed_loop):
+        """Test that the sampled loop reaches the setpoint."""
+        results = closed_loop.run_sampled((0.0, 60.0), np.array([0.0]), sample_time=0.5)
+
+        assert results['success']
+        assert len(results['t']) == 121
+        assert results['x'].shape == (1, 121)
+        assert results['u'].shape == (121,)
+        assert results['setpoint'].shape == (121,)
+        assert abs(results['y'][-1] - 1.0) < 1e-2
+
+    def test_run_sampled_one_update_per_sample(self, closed_loop):
+        """Test that the controller executes exactly once per sample."""
+        results = closed_loop.run((0.0, 10.0), np.array([0.0]), sample_time=0.25)
+
+        assert closed_loop.controller.n_updates == len(results['t']) == 41
+
+    def test_run_sampled_solver_independent(self, closed_loop):
+        """Test that results do not depend on the solver's step choice."""
+        rk45 = closed_loop.run_sampled((0.0, 20.0), np.array([0.0]), 0.5, solver='RK45',
+                                       rtol=1e-9, atol=1e-12)
+        lsoda = closed_loop.run_sampled((0.0, 20.0), np.array([0.0]), 0.5, solver='LSODA',
+                                        rtol=1e-9, atol=1e-12)
+
+        np.testing.assert_allclose(rk45['u'], lsoda['u'], rtol=1e-6, atol=1e-8)
+        np.testing.assert_allclose(rk45['x'], lsoda['x'], rtol=1e-6, atol=1e-8)
+
+    def test_run_sampled_partial_last_interval(self, closed_loop):
+        """Test that the final sample lands on the end of the time span."""
+        results = closed_loop.run_sampled((0.0, 1.0), np.array([0.0]), sample_time=0.3)
+
+        np.testing.assert_allclose(results['t'], [0.0, 0.3, 0.6, 0.9, 1.0])
+
+    def test_run_sampled_invalid_sample_time(self, closed_loop):
+        """Test that a non-positive sample time is rejected."""
+        with pytest.raises(ValueError):
+            closed_loop.run_sampled((0.0, 1.0), np.array([0.0]), sample_time=0.0)
+
+    def test_run_does_not_rerun_controller(self, closed_loop):
+        """Test that recorded inputs come from the integration pass only."""
+        results = closed_loop.run((0.0, 30.0), np.array([0.0]))
+        
+        assert results['success']
+        assert closed_loop.controller.n_updates == results['nfev']
+        assert results['u'].shape == (1000,)
+        assert abs(results['y'][-1] - 1.0) < 1e-2
+        assert np.all((results['u'] >= 0.0) & (results['u'] <= 10.0))
+
+    def test_run_records_accepted_steps_only(self):
+        """Test that inputs are recorded at accepted solver steps, not trial evaluations."""
+        accepted = []
+
+        class RecordingSimulation(ProcessSimulation):
+            @staticmethod
+            def _integrate(fun, t_span, x0, solver, on_step, **options):
+                def record(t):
+                    accepted.append(t)
+                    on_step(t)
+                return ProcessSimulation._integrate(fun, t_span, x0, solver, record, **options)
+
+        sim = RecordingSimulation(FirstOrderProcess(), TimeStampController())
+        sim.set_setpoint_profile(lambda t: 1.0)
+        results = sim.run((0.0, 20.0), np.array([0.0]), n_output_points=201)
+
+        assert results['success']
+        assert sim.controller.calls == results['nfev'] > len(accepted)
+        assert np.all(results['u'] <= results['t'])
+        assert np.all(np.isin(results['u'], accepted))
+
+    def test_run_batched_output(self):
+        """Test that output_batch evaluates all output points in one call."""
+        sim = ProcessSimulation(BatchOutputProcess(), name="Batch Output")
+        results = sim.run((0.0, 5.0), np.array([1.0]), u_profile=lambda t: 0.0, n_output_points=11)
+        np.testing.assert_allclose(results['y'], 10.0 * results['x'][0])
+
+    def test_run_output_grid(self, closed_loop):
+        """Test configurable output points and explicit output times."""
+        results = closed_loop.run((0.0, 10.0), np.array([0.0]), n_output_points=11)
+        np.testing.assert_allclose(results['t'], np.linspace(0.0, 10.0, 11))
+        assert results['x'].shape == (1, 11)
+        
+        t_eval = np.array([0.0, 2.5, 10.0])
+        results = closed_loop.run((0.0, 10.0), np.array([0.0]), t_eval=t_eval)
+        np.testing.assert_allclose(results['t'], t_eval)
+        assert results['setpoint'].shape == (3,)
+
+    def test_run_open_loop_profile(self):
+        """Test open-loop inputs for array-aware and scalar-only profiles."""
+        sim = ProcessSimulation(FirstOrderProcess(), name="Open Loop")
+        t_eval = np.linspace(0.0, 10.0, 21)
+        
+        step = sim.run((0.0, 10.0), np.array([0.0]), u_profile=lambda t: 1.0 if t >= 5.0 else 0.0,
+                       t_eval=t_eval)
+        np.testing.assert_array_equal(step['u'], (t_eval >= 5.0).astype(float))
+        
+        ramp = sim.run((0.0, 10.0), np.array([0.0]), u_profile=lambda t: 0.1 * t, t_eval=t_eval)
+        np.testing.assert_allclose(ramp['u'], 0.1 * t_eval)
+
+    def test_run_float32_storage(self, closed_loop):
+        """Test float32 result storage."""
+        results = closed_loop.run((0.0, 10.0), np.array([0.0]), dtype=np.float32)
+        
+        assert results['t'].dtype == np.float64
+        for key in ('x', 'u', 'y', 'setpoint'):
+            assert results[key].dtype == np.float32
+        
+        reference = closed_loop.run((0.0, 10.0), np.array([0.0]))
+        np.testing.assert_allclose(results['x'], reference['x'], rtol=1e-6)
+
+    def test_run_sampled_float32_storage(self, closed_loop):
+        """Test float32 storage in the sampled-data loop."""
+        results = closed_loop.run((0.0, 5.0), np.array([0.0]), sample_time=0.5, dtype=np.float32)
+        assert results['x'].dtype == np.float32
+        assert results['u'].dtype == np.float32
+
+
+class TestScenarioRunner:
+    """Test class for ScenarioRunner and compare_scenarios."""
+
+    @pytest.fixture
+    def simulation(self):
+        """Picklable closed-loop simulation."""
+        controller = PIDController(Kp=1.0, Ki=0.5, MV_min=0.0, MV_max=10.0, direct_action=True)
+        return ProcessSimulation(FirstOrderProcess(), controller, name="Scenario Loop")
+
+    @pytest.fixture
+    def scenarios(self):
+        """Setpoint step scenarios with random load disturbances."""
+        params = {'t_span': (0.0, 20.0), 'x0': np.array([0.0]), 'sample_time': 0.1}
+        return [
+            {'name': f'step_{sp}', 'simulation_params': params,
+             'setpoint': StepProfile(2.0, 0.0, sp), 'disturbances': [RandomLoad()]}
+            for sp in (0.5, 1.0, 1.5, 2.0)
+        ]
+
+    def test_serial_table(self, simulation, scenarios):
+        """Test the columnar metric table."""
+        outcome = ScenarioRunner(simulation, n_workers=1, seed=42).run(scenarios)
+        table = outcome['table']
+
+        assert table['name'] == ['step_0.5', 'step_1.0', 'step_1.5', 'step_2.0']
+        assert table['success'].all()
+        for key in ('ise', 'iae', 'itae', 'mae'):
+            assert table[key].shape == (4,)
+        assert np.all(np.diff(table['ise']) > 0)
+        assert 'trajectories' not in outcome
+        assert simulation.setpoint_profile is None
+        assert simulation.disturbances == []
+
+    def test_parallel_matches_serial(self, simulation, scenarios):
+        """Test that a process pool reproduces the serial results."""
+        shm_before = set(glob.glob('/dev/shm/psm_*'))
+        serial = ScenarioRunner(simulation, n_workers=1, seed=7, return_trajectories=True).run(scenarios)
+        parallel = ScenarioRunner(simulation, n_workers=2, chunksize=2, seed=7,
+                                  return_trajectories=True).run(scenarios)
+
+        np.testing.assert_array_equal(serial['table']['seed'], parallel['table']['seed'])
+        np.testing.assert_allclose(serial['table']['iae'], parallel['table']['iae'])
+        for a, b in zip(serial['trajectories'], parallel['trajectories']):
+            np.testing.assert_array_equal(a['x'], b['x'])
+            np.testing.assert_array_equal(a['u'], b['u'])
+        assert set(glob.glob('/dev/shm/psm_*')) <= shm_before
+
+    def test_failed_parallel_run_releases_shared_memory(self, simulation, scenarios):
+        """Test that no shared memory block outlives a parallel run that raises."""
+        shm_before = set(glob.glob('/dev/shm/psm_*'))
+        params = {'t_span': (0.0, 20.0), 'x0': SlowInvalidState(), 'sample_time': 0.1}
+        scenarios.insert(0, {'name': 'broken', 'simulation_params': params})
+        runner = ScenarioRunner(simulation, n_workers=2, seed=3, return_trajectories=True)
+
+        with pytest.raises(RuntimeError):
+            runner.run(scenarios)
+        assert set(glob.glob('/dev/shm/psm_*')) <= shm_before
+
+    def test_serial_run_keeps_caller_random_state(self, simulation, scenarios):
+        """Test that scenario seeding does not reset the caller's global RNGs."""
+        np.random.seed(123)
+        random.seed(123)
+        expected = np.random.random(), random.random()
+        np.random.seed(123)
+        random.seed(123)
+
+        simulation.compare_scenarios(scenarios, seed=1)
+        assert (np.random.random(), random.random()) == expected
+
+    def test_compare_scenarios(self, simulation, scenarios):
+        """Test scenario comparison on ISE."""
+        comparison = simulation.compare_scenarios(scenarios, metric='ise', seed=1)
+
+        assert comparison['best_scenario'] == 'step_0.5'
+        assert comparison['scenarios']['step_2.0']['results']['x'].shape == (1, 201)
+        assert comparison['table']['ise'][0] == comparison['scenarios']['step_0.5']['metric_value']
+
+    def test_scenario_spec_from_dict(self):
+        """Test conversion of scenario dictionaries."""
+        spec = ScenarioSpec.from_dict({'simulation_params': {'t_span': (0, 1)}}, index=2)
+
+        assert spec.name == 'Scenario_3'
+        assert spec.seed is None
+        assert spec.disturbances == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,65 @@
+"""
+Test suite for lazy package imports
+
+Tests that `import sproclib` stays cheap and that public names still
+resolve on first access.
+"""
+
+import importlib
+import os
+import subprocess
+import sys
+import pytest
+
+# Generous budget for a cold interpreter; eager imports took over 2 s
+IMPORT_TIME_BUDGET = 1.0
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import sproclib
+sproclib.PIDController
+elapsed = time.perf_counter() - start
+heavy = [m for m in ('scipy', 'matplotlib', 'sproclib.unit', 'sproclib.analysis') if m in sys.modules]
+print(elapsed, ','.join(heavy))
+"""
+
+
+class TestLazyImport:
+    """Test class for lazy package exports."""
+
+    def test_import_time_budget(self):
+        """Test that importing sproclib and reading PIDController stays fast."""
+        elapsed = min(self._probe()[0] for _ in range(3))
+        assert elapsed < IMPORT_TIME_BUDGET
+
+    def test_pid_does_not_import_heavy_modules(self):
+        """Test that unrelated subpackages and SciPy are not imported."""
+        assert self._probe()[1] == []
+
+    @pytest.mark.parametrize("package", [
+        'sproclib', 'sproclib.unit', 'sproclib.controller',
+        'sproclib.transport', 'sproclib.analysis', 'sproclib.optimization'
+    ])
+    def test_public_names_resolve(self, package):
+        """Test that every name in __all__ resolves and appears in dir()."""
+        module = importlib.import_module(package)
+        for name in module.__all__:
+            assert getattr(module, name) is not None
+            assert name in dir(module)
+
+    def test_unknown_attribute(self):
+        """Test that unknown names raise AttributeError."""
+        import sproclib
+        with pytest.raises(AttributeError):
+            sproclib.NoSuchController
+
+    def _probe(self):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run([sys.executable, '-c', PROBE], capture_output=True,
+                                text=True, check=True, cwd=root).stdout.split()
+        return float(output[0]), output[1].split(',') if len(output) > 1 else []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
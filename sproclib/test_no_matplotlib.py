@@ -0,0 +1,61 @@
+"""
+Test suite for the optional plotting layer
+
+Tests that computational modules import without matplotlib and that
+plotting is only reachable through sproclib.viz (or methods that defer to it).
+"""
+
+import os
+import subprocess
+import sys
+import pytest
+
+PROBE = """
+import contextlib, importlib, io, os, re, sys
+skip = re.compile(r'(example|demo|plot|test|_fixed|create_|generate_|visualiz|benchmark|__main__|run_|viz)', re.I)
+modules = []
+for directory, _, files in os.walk('sproclib'):
+    for filename in files:
+        path = os.path.join(directory, filename)
+        if filename.endswith('.py') and '__pycache__' not in path and not skip.search(path):
+            name = path[:-3].replace(os.sep, '.')
+            modules.append(name[:-len('.__init__')] if name.endswith('.__init__') else name)
+for name in sorted(modules):
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            importlib.import_module(name)
+    except Exception as e:
+        print('FAILED', name, repr(e))
+    if 'matplotlib' in sys.modules:
+        print('MATPLOTLIB', name)
+        break
+print('MODULES', len(modules))
+"""
+
+
+class TestNoMatplotlib:
+    """Test class for matplotlib-free library imports."""
+
+    def test_library_modules_do_not_import_matplotlib(self):
+        """Test that every non-plot module imports, and does so without loading matplotlib."""
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run([sys.executable, '-c', PROBE], capture_output=True,
+                                text=True, check=True, cwd=root).stdout.splitlines()
+
+        # A module that fails to import cannot be checked for matplotlib
+        failed = [line for line in output if line.startswith('FAILED')]
+        assert not failed, '\n'.join(failed)
+        assert not [line for line in output if line.startswith('MATPLOTLIB')]
+        assert int(output[-1].split()[1]) > 50
+
+    def test_viz_exports_resolve(self):
+        """Test that the plotting functions resolve on first access."""
+        pytest.importorskip('matplotlib')
+        import sproclib.viz as viz
+        for name in ('plot_simulation_results', 'plot_bode', 'plot_schedule'):
+            assert callable(getattr(viz, name))
+            assert name in dir(viz)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
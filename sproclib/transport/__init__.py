@@ -12,30 +12,22 @@ Batch Transport:
 - Solid: DrumBinTransfer, VacuumTransfer
 """
 
-from . import continuous
-from . import batch
+# Transport models are imported on first access (PEP 562)
+from .._lazy import attach
 
-# Import all transport classes for convenience
-from .continuous.liquid import PipeFlow, PeristalticFlow, SlurryPipeline
-from .continuous.solid import PneumaticConveying, ConveyorBelt, GravityChute, ScrewFeeder
-from .batch.liquid import BatchTransferPumping
-from .batch.solid import DrumBinTransfer, VacuumTransfer
+_EXPORTS = {
+    'PipeFlow': ('.continuous.liquid', 'PipeFlow'),
+    'PeristalticFlow': ('.continuous.liquid', 'PeristalticFlow'),
+    'SlurryPipeline': ('.continuous.liquid', 'SlurryPipeline'),
+    'PneumaticConveying': ('.continuous.solid', 'PneumaticConveying'),
+    'ConveyorBelt': ('.continuous.solid', 'ConveyorBelt'),
+    'GravityChute': ('.continuous.solid', 'GravityChute'),
+    'ScrewFeeder': ('.continuous.solid', 'ScrewFeeder'),
+    'BatchTransferPumping': ('.batch.liquid', 'BatchTransferPumping'),
+    'DrumBinTransfer': ('.batch.solid', 'DrumBinTransfer'),
+    'VacuumTransfer': ('.batch.solid', 'VacuumTransfer'),
+}
 
-__all__ = [
-    'continuous',
-    'batch',
-    # Continuous Liquid
-    'PipeFlow',
-    'PeristalticFlow', 
-    'SlurryPipeline',
-    # Continuous Solid
-    'PneumaticConveying',
-    'ConveyorBelt',
-    'GravityChute',
-    'ScrewFeeder',
-    # Batch Liquid
-    'BatchTransferPumping',
-    # Batch Solid
-    'DrumBinTransfer',
-    'VacuumTransfer'
-]
+__getattr__, __dir__ = attach(__name__, _EXPORTS, ['continuous', 'batch'])
+
+__all__ = ['continuous', 'batch'] + list(_EXPORTS)
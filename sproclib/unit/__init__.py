@@ -28,71 +28,38 @@ Author: Thorsten Gressling <gressling@paramus.ai>
 License: MIT License
 """
 
-# Import base classes
-from .base import ProcessModel
+# Units are imported on first access (PEP 562)
+from .._lazy import attach
 
-# Import core units that are known to work
-from .reactor.cstr import CSTR
-from .tank.interacting import InteractingTanks
-from .heat_exchanger import HeatExchanger
+_EXPORTS = {
+    'ProcessModel': ('.base', 'ProcessModel'),
+    'CSTR': ('.reactor.cstr', 'CSTR'),
+    'InteractingTanks': ('.tank.interacting', 'InteractingTanks'),
+    'HeatExchanger': ('.heat_exchanger', 'HeatExchanger'),
+    'Tank': ('.tank.single', 'Tank'),
+    'Pump': ('.pump', 'Pump'),
+    'CentrifugalPump': ('.pump', 'CentrifugalPump'),
+    'PositiveDisplacementPump': ('.pump', 'PositiveDisplacementPump'),
+    'ControlValve': ('.valve.control', 'ControlValve'),
+    'ThreeWayValve': ('.valve.three_way', 'ThreeWayValve'),
+    'Compressor': ('.compressor', 'Compressor'),
+    'Mixer': ('.mixer', 'Mixer'),
+    'LinearApproximation': ('.utilities', 'LinearApproximation'),
+    'GainScheduledModel': ('.utilities', 'GainScheduledModel'),
+    'BatchReactor': ('.reactor.batch', 'BatchReactor'),
+    'PlugFlowReactor': ('.reactor.plug_flow', 'PlugFlowReactor'),
+    'FixedBedReactor': ('.reactor.fixed_bed', 'FixedBedReactor'),
+    'SemiBatchReactor': ('.reactor.semi_batch', 'SemiBatchReactor'),
+    'FluidizedBedReactor': ('.reactor.fluidized_bed', 'FluidizedBedReactor'),
+    'DistillationTray': ('.distillation.tray', 'DistillationTray'),
+    'BinaryDistillationColumn': ('.distillation.column', 'BinaryDistillationColumn'),
+}
 
-# Import additional units with error handling
-try:
-    # Tank models
-    from .tank import Tank
-    
-    # Pump models  
-    from .pump import Pump, CentrifugalPump, PositiveDisplacementPump
-    
-    # Valve models
-    from .valve import ControlValve, ThreeWayValve
-    
-    # Compressor models
-    from .compressor import Compressor
-    
-    # Mixer models
-    from .mixer import Mixer
-    
-    # Utilities
-    from .utilities import LinearApproximation
-    
-    # Additional reactor models
-    from .reactor.batch import BatchReactor
-    from .reactor.plug_flow import PlugFlowReactor
-    from .reactor.fixed_bed import FixedBedReactor
-    from .reactor.semi_batch import SemiBatchReactor
-    from .reactor.fluidized_bed import FluidizedBedReactor
-    
-    # Distillation models
-    from .distillation.tray import DistillationTray
-    from .distillation.column import BinaryDistillationColumn
-
-except ImportError as e:
-    print(f"Warning: Some units could not be imported: {e}")
-    pass  # Some units may not be fully implemented yet
-
-__all__ = [
-    # Base classes
-    'ProcessModel',
-    
-    # Core working units
-    'CSTR',
-    'InteractingTanks',
-    'HeatExchanger',
+_SUBMODULES = [
+    'base', 'compressor', 'distillation', 'heat_exchanger', 'mixer', 'plant',
+    'pump', 'reactor', 'tank', 'utilities', 'valve'
 ]
 
-# Add additional units to __all__ if they were successfully imported
-import sys
-current_module = sys.modules[__name__]
-
-# Check what was successfully imported and add to __all__
-optional_units = [
-    'Tank', 'Pump', 'CentrifugalPump', 'PositiveDisplacementPump',
-    'ControlValve', 'ThreeWayValve', 'Compressor', 'Mixer', 'LinearApproximation',
-    'BatchReactor', 'PlugFlowReactor', 'FixedBedReactor', 'SemiBatchReactor',
-    'FluidizedBedReactor', 'DistillationTray', 'BinaryDistillationColumn'
-]
+__getattr__, __dir__ = attach(__name__, _EXPORTS, _SUBMODULES)
 
-for unit in optional_units:
-    if hasattr(current_module, unit):
-        __all__.append(unit)
+__all__ = list(_EXPORTS)
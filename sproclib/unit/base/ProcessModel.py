@@ -9,8 +9,9 @@ License: MIT License
 
 import numpy as np
 import logging
-from typing import Optional, Tuple, Dict, Any, List, Callable
+from typing import Optional, Tuple, Dict, Any, List, Callable, Union
 from abc import ABC, abstractmethod
+from scipy import sparse
 from scipy.integrate import solve_ivp
 
 logger = logging.getLogger(__name__)
@@ -60,12 +61,92 @@ class ProcessModel(ABC):
         """
         pass
     
+    def jacobian(self, t: float, x: np.ndarray, u: np.ndarray) -> Union[np.ndarray, sparse.spmatrix]:
+        """
+        Jacobian of the dynamics with respect to the states, df/dx.
+        
+        The default implementation uses forward finite differences. Models
+        override this with an analytic Jacobian; large tray or segment models
+        may return a scipy.sparse matrix.
+        
+        Args:
+            t: Time
+            x: State variables
+            u: Input variables
+            
+        Returns:
+            Jacobian matrix of shape (n_states, n_states)
+        """
+        x = np.asarray(x, dtype=float)
+        f0 = np.asarray(self.dynamics(t, x, u), dtype=float)
+        J = np.empty((len(f0), len(x)))
+        for j in range(len(x)):
+            h = np.sqrt(np.finfo(float).eps) * max(1.0, abs(x[j]))
+            x_pert = x.copy()
+            x_pert[j] += h
+            J[:, j] = (np.asarray(self.dynamics(t, x_pert, u), dtype=float) - f0) / h
+        return J
+    
+    @property
+    def has_jacobian(self) -> bool:
+        """True if the model provides an analytic jacobian implementation."""
+        return type(self).jacobian is not ProcessModel.jacobian
+    
+    def jacobian_sparsity(self) -> Optional[sparse.spmatrix]:
+        """
+        Sparsity pattern of the Jacobian.
+        
+        Returns:
+            Sparse matrix with nonzeros where df_i/dx_j may be nonzero, or
+            None if the Jacobian is treated as dense
+        """
+        return None
+    
+    def solver_jacobian_options(
+        self,
+        method: str,
+        u_func: Callable[[float], np.ndarray]
+    ) -> Dict[str, Any]:
+        """
+        Jacobian keyword arguments for solve_ivp.
+        
+        Implicit methods receive the analytic Jacobian if the model has one,
+        otherwise the sparsity pattern (if known) so that SciPy's finite
+        differencing groups independent columns.
+        
+        Args:
+            method: solve_ivp method name
+            u_func: Function returning inputs as function of time
+            
+        Returns:
+            Dictionary with 'jac' or 'jac_sparsity' (empty for explicit methods)
+        """
+        if method not in ('BDF', 'Radau', 'LSODA'):
+            return {}
+        
+        if self.has_jacobian:
+            if method == 'LSODA':
+                # LSODA only accepts dense Jacobians
+                def jac(t, x):
+                    J = self.jacobian(t, x, u_func(t))
+                    return J.toarray() if sparse.issparse(J) else J
+            else:
+                def jac(t, x):
+                    return self.jacobian(t, x, u_func(t))
+            return {'jac': jac}
+        
+        sparsity = self.jacobian_sparsity()
+        if sparsity is not None and method != 'LSODA':
+            return {'jac_sparsity': sparsity}
+        return {}
+    
     def simulate(
         self, 
         t_span: Tuple[float, float],
         x0: np.ndarray,
         u_func: Callable[[float], np.ndarray],
-        t_eval: Optional[np.ndarray] = None
+        t_eval: Optional[np.ndarray] = None,
+        method: str = 'RK45'
     ) -> Dict[str, np.ndarray]:
         """
         Simulate the process model.
@@ -75,6 +156,7 @@ class ProcessModel(ABC):
             x0: Initial conditions
             u_func: Function returning inputs as function of time
             t_eval: Time points for output (optional)
+            method: ODE solver method; implicit methods use the model Jacobian
             
         Returns:
             Dictionary with 't', 'x', 'u' arrays
@@ -83,7 +165,8 @@ class ProcessModel(ABC):
             u = u_func(t)
             return self.dynamics(t, x, u)
         
-        sol = solve_ivp(rhs, t_span, x0, t_eval=t_eval, dense_output=True)
+        sol = solve_ivp(rhs, t_span, x0, method=method, t_eval=t_eval, dense_output=True,
+                        **self.solver_jacobian_options(method, u_func))
         
         if t_eval is None:
             t_eval = sol.t
@@ -96,6 +179,135 @@ class ProcessModel(ABC):
             'u': u_values.T
         }
     
+    @property
+    def supports_batch(self) -> bool:
+        """True if the model provides a vectorized dynamics_batch implementation."""
+        return type(self).dynamics_batch is not ProcessModel.dynamics_batch
+    
+    def dynamics_batch(self, t: float, X: np.ndarray, U: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the dynamics for a batch of N states and inputs.
+        
+        The default implementation loops over the scalar dynamics. Models
+        override this with an array implementation operating on all rows at
+        once; model attributes may then hold (N,) arrays of parameters.
+        
+        Args:
+            t: Time
+            X: State variables, shape (N, n_states)
+            U: Input variables, shape (N, n_inputs)
+            
+        Returns:
+            State derivatives, shape (N, n_states)
+        """
+        X = np.atleast_2d(X)
+        U = np.atleast_2d(U)
+        dXdt = np.empty(X.shape, dtype=float)
+        for i in range(X.shape[0]):
+            dXdt[i] = self.dynamics(t, X[i], U[i])
+        return dXdt
+    
+    def simulate_batch(
+        self,
+        t_span: Tuple[float, float],
+        X0: np.ndarray,
+        U: Union[np.ndarray, Callable[[float], np.ndarray]],
+        params: Optional[Dict[str, np.ndarray]] = None,
+        t_eval: Optional[np.ndarray] = None,
+        method: str = 'RK45',
+        rtol: float = 1e-6,
+        atol: float = 1e-9
+    ) -> Dict[str, Any]:
+        """
+        Simulate an ensemble of N trajectories with a single solver call.
+        
+        All members are stacked into one state vector and advanced together.
+        Models that implement dynamics_batch are evaluated in one array call
+        per RHS evaluation; other models fall back to looping over dynamics.
+        
+        Args:
+            t_span: Time span (t_start, t_end)
+            X0: Initial conditions, shape (N, n_states)
+            U: Constant inputs of shape (N, n_inputs) or (n_inputs,), or a
+               function U(t) returning an (N, n_inputs) array
+            params: Per-member parameter values {name: array of length N}
+            t_eval: Time points for output (optional)
+            method: ODE solver method
+            rtol: Relative tolerance
+            atol: Absolute tolerance
+            
+        Returns:
+            Dictionary with 't' (n_t,), 'x' (N, n_states, n_t),
+            'u' (N, n_inputs, n_t), 'success', 'message' and 'nfev'
+        """
+        X0 = np.atleast_2d(np.asarray(X0, dtype=float))
+        N, n = X0.shape
+        
+        if callable(U):
+            u_func = U
+        else:
+            U_const = np.asarray(U, dtype=float)
+            U_const = np.broadcast_to(U_const, (N, U_const.shape[-1]))
+            u_func = lambda t: U_const
+        
+        params = {
+            key: np.broadcast_to(np.asarray(value, dtype=float), (N,))
+            for key, value in (params or {}).items()
+        }
+        for key in params:
+            if not hasattr(self, key):
+                raise ValueError(f"Parameter '{key}' not found in model '{self.name}'")
+        saved = {key: getattr(self, key) for key in params}
+        vectorized = self.supports_batch
+        n_u = np.atleast_2d(u_func(t_span[0])).shape[-1]
+        
+        def rhs(t, z):
+            X = z.reshape(N, n)
+            Ut = np.broadcast_to(np.atleast_2d(u_func(t)), (N, n_u))
+            if vectorized:
+                return self.dynamics_batch(t, X, Ut).ravel()
+            dXdt = np.empty((N, n))
+            for i in range(N):
+                for key, value in params.items():
+                    setattr(self, key, value[i])
+                dXdt[i] = self.dynamics(t, X[i], Ut[i])
+            return dXdt.ravel()
+        
+        options = {}
+        if method in ('BDF', 'Radau'):
+            # Members are independent: the Jacobian is block diagonal
+            block = self.jacobian_sparsity()
+            block = np.ones((n, n)) if block is None else block
+            options['jac_sparsity'] = sparse.block_diag([block] * N, format='csc')
+        
+        try:
+            if vectorized:
+                for key, value in params.items():
+                    setattr(self, key, value)
+            sol = solve_ivp(
+                rhs, t_span, X0.ravel(), method=method, t_eval=t_eval,
+                rtol=rtol, atol=atol, **options
+            )
+        finally:
+            for key, value in saved.items():
+                setattr(self, key, value)
+        
+        if not sol.success:
+            logger.warning(f"Batch simulation of '{self.name}' failed: {sol.message}")
+        
+        u_values = np.stack(
+            [np.broadcast_to(np.atleast_2d(u_func(t)), (N, n_u)) for t in sol.t], axis=-1
+        )
+        
+        return {
+            't': sol.t,
+            'x': sol.y.reshape(N, n, -1),
+            'u': u_values,
+            'success': sol.success,
+            'message': sol.message,
+            'nfev': sol.nfev
+        }
+    
     def get_info(self) -> Dict[str, Any]:
         """
         Get model information summary.
@@ -125,3 +337,5 @@ class ProcessModel(ABC):
                 self.parameters[key] = value
             else:
                 logger.warning(f"Parameter '{key}' not found in model '{self.name}'")
+        # Invalidates cached linearizations of this model
+        self._parameter_revision = getattr(self, '_parameter_revision', 0) + 1
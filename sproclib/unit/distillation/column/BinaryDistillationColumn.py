@@ -10,7 +10,9 @@ License: MIT License
 
 import numpy as np
 import logging
-from typing import Dict
+from typing import Dict, Optional, Union
+from scipy import sparse
+from scipy.sparse.linalg import spsolve
 from ...base import ProcessModel
 from ..tray import DistillationTray
 
@@ -94,6 +96,7 @@ class BinaryDistillationColumn(ProcessModel):
                 'vapor_liquid_equilibrium': 'y = α*x / (1 + (α-1)*x) - Relative volatility VLE model',
                 'material_balance': 'dN*x/dt = L_in*x_in + V_in*y_in - L_out*x_out - V_out*y_out - Component balance per tray',
                 'fenske_underwood_gilliland': 'Shortcut method for steady-state design and minimum reflux estimation',
+                'newton_steady_state': 'Newton iteration on dx/dt = 0 with sparse tridiagonal Jacobian',
                 'separation_metrics': 'Recovery, purity, and separation factor calculations'
             },
             'parameters': {
@@ -151,12 +154,12 @@ class BinaryDistillationColumn(ProcessModel):
             'limitations': ['Binary systems only', 'Constant relative volatility', 'Equilibrium stages assumed', 'Saturated liquid feed assumed']
         }
 
-    def vapor_liquid_equilibrium(self, x: float) -> float:
+    def vapor_liquid_equilibrium(self, x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         """
         Calculate vapor composition using relative volatility.
         
         Args:
-            x: Liquid mole fraction of light component
+            x: Liquid mole fraction of light component (scalar or per-tray array)
             
         Returns:
             Vapor mole fraction of light component
@@ -186,141 +189,253 @@ class BinaryDistillationColumn(ProcessModel):
         Returns:
             State derivatives
         """
-        # Extract inputs
-        R = max(0.1, u[0])      # Reflux ratio
-        Q_reb = u[1]            # Reboiler heat duty
-        D = max(0.1, u[2])      # Distillate flow rate
-        B = max(0.1, u[3])      # Bottoms flow rate
-        
-        # Calculate internal flows
-        L = R * D               # Reflux flow rate
-        V = L + D               # Vapor flow rate (above feed)
-        L_below = L + self.feed_flow  # Liquid flow rate below feed
-        V_below = V             # Vapor flow rate below feed (assuming saturated liquid feed)
-        
-        # Extract compositions
-        tray_compositions = x[0:self.N_trays]
-        drum_composition = x[self.N_trays]
-        reboiler_composition = x[self.N_trays + 1]
+        N = self.N_trays
+        flows = self._tray_flows(u)
         
         # Ensure compositions are in valid range
-        tray_compositions = np.clip(tray_compositions, 0.001, 0.999)
-        drum_composition = np.clip(drum_composition, 0.001, 0.999)
-        reboiler_composition = np.clip(reboiler_composition, 0.001, 0.999)
-        
-        dxdt = np.zeros(self.N_trays + 2)
-        
-        # Tray dynamics
-        for i in range(self.N_trays):
-            tray_num = i + 1
-            x_tray = tray_compositions[i]
-            
-            # Vapor composition leaving this tray
-            y_tray = self.vapor_liquid_equilibrium(x_tray)
-            
-            if tray_num == 1:  # Top tray
-                # Liquid in from reflux drum
-                L_in = L
-                x_in = drum_composition
-                # Vapor in from tray below
-                V_in = V
-                y_in = self.vapor_liquid_equilibrium(tray_compositions[i+1]) if i+1 < self.N_trays else self.vapor_liquid_equilibrium(reboiler_composition)
-                # Flows out
-                L_out = L + D if tray_num < self.feed_tray else L_below
-                V_out = V
-                
-            elif tray_num == self.feed_tray:  # Feed tray
-                # Liquid in from tray above
-                L_in = L
-                x_in = tray_compositions[i-1]
-                # Vapor in from tray below
-                V_in = V_below
-                y_in = self.vapor_liquid_equilibrium(tray_compositions[i+1]) if i+1 < self.N_trays else self.vapor_liquid_equilibrium(reboiler_composition)
-                # Flows out
-                L_out = L_below
-                V_out = V
-                
-                # Add feed contribution
-                feed_contribution = self.feed_flow * self.feed_composition
-                
-            elif tray_num == self.N_trays:  # Bottom tray (reboiler)
-                # Liquid in from tray above
-                L_in = L_below
-                x_in = tray_compositions[i-1]
-                # No vapor in from below
-                V_in = 0
-                y_in = 0
-                # Flows out
-                L_out = B
-                V_out = V_below
-                
-            else:  # Intermediate trays
-                # Liquid in from tray above
-                L_in = L if tray_num < self.feed_tray else L_below
-                x_in = tray_compositions[i-1]
-                # Vapor in from tray below
-                V_in = V if tray_num < self.feed_tray else V_below
-                y_in = self.vapor_liquid_equilibrium(tray_compositions[i+1]) if i+1 < self.N_trays else self.vapor_liquid_equilibrium(reboiler_composition)
-                # Flows out
-                L_out = L if tray_num < self.feed_tray else L_below
-                V_out = V if tray_num < self.feed_tray else V_below
-            
-            # Component balance for light component
-            light_in = L_in * x_in + V_in * y_in
-            light_out = L_out * x_tray + V_out * y_tray
-            
-            # Add feed if this is the feed tray
-            if tray_num == self.feed_tray:
-                light_in += self.feed_flow * self.feed_composition
-            
-            dxdt[i] = (light_in - light_out) / self.tray_holdup
+        xc = np.clip(x[0:N + 2], 0.001, 0.999)
+        tray_compositions = xc[0:N]
+        drum_composition = xc[N]
+        reboiler_composition = xc[N + 1]
+        
+        # Vapor-liquid equilibrium evaluated once for all trays and the reboiler
+        y = self.vapor_liquid_equilibrium(xc)
+        y_trays = y[0:N]
+        y_reb = y[N + 1]
+        
+        # Liquid enters from the tray above (reflux drum for the top tray),
+        # vapor from the tray below (reboiler for the last tray)
+        x_in = np.empty(N)
+        x_in[0] = drum_composition
+        x_in[1:] = tray_compositions[:-1]
+        y_in = np.empty(N)
+        y_in[:-1] = y_trays[1:]
+        y_in[-1] = y_reb
+        
+        dxdt = np.empty(N + 2)
+        
+        # Component balance for light component on all trays
+        light_in = flows['L_in'] * x_in + flows['V_in'] * y_in + flows['feed']
+        light_out = flows['L_out'] * tray_compositions + flows['V_out'] * y_trays
+        dxdt[0:N] = (light_in - light_out) / self.tray_holdup
         
         # Reflux drum dynamics
         # Vapor from top tray condenses, distillate and reflux leave
-        y_top = self.vapor_liquid_equilibrium(tray_compositions[0])
-        vapor_condensed = V * y_top
-        liquid_out_drum = (L + D) * drum_composition
+        vapor_condensed = flows['V'] * y_trays[0]
+        liquid_out_drum = (flows['L'] + flows['D']) * drum_composition
         
-        dxdt[self.N_trays] = (vapor_condensed - liquid_out_drum) / self.reflux_drum_holdup
+        dxdt[N] = (vapor_condensed - liquid_out_drum) / self.reflux_drum_holdup
         
         # Reboiler dynamics
         # Liquid from bottom tray enters, vapor and bottoms leave
-        if self.N_trays > 1:
-            liquid_in_reb = L_below * tray_compositions[-1]
+        if N > 1:
+            liquid_in_reb = flows['L_below'] * tray_compositions[-1]
         else:
-            liquid_in_reb = L_below * drum_composition
+            liquid_in_reb = flows['L_below'] * drum_composition
         
-        y_reb = self.vapor_liquid_equilibrium(reboiler_composition)
-        vapor_out_reb = V_below * y_reb
-        bottoms_out = B * reboiler_composition
+        vapor_out_reb = flows['V_below'] * y_reb
+        bottoms_out = flows['B'] * reboiler_composition
         
-        dxdt[self.N_trays + 1] = (liquid_in_reb - vapor_out_reb - bottoms_out) / self.reboiler_holdup
+        dxdt[N + 1] = (liquid_in_reb - vapor_out_reb - bottoms_out) / self.reboiler_holdup
         
         return dxdt
     
-    def steady_state(self, u: np.ndarray) -> np.ndarray:
+    def _tray_flows(self, u: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Internal flows and per-tray liquid/vapor flows for inputs u.
+        
+        The per-tray arrays reproduce the top/feed/bottom/intermediate tray
+        cases of dynamics: tray i receives liquid L_in[i] from above (the
+        reflux drum for the top tray) and vapor V_in[i] from below (the
+        reboiler for the last tray), and sends L_out[i], V_out[i].
+        
+        Args:
+            u: [R, Q_reboiler, D, B]
+            
+        Returns:
+            Dictionary with scalar flows 'L', 'V', 'L_below', 'V_below', 'D', 'B'
+            and per-tray arrays 'L_in', 'V_in', 'L_out', 'V_out', 'feed'
+        """
+        R = max(0.1, u[0])
+        D = max(0.1, u[2])
+        B = max(0.1, u[3])
+        
+        L = R * D
+        V = L + D
+        L_below = L + self.feed_flow
+        V_below = V
+        
+        N = self.N_trays
+        rectifying = np.arange(1, N + 1) < self.feed_tray
+        L_in = np.where(rectifying, L, L_below)
+        L_out = L_in.copy()
+        V_in = np.full(N, V)
+        V_out = np.full(N, V)
+        feed = np.zeros(N)
+        
+        # Top tray: reflux from the drum
+        L_in[0] = L
+        L_out[0] = L + D if self.feed_tray > 1 else L_below
+        
+        if 1 <= self.feed_tray <= N:
+            feed[self.feed_tray - 1] = self.feed_flow * self.feed_composition
+            if self.feed_tray > 1:
+                L_in[self.feed_tray - 1] = L
+                L_out[self.feed_tray - 1] = L_below
+        
+        # Bottom tray (unless it is also the top or feed tray): no vapor in
+        if N > 1 and self.feed_tray != N:
+            L_in[N - 1] = L_below
+            V_in[N - 1] = 0.0
+            L_out[N - 1] = B
+            V_out[N - 1] = V_below
+        
+        return {
+            'L': L, 'V': V, 'L_below': L_below, 'V_below': V_below, 'D': D, 'B': B,
+            'L_in': L_in, 'V_in': V_in, 'L_out': L_out, 'V_out': V_out, 'feed': feed
+        }
+    
+    def jacobian(self, t: float, x: np.ndarray, u: np.ndarray) -> sparse.csc_matrix:
+        """
+        Analytic sparse Jacobian of the column dynamics.
+        
+        Trays couple only to their neighbours, giving a tridiagonal tray
+        block bordered by the reflux drum and reboiler rows/columns.
+        
+        Args:
+            t: Time
+            x: State vector [tray compositions, drum composition, reboiler composition]
+            u: [R, Q_reboiler, D, B]
+            
+        Returns:
+            Sparse (N_trays+2 x N_trays+2) Jacobian in CSC format
+        """
+        N = self.N_trays
+        flows = self._tray_flows(u)
+        
+        # Derivative of the composition clipping applied in dynamics
+        m = ((x >= 0.001) & (x <= 0.999)).astype(float)
+        xc = np.clip(x, 0.001, 0.999)
+        dy_dx = self.alpha / (1 + (self.alpha - 1) * xc)**2 * m
+        
+        rows, cols, vals = [], [], []
+        
+        def add(r, c, v):
+            rows.append(np.atleast_1d(r))
+            cols.append(np.atleast_1d(c))
+            vals.append(np.atleast_1d(v))
+        
+        i = np.arange(N)
+        M = self.tray_holdup
+        add(i, i, (-flows['L_out'] * m[:N] - flows['V_out'] * dy_dx[:N]) / M)
+        add(i[1:], i[:-1], flows['L_in'][1:] * m[:N-1] / M)
+        add(0, N, flows['L_in'][0] * m[N] / M)
+        add(i[:-1], i[1:], flows['V_in'][:-1] * dy_dx[1:N] / M)
+        add(N - 1, N + 1, flows['V_in'][N-1] * dy_dx[N+1] / M)
+        
+        # Reflux drum
+        add(N, 0, flows['V'] * dy_dx[0] / self.reflux_drum_holdup)
+        add(N, N, -(flows['L'] + flows['D']) * m[N] / self.reflux_drum_holdup)
+        
+        # Reboiler
+        j_in = N - 1 if N > 1 else N
+        add(N + 1, j_in, flows['L_below'] * m[j_in] / self.reboiler_holdup)
+        add(N + 1, N + 1, (-flows['V_below'] * dy_dx[N+1] - flows['B'] * m[N+1]) / self.reboiler_holdup)
+        
+        return sparse.csc_matrix(
+            (np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(N + 2, N + 2)
+        )
+    
+    def jacobian_sparsity(self) -> sparse.csc_matrix:
+        """
+        Sparsity pattern of the Jacobian.
+        
+        Returns:
+            Sparse (N_trays+2 x N_trays+2) 0/1 pattern in CSC format
+        """
+        N = self.N_trays
+        pattern = sparse.lil_matrix((N + 2, N + 2))
+        pattern[:N, :N] = sparse.diags([np.ones(N - 1), np.ones(N), np.ones(N - 1)], [-1, 0, 1])
+        # Top tray <-> reflux drum, bottom tray <-> reboiler
+        pattern[0, N] = pattern[N, 0] = pattern[N, N] = 1
+        pattern[N - 1, N + 1] = pattern[N + 1, N + 1] = 1
+        pattern[N + 1, N - 1 if N > 1 else N] = 1
+        return pattern.tocsc()
+    
+    def steady_state(
+        self,
+        u: np.ndarray,
+        method: str = 'shortcut',
+        x0: Optional[np.ndarray] = None,
+        tol: float = 1e-10,
+        max_iter: int = 50
+    ) -> np.ndarray:
         """
         Calculate steady-state with distillation column.
         
+        The 'shortcut' method returns an approximate composition profile
+        (Fenske-Underwood-Gilliland style). The 'newton' method solves
+        dynamics(x, u) = 0 with Newton's method using the sparse analytic
+        Jacobian and a backtracking line search, starting from x0 or the
+        shortcut profile.
+        
         Args:
             u: Input variables [R, Q_reboiler, D, B] - reflux ratio, heat duty, distillate, bottoms
+            method: 'shortcut' or 'newton'
+            x0: Initial guess for the Newton iteration (optional)
+            tol: Convergence tolerance on the max-norm of dx/dt (Newton only)
+            max_iter: Maximum number of Newton iterations
             
         Returns:
             Steady-state values
         """
-        R, Q_reb, D, B = u
-        
-        # Use Fenske-Underwood-Gilliland shortcut method approximation
-        # This is a simplified version for control-oriented modeling
+        if method == 'shortcut':
+            return self._shortcut_profile(u)
+        if method != 'newton':
+            raise ValueError(f"Unknown steady-state method '{method}'. Use 'shortcut' or 'newton'")
+        
+        x = self._shortcut_profile(u) if x0 is None else np.clip(np.asarray(x0, dtype=float), 0.001, 0.999)
+        f = self.dynamics(0.0, x, u)
+        norm = np.max(np.abs(f))
+        
+        for _ in range(max_iter):
+            if norm < tol:
+                break
+            
+            dx = spsolve(self.jacobian(0.0, x, u), -f)
+            if not np.all(np.isfinite(dx)):
+                break
+            
+            # Backtracking line search on the residual norm
+            step = 1.0
+            while step > 1e-4:
+                x_new = np.clip(x + step * dx, 0.001, 0.999)
+                f_new = self.dynamics(0.0, x_new, u)
+                norm_new = np.max(np.abs(f_new))
+                if norm_new < norm:
+                    break
+                step *= 0.5
+            else:
+                break
+            
+            x, f, norm = x_new, f_new, norm_new
         
-        # Calculate minimum reflux ratio (approximate)
-        R_min = (self.feed_composition / (1 - self.feed_composition)) * ((1 - 0.95) / 0.95) / (self.alpha - 1)
-        R_min = max(0.1, R_min)
+        if norm >= tol:
+            logger.warning(f"Steady-state Newton iteration did not converge (residual {norm:.2e})")
         
-        # Ensure operating reflux ratio is above minimum
-        R_operating = max(R, 1.2 * R_min)
+        return x
+    
+    def _shortcut_profile(self, u: np.ndarray) -> np.ndarray:
+        """
+        Approximate composition profile from shortcut design relations.
         
-        # Calculate composition profile using approximate methods
+        Args:
+            u: Input variables [R, Q_reboiler, D, B]
+            
+        Returns:
+            Composition profile [tray compositions, drum composition, reboiler composition]
+        """
         compositions = np.zeros(self.N_trays + 2)
         
         # Distillate composition (approximate)
@@ -331,21 +446,20 @@ class BinaryDistillationColumn(ProcessModel):
         x_B = max(0.05, self.feed_composition * 0.2)
         compositions[self.N_trays + 1] = x_B  # Reboiler
         
-        # Composition profile on trays (linear approximation)
-        for i in range(self.N_trays):
-            if i < self.feed_tray - 1:
-                # Rectifying section
-                fraction = i / (self.feed_tray - 1)
-                compositions[i] = x_D - fraction * (x_D - self.feed_composition)
-            else:
-                # Stripping section
-                fraction = (i - self.feed_tray + 1) / (self.N_trays - self.feed_tray)
-                compositions[i] = self.feed_composition - fraction * (self.feed_composition - x_B)
+        # Composition profile on trays (linear in each section)
+        i = np.arange(self.N_trays)
+        rectifying = i < self.feed_tray - 1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fraction_top = i / (self.feed_tray - 1)
+            fraction_bottom = (i - self.feed_tray + 1) / (self.N_trays - self.feed_tray)
+        compositions[:self.N_trays] = np.where(
+            rectifying,
+            x_D - fraction_top * (x_D - self.feed_composition),
+            self.feed_composition - fraction_bottom * (self.feed_composition - x_B)
+        )
         
         # Ensure all compositions are in valid range
-        compositions = np.clip(compositions, 0.001, 0.999)
-        
-        return compositions
+        return np.clip(np.nan_to_num(compositions, nan=self.feed_composition), 0.001, 0.999)
     
     def calculate_separation_metrics(self, compositions: np.ndarray) -> Dict[str, float]:
         """
@@ -5,6 +5,7 @@ Tests multi-tray dynamics, separation performance, and control behavior
 
 import pytest
 import numpy as np
+from sproclib.unit.base import ProcessModel
 from sproclib.unit.distillation.column import BinaryDistillationColumn
 
 
@@ -270,3 +271,39 @@ class TestBinaryDistillationColumn:
         # Should be approximately balanced (within numerical error)
         relative_error = abs(feed_light - product_light) / feed_light
         assert relative_error < 0.1  # Allow 10% error for approximate steady-state method
+    
+    def test_jacobian_matches_finite_differences(self, default_column):
+        """Test sparse analytic Jacobian against finite differences"""
+        u = np.array([2.0, 800.0, 45.0, 55.0])
+        x = np.linspace(0.9, 0.1, default_column.N_trays + 2)
+        
+        J = default_column.jacobian(0.0, x, u)
+        J_fd = ProcessModel.jacobian(default_column, 0.0, x, u)
+        
+        np.testing.assert_allclose(J.toarray(), J_fd, rtol=1e-4, atol=1e-8)
+        
+        pattern = default_column.jacobian_sparsity().toarray()
+        assert not np.any((J.toarray() != 0) & (pattern == 0))
+    
+    def test_newton_steady_state(self, default_column):
+        """Test Newton steady state gives zero derivatives"""
+        u = np.array([2.0, 800.0, 45.0, 55.0])
+        x_ss = default_column.steady_state(u, method='newton')
+        
+        dxdt = default_column.dynamics(0.0, x_ss, u)
+        assert np.max(np.abs(dxdt)) < 1e-8
+        assert x_ss[default_column.N_trays] > x_ss[default_column.N_trays + 1]
+    
+    def test_newton_steady_state_large_column(self):
+        """Test Newton steady state for a 60-tray column"""
+        column = BinaryDistillationColumn(N_trays=60, feed_tray=30, alpha=1.5)
+        u = np.array([2.0, 800.0, 45.0, 55.0])
+        x_ss = column.steady_state(u, method='newton')
+        
+        assert x_ss.shape == (62,)
+        assert np.max(np.abs(column.dynamics(0.0, x_ss, u))) < 1e-8
+    
+    def test_steady_state_unknown_method(self, default_column):
+        """Test that an unknown steady-state method is rejected"""
+        with pytest.raises(ValueError):
+            default_column.steady_state(np.array([2.0, 800.0, 45.0, 55.0]), method='bisection')
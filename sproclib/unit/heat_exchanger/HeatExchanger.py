@@ -187,6 +187,101 @@ class HeatExchanger(ProcessModel):
         
         return np.array([dT_hot_out_dt, dT_cold_out_dt])
     
+    def dynamics_batch(self, t: float, X: np.ndarray, U: np.ndarray) -> np.ndarray:
+        """
+        Vectorized heat exchanger dynamics for N exchangers.
+        
+        Args:
+            t: Time
+            X: [T_hot_out, T_cold_out] per row, shape (N, 2)
+            U: [T_hot_in, T_cold_in(, m_hot_new, m_cold_new)] per row,
+               shape (N, 2) or (N, 4)
+            
+        Returns:
+            [dT_hot_out/dt, dT_cold_out/dt] per row, shape (N, 2)
+        """
+        T_hot_out = X[:, 0]
+        T_cold_out = X[:, 1]
+        T_hot_in = U[:, 0]
+        T_cold_in = U[:, 1]
+        
+        # Update flow rates if provided
+        if U.shape[1] > 2:
+            m_hot_current = np.where(U[:, 2] > 0, U[:, 2], self.m_hot)
+            m_cold_current = np.where(U[:, 3] > 0, U[:, 3], self.m_cold)
+        else:
+            m_hot_current = np.broadcast_to(self.m_hot, T_hot_in.shape)
+            m_cold_current = np.broadcast_to(self.m_cold, T_cold_in.shape)
+        
+        C_hot_current = m_hot_current * self.cp_hot
+        C_cold_current = m_cold_current * self.cp_cold
+        C_min_current = np.minimum(C_hot_current, C_cold_current)
+        C_max_current = np.maximum(C_hot_current, C_cold_current)
+        
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            # Effectiveness with current conditions (counter-current)
+            C_ratio_current = C_min_current / C_max_current
+            NTU_current = self.U * self.A / C_min_current
+            exp_term = np.exp(-NTU_current * (1 - C_ratio_current))
+            eff_current = np.where(
+                np.abs(C_ratio_current - 1.0) < 1e-6,
+                NTU_current / (1 + NTU_current),
+                (1 - exp_term) / (1 - C_ratio_current * exp_term)
+            )
+            eff_current = np.where(C_min_current > 0, eff_current, 0.0)
+            
+            # Steady-state outlet temperatures using effectiveness-NTU method
+            Q_actual = eff_current * C_min_current * (T_hot_in - T_cold_in)
+            T_hot_out_ss = np.where(C_hot_current > 0, T_hot_in - Q_actual / C_hot_current, T_hot_in)
+            T_cold_out_ss = np.where(C_cold_current > 0, T_cold_in + Q_actual / C_cold_current, T_cold_in)
+            
+            # Time constants with current flow rates
+            tau_hot_current = np.where(
+                m_hot_current > 0, self.rho_hot * self.V_hot * self.cp_hot / C_hot_current, self.tau_hot
+            )
+            tau_cold_current = np.where(
+                m_cold_current > 0, self.rho_cold * self.V_cold * self.cp_cold / C_cold_current, self.tau_cold
+            )
+        
+        dT_hot_out_dt = (T_hot_out_ss - T_hot_out) / tau_hot_current
+        dT_cold_out_dt = (T_cold_out_ss - T_cold_out) / tau_cold_current
+        
+        return np.column_stack([dT_hot_out_dt, dT_cold_out_dt])
+    
+    def jacobian(self, t: float, x: np.ndarray, u: np.ndarray) -> np.ndarray:
+        """
+        Analytic Jacobian of the heat exchanger dynamics.
+        
+        The outlet temperatures relax linearly towards the effectiveness-NTU
+        steady state, so the Jacobian is diagonal with entries -1/tau.
+        
+        Args:
+            t: Time
+            x: [T_hot_out, T_cold_out]
+            u: [T_hot_in, T_cold_in, m_hot_new, m_cold_new]
+            
+        Returns:
+            2x2 Jacobian matrix
+        """
+        if len(u) > 2:
+            m_hot_current = u[2] if u[2] > 0 else self.m_hot
+            m_cold_current = u[3] if u[3] > 0 else self.m_cold
+        else:
+            m_hot_current = self.m_hot
+            m_cold_current = self.m_cold
+        
+        if m_hot_current > 0:
+            tau_hot_current = self.rho_hot * self.V_hot / m_hot_current
+        else:
+            tau_hot_current = self.tau_hot
+        
+        if m_cold_current > 0:
+            tau_cold_current = self.rho_cold * self.V_cold / m_cold_current
+        else:
+            tau_cold_current = self.tau_cold
+        
+        return np.diag([-1.0 / tau_hot_current, -1.0 / tau_cold_current])
+    
     def steady_state(self, u: np.ndarray) -> np.ndarray:
         """
         Calculate steady-state outlet temperatures.
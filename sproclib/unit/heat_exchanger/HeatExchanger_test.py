@@ -11,6 +11,7 @@ import os
 # Add the parent directory to the Python path to import HeatExchanger
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
 
+from sproclib.unit.base import ProcessModel
 from sproclib.unit.heat_exchanger.HeatExchanger import HeatExchanger
 
 
@@ -297,6 +298,34 @@ class TestHeatExchanger:
             assert 'description' in param_info, f"Parameter {param_name} missing description"
             assert 'value' in param_info, f"Parameter {param_name} missing value"
 
+    
+    def test_dynamics_batch_matches_dynamics(self, default_heat_exchanger):
+        """Test vectorized dynamics against the scalar implementation"""
+        hx = default_heat_exchanger
+        X = np.array([[350.0, 300.0], [340.0, 310.0], [360.0, 295.0]])
+        U = np.array([
+            [363.15, 293.15, 2.0, 2.5],
+            [363.15, 293.15, 2.0, 2.0],   # balanced capacity rates
+            [373.15, 283.15, 0.0, 1.0],   # zero flow falls back to design value
+        ])
+        
+        dXdt = hx.dynamics_batch(0.0, X, U)
+        expected = np.array([hx.dynamics(0.0, x, u) for x, u in zip(X, U)])
+        np.testing.assert_allclose(dXdt, expected)
+        
+        dXdt = hx.dynamics_batch(0.0, X, U[:, :2])
+        expected = np.array([hx.dynamics(0.0, x, u) for x, u in zip(X, U[:, :2])])
+        np.testing.assert_allclose(dXdt, expected)
+    
+    def test_jacobian(self, default_heat_exchanger):
+        """Test analytic Jacobian against finite differences"""
+        hx = default_heat_exchanger
+        x = np.array([340.0, 310.0])
+        u = np.array([363.15, 293.15, 1.5, 3.0])
+        
+        J = hx.jacobian(0.0, x, u)
+        J_fd = ProcessModel.jacobian(hx, 0.0, x, u)
+        np.testing.assert_allclose(J, J_fd, rtol=1e-5)
 
 if __name__ == "__main__":
     # Run tests when executed directly
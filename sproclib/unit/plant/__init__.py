@@ -9,14 +9,16 @@ Classes:
     ProcessUnit: Base class for all process units
     ChemicalPlant: Main plant class with semantic API
     PlantConfiguration: Plant-wide configuration parameters
+    CompiledFlowsheet: Global state layout and stream routing of a compiled plant
 """
 
 from .process_unit import ProcessUnit
-from .chemical_plant import ChemicalPlant, PlantConfiguration
+from .chemical_plant import ChemicalPlant, PlantConfiguration, CompiledFlowsheet
 
 __all__ = [
     'ProcessUnit',
     'ChemicalPlant', 
+    'CompiledFlowsheet',
     'PlantConfiguration'
     'Stream', 
     'PlantOptimizer'
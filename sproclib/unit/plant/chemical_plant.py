@@ -6,9 +6,15 @@ plant design similar to TensorFlow/Keras Sequential models.
 """
 
 import numpy as np
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union, Callable
 import logging
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
+import scipy.integrate
+from scipy import sparse
+from scipy.sparse.linalg import spsolve
+
+from ..base import ProcessModel
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +31,30 @@ class PlantConfiguration:
     maintenance_factor: float = 0.03  # fraction of capital cost
 
 
+@dataclass
+class CompiledFlowsheet:
+    """
+    Global state layout and stream routing of a compiled plant.
+    
+    Every dynamic unit owns a contiguous slice of the plant state vector.
+    For each unit, routes hold the input positions fed by streams and the
+    global state indices they are read from, so building the unit input
+    is a single fancy-indexing assignment.
+    """
+    unit_names: List[str] = field(default_factory=list)
+    units: List[Any] = field(default_factory=list)
+    slices: List[slice] = field(default_factory=list)
+    n_states: int = 0
+    routes: List[Tuple[np.ndarray, np.ndarray]] = field(default_factory=list)
+    # stream name -> (source unit, source state indices, target unit, target input indices)
+    streams: Dict[str, Tuple[str, np.ndarray, str, np.ndarray]] = field(default_factory=dict)
+    jac_sparsity: Optional[sparse.csr_matrix] = None
+    
+    def index(self, unit_name: str) -> int:
+        """Position of a dynamic unit in the flowsheet."""
+        return self.unit_names.index(unit_name)
+
+
 class ChemicalPlant:
     """
     Main chemical plant class enabling semantic plant design.
@@ -46,19 +76,34 @@ class ChemicalPlant:
         self.units: List = []
         self.streams: Dict[str, Any] = {}
         self.connections: List[Tuple[str, str, str]] = []
+        self.stream_ports: Dict[str, Dict[Union[str, int], Union[str, int]]] = {}
+        self.operating_points: Dict[str, Dict[str, Any]] = {}
+        self.flowsheet: Optional[CompiledFlowsheet] = None
         self.is_compiled = False
         self.optimizer = None
         self.metrics = []
         
         logger.info(f"Initialized chemical plant: {self.name}")
     
-    def add(self, unit, name: Optional[str] = None):
+    def add(
+        self,
+        unit,
+        name: Optional[str] = None,
+        x0: Optional[np.ndarray] = None,
+        u: Optional[Union[np.ndarray, Callable[[float], np.ndarray]]] = None
+    ):
         """
         Add a process unit to the plant (similar to model.add()).
         
+        Units given an initial state and nominal inputs take part in the
+        dynamic plant simulation; all other units are design-only.
+        
         Args:
             unit: Process unit instance (reactor, pump, etc.)
             name: Optional name for the unit
+            x0: Initial state of the unit for dynamic simulation
+            u: Nominal input vector, or function u(t), for dynamic simulation.
+                Entries fed by connected streams are overwritten
         """
         if name:
             unit.name = name
@@ -70,11 +115,22 @@ class ChemicalPlant:
             unit.name = f"{unit_type}_{unit_count + 1}"
         
         self.units.append(unit)
+        if x0 is not None and u is not None:
+            self.operating_points[unit.name] = {
+                'x0': np.asarray(x0, dtype=float),
+                'u': u if callable(u) else np.asarray(u, dtype=float)
+            }
         logger.info(f"Added unit: {unit.name} ({type(unit).__name__})")
         
         return self
     
-    def connect(self, from_unit: str, to_unit: str, stream_name: str = None):
+    def connect(
+        self,
+        from_unit: str,
+        to_unit: str,
+        stream_name: str = None,
+        ports: Optional[Dict[Union[str, int], Union[str, int]]] = None
+    ):
         """
         Connect two units with a stream.
         
@@ -82,11 +138,16 @@ class ChemicalPlant:
             from_unit: Name of source unit
             to_unit: Name of destination unit  
             stream_name: Optional name for connecting stream
+            ports: Mapping of source states to destination inputs used in
+                dynamic simulation, e.g. {'CA': 'CAi', 'T': 'Ti'}. Names refer
+                to the units' state_variables/inputs; integer indices also work
         """
         if not stream_name:
             stream_name = f"{from_unit}_to_{to_unit}"
         
         self.connections.append((from_unit, to_unit, stream_name))
+        if ports:
+            self.stream_ports[stream_name] = dict(ports)
         logger.info(f"Connected {from_unit} → {to_unit} via {stream_name}")
         
         return self
@@ -111,6 +172,9 @@ class ChemicalPlant:
         # Validate plant configuration
         self._validate_plant()
         
+        # Global state layout and stream routing for dynamic simulation
+        self.flowsheet = self._compile_flowsheet()
+        
         logger.info(f"Plant compiled with optimizer={optimizer}, loss={loss}")
         return self
     
@@ -171,64 +235,430 @@ class ChemicalPlant:
         
         return results
     
-    def simulate(self, duration: float = 24.0, time_step: float = 0.1):
+    def simulate(
+        self,
+        duration: float = 24.0,
+        time_step: float = 0.1,
+        inputs: Optional[Dict[str, Union[np.ndarray, Callable[[float], np.ndarray]]]] = None,
+        method: str = 'BDF',
+        rtol: float = 1e-6,
+        atol: float = 1e-8
+    ) -> Dict[str, Any]:
         """
         Run dynamic plant simulation.
         
+        The states of all dynamic units are integrated together as one ODE
+        system with a single solver. Stream connections feed source states
+        into destination inputs, and the connection graph provides the
+        Jacobian sparsity pattern for implicit methods. Results are written
+        step by step into preallocated per-unit arrays.
+        
         Args:
-            duration: Simulation duration (hours)
-            time_step: Time step (hours)
+            duration: Simulation duration (time units of the unit models)
+            time_step: Output interval
+            inputs: Optional per-unit input overrides (vector or function u(t))
+            method: Integration method (any scipy.integrate OdeSolver, e.g. 'BDF')
+            rtol: Relative tolerance
+            atol: Absolute tolerance
+            
+        Returns:
+            Dictionary with 'time', per-unit state arrays 'units' (n_states, n_times),
+            routed 'streams', 'success', 'message' and 'nfev'
         """
         if not self.is_compiled:
             raise RuntimeError("Plant must be compiled before simulation. Call plant.compile().")
         
-        print(f"Running plant simulation for {duration} hours...")
+        fs = self.flowsheet
+        inputs = inputs or {}
         
-        # Dynamic simulation logic
-        time_points = np.arange(0, duration + time_step, time_step)
+        n_points = int(round(duration / time_step)) + 1
+        time_points = np.linspace(0.0, duration, n_points)
         results = {
             'time': time_points,
-            'units': {unit.name: [] for unit in self.units},
+            'units': {name: np.empty((sl.stop - sl.start, n_points))
+                      for name, sl in zip(fs.unit_names, fs.slices)},
             'streams': {},
-            'economics': []
+            'success': True,
+            'message': 'No dynamic units',
+            'nfev': 0
         }
-        
-        # Simulate each time step
-        for t in time_points:
-            # Unit operations at time t
-            for unit in self.units:
-                unit_result = self._simulate_unit_step(unit, t, time_step)
-                results['units'][unit.name].append(unit_result)
+        if fs.n_states == 0:
+            return results
+        
+        # Nominal inputs and initial state
+        u_nominal = [inputs.get(name, self.operating_points[name]['u']) for name in fs.unit_names]
+        x0 = np.concatenate([self.operating_points[name]['x0'] for name in fs.unit_names])
+        
+        def plant_dynamics(t, x):
+            dxdt = np.empty_like(x)
+            for unit, sl, (input_idx, source_idx), u_k in zip(fs.units, fs.slices, fs.routes, u_nominal):
+                u = np.array(u_k(t) if callable(u_k) else u_k, dtype=float)
+                u[input_idx] = x[source_idx]
+                dxdt[sl] = unit.dynamics(t, x[sl], u)
+            return dxdt
+        
+        solver_class = getattr(scipy.integrate, method, None)
+        if not (isinstance(solver_class, type) and issubclass(solver_class, scipy.integrate.OdeSolver)):
+            raise ValueError(f"Unknown integration method: {method}")
+        options = {}
+        if method in ('BDF', 'Radau'):
+            options['jac_sparsity'] = fs.jac_sparsity
+        
+        solver = solver_class(plant_dynamics, 0.0, x0, duration, rtol=rtol, atol=atol, **options)
+        
+        def store(k0, k1, x_block):
+            for name, sl in zip(fs.unit_names, fs.slices):
+                results['units'][name][:, k0:k1] = x_block[sl]
+        
+        store(0, 1, x0[:, None])
+        k = 1
+        while solver.status == 'running' and k < n_points:
+            message = solver.step()
+            if solver.status == 'failed':
+                results['success'] = False
+                results['message'] = message
+                logger.error(f"Plant simulation failed at t={solver.t:.4g}: {message}")
+                break
             
-            # Economic calculation
-            economics = self._calculate_economics(t)
-            results['economics'].append(economics)
+            # Dense output of the step fills every output time it covered
+            k_new = np.searchsorted(time_points, solver.t, side='right')
+            if k_new > k:
+                store(k, k_new, solver.dense_output()(time_points[k:k_new]))
+                k = k_new
+        
+        if results['success']:
+            results['message'] = 'Plant simulation completed'
+        results['nfev'] = solver.nfev
+        
+        for stream_name, (source, state_idx, _, _) in fs.streams.items():
+            results['streams'][stream_name] = results['units'][source][state_idx]
         
+        logger.info(f"Plant simulation: {fs.n_states} states, {n_points} points, {solver.nfev} RHS evaluations")
         return results
     
-    def evaluate(self, operating_conditions: Dict):
+    def evaluate(self, operating_conditions: Dict, method: str = 'wegstein'):
         """
         Evaluate plant performance at given operating conditions.
         
+        Units with an operating point are solved to a flowsheet steady state
+        (see solve_steady_state); their entries hold the steady state, the
+        inputs it was computed for, and the unit's performance metrics if it
+        provides them. Plant-wide metrics are computed from these results
+        (see _calculate_plant_metrics); metrics the units give no data for
+        are omitted.
+        
         Args:
-            operating_conditions: Dictionary of operating conditions
+            operating_conditions: Dictionary of operating conditions. Entries
+                keyed by a unit name override that unit's nominal inputs, or
+                give the inputs a design-only unit is evaluated at
+            method: Tear-stream convergence method for the steady state, or
+                'newton' for the equation-oriented solve
         """
         if not self.is_compiled:
             raise RuntimeError("Plant must be compiled before evaluation. Call plant.compile().")
         
         # Calculate steady-state performance
         performance = {}
+        inputs = {name: u for name, u in operating_conditions.items()
+                  if name in self.flowsheet.unit_names}
+        if method == 'newton':
+            steady_state = self.solve_equation_oriented(inputs=inputs)
+        else:
+            steady_state = self.solve_steady_state(inputs=inputs, method=method)
         
         # Unit-wise evaluation
         for unit in self.units:
-            unit_performance = self._evaluate_unit(unit, operating_conditions)
+            if unit.name in steady_state['units']:
+                x_ss = steady_state['units'][unit.name]
+                u_ss = steady_state['inputs'][unit.name]
+                unit_performance = {'steady_state': x_ss, 'inputs': u_ss}
+                if hasattr(unit, 'get_performance_metrics'):
+                    unit_performance.update(unit.get_performance_metrics(x_ss, u_ss))
+            else:
+                unit_performance = self._evaluate_unit(unit, operating_conditions)
             performance[unit.name] = unit_performance
         
         # Plant-wide metrics
         performance['plant'] = self._calculate_plant_metrics(performance)
+        performance['flowsheet'] = {key: value for key, value in steady_state.items()
+                                    if key not in ('units', 'inputs')}
         
         return performance
     
+    def solve_steady_state(
+        self,
+        inputs: Optional[Dict[str, np.ndarray]] = None,
+        method: str = 'wegstein',
+        tol: float = 1e-8,
+        max_iter: int = 100,
+        q_bounds: Tuple[float, float] = (-5.0, 0.0)
+    ) -> Dict[str, Any]:
+        """
+        Sequential-modular flowsheet steady state.
+        
+        Units are calculated in topological order with their own
+        steady_state(u). Recycle loops are broken at tear streams (the back
+        edges of a depth-first search over the connections) and the tear
+        values are converged by direct substitution, bounded Wegstein or
+        Broyden's method.
+        
+        Args:
+            inputs: Optional per-unit nominal input overrides
+            method: 'direct', 'wegstein' or 'broyden'
+            tol: Convergence tolerance on the relative tear-stream change
+            max_iter: Maximum number of tear iterations (0 gives a single
+                sequential pass from the x0 tear guesses)
+            q_bounds: Bounds on the Wegstein acceleration factor
+            
+        Returns:
+            Dictionary with per-unit steady states and inputs, calculation
+            order, tear streams, convergence flag, iteration and unit
+            evaluation counts, per-unit timings and residual history
+        """
+        if not self.is_compiled:
+            raise RuntimeError("Plant must be compiled before evaluation. Call plant.compile().")
+        if method not in ('direct', 'wegstein', 'broyden'):
+            raise ValueError(f"Unknown tear-stream method: {method}")
+        
+        fs = self.flowsheet
+        inputs = inputs or {}
+        order, tears = self._calculation_order()
+        u_nominal = {name: np.asarray(inputs.get(name, self.operating_points[name]['u']), dtype=float)
+                     for name in fs.unit_names}
+        
+        # Tear vector layout and initial guess from the source units' x0
+        tear_slices, offset = {}, 0
+        for stream in tears:
+            n = len(fs.streams[stream][1])
+            tear_slices[stream] = slice(offset, offset + n)
+            offset += n
+        tear_guess = np.zeros(offset)
+        for stream in tears:
+            source, state_idx, _, _ = fs.streams[stream]
+            tear_guess[tear_slices[stream]] = self.operating_points[source]['x0'][state_idx]
+        
+        x_units, u_units = {}, {}
+        timings = {name: 0.0 for name in fs.unit_names}
+        counter = {'evaluations': 0}
+        
+        def sweep(tear_values):
+            """One pass through the flowsheet; returns the recalculated tears."""
+            for name in order:
+                u = u_nominal[name].copy()
+                for stream, (source, state_idx, target, input_idx) in fs.streams.items():
+                    if target != name:
+                        continue
+                    if stream in tear_slices:
+                        u[input_idx] = tear_values[tear_slices[stream]]
+                    else:
+                        u[input_idx] = x_units[source][state_idx]
+                start = time.perf_counter()
+                x_units[name] = np.asarray(fs.units[fs.index(name)].steady_state(u), dtype=float)
+                timings[name] += time.perf_counter() - start
+                counter['evaluations'] += 1
+                u_units[name] = u
+            new_values = np.empty_like(tear_values)
+            for stream, sl in tear_slices.items():
+                source, state_idx, _, _ = fs.streams[stream]
+                new_values[sl] = x_units[source][state_idx]
+            return new_values
+        
+        x = tear_guess
+        g = sweep(x)
+        residuals = []
+        converged = False
+        iterations = 0
+        x_prev = g_prev = None
+        H = -np.eye(len(x))  # Broyden inverse Jacobian of F(x) = g(x) - x
+        
+        while True:
+            F = g - x
+            residual = np.max(np.abs(F) / np.maximum(np.abs(x), 1.0)) if len(x) else 0.0
+            residuals.append(residual)
+            if residual < tol:
+                converged = True
+                break
+            if iterations >= max_iter:
+                if max_iter > 0:
+                    logger.warning(f"Flowsheet steady state not converged after {max_iter} "
+                                   f"iterations (residual {residual:.2e})")
+                break
+            
+            if method == 'wegstein' and x_prev is not None:
+                dx = x - x_prev
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    slope = np.where(np.abs(dx) > 0, (g - g_prev) / dx, 0.0)
+                    q = np.where(slope != 1.0, slope / (slope - 1.0), 0.0)
+                q = np.clip(q, *q_bounds)
+                x_new = q * x + (1.0 - q) * g
+            elif method == 'broyden':
+                if x_prev is not None:
+                    dx = x - x_prev
+                    dF = F - (g_prev - x_prev)
+                    H_dF = H @ dF
+                    denominator = dx @ H_dF
+                    if abs(denominator) > 1e-300:
+                        H += np.outer(dx - H_dF, dx @ H) / denominator
+                x_new = x - H @ F
+            else:
+                x_new = g
+            
+            x_prev, g_prev = x, g
+            x = x_new
+            g = sweep(x)
+            iterations += 1
+        
+        streams = {stream: x_units[source][state_idx]
+                   for stream, (source, state_idx, _, _) in fs.streams.items()}
+        
+        logger.info(f"Flowsheet steady state ({method}): converged={converged}, "
+                    f"{iterations} iterations, {counter['evaluations']} unit evaluations")
+        
+        return {
+            'units': x_units,
+            'inputs': u_units,
+            'streams': streams,
+            'order': order,
+            'tear_streams': tears,
+            'converged': converged,
+            'iterations': iterations,
+            'unit_evaluations': counter['evaluations'],
+            'unit_timings': timings,
+            'residual_history': np.array(residuals),
+            'method': method
+        }
+    
+    def solve_equation_oriented(
+        self,
+        inputs: Optional[Dict[str, np.ndarray]] = None,
+        x0: Optional[np.ndarray] = None,
+        tol: float = 1e-8,
+        max_iter: int = 50
+    ) -> Dict[str, Any]:
+        """
+        Equation-oriented flowsheet steady state.
+        
+        All unit residuals dynamics(0, x, u) = 0 are solved simultaneously
+        for the global plant state by Newton's method. Stream connections
+        are eliminated by substitution through the routing index arrays, so
+        the sparse Jacobian consists of each unit's own Jacobian block plus
+        input-coupling columns for the routed source states (finite
+        differences on the routed inputs only).
+        
+        Args:
+            inputs: Optional per-unit nominal input overrides
+            x0: Initial plant state. Defaults to one sequential pass of the
+                units' steady_state results (see solve_steady_state)
+            tol: Convergence tolerance on the max-norm of the residuals
+            max_iter: Maximum number of Newton iterations
+            
+        Returns:
+            Dictionary with per-unit steady states and inputs, convergence
+            flag, iteration count, residual history and timings
+        """
+        if not self.is_compiled:
+            raise RuntimeError("Plant must be compiled before evaluation. Call plant.compile().")
+        
+        fs = self.flowsheet
+        inputs = inputs or {}
+        u_nominal = [np.asarray(inputs.get(name, self.operating_points[name]['u']), dtype=float)
+                     for name in fs.unit_names]
+        
+        start = time.perf_counter()
+        if x0 is None:
+            initial = self.solve_steady_state(inputs=inputs, method='direct', max_iter=0)
+            x = np.concatenate([initial['units'][name] for name in fs.unit_names])
+        else:
+            x = np.asarray(x0, dtype=float).copy()
+        
+        def unit_inputs(x):
+            u_all = []
+            for (input_idx, source_idx), u_k in zip(fs.routes, u_nominal):
+                u = u_k.copy()
+                u[input_idx] = x[source_idx]
+                u_all.append(u)
+            return u_all
+        
+        def residual(x):
+            u_all = unit_inputs(x)
+            return np.concatenate([unit.dynamics(0.0, x[sl], u)
+                                   for unit, sl, u in zip(fs.units, fs.slices, u_all)])
+        
+        def jacobian(x):
+            rows, cols, values = [], [], []
+            for unit, sl, (input_idx, source_idx), u in zip(fs.units, fs.slices, fs.routes, unit_inputs(x)):
+                x_k = x[sl]
+                if hasattr(unit, 'jacobian'):
+                    J = sparse.coo_matrix(unit.jacobian(0.0, x_k, u))
+                else:
+                    J = sparse.coo_matrix(ProcessModel.jacobian(unit, 0.0, x_k, u))
+                rows.append(J.row + sl.start)
+                cols.append(J.col + sl.start)
+                values.append(J.data)
+                
+                # Coupling through routed inputs
+                if len(input_idx):
+                    f0 = unit.dynamics(0.0, x_k, u)
+                    for j_input, j_source in zip(input_idx, source_idx):
+                        h = 1e-7 * max(1.0, abs(u[j_input]))
+                        u_pert = u.copy()
+                        u_pert[j_input] += h
+                        rows.append(np.arange(sl.start, sl.stop))
+                        cols.append(np.full(len(x_k), j_source))
+                        values.append((unit.dynamics(0.0, x_k, u_pert) - f0) / h)
+            return sparse.coo_matrix(
+                (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+                shape=(fs.n_states, fs.n_states)
+            ).tocsc()
+        
+        f = residual(x)
+        norm = np.max(np.abs(f)) if len(f) else 0.0
+        residuals = [norm]
+        iterations = 0
+        
+        while norm >= tol and iterations < max_iter:
+            dx = spsolve(jacobian(x), -f)
+            if not np.all(np.isfinite(dx)):
+                break
+            
+            # Backtracking line search on the residual norm
+            step = 1.0
+            while step > 1e-4:
+                x_new = x + step * dx
+                f_new = residual(x_new)
+                norm_new = np.max(np.abs(f_new))
+                if norm_new < norm:
+                    break
+                step *= 0.5
+            else:
+                break
+            
+            x, f, norm = x_new, f_new, norm_new
+            residuals.append(norm)
+            iterations += 1
+        
+        converged = norm < tol
+        if not converged:
+            logger.warning(f"Equation-oriented steady state did not converge (residual {norm:.2e})")
+        
+        u_all = unit_inputs(x)
+        x_units = {name: x[sl] for name, sl in zip(fs.unit_names, fs.slices)}
+        streams = {stream: x_units[source][state_idx]
+                   for stream, (source, state_idx, _, _) in fs.streams.items()}
+        
+        logger.info(f"Equation-oriented steady state: converged={converged}, {iterations} Newton iterations")
+        
+        return {
+            'units': x_units,
+            'inputs': dict(zip(fs.unit_names, u_all)),
+            'streams': streams,
+            'converged': converged,
+            'iterations': iterations,
+            'residual_history': np.array(residuals),
+            'solve_time': time.perf_counter() - start,
+            'method': 'newton'
+        }
+    
     def get_config(self):
         """Get plant configuration."""
         # Handle units that may have get_config() or get_info() methods
@@ -332,31 +762,178 @@ class ChemicalPlant:
             'message': result.message
         }
     
-    def _simulate_unit_step(self, unit, t, dt):
-        """Simulate one time step for a unit."""
-        # Placeholder - would call unit's dynamics method
-        return {'t': t, 'state': np.random.random(2)}
+    def _compile_flowsheet(self) -> CompiledFlowsheet:
+        """Assemble the global state vector, stream routing and sparsity pattern."""
+        fs = CompiledFlowsheet()
+        offset = 0
+        for unit in self.units:
+            if unit.name not in self.operating_points or not hasattr(unit, 'dynamics'):
+                continue
+            n = len(self.operating_points[unit.name]['x0'])
+            fs.unit_names.append(unit.name)
+            fs.units.append(unit)
+            fs.slices.append(slice(offset, offset + n))
+            offset += n
+        fs.n_states = offset
+        
+        # Resolve stream ports to index arrays
+        input_idx = [[] for _ in fs.units]
+        source_idx = [[] for _ in fs.units]
+        for from_unit, to_unit, stream in self.connections:
+            ports = self.stream_ports.get(stream)
+            if not ports:
+                continue
+            if from_unit not in fs.unit_names or to_unit not in fs.unit_names:
+                raise ValueError(f"Stream '{stream}' routes ports between units without "
+                                 f"an operating point (add them with x0 and u)")
+            i_from, i_to = fs.index(from_unit), fs.index(to_unit)
+            src, dst = fs.units[i_from], fs.units[i_to]
+            n_src = fs.slices[i_from].stop - fs.slices[i_from].start
+            u_to = self.operating_points[to_unit]['u']
+            n_dst = None if callable(u_to) else len(u_to)
+            
+            state_ports, input_ports = [], []
+            for state, port in ports.items():
+                j_state = self._port_index(getattr(src, 'state_variables', {}), state, n_src, stream)
+                j_input = self._port_index(getattr(dst, 'inputs', {}), port, n_dst, stream)
+                state_ports.append(j_state)
+                input_ports.append(j_input)
+                input_idx[i_to].append(j_input)
+                source_idx[i_to].append(fs.slices[i_from].start + j_state)
+            fs.streams[stream] = (from_unit, np.array(state_ports, dtype=int),
+                                  to_unit, np.array(input_ports, dtype=int))
+        fs.routes = [(np.array(i, dtype=int), np.array(j, dtype=int))
+                     for i, j in zip(input_idx, source_idx)]
+        
+        # Jacobian sparsity: unit blocks plus stream couplings
+        pattern = sparse.lil_matrix((fs.n_states, fs.n_states))
+        for unit, sl, (_, sources) in zip(fs.units, fs.slices, fs.routes):
+            block = unit.jacobian_sparsity() if hasattr(unit, 'jacobian_sparsity') else None
+            pattern[sl, sl] = np.ones((sl.stop - sl.start,) * 2) if block is None else block
+            for j in sources:
+                pattern[sl, j] = 1
+        fs.jac_sparsity = pattern.tocsr()
+        
+        logger.info(f"Flowsheet compiled: {len(fs.units)} dynamic units, {fs.n_states} states, "
+                    f"{len(fs.streams)} routed streams")
+        return fs
+    
+    def _calculation_order(self) -> Tuple[List[str], List[str]]:
+        """
+        Tear streams and a topological calculation order of the dynamic units.
+        
+        Back edges of a depth-first search (started in the order units were
+        added) break every recycle loop; the remaining stream graph is
+        acyclic and is ordered with Kahn's algorithm.
+        """
+        fs = self.flowsheet
+        edges = {name: [] for name in fs.unit_names}
+        for stream, (source, _, target, _) in fs.streams.items():
+            edges[source].append((target, stream))
+        
+        # Iterative DFS; an edge into a node on the current path is a back edge
+        state = {name: 0 for name in fs.unit_names}  # 0 new, 1 on path, 2 done
+        tears = []
+        for root in fs.unit_names:
+            if state[root]:
+                continue
+            state[root] = 1
+            stack = [(root, iter(edges[root]))]
+            while stack:
+                node, children = stack[-1]
+                for target, stream in children:
+                    if state[target] == 1:
+                        tears.append(stream)
+                    elif state[target] == 0:
+                        state[target] = 1
+                        stack.append((target, iter(edges[target])))
+                        break
+                else:
+                    state[node] = 2
+                    stack.pop()
+        
+        in_degree = {name: 0 for name in fs.unit_names}
+        for stream, (_, _, target, _) in fs.streams.items():
+            if stream not in tears:
+                in_degree[target] += 1
+        ready = [name for name in fs.unit_names if in_degree[name] == 0]
+        order = []
+        while ready:
+            node = ready.pop(0)
+            order.append(node)
+            for target, stream in edges[node]:
+                if stream in tears:
+                    continue
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    ready.append(target)
+        
+        return order, tears
     
-    def _calculate_economics(self, t):
-        """Calculate economic metrics at time t."""
-        return {
-            'operating_cost': np.random.random() * 1000,
-            'revenue': np.random.random() * 2000,
-            'profit': np.random.random() * 500
-        }
+    @staticmethod
+    def _port_index(names: Dict[str, Any], port: Union[str, int], size: Optional[int], stream: str) -> int:
+        """Resolve a state/input port given by name or index."""
+        if isinstance(port, str):
+            if port not in names:
+                raise ValueError(f"Stream '{stream}': unknown port '{port}'")
+            index = list(names).index(port)
+        else:
+            index = int(port)
+        if index < 0 or (size is not None and index >= size):
+            raise ValueError(f"Stream '{stream}': port index {index} out of range")
+        return index
     
     def _evaluate_unit(self, unit, conditions):
-        """Evaluate unit performance."""
-        return {'efficiency': 0.85, 'conversion': 0.92}
+        """
+        Evaluate a design-only unit.
+        
+        The unit's efficiency is reported if it has one. If the operating
+        conditions hold inputs for the unit (keyed by its name), its steady
+        state and performance metrics at those inputs are added.
+        """
+        performance = {}
+        efficiency = getattr(unit, 'eta', getattr(unit, 'efficiency', None))
+        if isinstance(efficiency, (int, float)) and not isinstance(efficiency, bool):
+            performance['efficiency'] = float(efficiency)
+        
+        u = conditions.get(unit.name)
+        if u is not None and hasattr(unit, 'steady_state'):
+            u = np.asarray(u, dtype=float)
+            x = np.asarray(unit.steady_state(u), dtype=float)
+            performance.update({'steady_state': x, 'inputs': u})
+            if hasattr(unit, 'get_performance_metrics'):
+                performance.update(unit.get_performance_metrics(x, u))
+        return performance
     
     def _calculate_plant_metrics(self, unit_performance):
-        """Calculate plant-wide metrics."""
-        return {
-            'overall_efficiency': 0.80,
-            'total_energy': 1500.0,  # kW
-            'production_rate': 1000.0,  # kg/h
-            'profit_rate': 500.0  # $/h
-        }
+        """
+        Calculate plant-wide metrics from the per-unit performance.
+        
+        Metrics are only reported when the units provide the data for them:
+        total_energy [kW], energy_cost_rate [$/h] and overall_efficiency
+        (power-weighted) from the units reporting their power, and
+        production_rate from the productivity of the product units (flowsheet
+        units whose states feed no other unit), in the units' own rate units.
+        """
+        metrics = {}
+        
+        powered = [p for p in unit_performance.values() if 'power' in p]
+        if powered:
+            total_power = sum(float(p['power']) for p in powered)  # W
+            metrics['total_energy'] = total_power / 1000.0
+            metrics['energy_cost_rate'] = metrics['total_energy'] * self.config.electricity_cost
+            if total_power > 0 and all('efficiency' in p for p in powered):
+                metrics['overall_efficiency'] = sum(
+                    p['efficiency'] * float(p['power']) for p in powered
+                ) / total_power
+        
+        sources = {source for source, _, _, _ in self.flowsheet.streams.values()}
+        products = [unit_performance[name] for name in self.flowsheet.unit_names
+                    if name not in sources]
+        if products and all('productivity' in p for p in products):
+            metrics['production_rate'] = sum(float(p['productivity']) for p in products)
+        
+        return metrics
     
     def _calculate_unit_energy_cost(self, unit, variables):
         """Calculate energy cost for a unit."""
@@ -49,8 +49,8 @@ def create_optimization_plot(results, evaluation):
     
     # Plot 2: Efficiency and Conversion Metrics
     units = ['Feed Pump', 'Reactor']
-    efficiency = [evaluation['feed_pump']['efficiency'], evaluation['reactor']['efficiency']]
-    conversion = [evaluation['feed_pump']['conversion'], evaluation['reactor']['conversion']]
+    efficiency = [evaluation['feed_pump'].get('efficiency', 0.0), evaluation['reactor'].get('efficiency', 0.0)]
+    conversion = [evaluation['feed_pump'].get('conversion', 0.0), evaluation['reactor'].get('conversion', 0.0)]
     
     x = np.arange(len(units))
     width = 0.35
@@ -70,9 +70,9 @@ def create_optimization_plot(results, evaluation):
     plant_metrics = evaluation['plant']
     metrics_names = ['Overall\nEfficiency', 'Production\nRate (scaled)', 'Profit Rate\n(scaled)']
     metrics_values = [
-        plant_metrics['overall_efficiency'],
-        plant_metrics['production_rate'] / 1000,  # Scale to 0-1 range
-        plant_metrics['profit_rate'] / 500        # Scale to 0-1 range
+        plant_metrics.get('overall_efficiency', 0.0),
+        plant_metrics.get('production_rate', 0.0) / 1000,  # Scale to 0-1 range
+        plant_metrics.get('profit_rate', 0.0) / 500        # Scale to 0-1 range
     ]
     
     colors = ['gold', 'lightgreen', 'lightblue']
@@ -96,12 +96,12 @@ OPTIMIZATION SUMMARY
 ✓ Status: {'SUCCESS' if results['success'] else 'FAILED'}
 ✓ Optimal Cost: ${results['optimal_cost']:.2f}
 ✓ Target Production: 1000.0 units
-✓ Achieved Production: {plant_metrics['production_rate']:.1f} units
+✓ Achieved Production: {plant_metrics.get('production_rate', 0.0):.1f} units
 
 Key Performance Indicators:
-• Overall Efficiency: {plant_metrics['overall_efficiency']:.1%}
-• Profit Rate: ${plant_metrics['profit_rate']:.2f}
-• Energy Consumption: {plant_metrics['total_energy']:.1f} kWh
+• Overall Efficiency: {plant_metrics.get('overall_efficiency', 0.0):.1%}
+• Profit Rate: ${plant_metrics.get('profit_rate', 0.0):.2f}
+• Energy Consumption: {plant_metrics.get('total_energy', 0.0):.1f} kWh
 
 Optimizer: Economic
 Loss Function: Total Cost
@@ -268,8 +268,8 @@ def create_scenario_analysis_plot(plant, evaluation):
             
             scenario_results['pump_efficiency']['params'].append(eta)
             scenario_results['pump_efficiency']['costs'].append(opt_results.get('optimal_cost', 1000))
-            scenario_results['pump_efficiency']['efficiencies'].append(eval_results['plant']['overall_efficiency'])
-            scenario_results['pump_efficiency']['profits'].append(eval_results['plant']['profit_rate'])
+            scenario_results['pump_efficiency']['efficiencies'].append(eval_results['plant'].get('overall_efficiency', 0.0))
+            scenario_results['pump_efficiency']['profits'].append(eval_results['plant'].get('profit_rate', 0.0))
         except:
             # Use baseline values if optimization fails
             scenario_results['pump_efficiency']['params'].append(eta)
@@ -292,8 +292,8 @@ def create_scenario_analysis_plot(plant, evaluation):
             
             scenario_results['reactor_volume']['params'].append(volume)
             scenario_results['reactor_volume']['costs'].append(opt_results.get('optimal_cost', 1000))
-            scenario_results['reactor_volume']['efficiencies'].append(eval_results['plant']['overall_efficiency'])
-            scenario_results['reactor_volume']['profits'].append(eval_results['plant']['profit_rate'])
+            scenario_results['reactor_volume']['efficiencies'].append(eval_results['plant'].get('overall_efficiency', 0.0))
+            scenario_results['reactor_volume']['profits'].append(eval_results['plant'].get('profit_rate', 0.0))
         except:
             # Use baseline values if optimization fails
             optimal_volume = 150.0
@@ -318,8 +318,8 @@ def create_scenario_analysis_plot(plant, evaluation):
             
             scenario_results['production_target']['params'].append(target)
             scenario_results['production_target']['costs'].append(opt_results.get('optimal_cost', target * 0.6))
-            scenario_results['production_target']['efficiencies'].append(eval_results['plant']['overall_efficiency'])
-            scenario_results['production_target']['profits'].append(eval_results['plant']['profit_rate'])
+            scenario_results['production_target']['efficiencies'].append(eval_results['plant'].get('overall_efficiency', 0.0))
+            scenario_results['production_target']['profits'].append(eval_results['plant'].get('profit_rate', 0.0))
         except:
             # Use baseline values if optimization fails
             scenario_results['production_target']['params'].append(target)
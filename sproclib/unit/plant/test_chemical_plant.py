@@ -0,0 +1,216 @@
+"""
+Test suite for ChemicalPlant
+
+Tests cover flowsheet compilation, the plant-wide dynamic simulation and
+the sequential-modular steady state.
+"""
+
+import pytest
+import numpy as np
+from scipy.integrate import solve_ivp
+from .chemical_plant import ChemicalPlant
+from ..base import ProcessModel
+from ..reactor.cstr import CSTR
+from ..pump.generic.Pump import Pump
+
+
+class LinearUnit(ProcessModel):
+    """Single-state unit with steady state x = gains @ u."""
+
+    def __init__(self, gains, name: str = "LinearUnit"):
+        super().__init__(name)
+        self.gains = np.asarray(gains, dtype=float)
+
+    def dynamics(self, t, x, u):
+        return self.gains @ u - x
+
+    def steady_state(self, u):
+        return np.array([self.gains @ u])
+
+
+class TestChemicalPlant:
+    """Test class for ChemicalPlant."""
+    
+    @pytest.fixture
+    def u_feed(self):
+        """Nominal CSTR inputs [q, CAi, Ti, Tc]."""
+        return np.array([100.0, 1.0, 350.0, 300.0])
+    
+    @pytest.fixture
+    def cstr_train(self, u_feed):
+        """Two CSTRs in series with a design-only feed pump."""
+        plant = ChemicalPlant(name="CSTR Train")
+        plant.add(Pump(), name="feed_pump")
+        plant.add(CSTR(), name="R1", x0=[0.5, 350.0], u=u_feed)
+        plant.add(CSTR(), name="R2", x0=[0.5, 350.0], u=u_feed)
+        plant.connect("feed_pump", "R1", "feed")
+        plant.connect("R1", "R2", "R1_out", ports={'CA': 'CAi', 'T': 'Ti'})
+        plant.compile()
+        return plant
+    
+    def test_compile_flowsheet(self, cstr_train):
+        """Test global state layout, routing and sparsity pattern."""
+        fs = cstr_train.flowsheet
+        
+        assert fs.unit_names == ['R1', 'R2']
+        assert fs.n_states == 4
+        assert fs.slices == [slice(0, 2), slice(2, 4)]
+        np.testing.assert_array_equal(fs.routes[1][0], [1, 2])
+        np.testing.assert_array_equal(fs.routes[1][1], [0, 1])
+        
+        expected = np.array([[1, 1, 0, 0],
+                             [1, 1, 0, 0],
+                             [1, 1, 1, 1],
+                             [1, 1, 1, 1]])
+        np.testing.assert_array_equal(fs.jac_sparsity.toarray() != 0, expected == 1)
+    
+    def test_simulate_matches_coupled_model(self, cstr_train, u_feed):
+        """Test plant simulation against a hand-coupled ODE system."""
+        results = cstr_train.simulate(duration=10.0, time_step=0.1, rtol=1e-8, atol=1e-10)
+        
+        assert results['success']
+        assert results['units']['R1'].shape == (2, 101)
+        assert 'feed_pump' not in results['units']
+        
+        r1, r2 = cstr_train.flowsheet.units
+        
+        def coupled(t, x):
+            u2 = u_feed.copy()
+            u2[1:3] = x[:2]
+            return np.concatenate([r1.dynamics(t, x[:2], u_feed), r2.dynamics(t, x[2:], u2)])
+        
+        sol = solve_ivp(coupled, (0.0, 10.0), [0.5, 350.0, 0.5, 350.0], method='BDF',
+                        t_eval=results['time'], rtol=1e-10, atol=1e-12)
+        np.testing.assert_allclose(results['units']['R1'], sol.y[:2], rtol=1e-5)
+        np.testing.assert_allclose(results['units']['R2'], sol.y[2:], rtol=1e-5)
+        np.testing.assert_array_equal(results['streams']['R1_out'], results['units']['R1'])
+    
+    def test_simulate_input_override(self, cstr_train):
+        """Test time-varying input functions."""
+        step = lambda t: np.array([100.0, 1.0 if t < 5.0 else 2.0, 350.0, 300.0])
+        results = cstr_train.simulate(duration=10.0, time_step=1.0, inputs={'R1': step},
+                                      method='LSODA', rtol=1e-8, atol=1e-10)
+        
+        assert results['success']
+        r1 = cstr_train.flowsheet.units[0]
+        sol = solve_ivp(lambda t, x: r1.dynamics(t, x, step(t)), (0.0, 10.0), [0.5, 350.0],
+                        method='LSODA', t_eval=results['time'], rtol=1e-10, atol=1e-12)
+        np.testing.assert_allclose(results['units']['R1'], sol.y, rtol=1e-4)
+    
+    def test_unknown_port(self, u_feed):
+        """Test that unresolvable ports are rejected at compile time."""
+        plant = ChemicalPlant()
+        plant.add(CSTR(), name="R1", x0=[0.5, 350.0], u=u_feed)
+        plant.add(CSTR(), name="R2", x0=[0.5, 350.0], u=u_feed)
+        plant.connect("R1", "R2", ports={'CA': 'feed_rate'})
+        
+        with pytest.raises(ValueError):
+            plant.compile()
+    
+    @pytest.fixture
+    def recycle_plant(self):
+        """Three units with two recycle streams (overall loop gain 0.9)."""
+        plant = ChemicalPlant(name="Recycle Loop")
+        plant.add(LinearUnit([1.0, 0.9, 0.2]), name="A", x0=[0.0], u=[1.0, 0.0, 0.0])
+        plant.add(LinearUnit([0.9]), name="B", x0=[0.0], u=[0.0])
+        plant.add(LinearUnit([0.5]), name="C", x0=[0.0], u=[0.0])
+        plant.connect("A", "B", "AB", ports={0: 0})
+        plant.connect("B", "C", "BC", ports={0: 0})
+        plant.connect("B", "A", "recycle_B", ports={0: 1})
+        plant.connect("C", "A", "recycle_C", ports={0: 2})
+        plant.compile()
+        return plant
+    
+    def test_tear_stream_selection(self, recycle_plant):
+        """Test that back edges are torn and units are ordered."""
+        order, tears = recycle_plant._calculation_order()
+        
+        assert order == ['A', 'B', 'C']
+        assert sorted(tears) == ['recycle_B', 'recycle_C']
+    
+    @pytest.mark.parametrize("method", ['direct', 'wegstein', 'broyden'])
+    def test_recycle_steady_state(self, recycle_plant, method):
+        """Test recycle convergence against the analytic solution."""
+        result = recycle_plant.solve_steady_state(method=method, tol=1e-10, max_iter=500)
+        
+        assert result['converged']
+        np.testing.assert_allclose(result['units']['A'], [10.0], rtol=1e-8)
+        np.testing.assert_allclose(result['units']['C'], [4.5], rtol=1e-8)
+        assert result['unit_evaluations'] == 3 * (result['iterations'] + 1)
+        assert set(result['unit_timings']) == {'A', 'B', 'C'}
+    
+    def test_acceleration_reduces_unit_evaluations(self, recycle_plant):
+        """Test that Wegstein and Broyden beat successive substitution."""
+        direct = recycle_plant.solve_steady_state(method='direct', max_iter=500)
+        wegstein = recycle_plant.solve_steady_state(method='wegstein')
+        broyden = recycle_plant.solve_steady_state(method='broyden')
+        
+        assert direct['unit_evaluations'] > 300
+        assert wegstein['unit_evaluations'] < 100
+        assert broyden['unit_evaluations'] < 30
+    
+    def test_equation_oriented_recycle(self, recycle_plant):
+        """Test simultaneous Newton solve of the recycle flowsheet."""
+        result = recycle_plant.solve_equation_oriented()
+        
+        assert result['converged']
+        assert result['iterations'] <= 2
+        np.testing.assert_allclose(result['units']['A'], [10.0], rtol=1e-10)
+        np.testing.assert_allclose(result['streams']['recycle_C'], [4.5], rtol=1e-10)
+    
+    def test_equation_oriented_matches_sequential(self, u_feed):
+        """Test Newton and Wegstein agree on a nonlinear recycle flowsheet."""
+        plant = ChemicalPlant(name="Reactor Recycle")
+        plant.add(CSTR(), name="R1", x0=[0.5, 350.0], u=u_feed)
+        plant.add(CSTR(), name="R2", x0=[0.5, 350.0], u=u_feed)
+        plant.connect("R1", "R2", "R1_out", ports={'CA': 'CAi', 'T': 'Ti'})
+        plant.connect("R2", "R1", "R2_heat", ports={'T': 'Tc'})
+        plant.compile()
+        
+        sequential = plant.solve_steady_state(method='wegstein', tol=1e-12)
+        simultaneous = plant.solve_equation_oriented(tol=1e-9)
+        
+        assert sequential['converged'] and simultaneous['converged']
+        assert simultaneous['iterations'] < 10
+        for name in ('R1', 'R2'):
+            np.testing.assert_allclose(simultaneous['units'][name], sequential['units'][name], rtol=1e-7)
+    
+    def test_evaluate_uses_unit_steady_states(self, cstr_train, u_feed):
+        """Test plant evaluation of a series flowsheet."""
+        performance = cstr_train.evaluate({'R1': u_feed})
+        
+        r1, r2 = cstr_train.flowsheet.units
+        x1 = r1.steady_state(u_feed)
+        x2 = r2.steady_state(np.array([u_feed[0], x1[0], x1[1], u_feed[3]]))
+        np.testing.assert_allclose(performance['R2']['steady_state'], x2)
+        assert 'conversion' in performance['R1']
+        assert performance['flowsheet']['converged']
+        assert performance['flowsheet']['tear_streams'] == []
+        assert performance['flowsheet']['unit_evaluations'] == 2
+        assert 'efficiency' in performance['feed_pump']
+
+    def test_plant_metrics_from_unit_performance(self, cstr_train, u_feed):
+        """Test that plant metrics are computed from the units, and omitted without data."""
+        performance = cstr_train.evaluate({'R1': u_feed})
+        x2 = performance['R2']['steady_state']
+        assert performance['plant'] == {'production_rate': pytest.approx(u_feed[0] * x2[0])}
+
+        performance = cstr_train.evaluate({'R1': u_feed, 'feed_pump': [1e5, 0.01]})
+        pump, plant = performance['feed_pump'], performance['plant']
+        np.testing.assert_allclose(pump['steady_state'], [3e5, 0.01 * 2e5 / 0.7])
+        assert plant['total_energy'] == pytest.approx(0.01 * 2e5 / 0.7 / 1000.0)
+        assert plant['energy_cost_rate'] == pytest.approx(plant['total_energy'] * 0.10)
+        assert plant['overall_efficiency'] == pytest.approx(0.7)
+        assert 'profit_rate' not in plant
+
+    def test_simulate_requires_compile(self):
+        """Test that simulation requires a compiled plant."""
+        plant = ChemicalPlant()
+        plant.add(CSTR(), name="R1")
+        
+        with pytest.raises(RuntimeError):
+            plant.simulate()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
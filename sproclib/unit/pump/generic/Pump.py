@@ -42,6 +42,26 @@ class Pump(ProcessModel):
         Power = flow * delta_P / self.eta  # W
         return np.array([P_out, Power])
 
+    def get_performance_metrics(self, x: np.ndarray, u: np.ndarray) -> dict:
+        """
+        Calculate performance metrics.
+        
+        Args:
+            x: [P_outlet, ...] - outlet pressure
+            u: Inputs as for steady_state
+            
+        Returns:
+            Dictionary with performance metrics
+        """
+        _, power = self.steady_state(u)  # W
+        
+        return {
+            'outlet_pressure': x[0],
+            'power': power,
+            'hydraulic_power': power * self.eta,
+            'efficiency': self.eta
+        }
+
     def dynamics(self, t: float, x: np.ndarray, u: np.ndarray) -> np.ndarray:
         """
         Dynamic model: first-order lag for outlet pressure.
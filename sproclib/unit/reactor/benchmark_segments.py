@@ -0,0 +1,80 @@
+"""
+Axial Discretization Benchmark for PlugFlowReactor and FixedBedReactor
+
+This script measures how the right-hand-side cost and the total BDF solve
+time scale with the number of axial segments. Each stiff solve is run twice:
+with SciPy's dense finite-difference Jacobian and with the model's sparse
+analytic Jacobian (sparse LU inside BDF).
+
+Usage:
+    python -m sproclib.unit.reactor.benchmark_segments
+
+Author: Thorsten Gressling <gressling@paramus.ai>
+License: MIT License
+"""
+
+import time
+import numpy as np
+from scipy.integrate import solve_ivp
+
+from sproclib.unit.reactor.plug_flow import PlugFlowReactor
+from sproclib.unit.reactor.fixed_bed import FixedBedReactor
+
+
+def time_rhs(model, x, u, repeats: int = 200) -> float:
+    """Average time of one dynamics evaluation [s]."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        model.dynamics(0.0, x, u)
+    return (time.perf_counter() - start) / repeats
+
+
+def time_solve(model, x0, u, t_final: float, use_jacobian: bool):
+    """Wall time [s] and RHS evaluation count of a BDF solve."""
+    options = model.solver_jacobian_options('BDF', lambda t: u) if use_jacobian else {}
+    start = time.perf_counter()
+    sol = solve_ivp(lambda t, x: model.dynamics(t, x, u), (0.0, t_final), x0,
+                    method='BDF', rtol=1e-6, atol=1e-8, **options)
+    return time.perf_counter() - start, sol.nfev
+
+
+def run_benchmark(name, model_class, u, CA0, T0, t_final, segment_counts):
+    """Print RHS and solve timings for a range of segment counts."""
+    print(f"\n{name}")
+    print(f"{'n_segments':>10} {'RHS [us]':>10} {'FD Jac [s]':>11} {'nfev':>7} "
+          f"{'Sparse Jac [s]':>15} {'nfev':>7} {'speedup':>8}")
+
+    for n in segment_counts:
+        model = model_class(n_segments=n)
+        x0 = np.concatenate([np.full(n, CA0), np.full(n, T0)])
+
+        rhs_time = time_rhs(model, x0, u)
+        fd_time, fd_nfev = time_solve(model, x0, u, t_final, use_jacobian=False)
+        jac_time, jac_nfev = time_solve(model, x0, u, t_final, use_jacobian=True)
+
+        print(f"{n:>10d} {rhs_time * 1e6:>10.1f} {fd_time:>11.3f} {fd_nfev:>7d} "
+              f"{jac_time:>15.3f} {jac_nfev:>7d} {fd_time / jac_time:>7.1f}x")
+
+
+def main():
+    """Run the axial discretization benchmark."""
+    print("=" * 78)
+    print("Axial discretization benchmark (BDF, rtol=1e-6)")
+    print("=" * 78)
+
+    segment_counts = [20, 50, 100, 200, 500]
+
+    run_benchmark(
+        "PlugFlowReactor", PlugFlowReactor,
+        u=np.array([1.0, 1.0, 350.0, 300.0]), CA0=0.0, T0=350.0,
+        t_final=5.0, segment_counts=segment_counts
+    )
+    run_benchmark(
+        "FixedBedReactor", FixedBedReactor,
+        u=np.array([0.1, 1000.0, 450.0, 430.0]), CA0=0.0, T0=450.0,
+        t_final=100.0, segment_counts=segment_counts
+    )
+
+
+if __name__ == "__main__":
+    main()
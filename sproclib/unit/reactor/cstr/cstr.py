@@ -12,6 +12,7 @@ import numpy as np
 import logging
 from typing import Optional, Tuple, Dict, Any
 from ...base import ProcessModel
+from ....utilities.steady_state import SteadyStateSolver
 
 logger = logging.getLogger(__name__)
 
@@ -79,6 +80,9 @@ class CSTR(ProcessModel):
             'reaction_rate': 'Reaction rate [mol/L/min]',
             'heat_generation': 'Heat generation [J/min]'
         }
+        
+        # Cached steady states (Newton with the analytic Jacobian)
+        self.steady_state_solver = SteadyStateSolver(self, initial_guess=self._steady_state_guess)
     
     def reaction_rate(self, T: float) -> float:
         """Calculate reaction rate constant k(T) = k0 * exp(-Ea/RT)"""
@@ -114,30 +118,84 @@ class CSTR(ProcessModel):
         
         return np.array([dCAdt, dTdt])
     
-    def steady_state(self, u: np.ndarray) -> np.ndarray:
+    def dynamics_batch(self, t: float, X: np.ndarray, U: np.ndarray) -> np.ndarray:
         """
-        Calculate steady-state for CSTR (requires numerical solution).
+        Vectorized CSTR dynamics for N reactors.
         
         Args:
-            u: [q, CAi, Ti, Tc] - operating conditions
+            t: Time
+            X: [CA, T] per row, shape (N, 2)
+            U: [q, CAi, Ti, Tc] per row, shape (N, 4)
             
         Returns:
-            [CA_ss, T_ss] - steady-state concentration and temperature
+            [dCA/dt, dT/dt] per row, shape (N, 2)
+        """
+        CA = np.maximum(X[:, 0], 0.0)
+        T = np.maximum(X[:, 1], 250.0)
+        q, CAi, Ti, Tc = U[:, 0], U[:, 1], U[:, 2], U[:, 3]
+        
+        k = self.reaction_rate(T)
+        
+        dCAdt = q/self.V * (CAi - CA) - k * CA
+        dTdt = (q/self.V * (Ti - T) + 
+                (-self.dHr) * k * CA / (self.rho * self.Cp) +
+                self.UA * (Tc - T) / (self.V * self.rho * self.Cp))
+        
+        return np.column_stack([dCAdt, dTdt])
+    
+    def jacobian(self, t: float, x: np.ndarray, u: np.ndarray) -> np.ndarray:
+        """
+        Analytic Jacobian of the CSTR dynamics with respect to [CA, T].
+        
+        Args:
+            t: Time
+            x: [CA, T] - concentration and temperature
+            u: [q, CAi, Ti, Tc] - flow rate, inlet concentration, inlet temp, coolant temp
+            
+        Returns:
+            2x2 Jacobian matrix
         """
-        from scipy.optimize import fsolve
+        CA, T = x
+        q = u[0]
         
-        def equations(x):
-            return self.dynamics(0, x, u)
+        # Derivatives of the lower bounds applied in dynamics
+        m_CA = 1.0 if CA >= 0.0 else 0.0
+        m_T = 1.0 if T >= 250.0 else 0.0
+        CA = max(CA, 0.0)
+        T = max(T, 250.0)
         
-        # Initial guess based on inlet conditions
-        x0 = np.array([u[1] * 0.5, u[2]])  # 50% conversion, inlet temperature
+        k = self.reaction_rate(T)
+        dk_dT = k * self.Ea / (self.R * T**2)
+        a = -self.dHr / (self.rho * self.Cp)
+        b = self.UA / (self.V * self.rho * self.Cp)
         
-        try:
-            x_ss = fsolve(equations, x0)
-            return x_ss
-        except:
-            logger.warning("Steady-state calculation failed, returning initial guess")
-            return x0
+        return np.array([
+            [(-q/self.V - k) * m_CA, -dk_dT * CA * m_T],
+            [a * k * m_CA, (-q/self.V + a * dk_dT * CA - b) * m_T]
+        ])
+    
+    def _steady_state_guess(self, u: np.ndarray) -> np.ndarray:
+        """Cold-start guess: 50% conversion at the inlet temperature."""
+        return np.array([u[1] * 0.5, u[2]])
+    
+    def steady_state(self, u: np.ndarray, x0: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calculate steady-state for CSTR (requires numerical solution).
+        
+        Without x0 the solve starts from the cold-start guess, so the result
+        does not depend on previously solved operating points; pass x0 (or
+        use steady_state_solver.track()) to select one of several steady
+        states. Results are cached; steady_state_solver.solve() additionally
+        reports the convergence status.
+        
+        Args:
+            u: [q, CAi, Ti, Tc] - operating conditions
+            x0: Starting point [CA, T] (optional)
+            
+        Returns:
+            [CA_ss, T_ss] - steady-state concentration and temperature
+        """
+        return self.steady_state_solver(u, x0)
     
     def calculate_conversion(self, CA: float, CAi: float) -> float:
         """
@@ -229,7 +287,8 @@ class CSTR(ProcessModel):
                 'reaction_kinetics': 'Arrhenius equation: k = k0 * exp(-Ea/RT)',
                 'material_balance': 'dCA/dt = q/V*(CAi - CA) - k(T)*CA',
                 'energy_balance': 'dT/dt = q/V*(Ti - T) + (-dHr)*k(T)*CA/(rho*Cp) + UA*(Tc - T)/(V*rho*Cp)',
-                'steady_state': 'Numerical solution using scipy.optimize.fsolve'
+                'steady_state': 'Cached Newton solution from the cold-start guess with the analytic Jacobian',
+                'jacobian': 'Analytic df/dx with dk/dT = k*Ea/(R*T^2)'
             },
             'parameters': {
                 'V': {'value': self.V, 'units': 'L', 'description': 'Reactor volume'},
@@ -9,7 +9,9 @@ Author: SPROCLIB Development Team
 
 import pytest
 import numpy as np
-from unit.reactor.cstr import CSTR
+from scipy.integrate import solve_ivp
+from .cstr import CSTR
+from ...base import ProcessModel
 
 
 class TestCSTR:
@@ -268,3 +270,53 @@ class TestCSTR:
         expected_outputs = ['CA', 'T', 'reaction_rate', 'heat_generation']
         for out in expected_outputs:
             assert out in default_cstr.outputs
+    
+    def test_dynamics_batch_matches_dynamics(self, default_cstr, test_inputs):
+        """Test vectorized dynamics against the scalar implementation."""
+        X = np.array([[0.5, 360.0], [0.9, 320.0], [-0.1, 200.0]])
+        U = np.tile(test_inputs, (3, 1))
+        U[:, 3] = [290.0, 300.0, 310.0]
+        
+        dXdt = default_cstr.dynamics_batch(0.0, X, U)
+        expected = np.array([default_cstr.dynamics(0.0, x, u) for x, u in zip(X, U)])
+        
+        np.testing.assert_allclose(dXdt, expected)
+    
+    def test_simulate_batch_parameter_sweep(self, default_cstr, test_inputs):
+        """Test batch simulation over a sweep of UA values."""
+        UA_values = np.array([4e4, 5e4, 6e4])
+        X0 = np.tile([0.5, 350.0], (3, 1))
+        t_eval = np.linspace(0.0, 2.0, 5)
+        
+        batch = default_cstr.simulate_batch(
+            (0.0, 2.0), X0, test_inputs, params={'UA': UA_values}, t_eval=t_eval,
+            rtol=1e-8, atol=1e-10
+        )
+        
+        assert batch['success']
+        assert batch['x'].shape == (3, 2, 5)
+        assert default_cstr.UA == 50000.0
+        for i, UA in enumerate(UA_values):
+            cstr = CSTR(UA=UA)
+            single = solve_ivp(lambda t, x: cstr.dynamics(t, x, test_inputs), (0.0, 2.0), X0[i],
+                               t_eval=t_eval, rtol=1e-8, atol=1e-10)
+            np.testing.assert_allclose(batch['x'][i], single.y, rtol=1e-5)
+    
+    def test_jacobian_matches_finite_differences(self, default_cstr, test_inputs, test_state):
+        """Test analytic Jacobian against the finite-difference base implementation."""
+        J = default_cstr.jacobian(0.0, test_state, test_inputs)
+        J_fd = ProcessModel.jacobian(default_cstr, 0.0, test_state, test_inputs)
+        
+        assert default_cstr.has_jacobian
+        np.testing.assert_allclose(J, J_fd, rtol=1e-5)
+    
+    def test_simulate_stiff_solver_with_jacobian(self, default_cstr, test_inputs):
+        """Test that implicit solvers with the analytic Jacobian match RK45."""
+        x0 = np.array([0.9, 310.0])
+        t_eval = np.linspace(0.0, 20.0, 5)
+        
+        reference = default_cstr.simulate((0.0, 20.0), x0, lambda t: test_inputs, t_eval=t_eval)
+        for method in ['BDF', 'Radau', 'LSODA']:
+            result = default_cstr.simulate((0.0, 20.0), x0, lambda t: test_inputs,
+                                           t_eval=t_eval, method=method)
+            np.testing.assert_allclose(result['x'], reference['x'], rtol=1e-2)
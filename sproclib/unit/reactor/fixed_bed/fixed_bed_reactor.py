@@ -10,6 +10,8 @@ License: MIT License
 
 import numpy as np
 import logging
+from typing import Union
+from scipy import sparse
 from ...base import ProcessModel
 
 class FixedBedReactor(ProcessModel):
@@ -79,16 +81,20 @@ class FixedBedReactor(ProcessModel):
             'W_cat_segment': self.W_cat_segment
         }
     
-    def reaction_rate(self, CA: float, T: float) -> float:
+    def reaction_rate(
+        self,
+        CA: Union[float, np.ndarray],
+        T: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
         """
         Calculate reaction rate per unit catalyst mass.
         
         Args:
-            CA: Concentration [mol/m³]
-            T: Temperature [K]
+            CA: Concentration [mol/m³], scalar or per-segment array
+            T: Temperature [K], scalar or per-segment array
             
         Returns:
-            Reaction rate [mol/kg·s]
+            Reaction rate [mol/kg·s], same shape as CA and T
         """
         R = 8.314  # Gas constant [J/mol·K]
         k = self.k0 * np.exp(-self.Ea / (R * T))
@@ -129,39 +135,86 @@ class FixedBedReactor(ProcessModel):
         CA = np.maximum(CA, 0.0)
         T = np.maximum(T, 250.0)
         
-        # Calculate derivatives
-        dCAdt = np.zeros(self.n_segments)
-        dTdt = np.zeros(self.n_segments)
-        
         # Residence time in each segment (based on void volume)
         tau_segment = self.V_segment / Q if Q > 0 else 1e6
         
-        for i in range(self.n_segments):
-            # Reaction rate
-            r = self.reaction_rate(CA[i], T[i])  # [mol/kg·s]
-            r_vol = r * self.W_cat_segment / self.V_segment  # [mol/m³·s]
-            
-            # Convection terms
-            if i == 0:
-                # First segment - inlet conditions
-                CA_in = CAi
-                T_in = Ti
-            else:
-                # Subsequent segments
-                CA_in = CA[i-1]
-                T_in = T[i-1]
-            
-            # Material balance: dCA/dt = (CA_in - CA_out)/tau - r_vol
-            dCAdt[i] = (CA_in - CA[i]) / tau_segment - r_vol
-            
-            # Energy balance
-            heat_generation = (-self.delta_H * r_vol) / (self.rho * self.cp)
-            heat_removal = (self.U * self.A_heat * (T[i] - Tw)) / (self.rho * self.cp * self.V_segment)
-            
-            dTdt[i] = (T_in - T[i]) / tau_segment + heat_generation - heat_removal
+        # Upwind convection: each segment is fed by its upstream neighbour
+        CA_in = np.empty(self.n_segments)
+        CA_in[0] = CAi
+        CA_in[1:] = CA[:-1]
+        T_in = np.empty(self.n_segments)
+        T_in[0] = Ti
+        T_in[1:] = T[:-1]
+        
+        # Reaction rate in all segments
+        r = self.reaction_rate(CA, T)  # [mol/kg·s]
+        r_vol = r * self.W_cat_segment / self.V_segment  # [mol/m³·s]
+        
+        # Material balance: dCA/dt = (CA_in - CA_out)/tau - r_vol
+        dCAdt = (CA_in - CA) / tau_segment - r_vol
+        
+        # Energy balance
+        heat_generation = (-self.delta_H * r_vol) / (self.rho * self.cp)
+        heat_removal = (self.U * self.A_heat * (T - Tw)) / (self.rho * self.cp * self.V_segment)
+        
+        dTdt = (T_in - T) / tau_segment + heat_generation - heat_removal
         
         return np.concatenate([dCAdt, dTdt])
     
+    def jacobian(self, t: float, x: np.ndarray, u: np.ndarray) -> sparse.csc_matrix:
+        """
+        Analytic sparse Jacobian of the axially discretized dynamics.
+        
+        Each segment couples only to itself and its upstream neighbour, so
+        the CA/CA and T/T blocks are lower bidiagonal and the CA/T blocks
+        are diagonal.
+        
+        Args:
+            t: Time
+            x: State vector [CA_segments, T_segments]
+            u: [Q, CAi, Ti, Tw]
+            
+        Returns:
+            Sparse (2*n_segments x 2*n_segments) Jacobian in CSC format
+        """
+        Q = u[0]
+        n = self.n_segments
+        R = 8.314  # Gas constant [J/mol·K]
+        
+        # Derivatives of the lower bounds applied in dynamics
+        m_CA = (x[0:n] >= 0.0).astype(float)
+        m_T = (x[n:2*n] >= 250.0).astype(float)
+        CA = np.maximum(x[0:n], 0.0)
+        T = np.maximum(x[n:2*n], 250.0)
+        
+        # Reaction rate per unit volume: r_vol = c*k(T)*CA
+        c = self.W_cat_segment / self.V_segment
+        k = c * self.k0 * np.exp(-self.Ea / (R * T))
+        dk_dT = k * self.Ea / (R * T**2)
+        
+        inv_tau = Q / self.V_segment if Q > 0 else 1e-6
+        a = -self.delta_H / (self.rho * self.cp)
+        h = self.U * self.A_heat / (self.rho * self.cp * self.V_segment)
+        
+        J_CC = sparse.diags([(-inv_tau - k) * m_CA, inv_tau * m_CA[:-1]], [0, -1], shape=(n, n))
+        J_CT = sparse.diags(-dk_dT * CA * m_T)
+        J_TC = sparse.diags(a * k * m_CA)
+        J_TT = sparse.diags([(-inv_tau + a * dk_dT * CA - h) * m_T, inv_tau * m_T[:-1]], [0, -1], shape=(n, n))
+        
+        return sparse.bmat([[J_CC, J_CT], [J_TC, J_TT]], format='csc')
+    
+    def jacobian_sparsity(self) -> sparse.csc_matrix:
+        """
+        Sparsity pattern of the Jacobian.
+        
+        Returns:
+            Sparse (2*n_segments x 2*n_segments) 0/1 pattern in CSC format
+        """
+        n = self.n_segments
+        upwind = sparse.diags([np.ones(n), np.ones(n - 1)], [0, -1], shape=(n, n))
+        coupling = sparse.identity(n)
+        return sparse.bmat([[upwind, coupling], [coupling, upwind]], format='csc')
+    
     def steady_state(self, u: np.ndarray) -> np.ndarray:
         """
         Calculate steady-state concentration and temperature profile.
@@ -9,7 +9,8 @@ Author: SPROCLIB Development Team
 
 import pytest
 import numpy as np
-from unit.reactor.FixedBedReactor import FixedBedReactor
+from .fixed_bed_reactor import FixedBedReactor
+from ...base import ProcessModel
 
 
 class TestFixedBedReactor:
@@ -104,3 +105,45 @@ class TestFixedBedReactor:
         # Check catalyst mass per segment
         expected_W_cat = reactor.rho_cat * (1 - reactor.epsilon) * reactor.A_cross * reactor.dz
         assert abs(reactor.W_cat_segment - expected_W_cat) < 1e-10
+    
+    def test_jacobian_matches_finite_differences(self, test_inputs):
+        """Test sparse analytic Jacobian against finite differences."""
+        reactor = FixedBedReactor(n_segments=8)
+        x = np.concatenate([np.linspace(1000.0, 200.0, 8), np.linspace(450.0, 470.0, 8)])
+        
+        J = reactor.jacobian(0.0, x, test_inputs)
+        J_fd = ProcessModel.jacobian(reactor, 0.0, x, test_inputs)
+        
+        assert J.shape == (16, 16)
+        np.testing.assert_allclose(J.toarray(), J_fd, rtol=1e-4, atol=1e-6 * np.abs(J_fd).max())
+    
+    def test_jacobian_sparsity_pattern(self, test_inputs):
+        """Test that the sparsity pattern covers all Jacobian nonzeros."""
+        reactor = FixedBedReactor(n_segments=8)
+        x = np.concatenate([np.linspace(1000.0, 200.0, 8), np.linspace(450.0, 470.0, 8)])
+        
+        J = reactor.jacobian(0.0, x, test_inputs).toarray()
+        pattern = reactor.jacobian_sparsity().toarray()
+        
+        assert not np.any((J != 0) & (pattern == 0))
+        assert pattern.sum() == 4 * 8 + 2 * 7
+    
+    def test_dynamics_vectorized_segments(self):
+        """Test array-based dynamics against a per-segment evaluation."""
+        reactor = FixedBedReactor(n_segments=200)
+        u = np.array([0.1, 1000.0, 450.0, 430.0])
+        CA = np.linspace(1000.0, 100.0, 200)
+        T = np.linspace(450.0, 480.0, 200)
+        
+        dxdt = reactor.dynamics(0.0, np.concatenate([CA, T]), u)
+        
+        tau = reactor.V_segment / u[0]
+        CA_in = np.concatenate([[u[1]], CA[:-1]])
+        T_in = np.concatenate([[u[2]], T[:-1]])
+        r = np.array([reactor.reaction_rate(c, temp) for c, temp in zip(CA, T)])
+        r_vol = r * reactor.W_cat_segment / reactor.V_segment
+        dCAdt = (CA_in - CA) / tau - r_vol
+        dTdt = ((T_in - T) / tau - reactor.delta_H * r_vol / (reactor.rho * reactor.cp)
+                - reactor.U * reactor.A_heat * (T - u[3]) / (reactor.rho * reactor.cp * reactor.V_segment))
+        
+        np.testing.assert_allclose(dxdt, np.concatenate([dCAdt, dTdt]), rtol=1e-10)
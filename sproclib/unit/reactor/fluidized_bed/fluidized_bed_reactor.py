@@ -9,10 +9,12 @@ Author: SPROCLIB Development Team
 
 import numpy as np
 from typing import Dict, Tuple, List, Optional
-from scipy.optimize import fsolve
 import logging
 
 from ...base import ProcessModel
+from ....utilities.steady_state import SteadyStateSolver
+
+logger = logging.getLogger(__name__)
 
 class FluidizedBedReactor(ProcessModel):
     """Fluidized bed catalytic reactor model with bubble and emulsion phases."""
@@ -71,6 +73,9 @@ class FluidizedBedReactor(ProcessModel):
             'epsilon_mf': epsilon_mf, 'k0': k0, 'Ea': Ea, 'delta_H': delta_H,
             'K_bc': K_bc, 'K_ce': K_ce
         }
+        
+        # Cached steady states (Newton with the analytic Jacobian)
+        self.steady_state_solver = SteadyStateSolver(self, initial_guess=self._steady_state_guess)
 
     
     def fluidization_properties(self, U_g: float) -> Dict[str, float]:
@@ -170,31 +175,66 @@ class FluidizedBedReactor(ProcessModel):
         return np.array([dCA_bubble_dt, dCA_emulsion_dt, dT_dt])
 
     
-    def steady_state(self, u: np.ndarray) -> np.ndarray:
+    def jacobian(self, t: float, x: np.ndarray, u: np.ndarray) -> np.ndarray:
         """
-        Calculate steady-state concentrations and temperature.
+        Analytic Jacobian of the dynamics with respect to [CA_bubble, CA_emulsion, T].
         
         Args:
-            u: Input variables [CA_in, T_in, U_g, T_coolant]
+            t: Time [s]
+            x: State variables
+            u: Input variables
             
         Returns:
-            Steady-state values [CA_bubble, CA_emulsion, T]
+            3x3 Jacobian matrix
         """
+        CA_bubble, CA_emulsion, T = x
         CA_in, T_in, U_g, T_coolant = u
         
-        # Initial guess
-        x0 = np.array([CA_in * 0.9, CA_in * 0.8, T_in])
+        props = self.fluidization_properties(U_g)
+        delta = props['bubble_fraction']
+        gamma = props['emulsion_fraction']
         
-        # Solve for steady state
-        def steady_state_eqs(x):
-            return self.dynamics(0, x, u)
+        R = 8.314
+        k = self.k0 * np.exp(-self.Ea / (R * T))
+        dk_dT = k * self.Ea / (R * T**2)
+        W_cat = self.rho_cat * (1 - self.epsilon_mf) * self.V_total * gamma
+        rho_cp = 1000 * 1000
         
-        try:
-            x_ss = fsolve(steady_state_eqs, x0)
-            return x_ss
-        except:
-            logger.warning("Steady-state calculation failed, returning initial guess")
-            return x0
+        J = np.zeros((3, 3))
+        if delta > 0:
+            J[0, 0] = -(U_g - self.U_mf) / (delta * self.H) - self.K_bc
+            J[0, 1] = self.K_bc
+        J[1, 0] = self.K_bc
+        J[1, 1] = -self.U_mf / (gamma * self.H) - self.K_bc - k * W_cat / (gamma * self.V_total)
+        J[1, 2] = -dk_dT * CA_emulsion * W_cat / (gamma * self.V_total)
+        J[2, 1] = -self.delta_H * k * W_cat / (rho_cp * self.V_total)
+        J[2, 2] = (-U_g / self.H * rho_cp - self.delta_H * dk_dT * CA_emulsion * W_cat - 1000) / (rho_cp * self.V_total)
+        return J
+
+    
+    def _steady_state_guess(self, u: np.ndarray) -> np.ndarray:
+        """Cold-start guess from the inlet conditions."""
+        CA_in, T_in, U_g, T_coolant = u
+        return np.array([CA_in * 0.9, CA_in * 0.8, T_in])
+    
+    def steady_state(self, u: np.ndarray, x0: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calculate steady-state concentrations and temperature.
+        
+        Without x0 the solve starts from the cold-start guess, so the result
+        does not depend on previously solved operating points; pass x0 (or
+        use steady_state_solver.track()) to select one of several steady
+        states. Results are cached; steady_state_solver.solve() additionally
+        reports the convergence status.
+        
+        Args:
+            u: Input variables [CA_in, T_in, U_g, T_coolant]
+            x0: Starting point (optional)
+            
+        Returns:
+            Steady-state values [CA_bubble, CA_emulsion, T]
+        """
+        return self.steady_state_solver(u, x0)
 
     
     def calculate_conversion(self, CA_in: float, CA_out: float) -> float:
@@ -219,7 +259,8 @@ class FluidizedBedReactor(ProcessModel):
                 'two_phase_model': 'Bubble and emulsion phase mass balances',
                 'fluidization': 'Minimum fluidization velocity and regime maps',
                 'mass_transfer': 'Inter-phase mass transfer coefficients',
-                'reaction_kinetics': 'Heterogeneous catalysis in emulsion phase'
+                'reaction_kinetics': 'Heterogeneous catalysis in emulsion phase',
+                'steady_state': 'Warm-started, cached Newton solution with the analytic Jacobian'
             },
             'applications': [
                 'Fluid catalytic cracking',
@@ -70,6 +70,29 @@ class InteractingTanks(ProcessModel):
         
         return np.array([dh1dt, dh2dt])
     
+    def dynamics_batch(self, t: float, X: np.ndarray, U: np.ndarray) -> np.ndarray:
+        """
+        Vectorized interacting tanks dynamics for N tank pairs.
+        
+        Args:
+            t: Time
+            X: [h1, h2] per row, shape (N, 2)
+            U: [q_in] per row, shape (N, 1)
+            
+        Returns:
+            [dh1/dt, dh2/dt] per row, shape (N, 2)
+        """
+        h1 = np.maximum(X[:, 0], 0.0)
+        h2 = np.maximum(X[:, 1], 0.0)
+        
+        q12 = self.C1 * np.sqrt(h1)
+        q_out = self.C2 * np.sqrt(h2)
+        
+        dh1dt = (U[:, 0] - q12) / self.A1
+        dh2dt = (q12 - q_out) / self.A2
+        
+        return np.column_stack([dh1dt, dh2dt])
+    
     def describe(self) -> dict:
         """
         Introspect metadata for documentation and algorithm querying.
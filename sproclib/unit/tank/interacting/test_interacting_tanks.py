@@ -7,6 +7,7 @@ steady-state, and interaction effects.
 
 import pytest
 import numpy as np
+from scipy.integrate import solve_ivp
 from .interacting_tanks import InteractingTanks
 
 
@@ -293,6 +294,31 @@ class TestInteractingTanks:
         # Larger A2 should make tank 2 respond slower
         assert abs(dxdt_large_a2[1]) < abs(dxdt_large_a1[1])
 
+    
+    def test_dynamics_batch_matches_dynamics(self):
+        """Test vectorized dynamics against the scalar implementation."""
+        tanks = InteractingTanks(A1=2.0, A2=1.5, C1=0.5, C2=0.3)
+        X = np.array([[1.0, 0.5], [0.0, 2.0], [-0.1, 0.3]])
+        U = np.array([[0.6], [0.0], [1.2]])
+        
+        dXdt = tanks.dynamics_batch(0.0, X, U)
+        expected = np.array([tanks.dynamics(0.0, x, u) for x, u in zip(X, U)])
+        
+        np.testing.assert_allclose(dXdt, expected)
+    
+    def test_simulate_batch_matches_simulate(self):
+        """Test batch simulation against individual simulations."""
+        tanks = InteractingTanks(A1=1.0, A2=1.0, C1=0.5, C2=0.3)
+        X0 = np.array([[0.5, 0.5], [1.0, 2.0]])
+        U = np.array([[0.4], [0.6]])
+        t_eval = np.linspace(0.0, 10.0, 11)
+        
+        batch = tanks.simulate_batch((0.0, 10.0), X0, U, t_eval=t_eval, rtol=1e-8, atol=1e-10)
+        
+        for i in range(2):
+            single = solve_ivp(lambda t, x: tanks.dynamics(t, x, U[i]), (0.0, 10.0), X0[i],
+                               t_eval=t_eval, rtol=1e-8, atol=1e-10)
+            np.testing.assert_allclose(batch['x'][i], single.y, rtol=1e-5)
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -73,6 +73,22 @@ class Tank(ProcessModel):
         dhdt = (q_in - self.C * np.sqrt(h)) / self.A
         return np.array([dhdt])
     
+    def dynamics_batch(self, t: float, X: np.ndarray, U: np.ndarray) -> np.ndarray:
+        """
+        Vectorized tank dynamics for N tanks.
+        
+        Args:
+            t: Time
+            X: [height] per row, shape (N, 1)
+            U: [q_in] per row, shape (N, 1)
+            
+        Returns:
+            [dh/dt] per row, shape (N, 1)
+        """
+        h = np.maximum(X[:, 0], 0.0)
+        dhdt = (U[:, 0] - self.C * np.sqrt(h)) / self.A
+        return dhdt[:, np.newaxis]
+    
     def steady_state(self, u: np.ndarray) -> np.ndarray:
         """
         Steady-state height: h = (q_in/C)²
@@ -231,6 +231,31 @@ class TestTank:
         assert 'q_out' in tank.outputs
         assert 'volume' in tank.outputs
 
+    
+    def test_dynamics_batch_matches_dynamics(self, tank):
+        """Test vectorized dynamics against the scalar implementation."""
+        X = np.array([[0.0], [0.5], [1.0], [-0.1]])
+        U = np.array([[0.5], [0.8], [0.2], [0.5]])
+        
+        dXdt = tank.dynamics_batch(0.0, X, U)
+        expected = np.array([tank.dynamics(0.0, x, u) for x, u in zip(X, U)])
+        
+        assert dXdt.shape == (4, 1)
+        np.testing.assert_allclose(dXdt, expected)
+    
+    def test_simulate_batch_parameters(self, tank):
+        """Test batch simulation with per-member parameters."""
+        C_values = np.array([0.4, 0.5, 0.8])
+        result = tank.simulate_batch(
+            (0.0, 200.0), np.zeros((3, 1)), np.array([0.8]),
+            params={'C': C_values}
+        )
+        
+        assert result['success']
+        assert result['x'].shape[:2] == (3, 1)
+        np.testing.assert_allclose(result['x'][:, 0, -1], (0.8 / C_values) ** 2, rtol=1e-3)
+        # Original parameter restored after the run
+        assert tank.C == 0.5
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,377 @@
+"""
+Gain-Scheduled Linear Models for SPROCLIB
+
+This module provides a library of linear models of a nonlinear process at
+a rectilinear grid of operating points, with fast interpolation between
+them. Schedules are built offline (one batched linearization over all grid
+points) and stored as .npz files, so online use reduces to a binary search
+per scheduling variable and a weighted sum of a few stored matrices.
+
+Author: Thorsten Gressling <gressling@paramus.ai>
+License: MIT License
+"""
+
+import numpy as np
+from itertools import product
+from typing import Optional, Tuple, Dict, Any, List, Sequence, Callable, Union
+import logging
+
+from ..base import ProcessModel
+from .LinearApproximation import LinearApproximation
+
+logger = logging.getLogger(__name__)
+
+INTERPOLATION_METHODS = ('linear', 'barycentric', 'nearest')
+
+FORMAT_VERSION = 1
+
+
+class GainScheduledModel:
+    """
+    Linear models (A, B, C, D) on a grid of 1 to 3 scheduling variables.
+
+    Matrices of all K = prod(len(axis)) grid points are held in contiguous
+    arrays of shape (K, rows, columns) in C order over the axes, together
+    with the operating points (x_ss, u_ss). A scheduling point is located
+    with one np.searchsorted per axis. Interpolation is multilinear over the
+    2^d cell corners ('linear'), over the d + 1 vertices of the enclosing
+    simplex of the cell's Kuhn triangulation ('barycentric'), or takes the
+    nearest grid point ('nearest'). Points outside the grid are clamped to
+    its boundary.
+    """
+
+    def __init__(
+        self,
+        axes: Sequence[np.ndarray],
+        A: np.ndarray,
+        B: np.ndarray,
+        C: Optional[np.ndarray] = None,
+        D: Optional[np.ndarray] = None,
+        x_ss: Optional[np.ndarray] = None,
+        u_ss: Optional[np.ndarray] = None,
+        scheduling_names: Optional[List[str]] = None,
+        name: str = "GainScheduledModel"
+    ):
+        """
+        Initialize gain-scheduled model from stored matrices.
+
+        Args:
+            axes: Strictly increasing grid values per scheduling variable (1-3 axes)
+            A: State matrices, shape (K, n, n) or (*grid_shape, n, n)
+            B: Input matrices, shape (K, n, m) or (*grid_shape, n, m)
+            C: Output matrices (default: identity at every point)
+            D: Feedthrough matrices (default: zero)
+            x_ss: Operating-point states, shape (K, n) (default: zero)
+            u_ss: Operating-point inputs, shape (K, m) (default: zero)
+            scheduling_names: Names of the scheduling variables
+            name: Model name
+        """
+        self.axes = [np.asarray(axis, dtype=float) for axis in axes]
+        if not 1 <= len(self.axes) <= 3:
+            raise ValueError("Gain schedules support 1 to 3 scheduling variables")
+        for axis in self.axes:
+            if axis.ndim != 1 or axis.size < 2 or np.any(np.diff(axis) <= 0):
+                raise ValueError("Each axis needs at least 2 strictly increasing values")
+
+        self.grid_shape = tuple(axis.size for axis in self.axes)
+        self.n_points = int(np.prod(self.grid_shape))
+        K = self.n_points
+
+        self.A = self._stack(A, 'A')
+        self.B = self._stack(B, 'B')
+        n, m = self.B.shape[1], self.B.shape[2]
+        if self.A.shape[1:] != (n, n):
+            raise ValueError("A must be square with as many rows as B")
+        self.C = np.ascontiguousarray(np.broadcast_to(np.eye(n), (K, n, n))) if C is None else self._stack(C, 'C')
+        p = self.C.shape[1]
+        self.D = np.zeros((K, p, m)) if D is None else self._stack(D, 'D')
+        self.x_ss = np.zeros((K, n)) if x_ss is None else np.ascontiguousarray(np.reshape(x_ss, (K, n)), dtype=float)
+        self.u_ss = np.zeros((K, m)) if u_ss is None else np.ascontiguousarray(np.reshape(u_ss, (K, m)), dtype=float)
+
+        self.n_states, self.n_inputs, self.n_outputs = n, m, p
+        self.scheduling_names = scheduling_names or [f"s{i}" for i in range(len(self.axes))]
+        self.name = name
+
+        self._strides = np.array([int(np.prod(self.grid_shape[i + 1:])) for i in range(len(self.axes))])
+        corners = np.array(list(product((0, 1), repeat=len(self.axes))))
+        self._corner_bits = corners
+        self._corner_offsets = corners @ self._strides
+
+        logger.info(f"GainScheduledModel '{name}': {K} operating points, grid {self.grid_shape}")
+
+    def _stack(self, matrices: np.ndarray, label: str) -> np.ndarray:
+        matrices = np.asarray(matrices, dtype=float)
+        if matrices.shape[0] != self.n_points:
+            if matrices.shape[:len(self.grid_shape)] != self.grid_shape:
+                raise ValueError(f"{label} must have shape (K, ...) or (*grid_shape, ...)")
+        return np.ascontiguousarray(matrices.reshape((self.n_points,) + matrices.shape[-2:]))
+
+    @classmethod
+    def from_model(
+        cls,
+        model: ProcessModel,
+        axes: Sequence[np.ndarray],
+        operating_point: Callable[[np.ndarray], Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]],
+        C: Optional[np.ndarray] = None,
+        D: Optional[np.ndarray] = None,
+        method: str = 'central',
+        epsilon: Optional[float] = None,
+        linearization: Optional[LinearApproximation] = None,
+        scheduling_names: Optional[List[str]] = None,
+        name: Optional[str] = None
+    ) -> 'GainScheduledModel':
+        """
+        Build a schedule by linearizing a process model at every grid point.
+
+        All grid points are linearized with one batched call of the shared
+        linearization engine; passing the same LinearApproximation again
+        reuses its cached linearizations.
+
+        Args:
+            model: Nonlinear process model
+            axes: Grid values per scheduling variable
+            operating_point: Maps a scheduling point to u_ss, or to a tuple
+                (x_ss, u_ss); x_ss defaults to model.steady_state(u_ss)
+            C: Output matrix at every point (default: identity)
+            D: Feedthrough matrix at every point (default: zero)
+            method: Linearization method ('forward', 'central', 'complex')
+            epsilon: Perturbation size (default: relative step)
+            linearization: LinearApproximation of the model to reuse
+            scheduling_names: Names of the scheduling variables
+            name: Model name (default: derived from the process model)
+
+        Returns:
+            GainScheduledModel
+        """
+        axes = [np.asarray(axis, dtype=float) for axis in axes]
+        points = np.array(list(product(*axes)))
+
+        X_ss, U_ss = [], []
+        for s in points:
+            point = operating_point(s)
+            if isinstance(point, tuple):
+                x, u = point
+            else:
+                u = point
+                x = model.steady_state(np.asarray(u, dtype=float))
+            X_ss.append(np.asarray(x, dtype=float))
+            U_ss.append(np.asarray(u, dtype=float))
+        X_ss, U_ss = np.array(X_ss), np.array(U_ss)
+
+        linearization = linearization or LinearApproximation(model)
+        A, B = linearization.linearize_many(U_ss, X_ss, epsilon=epsilon, method=method)
+
+        K, n = X_ss.shape
+        C_all = None if C is None else np.broadcast_to(np.asarray(C, dtype=float), (K,) + np.shape(C))
+        D_all = None if D is None else np.broadcast_to(np.asarray(D, dtype=float), (K,) + np.shape(D))
+        return cls(axes, A, B, C_all, D_all, X_ss, U_ss, scheduling_names,
+                   name or f"{getattr(model, 'name', 'Model')} schedule")
+
+    # ------------------------------------------------------------------
+    # Lookup and interpolation
+    # ------------------------------------------------------------------
+
+    def locate(self, s: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Grid cells and local coordinates of scheduling points.
+
+        Args:
+            s: Scheduling point (d,) or points (P, d)
+
+        Returns:
+            Lower-corner cell indices (P, d) and local coordinates in [0, 1]
+            (P, d)
+        """
+        S = np.atleast_2d(np.asarray(s, dtype=float))
+        if S.shape[1] != len(self.axes):
+            raise ValueError(f"Expected {len(self.axes)} scheduling variables, got {S.shape[1]}")
+        cells = np.empty(S.shape, dtype=np.intp)
+        local = np.empty(S.shape)
+        for i, axis in enumerate(self.axes):
+            value = np.clip(S[:, i], axis[0], axis[-1])
+            j = np.clip(np.searchsorted(axis, value, side='right') - 1, 0, axis.size - 2)
+            cells[:, i] = j
+            local[:, i] = (value - axis[j]) / (axis[j + 1] - axis[j])
+        return cells, local
+
+    def weights(self, s: np.ndarray, method: str = 'linear') -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Grid points and interpolation weights for scheduling points.
+
+        Args:
+            s: Scheduling point (d,) or points (P, d)
+            method: 'linear', 'barycentric' or 'nearest'
+
+        Returns:
+            Flat grid-point indices (P, v) and weights (P, v) summing to one
+        """
+        cells, local = self.locate(s)
+        base = cells @ self._strides
+
+        if method == 'linear':
+            bits = self._corner_bits
+            w = np.prod(np.where(bits[None, :, :], local[:, None, :], 1.0 - local[:, None, :]), axis=2)
+            return base[:, None] + self._corner_offsets[None, :], w
+
+        if method == 'barycentric':
+            # Kuhn simplex: walk from the base corner along axes in order of decreasing local coordinate
+            order = np.argsort(-local, axis=1)
+            sorted_local = np.take_along_axis(local, order, axis=1)
+            P, d = local.shape
+            index = np.empty((P, d + 1), dtype=np.intp)
+            index[:, 0] = base
+            index[:, 1:] = base[:, None] + np.cumsum(self._strides[order], axis=1)
+            w = np.empty((P, d + 1))
+            w[:, 0] = 1.0 - sorted_local[:, 0]
+            w[:, 1:d] = sorted_local[:, :-1] - sorted_local[:, 1:]
+            w[:, d] = sorted_local[:, -1]
+            return index, w
+
+        if method == 'nearest':
+            return (base + (local >= 0.5).astype(np.intp) @ self._strides)[:, None], np.ones((len(base), 1))
+
+        raise ValueError(f"Unknown interpolation method '{method}', expected one of {INTERPOLATION_METHODS}")
+
+    def _interpolate(self, arrays: Sequence[np.ndarray], s: np.ndarray, method: str) -> List[np.ndarray]:
+        index, w = self.weights(s, method)
+        return [np.einsum('pv,pv...->p...', w, array[index]) for array in arrays]
+
+    def matrices(
+        self,
+        s: np.ndarray,
+        method: str = 'linear'
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Interpolated (A, B, C, D) at a scheduling point.
+
+        Args:
+            s: Scheduling point (d,), or points (P, d) for stacked results
+            method: 'linear', 'barycentric' or 'nearest'
+
+        Returns:
+            A, B, C, D (with a leading P axis for several points)
+        """
+        result = self._interpolate((self.A, self.B, self.C, self.D), s, method)
+        if np.ndim(s) < 2:
+            result = [r[0] for r in result]
+        return tuple(result)
+
+    def operating_point(self, s: np.ndarray, method: str = 'linear') -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Interpolated operating point (x_ss, u_ss) at a scheduling point.
+
+        Args:
+            s: Scheduling point (d,) or points (P, d)
+            method: 'linear', 'barycentric' or 'nearest'
+
+        Returns:
+            x_ss, u_ss
+        """
+        x_ss, u_ss = self._interpolate((self.x_ss, self.u_ss), s, method)
+        if np.ndim(s) < 2:
+            return x_ss[0], u_ss[0]
+        return x_ss, u_ss
+
+    def state_space(self, s: np.ndarray, method: str = 'linear'):
+        """
+        StateSpaceModel (deviation variables) at a scheduling point.
+
+        Args:
+            s: Scheduling point (d,)
+            method: 'linear', 'barycentric' or 'nearest'
+
+        Returns:
+            StateSpaceModel with the interpolated matrices
+        """
+        from ...controller.state_space.StateSpaceController import StateSpaceModel
+        A, B, C, D = self.matrices(s, method)
+        return StateSpaceModel(A, B, C, D, name=f"{self.name} at {np.atleast_1d(s).tolist()}")
+
+    def derivative(
+        self,
+        s: np.ndarray,
+        x: np.ndarray,
+        u: np.ndarray,
+        method: str = 'linear'
+    ) -> np.ndarray:
+        """
+        Linear-model estimate of dx/dt = A (x - x_ss) + B (u - u_ss).
+
+        Args:
+            s: Scheduling point (d,)
+            x: States
+            u: Inputs
+            method: 'linear', 'barycentric' or 'nearest'
+
+        Returns:
+            State derivatives
+        """
+        A, B, x_ss, u_ss = self._interpolate((self.A, self.B, self.x_ss, self.u_ss), s, method)
+        return A[0] @ (np.asarray(x) - x_ss[0]) + B[0] @ (np.asarray(u) - u_ss[0])
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+
+    def save(self, file) -> None:
+        """
+        Write the schedule to a compressed .npz file.
+
+        Args:
+            file: Path or binary file object
+        """
+        np.savez_compressed(
+            file,
+            format_version=FORMAT_VERSION,
+            name=np.array(self.name),
+            scheduling_names=np.array(self.scheduling_names),
+            n_axes=len(self.axes),
+            A=self.A, B=self.B, C=self.C, D=self.D,
+            x_ss=self.x_ss, u_ss=self.u_ss,
+            **{f"axis_{i}": axis for i, axis in enumerate(self.axes)}
+        )
+
+    @classmethod
+    def load(cls, file) -> 'GainScheduledModel':
+        """
+        Read a schedule written by save().
+
+        Args:
+            file: Path or binary file object
+
+        Returns:
+            GainScheduledModel
+        """
+        with np.load(file) as data:
+            if int(data['format_version']) != FORMAT_VERSION:
+                raise ValueError(f"Unsupported gain schedule version {int(data['format_version'])}")
+            axes = [data[f"axis_{i}"] for i in range(int(data['n_axes']))]
+            return cls(axes, data['A'], data['B'], data['C'], data['D'], data['x_ss'], data['u_ss'],
+                       [str(n) for n in data['scheduling_names']], str(data['name']))
+
+    def describe(self) -> Dict[str, Any]:
+        """
+        Description of the gain-scheduled model.
+
+        Returns:
+            Dictionary with the grid, dimensions and interpolation methods.
+        """
+        return {
+            'class_name': 'GainScheduledModel',
+            'description': 'Library of linear models on a grid of operating points',
+            'purpose': 'Replace online relinearization by interpolation of precomputed models',
+            'scheduling_variables': {
+                name: {'min': float(axis[0]), 'max': float(axis[-1]), 'points': int(axis.size)}
+                for name, axis in zip(self.scheduling_names, self.axes)
+            },
+            'n_operating_points': self.n_points,
+            'dimensions': {
+                'n_states': self.n_states,
+                'n_inputs': self.n_inputs,
+                'n_outputs': self.n_outputs
+            },
+            'storage': 'Contiguous (K, rows, columns) arrays in C order over the grid',
+            'lookup': 'Binary search per axis (np.searchsorted)',
+            'interpolation_methods': list(INTERPOLATION_METHODS),
+            'serialization': '.npz (save/load)'
+        }
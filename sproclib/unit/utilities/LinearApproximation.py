@@ -12,6 +12,7 @@ import numpy as np
 import logging
 from typing import Optional, Tuple, Dict, Any
 from ..base import ProcessModel
+from ...utilities.linearization import Linearizer
 
 logger = logging.getLogger(__name__)
 
@@ -33,57 +34,99 @@ class LinearApproximation:
         self.D = None  # Feedthrough matrix
         self.x_ss = None  # Steady-state states
         self.u_ss = None  # Steady-state inputs
+        self._linearizers = {}  # (method, epsilon) -> Linearizer
+    
+    def linearizer(self, method: str = 'forward', epsilon: Optional[float] = 1e-6) -> Linearizer:
+        """
+        Cached linearization engine of the model for a method and step size.
+        
+        Args:
+            method: 'forward', 'central' or 'complex' (complex step)
+            epsilon: Perturbation size (None: relative step suited to the method)
+            
+        Returns:
+            Linearizer shared by all calls with the same settings
+        """
+        key = (method, epsilon)
+        if key not in self._linearizers:
+            self._linearizers[key] = Linearizer.from_model(self.model, t=0.0, method=method, epsilon=epsilon)
+        return self._linearizers[key]
     
     def linearize(
         self,
         u_ss: np.ndarray,
         x_ss: Optional[np.ndarray] = None,
-        epsilon: float = 1e-6
+        epsilon: Optional[float] = 1e-6,
+        method: str = 'forward'
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Linearize model around operating point using finite differences.
+        Linearize model around operating point.
+        
+        The model's analytic Jacobian is used for A when it provides one;
+        all other derivatives come from one batched finite-difference (or
+        complex-step) evaluation. Results are cached per operating point and
+        model parameter values, so changing a parameter in place (e.g.
+        ``cstr.V *= 2``) is picked up; call clear_cache() after changing
+        anything else the dynamics depend on.
         
         Args:
             u_ss: Steady-state inputs
             x_ss: Steady-state states (calculated if None)
-            epsilon: Perturbation size for finite differences
+            epsilon: Perturbation size for finite differences (None: relative
+                step suited to the method)
+            method: 'forward', 'central' or 'complex' (complex step)
             
         Returns:
             A, B matrices for linear model dx/dt = A*x + B*u
         """
+        u_ss = np.asarray(u_ss, dtype=float)
         if x_ss is None:
             x_ss = self.model.steady_state(u_ss)
+        x_ss = np.asarray(x_ss, dtype=float)
         
         self.u_ss = u_ss
         self.x_ss = x_ss
         
-        n_states = len(x_ss)
-        n_inputs = len(u_ss)
-        
-        # Calculate A matrix (∂f/∂x)
-        A = np.zeros((n_states, n_states))
-        f0 = self.model.dynamics(0, x_ss, u_ss)
-        
-        for i in range(n_states):
-            x_pert = x_ss.copy()
-            x_pert[i] += epsilon
-            f_pert = self.model.dynamics(0, x_pert, u_ss)
-            A[:, i] = (f_pert - f0) / epsilon
-        
-        # Calculate B matrix (∂f/∂u)
-        B = np.zeros((n_states, n_inputs))
-        
-        for i in range(n_inputs):
-            u_pert = u_ss.copy()
-            u_pert[i] += epsilon
-            f_pert = self.model.dynamics(0, x_ss, u_pert)
-            B[:, i] = (f_pert - f0) / epsilon
+        A, B = self.linearizer(method, epsilon).linearize(x_ss, u_ss)
         
         self.A = A
         self.B = B
         
         return A, B
     
+    def clear_cache(self):
+        """Discard the cached linearizations of all methods and step sizes."""
+        for linearizer in self._linearizers.values():
+            linearizer.clear_cache()
+    
+    def linearize_many(
+        self,
+        U_ss: np.ndarray,
+        X_ss: Optional[np.ndarray] = None,
+        epsilon: Optional[float] = 1e-6,
+        method: str = 'forward'
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Linearize model at many operating points (e.g. for gain scheduling).
+        
+        All points not yet cached are evaluated in one batched call.
+        
+        Args:
+            U_ss: Inputs per operating point, shape (K, n_inputs)
+            X_ss: States per operating point, shape (K, n_states)
+                (steady states are calculated if None)
+            epsilon: Perturbation size for finite differences (None: relative
+                step suited to the method)
+            method: 'forward', 'central' or 'complex' (complex step)
+            
+        Returns:
+            A of shape (K, n_states, n_states) and B of shape (K, n_states, n_inputs)
+        """
+        U_ss = np.atleast_2d(np.asarray(U_ss, dtype=float))
+        if X_ss is None:
+            X_ss = np.array([self.model.steady_state(u) for u in U_ss])
+        return self.linearizer(method, epsilon).linearize_many(X_ss, U_ss)
+    
     def get_transfer_function(
         self,
         output_idx: int = 0,
@@ -1,9 +1,12 @@
 """
-LinearApproximation module for SPROCLIB - Standard Process Control Library
+Linearization utilities for SPROCLIB - Standard Process Control Library
 
-This module imports the LinearApproximation class from LinearApproximation.py.
+This module provides LinearApproximation (linear models of process models
+at an operating point) and GainScheduledModel (interpolated linear models
+over a grid of operating points).
 """
 
 from .LinearApproximation import LinearApproximation
+from .GainScheduledModel import GainScheduledModel
 
-__all__ = ['LinearApproximation']
+__all__ = ['LinearApproximation', 'GainScheduledModel']
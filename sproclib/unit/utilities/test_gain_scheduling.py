@@ -0,0 +1,147 @@
+"""
+Test cases for GainScheduledModel
+
+Tests cover grid lookup, linear and barycentric interpolation, building a
+schedule from a process model, and .npz serialization.
+"""
+
+import io
+import pytest
+import numpy as np
+from .GainScheduledModel import GainScheduledModel
+from .LinearApproximation import LinearApproximation
+from ..reactor.cstr import CSTR
+
+
+def linear_schedule(axes):
+    """Schedule whose A, B entries are affine in the scheduling variables."""
+    grid = np.array(np.meshgrid(*axes, indexing='ij')).reshape(len(axes), -1).T
+    coefficients = np.arange(1.0, len(axes) + 1)
+    A = np.array([[[-1.0 - s @ coefficients, 0.1], [0.2, -2.0 + s.sum()]] for s in grid])
+    B = np.array([[[1.0 + s[0]], [0.5 * s[-1]]] for s in grid])
+    return GainScheduledModel(axes, A, B, x_ss=grid[:, :1] * np.ones((1, 2)), u_ss=grid[:, :1])
+
+
+class TestGainScheduledModel:
+    """Test suite for GainScheduledModel."""
+
+    @pytest.fixture
+    def schedule_3d(self):
+        axes = [np.array([0.0, 0.5, 2.0]), np.array([1.0, 2.0, 3.0, 5.0]), np.array([-1.0, 1.0])]
+        return linear_schedule(axes)
+
+    @pytest.mark.parametrize("method", ['linear', 'barycentric'])
+    def test_affine_data_interpolated_exactly(self, schedule_3d, method):
+        """Both interpolation methods reproduce matrices that are affine in s."""
+        rng = np.random.default_rng(0)
+        for s in rng.uniform([0.0, 1.0, -1.0], [2.0, 5.0, 1.0], size=(50, 3)):
+            A, B, C, D = schedule_3d.matrices(s, method)
+            np.testing.assert_allclose(A, [[-1.0 - s @ [1, 2, 3], 0.1], [0.2, -2.0 + s.sum()]], atol=1e-12)
+            np.testing.assert_allclose(B, [[1.0 + s[0]], [0.5 * s[-1]]], atol=1e-12)
+            np.testing.assert_allclose(C, np.eye(2), atol=1e-15)
+            np.testing.assert_array_equal(D, np.zeros((2, 1)))
+
+    def test_weights(self, schedule_3d):
+        """Barycentric uses d + 1 nonnegative weights, multilinear 2^d."""
+        S = np.array([[0.3, 2.5, 0.2], [1.9, 4.9, -0.9]])
+        index, w = schedule_3d.weights(S, 'barycentric')
+        assert index.shape == (2, 4)
+        assert np.all(w >= 0)
+        np.testing.assert_allclose(w.sum(axis=1), 1.0)
+        index, w = schedule_3d.weights(S, 'linear')
+        assert index.shape == (2, 8)
+        np.testing.assert_allclose(w.sum(axis=1), 1.0)
+
+    def test_grid_points_and_nearest(self, schedule_3d):
+        """At grid points every method returns the stored matrices."""
+        k = np.ravel_multi_index((1, 2, 0), schedule_3d.grid_shape)
+        for method in ('linear', 'barycentric', 'nearest'):
+            A, B, _, _ = schedule_3d.matrices([0.5, 3.0, -1.0], method)
+            np.testing.assert_array_equal(A, schedule_3d.A[k])
+            np.testing.assert_array_equal(B, schedule_3d.B[k])
+        A, _, _, _ = schedule_3d.matrices([0.6, 3.2, -0.8], 'nearest')
+        np.testing.assert_array_equal(A, schedule_3d.A[k])
+
+    def test_clamped_outside_grid(self, schedule_3d):
+        A_out, _, _, _ = schedule_3d.matrices([5.0, 0.0, 3.0])
+        A_edge, _, _, _ = schedule_3d.matrices([2.0, 1.0, 1.0])
+        np.testing.assert_array_equal(A_out, A_edge)
+
+    def test_batched_points(self, schedule_3d):
+        S = np.array([[0.3, 2.5, 0.2], [1.9, 4.9, -0.9]])
+        A, B, C, D = schedule_3d.matrices(S)
+        assert A.shape == (2, 2, 2) and B.shape == (2, 2, 1)
+        np.testing.assert_array_equal(A[1], schedule_3d.matrices(S[1])[0])
+
+    def test_from_cstr_model(self):
+        """Schedule of the CSTR over coolant temperature matches direct linearization."""
+        cstr = CSTR()
+        u_nominal = np.array([10.0, 1.0, 350.0, 300.0])
+        axes = [np.linspace(300.0, 320.0, 11)]
+
+        def operating_point(s):
+            u = u_nominal.copy()
+            u[3] = s[0]
+            return u
+
+        linearization = LinearApproximation(cstr)
+        schedule = GainScheduledModel.from_model(cstr, axes, operating_point,
+                                                 linearization=linearization, scheduling_names=['Tc'])
+        assert schedule.A.shape == (11, 2, 2) and schedule.B.shape == (11, 2, 4)
+        assert schedule.A.flags['C_CONTIGUOUS']
+
+        # Grid point equals a direct linearization
+        A_direct, B_direct = linearization.linearize(operating_point([306.0]), method='central', epsilon=None)
+        A, B, _, _ = schedule.matrices([306.0])
+        np.testing.assert_allclose(A, A_direct, rtol=1e-10)
+        np.testing.assert_allclose(B, B_direct, rtol=1e-10)
+
+        # Between grid points the interpolation is close to relinearizing
+        u_mid = operating_point([307.0])
+        A_mid, _ = LinearApproximation(cstr).linearize(u_mid, method='central', epsilon=None)
+        A, _, _, _ = schedule.matrices([307.0])
+        np.testing.assert_allclose(A, A_mid, rtol=0.05)
+        x_ss, u_ss = schedule.operating_point([307.0])
+        np.testing.assert_allclose(u_ss, u_mid)
+        np.testing.assert_allclose(x_ss, cstr.steady_state(u_mid), rtol=0.01)
+
+        # Rebuilding the schedule is served from the linearization cache
+        misses = linearization.linearizer('central', None).cache_info()['misses']
+        GainScheduledModel.from_model(cstr, axes, operating_point, linearization=linearization)
+        assert linearization.linearizer('central', None).cache_info()['misses'] == misses
+
+    def test_state_space_and_derivative(self, schedule_3d):
+        s = np.array([0.3, 2.5, 0.2])
+        model = schedule_3d.state_space(s)
+        np.testing.assert_allclose(model.A, schedule_3d.matrices(s)[0])
+        x_ss, u_ss = schedule_3d.operating_point(s)
+        np.testing.assert_allclose(schedule_3d.derivative(s, x_ss, u_ss), 0.0, atol=1e-12)
+
+    def test_save_and_load(self, schedule_3d, tmp_path):
+        path = tmp_path / "schedule.npz"
+        schedule_3d.save(path)
+        loaded = GainScheduledModel.load(path)
+        assert loaded.grid_shape == schedule_3d.grid_shape
+        assert loaded.scheduling_names == schedule_3d.scheduling_names
+        s = [1.2, 4.1, 0.3]
+        for left, right in zip(loaded.matrices(s, 'barycentric'), schedule_3d.matrices(s, 'barycentric')):
+            np.testing.assert_array_equal(left, right)
+
+        buffer = io.BytesIO()
+        schedule_3d.save(buffer)
+        buffer.seek(0)
+        assert GainScheduledModel.load(buffer).n_points == 24
+
+    def test_invalid_inputs(self):
+        with pytest.raises(ValueError):
+            GainScheduledModel([np.array([1.0, 0.0])], np.zeros((2, 1, 1)), np.zeros((2, 1, 1)))
+        with pytest.raises(ValueError):
+            GainScheduledModel([np.arange(2.0)] * 4, np.zeros((16, 1, 1)), np.zeros((16, 1, 1)))
+        schedule = linear_schedule([np.array([0.0, 1.0])])
+        with pytest.raises(ValueError):
+            schedule.matrices([0.5], method='cubic')
+
+    def test_describe(self, schedule_3d):
+        info = schedule_3d.describe()
+        assert info['class_name'] == 'GainScheduledModel'
+        assert info['n_operating_points'] == 24
@@ -0,0 +1,88 @@
+"""
+Dead-Time Buffer Benchmark for ControlValve
+
+This script measures the cost of one dead-time update (append plus delayed
+lookup, as done in every ControlValve RHS evaluation) as the number of
+buffered samples grows. The list-based implementation the valves used
+before (list.pop(0) and a linear interpolation scan) is compared with
+DeadTimeBuffer; the latter stays flat.
+
+Usage:
+    python -m sproclib.unit.valve.benchmark_dead_time
+
+Author: Thorsten Gressling <gressling@paramus.ai>
+License: MIT License
+"""
+
+import time
+import numpy as np
+
+from sproclib.utilities.buffers import DeadTimeBuffer
+from sproclib.unit.valve.control import ControlValve
+
+
+class ListDeadTime:
+    """Previous list-based dead-time handling, kept for comparison."""
+
+    def __init__(self, dead_time: float):
+        self.dead_time = dead_time
+        self.time_buffer = []
+        self.position_buffer = []
+
+    def update(self, t: float, value: float) -> float:
+        self.time_buffer.append(t)
+        self.position_buffer.append(value)
+        while self.time_buffer and self.time_buffer[0] < t - self.dead_time - 0.1:
+            self.time_buffer.pop(0)
+            self.position_buffer.pop(0)
+
+        target = t - self.dead_time
+        if not self.time_buffer or target < self.time_buffer[0]:
+            return 0.0
+        if target >= self.time_buffer[-1]:
+            return self.position_buffer[-1]
+        for i in range(len(self.time_buffer) - 1):
+            if self.time_buffer[i] <= target <= self.time_buffer[i + 1]:
+                t1, t2 = self.time_buffer[i], self.time_buffer[i + 1]
+                p1, p2 = self.position_buffer[i], self.position_buffer[i + 1]
+                return p1 + (p2 - p1) * (target - t1) / (t2 - t1)
+        return 0.0
+
+
+def time_per_call(buffer, dead_time: float, step: float, n_calls: int = 20000) -> float:
+    """Average time [s] of one update once the buffer holds dead_time/step samples."""
+    n_warmup = int(dead_time / step) + 10
+    for k in range(n_warmup):
+        buffer.update(k * step, np.sin(k * step))
+    start = time.perf_counter()
+    for k in range(n_warmup, n_warmup + n_calls):
+        buffer.update(k * step, np.sin(k * step))
+    return (time.perf_counter() - start) / n_calls
+
+
+def main():
+    """Run the dead-time buffer benchmark."""
+    print("=" * 62)
+    print("Dead-time update cost vs. buffered samples (dead_time = 1 s)")
+    print("=" * 62)
+    print(f"{'samples':>10} {'list [us]':>12} {'DeadTimeBuffer [us]':>20} {'speedup':>9}")
+
+    for step in [1e-2, 1e-3, 1e-4, 1e-5]:
+        list_time = time_per_call(ListDeadTime(1.0), 1.0, step, n_calls=2000)
+        buffer_time = time_per_call(DeadTimeBuffer(1.0), 1.0, step)
+        print(f"{round(1.0 / step):>10d} {list_time * 1e6:>12.2f} {buffer_time * 1e6:>20.2f} "
+              f"{list_time / buffer_time:>8.1f}x")
+
+    print("\nControlValve.dynamics with 1e-4 s steps (10000 buffered samples):")
+    valve = ControlValve(dead_time=1.0)
+    x, u = np.array([0.5, 0.0]), np.array([0.5, 2e5, 1e5, 1000.0])
+    for k in range(20000):
+        valve.dynamics(k * 1e-4, x, u)
+    start = time.perf_counter()
+    for k in range(20000, 40000):
+        valve.dynamics(k * 1e-4, x, u)
+    print(f"  {(time.perf_counter() - start) / 20000 * 1e6:.2f} us per RHS evaluation")
+
+
+if __name__ == "__main__":
+    main()
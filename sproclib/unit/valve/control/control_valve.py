@@ -12,6 +12,7 @@ import numpy as np
 import logging
 from typing import Dict
 from ...base import ProcessModel
+from ....utilities.buffers import DeadTimeBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -50,15 +51,11 @@ class ControlValve(ProcessModel):
         
         self.Cv_max = Cv_max
         self.valve_type = valve_type
-        self.dead_time = dead_time
+        self._dead_time_buffer = DeadTimeBuffer(dead_time)  # provides self.dead_time
         self.time_constant = time_constant
         self.rangeability = rangeability
         self.Cv_min = Cv_max / rangeability
         
-        # Dead-time buffer for valve position
-        self.position_buffer = []
-        self.time_buffer = []
-        
         # State: [actual_position, flow_rate]
         self.state_names = ['valve_position', 'flow_rate']
         
@@ -124,37 +121,32 @@ class ControlValve(ProcessModel):
         
         return flow_rate
 
+    @property
+    def dead_time(self) -> float:
+        """Valve position dead-time (seconds)."""
+        return self._dead_time_buffer.dead_time
+
+    @dead_time.setter
+    def dead_time(self, value: float):
+        self._dead_time_buffer.dead_time = float(value)
+
+    @property
+    def time_buffer(self) -> np.ndarray:
+        """Times of the buffered position commands."""
+        return self._dead_time_buffer.times
+
+    @property
+    def position_buffer(self) -> np.ndarray:
+        """Buffered position commands."""
+        return self._dead_time_buffer.values
+
     def _update_dead_time_buffer(self, t: float, position_command: float):
         """Update the dead-time buffer for valve position."""
-        self.time_buffer.append(t)
-        self.position_buffer.append(position_command)
-        
-        # Remove old entries beyond dead_time
-        while (self.time_buffer and 
-               self.time_buffer[0] < t - self.dead_time - 0.1):
-            self.time_buffer.pop(0)
-            self.position_buffer.pop(0)
+        self._dead_time_buffer.append(t, position_command)
 
     def _get_delayed_position(self, t: float) -> float:
         """Get valve position after dead-time delay."""
-        target_time = t - self.dead_time
-        
-        # If no history or target time is before first entry, return 0
-        if not self.time_buffer or target_time < self.time_buffer[0]:
-            return 0.0
-            
-        # If target time is after last entry, return last value
-        if target_time >= self.time_buffer[-1]:
-            return self.position_buffer[-1]
-            
-        # Linear interpolation between points
-        for i in range(len(self.time_buffer) - 1):
-            if (self.time_buffer[i] <= target_time <= self.time_buffer[i + 1]):
-                t1, t2 = self.time_buffer[i], self.time_buffer[i + 1]
-                p1, p2 = self.position_buffer[i], self.position_buffer[i + 1]
-                return p1 + (p2 - p1) * (target_time - t1) / (t2 - t1)
-                
-        return 0.0
+        return self._dead_time_buffer.delayed(t)
 
     def dynamics(self, t: float, x: np.ndarray, u: np.ndarray) -> np.ndarray:
         """
@@ -12,6 +12,7 @@ import numpy as np
 import logging
 from typing import Tuple
 from ...base import ProcessModel
+from ....utilities.buffers import DeadTimeBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -47,13 +48,9 @@ class ThreeWayValve(ProcessModel):
         
         self.Cv_max = Cv_max
         self.valve_config = valve_config
-        self.dead_time = dead_time
+        self._dead_time_buffer = DeadTimeBuffer(dead_time)  # provides self.dead_time
         self.time_constant = time_constant
         
-        # Dead-time buffer
-        self.position_buffer = []
-        self.time_buffer = []
-        
         if valve_config == "mixing":
             # State: [position, flow_out]
             # Inputs: [position_command, P1_in, P2_in, P_out, rho]
@@ -92,33 +89,32 @@ class ThreeWayValve(ProcessModel):
         
         return Cv_A, Cv_B
 
+    @property
+    def dead_time(self) -> float:
+        """Valve position dead-time (seconds)."""
+        return self._dead_time_buffer.dead_time
+
+    @dead_time.setter
+    def dead_time(self, value: float):
+        self._dead_time_buffer.dead_time = float(value)
+
+    @property
+    def time_buffer(self) -> np.ndarray:
+        """Times of the buffered position commands."""
+        return self._dead_time_buffer.times
+
+    @property
+    def position_buffer(self) -> np.ndarray:
+        """Buffered position commands."""
+        return self._dead_time_buffer.values
+
     def _update_dead_time_buffer(self, t: float, position_command: float):
         """Update dead-time buffer."""
-        self.time_buffer.append(t)
-        self.position_buffer.append(position_command)
-        
-        while (self.time_buffer and 
-               self.time_buffer[0] < t - self.dead_time - 0.1):
-            self.time_buffer.pop(0)
-            self.position_buffer.pop(0)
+        self._dead_time_buffer.append(t, position_command)
 
     def _get_delayed_position(self, t: float) -> float:
         """Get delayed valve position."""
-        target_time = t - self.dead_time
-        
-        if not self.time_buffer or target_time < self.time_buffer[0]:
-            return 0.0
-            
-        if target_time >= self.time_buffer[-1]:
-            return self.position_buffer[-1]
-            
-        for i in range(len(self.time_buffer) - 1):
-            if (self.time_buffer[i] <= target_time <= self.time_buffer[i + 1]):
-                t1, t2 = self.time_buffer[i], self.time_buffer[i + 1]
-                p1, p2 = self.position_buffer[i], self.position_buffer[i + 1]
-                return p1 + (p2 - p1) * (target_time - t1) / (t2 - t1)
-                
-        return 0.0
+        return self._dead_time_buffer.delayed(t)
 
     def dynamics(self, t: float, x: np.ndarray, u: np.ndarray) -> np.ndarray:
         """
@@ -9,6 +9,13 @@ Functions:
     bode_plot: Generate Bode plots for frequency analysis
     linearize: Linearize nonlinear models around operating points
     tune_pid: Automatic PID tuning using empirical rules
+
+Classes:
+    RingBuffer: Fixed-capacity preallocated history buffer
+    DeadTimeBuffer: Transport-delay buffer with interpolated lookup
+    Linearizer: Batched, cached Jacobian engine for linearization
+    SteadyStateSolver: Cached steady-state solver with branch tracking
+    Continuation: Pseudo-arclength continuation of steady-state branches
     
 Author: Thorsten Gressling <gressling@paramus.ai>
 License: MIT License
@@ -17,6 +24,10 @@ License: MIT License
 from .math_utils import *
 from .data_utils import *
 from .control_utils import *
+from .buffers import RingBuffer, DeadTimeBuffer
+from .linearization import Linearizer, batch_jacobians
+from .steady_state import SteadyStateSolver
+from .continuation import Continuation
 
 __all__ = [
     # Math utilities
@@ -34,5 +45,17 @@ __all__ = [
     'tune_pid',
     'simulate_process',
     'calculate_ise',
-    'calculate_iae'
+    'calculate_iae',
+    
+    # Buffers
+    'RingBuffer',
+    'DeadTimeBuffer',
+    
+    # Linearization
+    'Linearizer',
+    'batch_jacobians',
+    
+    # Steady states
+    'SteadyStateSolver',
+    'Continuation'
 ]
@@ -0,0 +1,235 @@
+"""
+Fixed-Size Buffers for SPROCLIB - Standard Process Control Library
+
+This module provides preallocated buffers for per-tick controller and model
+state, so that long-running loops neither allocate on every update nor grow
+without bound.
+
+Author: Thorsten Gressling <gressling@paramus.ai>
+License: MIT License
+"""
+
+import numpy as np
+from bisect import bisect_left, bisect_right
+
+
+class RingBuffer:
+    """
+    Fixed-capacity ring buffer of rows of floats.
+
+    Appending overwrites the oldest row once the buffer is full. A capacity
+    of 0 disables storage (appends are no-ops). Rows are stored in a
+    preallocated flat list, which is cheaper to write element-wise than a
+    NumPy array; reads return NumPy arrays.
+    """
+
+    __slots__ = ('_data', '_capacity', '_width', '_dtype', '_index', '_size')
+
+    def __init__(self, capacity: int, width: int = 1, dtype=np.float64):
+        """
+        Initialize ring buffer.
+
+        Args:
+            capacity: Maximum number of rows kept (0 disables the buffer)
+            width: Number of values per row
+            dtype: Data type of the arrays returned by values()
+        """
+        if capacity < 0:
+            raise ValueError("capacity must be non-negative")
+        self._capacity = int(capacity)
+        self._width = int(width)
+        self._dtype = dtype
+        self._data = [0.0] * (self._capacity * self._width)
+        self._index = 0
+        self._size = 0
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of rows kept."""
+        return self._capacity
+
+    @property
+    def width(self) -> int:
+        """Number of values per row."""
+        return self._width
+
+    def append(self, *values: float):
+        """
+        Store one row, overwriting the oldest row when full.
+
+        Args:
+            *values: One value per column
+        """
+        if self._capacity == 0:
+            return
+        if len(values) != self._width:
+            raise ValueError(f"expected {self._width} values, got {len(values)}")
+        start = self._index * self._width
+        self._data[start:start + self._width] = values
+        self._index = (self._index + 1) % self._capacity
+        if self._size < self._capacity:
+            self._size += 1
+
+    def clear(self):
+        """Discard all stored rows (storage is kept)."""
+        self._index = 0
+        self._size = 0
+
+    def values(self) -> np.ndarray:
+        """Stored rows in chronological order, shape (len, width) (a copy)."""
+        rows = np.array(self._data, dtype=self._dtype).reshape(self._capacity, self._width)
+        if self._size < self._capacity:
+            return rows[:self._size]
+        return np.roll(rows, -self._index, axis=0)
+
+    def column(self, column: int) -> np.ndarray:
+        """One column of the stored rows in chronological order (a copy)."""
+        return self.values()[:, column]
+
+    def last(self) -> np.ndarray:
+        """Most recent row (a copy)."""
+        if self._size == 0:
+            raise IndexError("ring buffer is empty")
+        start = (self._index - 1) % self._capacity * self._width
+        return np.array(self._data[start:start + self._width], dtype=self._dtype)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"RingBuffer(capacity={self._capacity}, width={self._width}, size={self._size})"
+
+
+class DeadTimeBuffer:
+    """
+    Transport-delay buffer: stores (t, value) samples and returns the value
+    at t - dead_time by linear interpolation.
+
+    Samples live in preallocated lists used as a sliding window. Expired
+    samples are dropped by moving the window start; the live window is copied
+    back to the front only when the end of the storage is reached, so
+    appending is amortized O(1). Lookups use bisect on the live window with a
+    fast path for the usual case of monotonically advancing query times. An
+    append with a time earlier than the newest sample (an ODE solver
+    rejecting a step) discards the samples after it.
+    """
+
+    __slots__ = ('dead_time', 'initial_value', 'margin', '_times', '_values',
+                 '_start', '_end', '_hint')
+
+    def __init__(self, dead_time: float, initial_value: float = 0.0,
+                 capacity: int = 256, margin: float = 0.1):
+        """
+        Initialize dead-time buffer.
+
+        Args:
+            dead_time: Transport delay (time units)
+            initial_value: Value returned before the first sample has aged
+                by dead_time
+            capacity: Initial storage size (grows if the live window needs more)
+            margin: Samples older than t - dead_time - margin are discarded
+        """
+        if dead_time < 0:
+            raise ValueError("dead_time must be non-negative")
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.dead_time = float(dead_time)
+        self.initial_value = initial_value
+        self.margin = float(margin)
+        self._times = [0.0] * int(capacity)
+        self._values = [0.0] * int(capacity)
+        self._start = 0
+        self._end = 0
+        self._hint = 0
+
+    def append(self, t: float, value: float):
+        """
+        Record the input value at time t.
+
+        Args:
+            t: Time of the sample
+            value: Input value at t
+        """
+        times = self._times
+        start, end = self._start, self._end
+        if end > start and t <= times[end - 1]:
+            # Step rejected or repeated time: rewrite history from t on
+            end = bisect_left(times, t, start, end)
+
+        # Drop samples no longer reachable, keeping one before the horizon
+        horizon = t - self.dead_time - self.margin
+        if end - start > 1 and times[start + 1] < horizon:
+            start = max(start, bisect_right(times, horizon, start, end) - 1)
+
+        if end == len(times):
+            n = end - start
+            if n >= len(times) // 2:
+                # Live window fills the storage: grow
+                times.extend([0.0] * len(times))
+                self._values.extend([0.0] * len(self._values))
+            times[:n] = times[start:end]
+            self._values[:n] = self._values[start:end]
+            self._hint = max(self._hint - start, 0)
+            start, end = 0, n
+
+        times[end] = t
+        self._values[end] = value
+        self._start, self._end = start, end + 1
+
+    def delayed(self, t: float) -> float:
+        """
+        Value at t - dead_time.
+
+        Args:
+            t: Current time
+
+        Returns:
+            Linearly interpolated delayed value (initial_value before the
+            first sample, the newest value beyond the last sample)
+        """
+        start, end = self._start, self._end
+        target = t - self.dead_time
+        times = self._times
+        if end == start or target < times[start]:
+            return self.initial_value
+        if target >= times[end - 1]:
+            return self._values[end - 1]
+
+        # Fast path: target in the interval of the previous lookup or the next one
+        i = self._hint
+        if not (start <= i < end - 1 and times[i] <= target):
+            i = bisect_right(times, target, start, end) - 1
+        elif times[i + 1] <= target:
+            i += 1
+            if not (i < end - 1 and times[i + 1] > target):
+                i = bisect_right(times, target, i, end) - 1
+        self._hint = i
+
+        t1, t2 = times[i], times[i + 1]
+        v1, v2 = self._values[i], self._values[i + 1]
+        return v1 + (v2 - v1) * (target - t1) / (t2 - t1)
+
+    def update(self, t: float, value: float) -> float:
+        """Append the sample at t and return the value at t - dead_time."""
+        self.append(t, value)
+        return self.delayed(t)
+
+    def clear(self):
+        """Discard all samples (storage is kept)."""
+        self._start = self._end = self._hint = 0
+
+    @property
+    def times(self) -> np.ndarray:
+        """Sample times in the live window (a copy)."""
+        return np.array(self._times[self._start:self._end])
+
+    @property
+    def values(self) -> np.ndarray:
+        """Sample values in the live window (a copy)."""
+        return np.array(self._values[self._start:self._end])
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __repr__(self) -> str:
+        return f"DeadTimeBuffer(dead_time={self.dead_time}, size={len(self)})"
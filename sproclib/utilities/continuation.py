@@ -0,0 +1,314 @@
+"""
+Parametric Continuation for SPROCLIB
+
+This module traces steady-state branches f(x, p) = 0 of a ProcessModel as a
+parameter p varies, using pseudo-arclength continuation. Unlike a grid of
+independent steady-state solves, the branch is followed around turning
+points, so unstable middle branches of multiple steady states are traced
+as well. Limit points and Hopf points are detected from the tangent and the
+eigenvalues of the state Jacobian and located by bisection along the arc.
+
+Author: Thorsten Gressling <gressling@paramus.ai>
+License: MIT License
+"""
+
+import numpy as np
+from typing import Optional, Tuple, Dict, Any, List, Union
+from scipy import sparse
+from scipy.optimize import brentq
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Continuation:
+    """
+    Pseudo-arclength continuation of process model steady states.
+
+    The continuation parameter is either one of the model inputs (by name
+    from model.inputs or by index) or a numeric model attribute. States and
+    parameter are scaled by max(1, |value|) at the starting point so that
+    the arclength weighs them comparably.
+    """
+
+    def __init__(
+        self,
+        model,
+        parameter: Union[str, int],
+        t: float = 0.0,
+        step: float = 0.01,
+        min_step: float = 1e-6,
+        max_step: float = 0.1,
+        max_angle: float = 10.0,
+        tolerance: float = 1e-10,
+        max_iterations: int = 10
+    ):
+        """
+        Initialize continuation.
+
+        Args:
+            model: Process model with dynamics(t, x, u) and jacobian(t, x, u)
+            parameter: Input name or index, or name of a model attribute
+            t: Time at which the dynamics are evaluated
+            step: Initial arclength step (scaled variables)
+            min_step: Smallest step before the continuation gives up
+            max_step: Largest step
+            max_angle: Largest change of the tangent direction per step [deg]
+            tolerance: Corrector tolerance on the scaled Newton step
+            max_iterations: Maximum corrector iterations per step
+        """
+        self.model = model
+        self.t = t
+        self.step = step
+        self.min_step = min_step
+        self.max_step = max_step
+        self.max_angle = max_angle
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+
+        input_names = list(getattr(model, 'inputs', {}) or {})
+        if isinstance(parameter, (int, np.integer)):
+            self.input_index: Optional[int] = int(parameter)
+            self.attribute: Optional[str] = None
+        elif parameter in input_names:
+            self.input_index = input_names.index(parameter)
+            self.attribute = None
+        elif hasattr(model, parameter):
+            self.input_index = None
+            self.attribute = parameter
+        else:
+            raise ValueError(f"Parameter '{parameter}' is neither an input nor an attribute of "
+                             f"model '{getattr(model, 'name', model)}'")
+        self.parameter = parameter
+
+        self._u: Optional[np.ndarray] = None
+        self._sx: Optional[np.ndarray] = None
+        self._sp = 1.0
+        self.nfev = 0
+
+    # Model evaluation
+
+    def _f(self, x: np.ndarray, p: float) -> np.ndarray:
+        self.nfev += 1
+        if self.input_index is not None:
+            u = self._u.copy()
+            u[self.input_index] = p
+            return np.asarray(self.model.dynamics(self.t, x, u), dtype=float)
+        saved = getattr(self.model, self.attribute)
+        try:
+            setattr(self.model, self.attribute, p)
+            return np.asarray(self.model.dynamics(self.t, x, self._u), dtype=float)
+        finally:
+            setattr(self.model, self.attribute, saved)
+
+    def _jacobian_x(self, x: np.ndarray, p: float) -> np.ndarray:
+        if self.input_index is not None:
+            u = self._u.copy()
+            u[self.input_index] = p
+            J = self.model.jacobian(self.t, x, u)
+        else:
+            saved = getattr(self.model, self.attribute)
+            try:
+                setattr(self.model, self.attribute, p)
+                J = self.model.jacobian(self.t, x, self._u)
+            finally:
+                setattr(self.model, self.attribute, saved)
+        return J.toarray() if sparse.issparse(J) else np.asarray(J, dtype=float)
+
+    def _jacobian_p(self, x: np.ndarray, p: float) -> np.ndarray:
+        h = np.finfo(float).eps ** (1.0 / 3.0) * max(1.0, abs(p))
+        return (self._f(x, p + h) - self._f(x, p - h)) / (2.0 * h)
+
+    # Scaled variables z = [x / sx, p / sp]
+
+    def _unscale(self, z: np.ndarray) -> Tuple[np.ndarray, float]:
+        return z[:-1] * self._sx, z[-1] * self._sp
+
+    def _scaled_jacobian(self, z: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        x, p = self._unscale(z)
+        Jx = self._jacobian_x(x, p)
+        return np.hstack([Jx * self._sx, self._jacobian_p(x, p)[:, None] * self._sp]), Jx
+
+    def _tangent(self, Jz: np.ndarray, previous: np.ndarray) -> np.ndarray:
+        # Null vector of Jz, oriented like the previous tangent
+        rhs = np.zeros(len(previous))
+        rhs[-1] = 1.0
+        tangent = np.linalg.solve(np.vstack([Jz, previous]), rhs)
+        return tangent / np.linalg.norm(tangent)
+
+    def _correct(self, z_base: np.ndarray, tangent: np.ndarray, h: float) -> Tuple[np.ndarray, bool, int]:
+        # Newton on [f(z) = 0, tangent . (z - z_base) = h] from the predictor
+        z = z_base + h * tangent
+        for iteration in range(1, self.max_iterations + 1):
+            x, p = self._unscale(z)
+            f = self._f(x, p)
+            Jz, _ = self._scaled_jacobian(z)
+            G = np.append(f, tangent @ (z - z_base) - h)
+            try:
+                dz = np.linalg.solve(np.vstack([Jz, tangent]), -G)
+            except np.linalg.LinAlgError:
+                return z, False, iteration
+            z = z + dz
+            if not np.all(np.isfinite(z)):
+                return z, False, iteration
+            if np.linalg.norm(dz) <= self.tolerance:
+                return z, True, iteration
+        return z, False, self.max_iterations
+
+    # Test functions for special points
+
+    @staticmethod
+    def _hopf_test(eigenvalues: np.ndarray) -> float:
+        # Bialternate product: zero when two eigenvalues sum to zero
+        n = len(eigenvalues)
+        i, j = np.triu_indices(n, k=1)
+        return float(np.real(np.prod(eigenvalues[i] + eigenvalues[j]))) if n > 1 else 1.0
+
+    def _point(self, z: np.ndarray, previous_tangent: np.ndarray) -> Dict[str, Any]:
+        Jz, Jx = self._scaled_jacobian(z)
+        tangent = self._tangent(Jz, previous_tangent)
+        eigenvalues = np.linalg.eigvals(Jx)
+        return {
+            'z': z,
+            'tangent': tangent,
+            'eigenvalues': eigenvalues,
+            'limit_test': tangent[-1],
+            'hopf_test': self._hopf_test(eigenvalues)
+        }
+
+    def _locate(self, start: Dict[str, Any], h: float, test) -> Optional[Dict[str, Any]]:
+        # Bisection on the arclength from the last accepted point for a zero of test(point)
+        cache = {0.0: start}
+
+        def value(sigma):
+            if sigma not in cache:
+                z, converged, _ = self._correct(start['z'], start['tangent'], sigma)
+                if not converged:
+                    raise RuntimeError("corrector failed")
+                cache[sigma] = self._point(z, start['tangent'])
+            return test(cache[sigma])
+
+        try:
+            sigma = brentq(value, 0.0, h, xtol=self.tolerance * 10)
+            value(sigma)
+        except (ValueError, RuntimeError) as error:
+            logger.warning(f"Could not locate point on the arc: {error}")
+            return None
+        return cache[sigma]
+
+    # Public interface
+
+    def trace(
+        self,
+        u: np.ndarray,
+        bounds: Tuple[float, float],
+        x0: Optional[np.ndarray] = None,
+        direction: int = 1,
+        max_points: int = 2000
+    ) -> Dict[str, Any]:
+        """
+        Trace the steady-state branch through (x0, p0) until p leaves bounds.
+
+        Args:
+            u: Model inputs; the starting parameter value is taken from u
+                (input parameter) or from the model attribute
+            bounds: Parameter range (p_min, p_max) of the trace
+            x0: Starting state (default: model.steady_state(u)), corrected onto
+                the branch before tracing
+            direction: +1 to start towards increasing p, -1 towards decreasing p
+            max_points: Maximum number of branch points
+
+        Returns:
+            Dictionary with branch arrays 'p' (K,), 'x' (K, n), 'stable' (K,),
+            'eigenvalues' (K, n), 'arclength' (K,), the list 'special_points'
+            (each with 'type' 'limit_point' or 'hopf', 'p', 'x', 'eigenvalues'
+            and 'index' of the preceding branch point), 'nfev', 'success' and
+            'message'
+        """
+        self._u = np.array(u, dtype=float)
+        self.nfev = 0
+        p_min, p_max = bounds
+        p0 = self._u[self.input_index] if self.input_index is not None else float(getattr(self.model, self.attribute))
+        x0 = np.asarray(self.model.steady_state(self._u) if x0 is None else x0, dtype=float)
+        self._sx = np.maximum(1.0, np.abs(x0))
+        self._sp = max(1.0, abs(p0))
+
+        # Converge the starting point at fixed p, then orient the tangent
+        z = np.append(x0 / self._sx, p0 / self._sp)
+        n = len(x0)
+        axis = np.zeros(n + 1)
+        axis[-1] = 1.0
+        z, converged, _ = self._correct(z, axis, 0.0)
+        if not converged:
+            return {'p': np.array([]), 'x': np.empty((0, n)), 'stable': np.array([], dtype=bool),
+                    'eigenvalues': np.empty((0, n), dtype=complex), 'arclength': np.array([]),
+                    'special_points': [], 'nfev': self.nfev, 'success': False,
+                    'message': 'No steady state near x0'}
+        point = self._point(z, np.sign(direction) * axis)
+
+        points = [point]
+        arclength = [0.0]
+        special: List[Dict[str, Any]] = []
+        h = self.step
+        cos_max = np.cos(np.radians(self.max_angle))
+        message = f"Reached max_points={max_points}"
+        success = True
+
+        while len(points) < max_points:
+            z_new, converged, iterations = self._correct(point['z'], point['tangent'], h)
+            candidate = self._point(z_new, point['tangent']) if converged else None
+            if candidate is None or candidate['tangent'] @ point['tangent'] < cos_max:
+                h *= 0.5
+                if h < self.min_step:
+                    success = False
+                    message = f"Step size fell below min_step at p={self._unscale(point['z'])[1]:.6g}"
+                    break
+                continue
+
+            for test, kind in (('limit_test', 'limit_point'), ('hopf_test', 'hopf')):
+                if np.sign(candidate[test]) != np.sign(point[test]):
+                    found = self._locate(point, h, lambda q, test=test: q[test])
+                    if found is None:
+                        continue
+                    eigenvalues = found['eigenvalues']
+                    if kind == 'hopf' and np.all(np.abs(eigenvalues.imag) < 1e-12):
+                        continue  # neutral saddle: real eigenvalues of opposite sign
+                    x_special, p_special = self._unscale(found['z'])
+                    special.append({'type': kind, 'p': p_special, 'x': x_special,
+                                    'eigenvalues': eigenvalues, 'index': len(points) - 1})
+
+            p = self._unscale(candidate['z'])[1]
+            if not p_min <= p <= p_max:
+                # End the branch exactly on the bound
+                bound = p_min if p < p_min else p_max
+                end = self._locate(point, h, lambda q: q['z'][-1] * self._sp - bound)
+                if end is not None:
+                    points.append(end)
+                    arclength.append(arclength[-1] + end['tangent'] @ (end['z'] - point['z']))
+                message = "Reached the parameter bound"
+                break
+
+            points.append(candidate)
+            arclength.append(arclength[-1] + h)
+            point = candidate
+            if iterations <= 2:
+                h = min(1.5 * h, self.max_step)
+            elif iterations >= 5:
+                h = max(0.5 * h, self.min_step)
+
+        Z = np.array([q['z'] for q in points])
+        eigenvalues = np.array([q['eigenvalues'] for q in points])
+        special = [s for s in special if p_min <= s['p'] <= p_max]
+        logger.info(f"Continuation of '{getattr(self.model, 'name', 'model')}' in {self.parameter}: "
+                    f"{len(points)} points, {len(special)} special points, {self.nfev} evaluations")
+        return {
+            'p': Z[:, -1] * self._sp,
+            'x': Z[:, :-1] * self._sx,
+            'stable': np.max(eigenvalues.real, axis=1) < 0,
+            'eigenvalues': eigenvalues,
+            'arclength': np.array(arclength),
+            'special_points': special,
+            'nfev': self.nfev,
+            'success': success,
+            'message': message
+        }
@@ -12,10 +12,14 @@ import numpy as np
 from typing import Optional, Tuple, Dict, Any, List, Callable, Union
 from scipy import signal, optimize
 from scipy.integrate import solve_ivp
+from .linearization import batch_jacobians, batched
 import logging
 
 logger = logging.getLogger(__name__)
 
+# np.trapz was renamed to np.trapezoid in NumPy 2.0
+_trapezoid = getattr(np, 'trapezoid', None) or getattr(np, 'trapz')
+
 
 def tune_pid(
     model_params: Dict[str, float],
@@ -157,7 +161,7 @@ def calculate_ise(
         raise ValueError("Time and error arrays must have same length")
     
     # Trapezoidal integration
-    ise = np.trapz(error**2, t)
+    ise = _trapezoid(error**2, t)
     return ise
 
 
@@ -179,7 +183,7 @@ def calculate_iae(
         raise ValueError("Time and error arrays must have same length")
     
     # Trapezoidal integration
-    iae = np.trapz(np.abs(error), t)
+    iae = _trapezoid(np.abs(error), t)
     return iae
 
 
@@ -201,7 +205,7 @@ def calculate_itae(
         raise ValueError("Time and error arrays must have same length")
     
     # Time-weighted error
-    itae = np.trapz(t * np.abs(error), t)
+    itae = _trapezoid(t * np.abs(error), t)
     return itae
 
 
@@ -438,43 +442,33 @@ def linearize(
     model_func: Callable,
     x_ss: np.ndarray,
     u_ss: np.ndarray,
-    epsilon: float = 1e-6
+    epsilon: float = 1e-6,
+    method: str = 'forward',
+    vectorized: bool = False
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Linearize a nonlinear model around an operating point.
     
+    All perturbed points are evaluated in one batch by the shared
+    linearization engine (sproclib.utilities.linearization).
+    
     Args:
         model_func: Function f(x, u) returning dx/dt
         x_ss: Steady-state states
         u_ss: Steady-state inputs
-        epsilon: Perturbation size for finite differences
+        epsilon: Perturbation size for finite differences (None: relative
+            step suited to the method)
+        method: 'forward', 'central' or 'complex' (complex step)
+        vectorized: model_func accepts (P, n_states) and (P, n_inputs)
+            arrays of rows and returns (P, n_states)
         
     Returns:
         A, B matrices for linear model dx/dt = A*x + B*u
     """
-    n_states = len(x_ss)
-    n_inputs = len(u_ss)
-    
-    # Calculate A matrix (∂f/∂x)
-    A = np.zeros((n_states, n_states))
-    f0 = model_func(x_ss, u_ss)
-    
-    for i in range(n_states):
-        x_pert = x_ss.copy()
-        x_pert[i] += epsilon
-        f_pert = model_func(x_pert, u_ss)
-        A[:, i] = (f_pert - f0) / epsilon
-    
-    # Calculate B matrix (∂f/∂u)
-    B = np.zeros((n_states, n_inputs))
-    
-    for i in range(n_inputs):
-        u_pert = u_ss.copy()
-        u_pert[i] += epsilon
-        f_pert = model_func(x_ss, u_pert)
-        B[:, i] = (f_pert - f0) / epsilon
-    
-    return A, B
+    batch_func = model_func if vectorized else batched(model_func)
+    A, B = batch_jacobians(batch_func, np.atleast_1d(x_ss)[None, :], np.atleast_1d(u_ss)[None, :],
+                           method=method, epsilon=epsilon)
+    return A[0], B[0]
 
 
 def disturbance_rejection(
@@ -0,0 +1,286 @@
+"""
+Linearization Engine for SPROCLIB
+
+This module provides the Jacobian computation shared by all linearization
+helpers of the library. All perturbed states and inputs of one or many
+operating points are stacked into matrices and evaluated with a single
+batched call of the dynamics. Forward differences, central differences and
+the complex-step method are supported, an analytic state Jacobian is used
+when the model provides one, and results of a Linearizer are cached by
+operating point.
+
+Author: Thorsten Gressling <gressling@paramus.ai>
+License: MIT License
+"""
+
+import numpy as np
+from collections import OrderedDict
+from typing import Optional, Tuple, Dict, Any, Callable
+from scipy import sparse
+import logging
+
+logger = logging.getLogger(__name__)
+
+METHODS = ('forward', 'central', 'complex')
+
+# Default relative step sizes (scaled by max(1, |v|))
+_DEFAULT_STEPS = {
+    'forward': np.sqrt(np.finfo(float).eps),
+    'central': np.finfo(float).eps ** (1.0 / 3.0),
+    'complex': 1e-20
+}
+
+
+def batched(func: Callable) -> Callable:
+    """Batch function evaluating a scalar f(x, u) row by row (keeps complex values)."""
+    def batch(X: np.ndarray, U: np.ndarray) -> np.ndarray:
+        return np.array([np.asarray(func(x, u)) for x, u in zip(X, U)])
+    return batch
+
+
+def batch_jacobians(
+    batch_func: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    X: np.ndarray,
+    U: np.ndarray,
+    method: str = 'forward',
+    epsilon: Optional[float] = None,
+    state_jacobian: Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Jacobians of f(x, u) at K operating points with one batched evaluation.
+
+    Args:
+        batch_func: Function F(X, U) mapping (P, n) states and (P, m) inputs
+            to (P, n) derivatives
+        X: Operating-point states, shape (K, n)
+        U: Operating-point inputs, shape (K, m)
+        method: 'forward', 'central' or 'complex' (complex step; batch_func
+            must propagate complex values)
+        epsilon: Absolute perturbation size (default: relative step suited
+            to the method)
+        state_jacobian: Analytic df/dx(x, u); only df/du is then differenced
+
+    Returns:
+        A of shape (K, n, n) and B of shape (K, n, m)
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown linearization method '{method}', expected one of {METHODS}")
+
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    U = np.atleast_2d(np.asarray(U, dtype=float))
+    K, n = X.shape
+    m = U.shape[1]
+    V = np.hstack([X, U])
+
+    # Perturbed columns: all of [x, u], or only u with an analytic df/dx
+    columns = np.arange(n, n + m) if state_jacobian is not None else np.arange(n + m)
+    c = len(columns)
+    if epsilon is None:
+        h = _DEFAULT_STEPS[method] * np.maximum(1.0, np.abs(V[:, columns]))
+    else:
+        h = np.full((K, c), float(epsilon))
+    rows = np.arange(c)
+
+    if method == 'forward':
+        P = np.repeat(V[:, None, :], c + 1, axis=1)
+        P[:, 1 + rows, columns] += h
+    elif method == 'central':
+        P = np.repeat(V[:, None, :], 2 * c, axis=1)
+        P[:, rows, columns] += h
+        P[:, c + rows, columns] -= h
+    else:
+        P = np.repeat(V[:, None, :], c, axis=1).astype(complex)
+        P[:, rows, columns] += 1j * h
+
+    P = P.reshape(-1, n + m)
+    F = np.asarray(batch_func(P[:, :n], P[:, n:])).reshape(K, -1, n)
+
+    if method == 'forward':
+        D = (F[:, 1:].real - F[:, :1].real) / h[:, :, None]
+    elif method == 'central':
+        D = (F[:, :c].real - F[:, c:].real) / (2.0 * h[:, :, None])
+    else:
+        D = F.imag / h[:, :, None]
+    D = D.transpose(0, 2, 1)  # (K, n, c)
+
+    if state_jacobian is None:
+        return D[:, :, :n].copy(), D[:, :, n:].copy()
+
+    A = np.empty((K, n, n))
+    for k in range(K):
+        J = state_jacobian(X[k], U[k])
+        A[k] = J.toarray() if sparse.issparse(J) else J
+    return A, D.copy()
+
+
+def _parameter_fingerprint(model) -> Tuple:
+    """
+    Cheap fingerprint of the current values of a model's parameters.
+
+    Covers the attributes named in model.parameters, read from the model
+    itself, so in-place changes such as ``model.V *= 2`` change it even
+    when the parameters dict is not updated.
+    """
+    fingerprint = []
+    for name in getattr(model, 'parameters', None) or {}:
+        value = getattr(model, name, None)
+        if isinstance(value, (int, float, complex, np.number, np.ndarray)):
+            fingerprint.append((name, np.asarray(value).tobytes()))
+    return tuple(fingerprint)
+
+
+class Linearizer:
+    """
+    Cached linearization of dx/dt = f(x, u) at operating points.
+
+    Results are stored per operating point (least recently used entries are
+    dropped beyond cache_size), so rebuilding a gain schedule over the same
+    points only evaluates the model for new points. Linearizers built with
+    from_model() also key the cache on the model's parameter values (see
+    _parameter_fingerprint) and ProcessModel.update_parameters revision, so
+    changed parameters are never served stale. Call clear_cache() after
+    changing anything else the dynamics depend on.
+    """
+
+    def __init__(
+        self,
+        func: Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]] = None,
+        batch_func: Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]] = None,
+        state_jacobian: Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]] = None,
+        method: str = 'forward',
+        epsilon: Optional[float] = None,
+        cache_size: int = 4096
+    ):
+        """
+        Initialize linearizer.
+
+        Args:
+            func: Scalar function f(x, u) returning dx/dt
+            batch_func: Vectorized F(X, U) over rows (preferred over func)
+            state_jacobian: Analytic df/dx(x, u) (optional)
+            method: 'forward', 'central' or 'complex'
+            epsilon: Absolute perturbation size (default: relative step)
+            cache_size: Maximum number of cached operating points
+        """
+        if func is None and batch_func is None:
+            raise ValueError("Either func or batch_func must be given")
+        if method not in METHODS:
+            raise ValueError(f"Unknown linearization method '{method}', expected one of {METHODS}")
+        self.batch_func = batch_func if batch_func is not None else batched(func)
+        self.state_jacobian = state_jacobian
+        self.method = method
+        self.epsilon = epsilon
+        self.cache_size = int(cache_size)
+        self._cache: OrderedDict = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._revision = lambda: 0
+
+    @classmethod
+    def from_model(
+        cls,
+        model,
+        t: float = 0.0,
+        method: str = 'forward',
+        epsilon: Optional[float] = None,
+        cache_size: int = 4096
+    ) -> 'Linearizer':
+        """
+        Linearizer for a ProcessModel.
+
+        Uses dynamics_batch when the model vectorizes it and the model's
+        analytic jacobian when it has one.
+
+        Args:
+            model: Process model with dynamics(t, x, u)
+            t: Time at which the dynamics are evaluated
+            method: 'forward', 'central' or 'complex'
+            epsilon: Absolute perturbation size (default: relative step)
+            cache_size: Maximum number of cached operating points
+
+        Returns:
+            Linearizer bound to the model
+        """
+        batch_func = None
+        if getattr(model, 'supports_batch', False):
+            batch_func = lambda X, U: model.dynamics_batch(t, X, U)
+        state_jacobian = None
+        if getattr(model, 'has_jacobian', False):
+            state_jacobian = lambda x, u: model.jacobian(t, x, u)
+        linearizer = cls(
+            func=lambda x, u: model.dynamics(t, x, u),
+            batch_func=batch_func,
+            state_jacobian=state_jacobian,
+            method=method,
+            epsilon=epsilon,
+            cache_size=cache_size
+        )
+        linearizer._revision = lambda: (getattr(model, '_parameter_revision', 0),
+                                        _parameter_fingerprint(model))
+        return linearizer
+
+    def linearize(self, x: np.ndarray, u: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Linearize at one operating point.
+
+        Args:
+            x: States
+            u: Inputs
+
+        Returns:
+            A, B matrices for the linear model dx/dt = A*x + B*u
+        """
+        A, B = self.linearize_many(np.atleast_2d(x), np.atleast_2d(u))
+        return A[0], B[0]
+
+    def linearize_many(self, X: np.ndarray, U: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Linearize at K operating points; uncached points share one batched call.
+
+        Args:
+            X: States, shape (K, n)
+            U: Inputs, shape (K, m) (or (m,) for the same inputs everywhere)
+
+        Returns:
+            A of shape (K, n, n) and B of shape (K, n, m)
+        """
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        U = np.asarray(U, dtype=float)
+        U = np.broadcast_to(U, (X.shape[0], U.shape[-1])) if U.ndim < 2 else U
+        K, n = X.shape
+        m = U.shape[1]
+
+        A = np.empty((K, n, n))
+        B = np.empty((K, n, m))
+        revision = self._revision()
+        keys = [(revision, X[k].tobytes(), U[k].tobytes()) for k in range(K)]
+        missing = []
+        for k, key in enumerate(keys):
+            cached = self._cache.get(key)
+            if cached is None:
+                missing.append(k)
+            else:
+                self._cache.move_to_end(key)
+                A[k], B[k] = cached
+        self._hits += K - len(missing)
+        self._misses += len(missing)
+
+        if missing:
+            A_new, B_new = batch_jacobians(self.batch_func, X[missing], U[missing], self.method,
+                                           self.epsilon, self.state_jacobian)
+            A[missing], B[missing] = A_new, B_new
+            for i, k in enumerate(missing):
+                self._cache[keys[k]] = (A_new[i], B_new[i])
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return A, B
+
+    def clear_cache(self):
+        """Discard cached linearizations."""
+        self._cache.clear()
+
+    def cache_info(self) -> Dict[str, Any]:
+        """Cache statistics: hits, misses and current size."""
+        return {'hits': self._hits, 'misses': self._misses, 'size': len(self._cache),
+                'max_size': self.cache_size}
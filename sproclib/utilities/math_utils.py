@@ -11,6 +11,7 @@ License: MIT License
 import numpy as np
 from typing import Optional, Tuple, Dict, Any, List
 from scipy import signal
+from .linearization import batch_jacobians, batched
 import logging
 
 logger = logging.getLogger(__name__)
@@ -69,43 +70,30 @@ def bode_plot(
     Returns:
         Dictionary with frequency, magnitude, and phase data
     """
-    import matplotlib.pyplot as plt
+    from ..analysis.frequency_response import bode
     
     if hasattr(system, 'sys'):
-        sys = system.sys
+        num, den = system.sys.num, system.sys.den
     else:
         num, den = system
-        sys = signal.TransferFunction(num, den)
     
     if w is None:
         w = np.logspace(-2, 2, 1000)
     
-    w, mag, phase = signal.bode(sys, w)
+    response = bode(num, den, w, with_margins=False)
+    mag_db = response['magnitude_db'][0]
+    phase_deg = response['phase_deg'][0]
     
     if plot:
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
-        
-        # Magnitude plot
-        ax1.semilogx(w/(2*np.pi), 20*np.log10(mag))
-        ax1.set_ylabel('Magnitude (dB)')
-        ax1.grid(True, which='both', alpha=0.3)
-        ax1.set_title(title)
-        
-        # Phase plot
-        ax2.semilogx(w/(2*np.pi), np.degrees(phase))
-        ax2.set_ylabel('Phase (degrees)')
-        ax2.set_xlabel('Frequency (Hz)')
-        ax2.grid(True, which='both', alpha=0.3)
-        
-        plt.tight_layout()
-        plt.show()
+        from ..viz.analysis import plot_bode
+        plot_bode(response['frequency'], mag_db, phase_deg, title=title)
     
     return {
-        'frequency': w,
-        'magnitude': mag,
-        'phase': phase,
-        'magnitude_db': 20*np.log10(mag),
-        'phase_deg': np.degrees(phase)
+        'frequency': response['frequency'],
+        'magnitude': response['magnitude'][0],
+        'phase': response['phase'][0],
+        'magnitude_db': mag_db,
+        'phase_deg': phase_deg
     }
 
 
@@ -113,43 +101,33 @@ def linearize(
     model_func,
     x_ss: np.ndarray,
     u_ss: np.ndarray,
-    epsilon: float = 1e-6
+    epsilon: float = 1e-6,
+    method: str = 'forward',
+    vectorized: bool = False
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Linearize a nonlinear model around an operating point.
     
+    All perturbed points are evaluated in one batch by the shared
+    linearization engine (sproclib.utilities.linearization).
+    
     Args:
         model_func: Function f(x, u) returning dx/dt
         x_ss: Steady-state states
         u_ss: Steady-state inputs
-        epsilon: Perturbation size for finite differences
+        epsilon: Perturbation size for finite differences (None: relative
+            step suited to the method)
+        method: 'forward', 'central' or 'complex' (complex step)
+        vectorized: model_func accepts (P, n_states) and (P, n_inputs)
+            arrays of rows and returns (P, n_states)
         
     Returns:
         A, B matrices for linear model dx/dt = A*x + B*u
     """
-    n_states = len(x_ss)
-    n_inputs = len(u_ss)
-    
-    # Calculate A matrix (∂f/∂x)
-    A = np.zeros((n_states, n_states))
-    f0 = model_func(x_ss, u_ss)
-    
-    for i in range(n_states):
-        x_pert = x_ss.copy()
-        x_pert[i] += epsilon
-        f_pert = model_func(x_pert, u_ss)
-        A[:, i] = (f_pert - f0) / epsilon
-    
-    # Calculate B matrix (∂f/∂u)
-    B = np.zeros((n_states, n_inputs))
-    
-    for i in range(n_inputs):
-        u_pert = u_ss.copy()
-        u_pert[i] += epsilon
-        f_pert = model_func(x_ss, u_pert)
-        B[:, i] = (f_pert - f0) / epsilon
-    
-    return A, B
+    batch_func = model_func if vectorized else batched(model_func)
+    A, B = batch_jacobians(batch_func, np.atleast_1d(x_ss)[None, :], np.atleast_1d(u_ss)[None, :],
+                           method=method, epsilon=epsilon)
+    return A[0], B[0]
 
 
 def stability_check(A: np.ndarray) -> bool:
@@ -224,11 +202,12 @@ def frequency_response(
         w: Frequency vector
         
     Returns:
-        Magnitude and phase arrays
+        Magnitude [dB] and phase [deg] arrays
     """
-    sys = signal.TransferFunction(num, den)
-    w, mag, phase = signal.bode(sys, w)
-    return mag, phase
+    from ..analysis.frequency_response import bode
+    
+    response = bode(num, den, w, with_margins=False)
+    return response['magnitude_db'][0], response['phase_deg'][0]
 
 
 __all__ = [
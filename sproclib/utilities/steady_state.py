@@ -0,0 +1,370 @@
+"""
+Steady-State Solver for SPROCLIB
+
+This module provides a steady-state service for process models whose
+equilibrium has no closed form. Solutions are kept in an LRU cache keyed by
+quantized inputs and solved by Newton's method with the model's analytic
+Jacobian. The default solve always starts from the model's cold-start guess,
+so the steady state returned for given inputs does not depend on what was
+solved before; nearby cached solutions only serve as a last-resort start.
+Every solve reports its convergence status instead of silently returning
+the initial guess, and track() follows one steady-state branch along a path
+of inputs, which keeps the solver on the same branch of models with
+multiple steady states (e.g. the exothermic CSTR).
+
+Author: Thorsten Gressling <gressling@paramus.ai>
+License: MIT License
+"""
+
+import numpy as np
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Callable
+from scipy import sparse
+from scipy.optimize import root
+from scipy.integrate import solve_ivp
+import logging
+
+from .linearization import _parameter_fingerprint
+
+logger = logging.getLogger(__name__)
+
+
+class _SettleBudgetExceeded(Exception):
+    """Raised inside the time-stepping fallback when its evaluation budget is spent."""
+
+
+class SteadyStateSolver:
+    """
+    Cached steady-state solver for f(x, u) = 0.
+
+    Inputs closer than `resolution` in every component share one cache
+    entry. Results of a model-bound solver are tied to the model's parameter
+    revision (bumped by ProcessModel.update_parameters) and to the current
+    values of the attributes named in model.parameters, so direct assignments
+    such as ``model.V = 50`` are not served stale; solutions for older
+    parameters are still used as fallback starts. Solutions found from an
+    explicit x0 or by track() are cached for reuse as starting points but
+    never returned by a default solve(u), which keeps it history-independent.
+    """
+
+    def __init__(
+        self,
+        model,
+        initial_guess: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+        t: float = 0.0,
+        resolution: float = 1e-9,
+        cache_size: int = 1024,
+        tolerance: float = 1e-10,
+        max_iterations: int = 50,
+        settle_time: Optional[float] = 1e6,
+        settle_evaluations: int = 2000
+    ):
+        """
+        Initialize steady-state solver.
+
+        Args:
+            model: Process model with dynamics(t, x, u) (and optionally jacobian)
+            initial_guess: Cold-start guess x0(u) used when nothing is cached
+            t: Time at which the dynamics are evaluated
+            resolution: Input quantization of the cache key
+            cache_size: Maximum number of cached operating points
+            tolerance: Relative step tolerance of the nonlinear solver
+            max_iterations: Maximum number of Newton iterations per start
+            settle_time: Horizon of the time-stepping fallback used when all
+                Newton starts fail (None disables it)
+            settle_evaluations: Evaluation budget of the time-stepping fallback
+                (bounds the effort when the dynamics oscillate)
+        """
+        self.model = model
+        self.initial_guess = initial_guess
+        self.t = t
+        self.resolution = float(resolution)
+        self.cache_size = int(cache_size)
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.settle_time = settle_time
+        self.settle_evaluations = settle_evaluations
+
+        self._cache: OrderedDict = OrderedDict()  # key -> slot in the arrays below
+        self._inputs: Optional[np.ndarray] = None  # (cache_size, m) cached inputs
+        self._states: Optional[np.ndarray] = None  # (cache_size, n) cached steady states
+        self._residuals: Optional[np.ndarray] = None
+        self._default: Optional[np.ndarray] = None  # solved without x0 (the answer of solve(u))
+        self._free: list = []
+        self._used = 0  # slots below this index have been filled at least once
+        self._hits = 0
+        self._misses = 0
+        self.last_result: Optional[Dict[str, Any]] = None
+
+    def _key(self, u: np.ndarray):
+        return (getattr(self.model, '_parameter_revision', 0), _parameter_fingerprint(self.model),
+                tuple(np.round(u / self.resolution).astype(np.int64)))
+
+    def residual(self, x: np.ndarray, u: np.ndarray) -> np.ndarray:
+        """Steady-state residual f(x, u)."""
+        return np.asarray(self.model.dynamics(self.t, x, u), dtype=float)
+
+    def _jacobian(self, u: np.ndarray) -> Optional[Callable]:
+        if not hasattr(self.model, 'jacobian'):
+            return None
+
+        def jac(x):
+            J = self.model.jacobian(self.t, x, u)
+            return J.toarray() if sparse.issparse(J) else np.asarray(J, dtype=float)
+        return jac
+
+    def nearest(self, u: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Cached solution with the closest inputs (scaled by max(1, |u|)).
+
+        Args:
+            u: Inputs
+
+        Returns:
+            Steady state solved at the nearest cached inputs, or None
+        """
+        if not self._cache:
+            return None
+        scale = np.maximum(1.0, np.abs(u))
+        # Freed slots hold infinite inputs and are never the nearest
+        distance = np.sum(((self._inputs[:self._used] - u) / scale) ** 2, axis=1)
+        return self._states[int(np.argmin(distance))].copy()
+
+    def _newton(self, u: np.ndarray, x0: np.ndarray) -> Dict[str, Any]:
+        # Damped Newton with the model Jacobian; MINPACK's hybrid method as fallback
+        jac = self._jacobian(u)
+        x = np.array(x0, dtype=float)
+        f = self.residual(x, u)
+        nfev = 1
+        converged = False
+        if jac is not None and np.all(np.isfinite(f)):
+            for _ in range(self.max_iterations):
+                try:
+                    dx = np.linalg.solve(jac(x), -f)
+                except np.linalg.LinAlgError:
+                    break
+                norm_f = np.linalg.norm(f)
+                step = 1.0
+                while True:
+                    x_new = x + step * dx
+                    f_new = self.residual(x_new, u)
+                    nfev += 1
+                    if (np.all(np.isfinite(f_new)) and np.linalg.norm(f_new) < (1 - 1e-4 * step) * norm_f) \
+                            or step < 1.0 / 64:
+                        break
+                    step *= 0.5
+                if not np.all(np.isfinite(f_new)):
+                    break
+                x, f = x_new, f_new
+                if np.linalg.norm(step * dx) <= self.tolerance * (1.0 + np.linalg.norm(x)):
+                    converged = True
+                    break
+
+        if converged:
+            message = 'The solution converged.'
+        else:
+            sol = root(lambda z: self.residual(z, u), x0, jac=jac, method='hybr',
+                       options={'xtol': self.tolerance})
+            x, f = sol.x, self.residual(sol.x, u)
+            nfev += sol.nfev + 1
+            converged = bool(sol.success) and bool(np.all(np.isfinite(f)))
+            message = sol.message
+        return {
+            'x': x,
+            'success': converged,
+            'message': message,
+            'residual': float(np.linalg.norm(f)),
+            'nfev': nfev
+        }
+
+    def _settle(self, u: np.ndarray, x0: np.ndarray) -> Dict[str, Any]:
+        # Integrate the dynamics towards a stable steady state, then polish with Newton
+        jac = self._jacobian(u)
+        last = {'x': x0, 'nfev': 0}
+
+        def rhs(t, x):
+            last['nfev'] += 1
+            if last['nfev'] > self.settle_evaluations:
+                raise _SettleBudgetExceeded
+            last['x'] = x
+            return self.residual(x, u)
+
+        try:
+            sol = solve_ivp(rhs, (0.0, self.settle_time), x0, method='BDF',
+                            jac=None if jac is None else (lambda t, x: jac(x)))
+            x_end = sol.y[:, -1]
+        except _SettleBudgetExceeded:
+            x_end = last['x']
+        result = self._newton(u, x_end)
+        result['nfev'] += last['nfev']
+        return result
+
+    def _store(self, key, u: np.ndarray, result: Dict[str, Any], default: bool):
+        if self._inputs is None:
+            self._inputs = np.full((self.cache_size, len(u)), np.inf)
+            self._states = np.zeros((self.cache_size, len(result['x'])))
+            self._residuals = np.zeros(self.cache_size)
+            self._default = np.zeros(self.cache_size, dtype=bool)
+            self._free = list(range(self.cache_size - 1, -1, -1))
+        slot = self._cache.get(key)
+        if slot is not None and self._default[slot] and not default:
+            return  # keep the default solution for these inputs
+        if slot is None:
+            if not self._free:
+                self._free.append(self._cache.popitem(last=False)[1])
+            slot = self._free.pop()
+            self._used = max(self._used, slot + 1)
+        self._cache[key] = slot
+        self._cache.move_to_end(key)
+        self._inputs[slot] = u
+        self._states[slot] = result['x']
+        self._residuals[slot] = result['residual']
+        self._default[slot] = default
+
+    def solve(self, u: np.ndarray, x0: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """
+        Solve f(x, u) = 0.
+
+        Starting points are tried in order: x0 (if given) and the cold-start
+        guess. If Newton fails from both, the dynamics are integrated from the
+        first start until they settle and the result is polished with Newton;
+        only if that fails too is the nearest cached solution tried. Without
+        x0 the result therefore depends only on u and the model parameters,
+        and a cached default solution is returned without evaluating the
+        model. Use x0 or track() to select one of several steady states.
+
+        Args:
+            u: Inputs
+            x0: Starting point (e.g. a solution on the branch to follow)
+
+        Returns:
+            Dictionary with 'x', 'success', 'message', 'residual', 'nfev',
+            'start' ('cache', 'x0', 'warm', 'cold' or 'settle') and 'attempts'
+        """
+        u = np.asarray(u, dtype=float)
+        key = self._key(u)
+
+        if x0 is None:
+            slot = self._cache.get(key)
+            if slot is not None and self._default[slot]:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                self.last_result = {'x': self._states[slot].copy(), 'success': True, 'message': 'cached',
+                                    'residual': float(self._residuals[slot]), 'nfev': 0, 'start': 'cache', 'attempts': 0}
+                return self.last_result
+        self._misses += 1
+
+        starts = []
+        if x0 is not None:
+            starts.append(('x0', np.asarray(x0, dtype=float)))
+        if self.initial_guess is not None:
+            starts.append(('cold', np.asarray(self.initial_guess(u), dtype=float)))
+        warm = self.nearest(u)
+        if not starts and warm is None:
+            raise ValueError("No starting point: give x0 or an initial_guess")
+
+        nfev = 0
+        best = None
+        for attempt, (start, x_start) in enumerate(starts, 1):
+            result = self._newton(u, x_start)
+            nfev += result['nfev']
+            result.update(start=start, attempts=attempt)
+            if best is None or result['residual'] < best['residual']:
+                best = result
+            if result['success']:
+                best = result
+                break
+        fallbacks = []
+        if starts and self.settle_time is not None:
+            fallbacks.append(('settle', lambda: self._settle(u, starts[0][1])))
+        if warm is not None:
+            fallbacks.append(('warm', lambda: self._newton(u, warm)))
+        for start, fallback in fallbacks:
+            if best is not None and best['success']:
+                break
+            result = fallback()
+            nfev += result['nfev']
+            result.update(start=start, attempts=(best['attempts'] if best else 0) + 1)
+            if best is None or result['success'] or result['residual'] < best['residual']:
+                best = result
+        best['nfev'] = nfev
+
+        if best['success']:
+            # A solution reached from a cached neighbour depends on the history
+            self._store(key, u, best, default=x0 is None and best['start'] != 'warm')
+        else:
+            logger.warning(f"Steady state of '{getattr(self.model, 'name', 'model')}' did not converge "
+                           f"for u={u}: {best['message']} (residual {best['residual']:.3g})")
+        self.last_result = best
+        return best
+
+    def __call__(self, u: np.ndarray, x0: Optional[np.ndarray] = None) -> np.ndarray:
+        """Steady state x for inputs u (see solve() for the convergence status)."""
+        return self.solve(u, x0)['x']
+
+    def track(self, U: np.ndarray, x0: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """
+        Follow one steady-state branch along a path of inputs.
+
+        Each point is started from a secant extrapolation of the two previous
+        solutions, so the solver stays on the branch it started on instead of
+        jumping to another steady state. Tracking stops where the branch is
+        lost (typically past a turning point); the remaining rows are NaN.
+
+        Args:
+            U: Inputs along the path, shape (K, m)
+            x0: Starting point for the first inputs (default: solve() as usual)
+
+        Returns:
+            Dictionary with 'x' (K, n), 'success' (K,), 'residual' (K,),
+            'nfev' and 'message'
+        """
+        U = np.atleast_2d(np.asarray(U, dtype=float))
+        K = U.shape[0]
+        first = self.solve(U[0], x0)
+        n = len(first['x'])
+
+        X = np.full((K, n), np.nan)
+        success = np.zeros(K, dtype=bool)
+        residual = np.full(K, np.nan)
+        nfev = first['nfev']
+        message = 'Branch tracked'
+
+        if not first['success']:
+            return {'x': X, 'success': success, 'residual': residual, 'nfev': nfev,
+                    'message': f"No steady state at the start of the path: {first['message']}"}
+        X[0], success[0], residual[0] = first['x'], True, first['residual']
+
+        for k in range(1, K):
+            x_pred = X[k - 1]
+            if k > 1:
+                previous = np.linalg.norm(U[k - 1] - U[k - 2])
+                if previous > 0:
+                    ratio = np.linalg.norm(U[k] - U[k - 1]) / previous
+                    x_pred = X[k - 1] + ratio * (X[k - 1] - X[k - 2])
+            result = self._newton(U[k], x_pred)
+            nfev += result['nfev']
+            # A correction much larger than the predicted step means the
+            # solver converged to a different branch
+            scale = np.maximum(1.0, np.abs(x_pred))
+            correction = np.linalg.norm((result['x'] - x_pred) / scale)
+            step = np.linalg.norm((x_pred - X[k - 1]) / scale)
+            jumped = k > 1 and correction > max(5.0 * step, 1e-6)
+            if not result['success'] or jumped:
+                message = f"Branch lost at point {k} (u={U[k]}); possibly a turning point"
+                break
+            X[k], success[k], residual[k] = result['x'], True, result['residual']
+            self._store(self._key(U[k]), U[k], result, default=False)
+
+        return {'x': X, 'success': success, 'residual': residual, 'nfev': nfev, 'message': message}
+
+    def clear_cache(self):
+        """Discard cached steady states."""
+        self._cache.clear()
+        self._inputs = None
+        self._used = 0
+
+    def cache_info(self) -> Dict[str, Any]:
+        """Cache statistics: hits, misses and current size."""
+        return {'hits': self._hits, 'misses': self._misses, 'size': len(self._cache),
+                'max_size': self.cache_size}
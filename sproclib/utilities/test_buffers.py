@@ -0,0 +1,90 @@
+"""
+Test suite for the preallocated buffers in sproclib.utilities.buffers
+"""
+
+import numpy as np
+import pytest
+
+from .buffers import RingBuffer, DeadTimeBuffer
+
+
+def reference_delayed(times, values, target, initial_value=0.0):
+    """Linear-scan interpolation as used by the original valve models."""
+    if not times or target < times[0]:
+        return initial_value
+    if target >= times[-1]:
+        return values[-1]
+    for i in range(len(times) - 1):
+        if times[i] <= target <= times[i + 1]:
+            return values[i] + (values[i + 1] - values[i]) * (target - times[i]) / (times[i + 1] - times[i])
+
+
+class TestRingBuffer:
+    """Test class for RingBuffer."""
+
+    def test_wraps_in_chronological_order(self):
+        """Test that the oldest rows are overwritten and reads are ordered."""
+        buffer = RingBuffer(4, width=2)
+        for k in range(7):
+            buffer.append(k, 10 * k)
+        assert len(buffer) == 4
+        np.testing.assert_array_equal(buffer.column(0), [3, 4, 5, 6])
+        np.testing.assert_array_equal(buffer.last(), [6, 60])
+
+    def test_disabled_and_invalid(self):
+        """Test zero capacity and row width checks."""
+        buffer = RingBuffer(0, width=3)
+        buffer.append(1.0, 2.0, 3.0)
+        assert len(buffer) == 0
+        assert buffer.values().shape == (0, 3)
+        with pytest.raises(ValueError):
+            RingBuffer(2, width=2).append(1.0)
+
+
+class TestDeadTimeBuffer:
+    """Test class for DeadTimeBuffer."""
+
+    def test_matches_linear_scan(self):
+        """Test interpolation against the linear-scan reference with irregular steps."""
+        rng = np.random.default_rng(0)
+        buffer = DeadTimeBuffer(dead_time=1.5, capacity=4)
+        times, values = [], []
+        t = 0.0
+        for _ in range(2000):
+            t += rng.uniform(0.001, 0.05)
+            value = np.sin(t) + rng.normal(scale=0.1)
+            times.append(t)
+            values.append(value)
+            assert buffer.update(t, value) == pytest.approx(reference_delayed(times, values, t - 1.5), abs=1e-12)
+            # Random look-back queries inside the retained window
+            query = t - rng.uniform(0.0, 0.05)
+            assert buffer.delayed(query) == pytest.approx(reference_delayed(times, values, query - 1.5), abs=1e-12)
+
+    def test_rejected_step_rewrites_history(self):
+        """Test that an earlier append discards the samples after it."""
+        buffer = DeadTimeBuffer(dead_time=5.0)
+        for t in (0.0, 1.0, 2.0, 3.0):
+            buffer.append(t, t)
+        buffer.append(1.5, 10.0)
+        np.testing.assert_array_equal(buffer.times, [0.0, 1.0, 1.5])
+        assert buffer.delayed(6.25) == pytest.approx(5.5)
+        buffer.append(1.5, 20.0)
+        np.testing.assert_array_equal(buffer.values, [0.0, 1.0, 20.0])
+
+    def test_window_is_bounded(self):
+        """Test that expired samples are dropped and storage stays bounded."""
+        buffer = DeadTimeBuffer(dead_time=1.0, capacity=8, margin=0.0)
+        for k in range(100000):
+            buffer.append(0.01 * k, float(k))
+        assert len(buffer) <= 102
+        assert len(buffer._times) <= 512
+        assert buffer.delayed(999.99) == pytest.approx(99899.0)
+
+    def test_initial_value_and_validation(self):
+        """Test the value before the first sample has aged and parameter checks."""
+        buffer = DeadTimeBuffer(dead_time=2.0, initial_value=0.3)
+        buffer.append(0.0, 1.0)
+        assert buffer.delayed(1.0) == 0.3
+        assert buffer.delayed(2.5) == 1.0
+        with pytest.raises(ValueError):
+            DeadTimeBuffer(dead_time=-1.0)
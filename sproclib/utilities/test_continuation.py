@@ -0,0 +1,120 @@
+"""
+Test suite for pseudo-arclength continuation in sproclib.utilities.continuation
+"""
+
+import numpy as np
+import pytest
+from scipy.optimize import fsolve
+
+from .continuation import Continuation
+from ..unit.base import ProcessModel
+from ..unit.reactor.cstr import CSTR
+
+
+class Brusselator(ProcessModel):
+    """Brusselator with steady state (a, b/a) and a Hopf point at b = 1 + a^2."""
+
+    def __init__(self, a: float = 1.0, b: float = 1.0):
+        super().__init__("Brusselator")
+        self.a = a
+        self.b = b
+
+    def dynamics(self, t, x, u):
+        X, Y = x
+        return np.array([self.a - (self.b + 1) * X + X ** 2 * Y, self.b * X - X ** 2 * Y])
+
+    def jacobian(self, t, x, u):
+        X, Y = x
+        return np.array([[-(self.b + 1) + 2 * X * Y, X ** 2], [self.b - 2 * X * Y, -X ** 2]])
+
+    def steady_state(self, u):
+        return np.array([self.a, self.b / self.a])
+
+
+@pytest.fixture(scope="module")
+def cstr_branch():
+    """S-shaped CSTR branch over coolant temperature (three steady states near 301 K)."""
+    cstr = CSTR()
+    u = np.array([100.0, 1.0, 350.0, 280.0])
+    return cstr, u, Continuation(cstr, 'Tc').trace(u, bounds=(280.0, 320.0))
+
+
+def limit_point(cstr, u, guess):
+    """Turning point from f(x, Tc) = 0 and det(df/dx) = 0."""
+    def equations(v):
+        w = u.copy()
+        w[3] = v[2]
+        return np.append(cstr.dynamics(0, v[:2], w) / [1.0, 100.0], np.linalg.det(cstr.jacobian(0, v[:2], w)))
+    return fsolve(equations, guess, xtol=1e-13)
+
+
+class TestContinuation:
+    """Test class for Continuation."""
+
+    def test_branch_points_are_steady_states(self, cstr_branch):
+        cstr, u, branch = cstr_branch
+        assert branch['success']
+        assert branch['p'][0] == pytest.approx(280.0) and branch['p'][-1] == pytest.approx(320.0)
+        for x, p in zip(branch['x'], branch['p']):
+            w = u.copy()
+            w[3] = p
+            np.testing.assert_allclose(cstr.dynamics(0, x, w), 0.0, atol=1e-6)
+
+    def test_all_three_steady_states_traced(self, cstr_branch):
+        """Test that the unstable middle branch between the turning points is included."""
+        _, _, branch = cstr_branch
+        crossings = np.flatnonzero(np.diff(np.sign(branch['p'] - 301.0)))
+        assert len(crossings) == 3
+        T = branch['x'][crossings, 1]
+        assert T[0] < 335.0 < T[1] < 355.0 < T[2]
+        assert branch['stable'][crossings[0]] and not branch['stable'][crossings[1]]
+
+    def test_limit_points(self, cstr_branch):
+        cstr, u, branch = cstr_branch
+        found = [s for s in branch['special_points'] if s['type'] == 'limit_point']
+        assert len(found) == 2
+        for point in found:
+            reference = limit_point(cstr, u, np.append(point['x'], point['p']))
+            assert point['p'] == pytest.approx(reference[2], abs=1e-6)
+            np.testing.assert_allclose(point['x'], reference[:2], rtol=1e-6)
+            assert np.min(np.abs(point['eigenvalues'])) < 1e-6
+        assert found[0]['p'] > found[1]['p']  # the branch turns back
+
+    def test_hopf_point(self, cstr_branch):
+        _, _, branch = cstr_branch
+        hopf = [s for s in branch['special_points'] if s['type'] == 'hopf']
+        assert len(hopf) == 1
+        eigenvalues = hopf[0]['eigenvalues']
+        assert np.all(np.abs(eigenvalues.real) < 1e-6 * np.abs(eigenvalues.imag))
+        # Stability changes at the Hopf point on the upper branch
+        k = hopf[0]['index']
+        assert not branch['stable'][k] and branch['stable'][k + 1]
+
+    def test_fewer_evaluations_than_grid(self, cstr_branch):
+        """A 401-point grid of Newton solves costs ~16000 evaluations and misses the middle branch."""
+        _, _, branch = cstr_branch
+        assert len(branch['p']) < 150
+        assert branch['nfev'] < 2000
+
+    def test_reverse_direction(self, cstr_branch):
+        cstr, _, branch = cstr_branch
+        reverse = Continuation(cstr, 3).trace(np.array([100.0, 1.0, 350.0, 320.0]), bounds=(280.0, 320.0),
+                                              direction=-1)
+        assert reverse['p'][-1] == pytest.approx(280.0)
+        forward = sorted(s['p'] for s in branch['special_points'])
+        np.testing.assert_allclose(sorted(s['p'] for s in reverse['special_points']), forward, atol=1e-6)
+
+    def test_attribute_parameter_hopf(self):
+        """Test continuation in a model attribute against the analytic Hopf point."""
+        model = Brusselator(a=1.5)
+        branch = Continuation(model, 'b').trace(np.zeros(0), bounds=(0.5, 5.0))
+        hopf = [s for s in branch['special_points'] if s['type'] == 'hopf']
+        assert len(hopf) == 1
+        assert hopf[0]['p'] == pytest.approx(1 + 1.5 ** 2, abs=1e-8)
+        np.testing.assert_allclose(np.abs(hopf[0]['eigenvalues'].imag), 1.5, rtol=1e-6)
+        np.testing.assert_allclose(branch['x'][:, 1], branch['p'] / 1.5, rtol=1e-8)
+        assert model.b == 1.0
+
+    def test_unknown_parameter(self):
+        with pytest.raises(ValueError):
+            Continuation(CSTR(), 'flux_capacitor')
@@ -0,0 +1,200 @@
+"""
+Test suite for the linearization engine in sproclib.utilities.linearization
+"""
+
+import numpy as np
+import pytest
+
+from .linearization import Linearizer, batch_jacobians
+from .math_utils import linearize as math_linearize
+from .control_utils import linearize as control_linearize
+from ..unit.base import ProcessModel
+from ..unit.utilities import LinearApproximation
+from ..unit.reactor.cstr import CSTR
+
+
+def reactor(x, u):
+    """Small nonlinear reactor, written with NumPy functions so it accepts complex values."""
+    k = 0.5 * np.exp(-1.0 / (0.5 + u[0]))
+    return np.array([u[1] * (1.0 - x[0]) - k * x[0] ** 2,
+                     k * x[0] ** 2 - u[1] * x[1] + 0.1 * np.sin(x[1])])
+
+
+def reactor_jacobians(x, u):
+    """Analytic A and B of reactor()."""
+    k = 0.5 * np.exp(-1.0 / (0.5 + u[0]))
+    dk = k / (0.5 + u[0]) ** 2
+    A = np.array([[-u[1] - 2 * k * x[0], 0.0],
+                  [2 * k * x[0], -u[1] + 0.1 * np.cos(x[1])]])
+    B = np.array([[-dk * x[0] ** 2, 1.0 - x[0]],
+                  [dk * x[0] ** 2, -x[1]]])
+    return A, B
+
+
+class CountingReactor(ProcessModel):
+    """reactor() as a ProcessModel, counting batched evaluations."""
+
+    def __init__(self, analytic: bool = False):
+        super().__init__("CountingReactor")
+        self.analytic = analytic
+        self.batch_calls = 0
+        self.scale = 1.0
+
+    def dynamics(self, t, x, u):
+        return self.scale * reactor(x, u)
+
+    def dynamics_batch(self, t, X, U):
+        self.batch_calls += 1
+        return np.array([self.dynamics(t, x, u) for x, u in zip(X, U)])
+
+    def steady_state(self, u):
+        return np.array([0.5, 0.5])
+
+
+class AnalyticReactor(CountingReactor):
+    def jacobian(self, t, x, u):
+        return self.scale * reactor_jacobians(x, u)[0]
+
+
+class TestBatchJacobians:
+    """Test class for batch_jacobians."""
+
+    x = np.array([0.7, 0.3])
+    u = np.array([1.2, 0.8])
+
+    @pytest.mark.parametrize("method, tolerance", [('forward', 1e-6), ('central', 1e-9), ('complex', 1e-14)])
+    def test_accuracy(self, method, tolerance):
+        """Test each method against the analytic Jacobians."""
+        A_ref, B_ref = reactor_jacobians(self.x, self.u)
+        A, B = math_linearize(reactor, self.x, self.u, epsilon=None, method=method)
+        np.testing.assert_allclose(A, A_ref, atol=tolerance)
+        np.testing.assert_allclose(B, B_ref, atol=tolerance)
+
+    def test_forward_matches_column_loop(self):
+        """Test that the default call reproduces the one-column-at-a-time differences."""
+        f0 = reactor(self.x, self.u)
+        A_loop = np.column_stack([(reactor(self.x + 1e-6 * e, self.u) - f0) / 1e-6 for e in np.eye(2)])
+        B_loop = np.column_stack([(reactor(self.x, self.u + 1e-6 * e) - f0) / 1e-6 for e in np.eye(2)])
+        for linearize in (math_linearize, control_linearize):
+            A, B = linearize(reactor, self.x, self.u)
+            np.testing.assert_array_equal(A, A_loop)
+            np.testing.assert_array_equal(B, B_loop)
+
+    def test_vectorized_function_is_called_once(self):
+        """Test that all perturbations of all points go into a single call."""
+        calls = []
+
+        def vectorized(X, U):
+            calls.append(X.shape[0])
+            k = 0.5 * np.exp(-1.0 / (0.5 + U[:, 0]))
+            return np.column_stack([U[:, 1] * (1 - X[:, 0]) - k * X[:, 0] ** 2,
+                                    k * X[:, 0] ** 2 - U[:, 1] * X[:, 1] + 0.1 * np.sin(X[:, 1])])
+
+        rng = np.random.default_rng(0)
+        X = rng.uniform(0.1, 1.0, (50, 2))
+        U = rng.uniform(0.5, 1.5, (50, 2))
+        A, B = batch_jacobians(vectorized, X, U, method='central')
+        assert calls == [50 * 8]
+        for k in (0, 17, 49):
+            A_ref, B_ref = reactor_jacobians(X[k], U[k])
+            np.testing.assert_allclose(A[k], A_ref, atol=1e-8)
+            np.testing.assert_allclose(B[k], B_ref, atol=1e-8)
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError):
+            batch_jacobians(lambda X, U: X, np.zeros((1, 2)), np.zeros((1, 1)), method='spline')
+
+
+class TestLinearizer:
+    """Test class for the cached Linearizer."""
+
+    def test_analytic_state_jacobian_is_used(self):
+        """Test that A comes from model.jacobian and only B is differenced."""
+        model = AnalyticReactor()
+        linearizer = Linearizer.from_model(model, method='central')
+        x, u = np.array([0.6, 0.4]), np.array([1.0, 0.9])
+        A, B = linearizer.linearize(x, u)
+        A_ref, B_ref = reactor_jacobians(x, u)
+        np.testing.assert_array_equal(A, A_ref)
+        np.testing.assert_allclose(B, B_ref, atol=1e-9)
+
+    def test_cache_by_operating_point(self):
+        """Test that repeated schedule construction does not re-evaluate the model."""
+        model = CountingReactor()
+        linearizer = Linearizer.from_model(model)
+        rng = np.random.default_rng(1)
+        X = rng.uniform(0.1, 1.0, (30, 2))
+        U = rng.uniform(0.5, 1.5, (30, 2))
+
+        A1, B1 = linearizer.linearize_many(X, U)
+        assert model.batch_calls == 1
+        A2, B2 = linearizer.linearize_many(X, U)
+        assert model.batch_calls == 1
+        np.testing.assert_array_equal(A1, A2)
+        np.testing.assert_array_equal(B1, B2)
+
+        # Only the new points are evaluated
+        linearizer.linearize_many(np.vstack([X[:5], [[0.5, 0.5]]]), np.vstack([U[:5], [[1.0, 1.0]]]))
+        assert model.batch_calls == 2
+        info = linearizer.cache_info()
+        assert info['size'] == 31 and info['hits'] == 35 and info['misses'] == 31
+
+    def test_update_parameters_invalidates_cache(self):
+        model = CountingReactor()
+        linearizer = Linearizer.from_model(model)
+        x, u = np.array([0.6, 0.4]), np.array([1.0, 0.9])
+        A1, _ = linearizer.linearize(x, u)
+        model.update_parameters(scale=2.0)
+        A2, _ = linearizer.linearize(x, u)
+        np.testing.assert_allclose(A2, 2.0 * A1, rtol=1e-6)
+
+    def test_cache_size_limit(self):
+        linearizer = Linearizer(reactor, cache_size=3)
+        for k in range(5):
+            linearizer.linearize(np.array([0.1 * k, 0.2]), np.array([1.0, 1.0]))
+        assert linearizer.cache_info()['size'] == 3
+
+
+class TestLinearApproximation:
+    """Test class for LinearApproximation on the shared engine."""
+
+    def test_linearize_many_matches_single_points(self):
+        model = CountingReactor()
+        approximation = LinearApproximation(model)
+        U = np.array([[1.0, 0.8], [1.2, 0.9], [0.8, 1.1]])
+        X = np.array([[0.6, 0.4], [0.5, 0.5], [0.7, 0.2]])
+        A, B = approximation.linearize_many(U, X, method='complex', epsilon=None)
+        for k in range(3):
+            A_k, B_k = approximation.linearize(U[k], X[k], method='complex', epsilon=None)
+            np.testing.assert_array_equal(A[k], A_k)
+            np.testing.assert_array_equal(B[k], B_k)
+            np.testing.assert_allclose(A_k, reactor_jacobians(X[k], U[k])[0], atol=1e-14)
+
+    def test_steady_state_default(self):
+        approximation = LinearApproximation(CountingReactor())
+        approximation.linearize(np.array([1.0, 0.8]))
+        np.testing.assert_array_equal(approximation.x_ss, [0.5, 0.5])
+        assert approximation.A.shape == (2, 2) and approximation.B.shape == (2, 2)
+
+    def test_in_place_parameter_change_is_not_stale(self):
+        """Test that linearize() picks up parameters changed by direct assignment."""
+        cstr = CSTR()
+        approximation = LinearApproximation(cstr)
+        u = np.array([100.0, 1.0, 350.0, 300.0])
+        x = np.array([0.5, 350.0])
+        _, B1 = approximation.linearize(u, x)
+        cstr.V *= 2
+        _, B2 = approximation.linearize(u, x)
+        # dCA/dt depends on q only through q/V
+        assert B2[0, 0] == pytest.approx(0.5 * B1[0, 0], rel=1e-5)
+
+    def test_clear_cache(self):
+        model = CountingReactor()
+        approximation = LinearApproximation(model)
+        u, x = np.array([1.0, 0.8]), np.array([0.6, 0.4])
+        approximation.linearize(u, x)
+        approximation.linearize(u, x)
+        assert model.batch_calls == 1
+        approximation.clear_cache()
+        approximation.linearize(u, x)
+        assert model.batch_calls == 2
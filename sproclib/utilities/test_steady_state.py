@@ -0,0 +1,169 @@
+"""
+Test suite for the steady-state solver in sproclib.utilities.steady_state
+"""
+
+import logging
+import numpy as np
+import pytest
+
+from .steady_state import SteadyStateSolver
+from ..unit.base import ProcessModel
+from ..unit.reactor.cstr import CSTR
+from ..unit.reactor.fluidized_bed.fluidized_bed_reactor import FluidizedBedReactor
+
+
+class NoSteadyState(ProcessModel):
+    """dx/dt = x^2 + u has no real steady state for u > 0."""
+
+    def dynamics(self, t, x, u):
+        return x ** 2 + u
+
+    def steady_state(self, u):
+        return np.zeros(1)
+
+
+def multiplicity_inputs(Tc):
+    """CSTR inputs with three steady states for Tc in about [299, 303] K."""
+    return np.array([100.0, 1.0, 350.0, Tc])
+
+
+class TestSteadyStateSolver:
+    """Test class for SteadyStateSolver."""
+
+    def test_cstr_steady_state_satisfies_dynamics(self):
+        """Test a point where the former fixed-guess fsolve returned a non-equilibrium."""
+        cstr = CSTR()
+        u = np.array([10.0, 1.0, 350.0, 290.0])
+        result = cstr.steady_state_solver.solve(u)
+        assert result['success']
+        np.testing.assert_allclose(cstr.dynamics(0, result['x'], u), 0.0, atol=1e-8)
+        np.testing.assert_allclose(cstr.steady_state(u), result['x'])
+
+    def test_cache(self):
+        cstr = CSTR()
+        solver = cstr.steady_state_solver
+        first = solver.solve(np.array([10.0, 1.0, 350.0, 300.5]))
+        assert first['start'] == 'cold'
+
+        # Inputs within the resolution are served from the cache
+        hit = solver.solve(np.array([10.0, 1.0, 350.0, 300.5 + 1e-12]))
+        assert hit['start'] == 'cache' and hit['nfev'] == 0
+        np.testing.assert_array_equal(hit['x'], first['x'])
+        info = solver.cache_info()
+        assert info['hits'] == 1 and info['misses'] == 1 and info['size'] == 1
+
+    def test_result_independent_of_history(self):
+        """Test that solving a distant operating point does not change the default branch."""
+        cstr = CSTR()
+        u = multiplicity_inputs(300.0)
+        before = cstr.steady_state(u)
+        cstr.steady_state(multiplicity_inputs(310.0))
+        cstr.steady_state_solver.clear_cache()
+        cstr.steady_state(multiplicity_inputs(310.0))
+        np.testing.assert_allclose(cstr.steady_state(u), before, rtol=1e-10)
+
+        # Branches selected with x0 or track() are not returned for u alone
+        fresh = CSTR()
+        high = fresh.steady_state(u, x0=np.array([0.1, 380.0]))
+        assert high[1] > 355.0
+        np.testing.assert_allclose(fresh.steady_state(u), before, rtol=1e-10)
+
+    def test_cached_neighbour_is_last_resort(self):
+        """Test that a cached solution is used only when the cold start fails."""
+        cstr = CSTR()
+        solver = SteadyStateSolver(cstr, initial_guess=lambda u: np.array([np.nan, np.nan]), settle_time=None)
+        solver.solve(np.array([10.0, 1.0, 350.0, 300.0]), x0=cstr._steady_state_guess(np.array([10.0, 1.0, 350.0, 300.0])))
+        result = solver.solve(np.array([10.0, 1.0, 350.0, 300.5]))
+        assert result['success'] and result['start'] == 'warm'
+
+    def test_update_parameters_invalidates_cache(self):
+        cstr = CSTR()
+        u = np.array([10.0, 1.0, 350.0, 300.0])
+        x1 = cstr.steady_state(u)
+        cstr.update_parameters(UA=60000.0)
+        result = cstr.steady_state_solver.solve(u)
+        assert result['start'] == 'cold'
+        np.testing.assert_allclose(cstr.dynamics(0, result['x'], u), 0.0, atol=1e-8)
+        assert not np.allclose(result['x'], x1)
+
+    def test_direct_attribute_change_invalidates_cache(self):
+        """Test that an attribute assigned directly is not served from the cache."""
+        cstr = CSTR()
+        u = np.array([100.0, 1.0, 350.0, 300.0])
+        cstr.steady_state(u)
+        cstr.V = 50.0
+        result = cstr.steady_state_solver.solve(u)
+        assert result['start'] != 'cache'
+        np.testing.assert_allclose(cstr.dynamics(0, result['x'], u), 0.0, atol=1e-8)
+        np.testing.assert_allclose(result['x'], CSTR(V=50.0).steady_state(u), rtol=1e-8)
+
+    def test_cache_size_limit(self):
+        cstr = CSTR()
+        solver = SteadyStateSolver(cstr, initial_guess=cstr._steady_state_guess, cache_size=3)
+        for Tc in (300.0, 301.0, 302.0, 303.0, 304.0):
+            solver.solve(np.array([10.0, 1.0, 350.0, Tc]))
+        assert solver.cache_info()['size'] == 3
+        assert solver.solve(np.array([10.0, 1.0, 350.0, 300.0]))['start'] == 'cold'
+        assert solver.solve(np.array([10.0, 1.0, 350.0, 304.0]))['start'] == 'cache'
+
+    def test_x0_selects_branch(self):
+        """Test that a starting point picks one of several steady states."""
+        cstr = CSTR()
+        u = multiplicity_inputs(301.0)
+        low = cstr.steady_state(u, x0=np.array([0.9, 320.0]))
+        high = cstr.steady_state(u, x0=np.array([0.1, 380.0]))
+        assert low[1] < 335.0 and high[1] > 365.0
+        for x in (low, high):
+            np.testing.assert_allclose(cstr.dynamics(0, x, u), 0.0, atol=1e-8)
+
+    def test_track_follows_branch_to_turning_point(self):
+        cstr = CSTR()
+        Tc = np.arange(296.0, 306.01, 0.5)
+        U = np.array([multiplicity_inputs(value) for value in Tc])
+        result = cstr.steady_state_solver.track(U, x0=np.array([0.9, 320.0]))
+
+        # The lower branch ends between 302 and 304 K; the solver must not jump
+        # to the upper branch
+        tracked = result['success']
+        assert tracked[:13].all() and not tracked[-1]
+        assert np.all(result['x'][tracked, 1] < 345.0)
+        assert np.all(np.isnan(result['x'][~tracked]))
+        assert 'turning point' in result['message']
+
+        # Downwards the upper branch ends near 299 K
+        result = cstr.steady_state_solver.track(U[::-1], x0=np.array([0.1, 390.0]))
+        assert result['success'][:13].all() and not result['success'][-1]
+        assert np.all(result['x'][result['success'], 1] > 355.0)
+
+    def test_failure_is_reported(self, caplog):
+        model = NoSteadyState()
+        solver = SteadyStateSolver(model, initial_guess=lambda u: np.array([1.0]), settle_time=None)
+        with caplog.at_level(logging.WARNING):
+            result = solver.solve(np.array([1.0]))
+        assert not result['success']
+        assert result['residual'] > 0.5
+        assert 'did not converge' in caplog.text
+        assert solver.cache_info()['size'] == 0
+
+    def test_missing_starting_point(self):
+        with pytest.raises(ValueError):
+            SteadyStateSolver(CSTR()).solve(np.array([10.0, 1.0, 350.0, 300.0]))
+
+
+class TestFluidizedBedSteadyState:
+    """Test class for the fluidized bed steady state on the shared solver."""
+
+    u = np.array([100.0, 700.0, 0.3, 650.0])
+
+    def test_analytic_jacobian(self):
+        reactor = FluidizedBedReactor()
+        x = np.array([80.0, 40.0, 690.0])
+        np.testing.assert_allclose(reactor.jacobian(0, x, self.u),
+                                   ProcessModel.jacobian(reactor, 0, x, self.u), rtol=1e-5, atol=1e-9)
+
+    def test_steady_state(self):
+        reactor = FluidizedBedReactor()
+        x_ss = reactor.steady_state(self.u)
+        assert reactor.steady_state_solver.last_result['success']
+        scale = np.abs(reactor.dynamics(0, reactor._steady_state_guess(self.u), self.u)).max()
+        assert np.abs(reactor.dynamics(0, x_ss, self.u)).max() < 1e-10 * scale
@@ -0,0 +1,38 @@
+"""
+Visualization Package for SPROCLIB - Standard Process Control Library
+
+Optional plotting layer. All matplotlib use in the library lives here and is
+imported only when a plot is requested, so computational modules never load
+matplotlib.
+
+Functions:
+    plot_simulation_results: States, inputs, outputs and control error
+    plot_bode: Bode magnitude and phase plot
+    plot_schedule: Gantt chart and inventories of a StateTaskNetwork schedule
+
+Classes:
+    EconomicOptimizationPlots: Plots for economic optimization studies
+    ProcessOptimizationPlots: Plots for process optimization studies
+
+Author: Thorsten Gressling <gressling@paramus.ai>
+License: MIT License
+"""
+
+# Plotting modules are imported on first access (PEP 562)
+from .._lazy import attach
+
+_EXPORTS = {
+    'plot_simulation_results': ('.simulation', 'plot_simulation_results'),
+    'plot_bode': ('.analysis', 'plot_bode'),
+    'plot_schedule': ('.scheduling', 'plot_schedule'),
+    'EconomicOptimizationPlots': (
+        'sproclib.optimization.economic_optimization.plots.visualization', 'EconomicOptimizationPlots'
+    ),
+    'ProcessOptimizationPlots': (
+        'sproclib.optimization.process_optimization.plots.visualization', 'ProcessOptimizationPlots'
+    ),
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS, ['simulation', 'analysis', 'scheduling'])
+
+__all__ = list(_EXPORTS)
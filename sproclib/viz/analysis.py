@@ -0,0 +1,40 @@
+"""
+Frequency Response Plots for SPROCLIB
+
+Bode plots shared by TransferFunction, SystemAnalysis and the utility
+functions.
+
+Author: Thorsten Gressling <gressling@paramus.ai>
+License: MIT License
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+
+def plot_bode(w: np.ndarray, magnitude_db: np.ndarray, phase_deg: np.ndarray, title: str = "Bode Plot"):
+    """
+    Plot magnitude and phase over frequency.
+    
+    Args:
+        w: Frequency vector [rad/time]
+        magnitude_db: Magnitude [dB]
+        phase_deg: Phase [degrees]
+        title: Plot title
+    """
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
+    
+    # Magnitude plot
+    ax1.semilogx(w/(2*np.pi), magnitude_db)
+    ax1.set_ylabel('Magnitude (dB)')
+    ax1.grid(True, which='both', alpha=0.3)
+    ax1.set_title(title)
+    
+    # Phase plot
+    ax2.semilogx(w/(2*np.pi), phase_deg)
+    ax2.set_ylabel('Phase (degrees)')
+    ax2.set_xlabel('Frequency (Hz)')
+    ax2.grid(True, which='both', alpha=0.3)
+    
+    plt.tight_layout()
+    plt.show()
@@ -0,0 +1,103 @@
+"""
+Scheduling Plots for SPROCLIB
+
+Gantt charts and inventory plots for StateTaskNetwork schedules.
+
+Author: Thorsten Gressling <gressling@paramus.ai>
+License: MIT License
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+from typing import Tuple
+
+
+def plot_schedule(
+    network,
+    figsize: Tuple[int, int] = (12, 6),
+    show_inventories: bool = True
+):
+    """
+    Plot Gantt chart of a StateTaskNetwork schedule.
+    
+    Args:
+        network: StateTaskNetwork with an optimized schedule
+        figsize: Figure size
+        show_inventories: Whether to show inventory plots
+    """
+    n_plots = 2 if show_inventories else 1
+    fig, axes = plt.subplots(n_plots, 1, figsize=(figsize[0], figsize[1] * n_plots))
+
+    if n_plots == 1:
+        axes = [axes]
+
+    # Gantt chart
+    ax = axes[0]
+    units = list(network.schedule['unit_schedules'].keys())
+    time_horizon = network.schedule['time_horizon']
+
+    # Color map for tasks
+    task_names = list(network.tasks.keys())
+    colors = plt.cm.Set3(np.linspace(0, 1, len(task_names)))
+    task_colors = dict(zip(task_names, colors))
+
+    # Create Gantt chart
+    for i, unit in enumerate(units):
+        schedule_unit = network.schedule['unit_schedules'][unit]
+
+        current_task = None
+        start_time = 0
+
+        for t, task in enumerate(schedule_unit):
+            if task != current_task:
+                if current_task is not None:
+                    # Plot previous task
+                    color = task_colors.get(current_task, 'gray')
+                    ax.barh(i, t - start_time, left=start_time, 
+                           height=0.6, alpha=0.8, color=color,
+                           label=current_task if current_task not in [t.get_text() for t in ax.get_legend().get_texts()] else "")
+                current_task = task
+                start_time = t
+
+        # Plot last task
+        if current_task is not None:
+            color = task_colors.get(current_task, 'gray')
+            ax.barh(i, len(schedule_unit) - start_time, left=start_time,
+                   height=0.6, alpha=0.8, color=color,
+                   label=current_task if current_task not in [t.get_text() for t in ax.get_legend().get_texts()] else "")
+
+    ax.set_yticks(range(len(units)))
+    ax.set_yticklabels(units)
+    ax.set_xlabel('Time')
+    ax.set_ylabel('Units')
+    ax.set_title(f'{network.name} - Production Schedule')
+    ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+    ax.grid(True, alpha=0.3)
+
+    # Inventory plot
+    if show_inventories and n_plots > 1:
+        ax2 = axes[1]
+
+        # Simulate inventory evolution (simplified)
+        time_points = range(time_horizon + 1)
+        inventories = {state: [info['initial_amount']] for state, info in network.states.items()}
+
+        # Simple inventory tracking
+        for t in range(time_horizon):
+            # Copy previous inventories
+            for state in inventories:
+                inventories[state].append(inventories[state][-1])
+
+        # Plot inventories
+        for state, inventory_history in inventories.items():
+            if network.states[state].get('is_product', False) or state in ['FeedA', 'FeedB']:  # Show key materials
+                ax2.plot(time_points, inventory_history, marker='o', label=state)
+
+        ax2.set_xlabel('Time')
+        ax2.set_ylabel('Inventory')
+        ax2.set_title('Material Inventories')
+        ax2.legend()
+        ax2.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    plt.show()
@@ -0,0 +1,91 @@
+"""
+Simulation Plots for SPROCLIB
+
+Plotting of ProcessSimulation results. Imported on demand so that the
+simulation core does not load matplotlib.
+
+Author: Thorsten Gressling <gressling@paramus.ai>
+License: MIT License
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+from typing import Optional, Tuple, Dict, Any, List
+
+
+def plot_simulation_results(
+    results: Dict[str, Any],
+    name: str = "Process Simulation",
+    variables: Optional[List[str]] = None,
+    figsize: Tuple[int, int] = (12, 10)
+):
+    """
+    Plot states, inputs, output/setpoint and control error of a simulation.
+    
+    Args:
+        results: Results dictionary from ProcessSimulation.run
+        name: Simulation name used in titles
+        variables: List of variables to plot
+        figsize: Figure size
+    """
+    t = results['t']
+    x = results['x']
+    u = results['u']
+    y = results['y']
+
+    # Determine number of subplots
+    n_plots = 3
+    if 'setpoint' in results:
+        n_plots = 4
+
+    fig, axes = plt.subplots(n_plots, 1, figsize=figsize)
+    if n_plots == 1:
+        axes = [axes]
+
+    # Plot states
+    if x.ndim > 1:
+        for i in range(x.shape[0]):
+            axes[0].plot(t, x[i, :], label=f'x{i+1}')
+    else:
+        axes[0].plot(t, x, label='x')
+    axes[0].set_ylabel('States')
+    axes[0].legend()
+    axes[0].grid(True, alpha=0.3)
+    axes[0].set_title(f'{name} - State Variables')
+
+    # Plot inputs
+    if u.ndim > 1:
+        for i in range(u.shape[0]):
+            axes[1].plot(t, u[i, :], label=f'u{i+1}')
+    else:
+        axes[1].plot(t, u, label='u')
+    axes[1].set_ylabel('Inputs')
+    axes[1].legend()
+    axes[1].grid(True, alpha=0.3)
+    axes[1].set_title('Control Inputs')
+
+    # Plot outputs
+    axes[2].plot(t, y, 'b-', label='Output', linewidth=2)
+    if 'setpoint' in results:
+        axes[2].plot(t, results['setpoint'], 'r--', label='Setpoint', linewidth=2)
+        axes[2].set_title('Process Output vs Setpoint')
+    else:
+        axes[2].set_title('Process Output')
+    axes[2].set_ylabel('Output')
+    axes[2].legend()
+    axes[2].grid(True, alpha=0.3)
+
+    # Plot control performance if closed-loop
+    if 'setpoint' in results and n_plots >= 4:
+        error = results['setpoint'] - y
+        axes[3].plot(t, error, 'g-', label='Error')
+        axes[3].set_ylabel('Control Error')
+        axes[3].set_xlabel('Time')
+        axes[3].legend()
+        axes[3].grid(True, alpha=0.3)
+        axes[3].set_title('Control Error')
+    else:
+        axes[-1].set_xlabel('Time')
+
+    plt.tight_layout()
+    plt.show()